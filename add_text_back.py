@@ -1,4 +1,8 @@
-with open(r'D:\dev\wwusa-saas-app\src\components\dashboard\Sidebar.tsx', 'r', encoding='utf-8') as f:
+from tools.paths import REPO_ROOT
+
+SIDEBAR = REPO_ROOT / 'src' / 'components' / 'dashboard' / 'Sidebar.tsx'
+
+with open(SIDEBAR, 'r', encoding='utf-8') as f:
     content = f.read()
 
 # Add back the text label
@@ -12,7 +16,7 @@ content = content.replace(
                 )}'''
 )
 
-with open(r'D:\dev\wwusa-saas-app\src\components\dashboard\Sidebar.tsx', 'w', encoding='utf-8') as f:
+with open(SIDEBAR, 'w', encoding='utf-8') as f:
     f.write(content)
 
 print("✅ Added WIND WIRELESS text back!")
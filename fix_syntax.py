@@ -1,4 +1,8 @@
-with open(r'D:\dev\wwusa-saas-app\src\app\[locale]\dashboard\inventory\page.tsx', 'r', encoding='utf-8') as f:
+from tools.paths import REPO_ROOT
+
+INVENTORY_PAGE = REPO_ROOT / 'src' / 'app' / '[locale]' / 'dashboard' / 'inventory' / 'page.tsx'
+
+with open(INVENTORY_PAGE, 'r', encoding='utf-8') as f:
     lines = f.readlines()
 
 # The function handleFileUpload starts around line 90
@@ -22,7 +26,7 @@ if start_idx != -1 and end_idx != -1:
     ]
     lines[start_idx:end_idx+1] = new_block
     
-    with open(r'D:\dev\wwusa-saas-app\src\app\[locale]\dashboard\inventory\page.tsx', 'w', encoding='utf-8') as f:
+    with open(INVENTORY_PAGE, 'w', encoding='utf-8') as f:
         f.writelines(lines)
     print("✅ Fixed syntax error successfully!")
 else:
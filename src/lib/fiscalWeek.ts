@@ -4,7 +4,7 @@
  * Wind Wireless's fiscal week logic:
  * - Week closes every Friday
  * - Week 1 of the month = from Monday before the first Friday to that Friday
- * - Example: April 2026: Week 1 = Mar 29 - Apr 3 (first Friday is Apr 3)
+ * - Example: April 2026: Week 1 = Mar 30 - Apr 3 (first Friday is Apr 3)
  * - January 2026 had 5 Fridays, so 5 weeks
  */
 
@@ -17,45 +17,33 @@ export interface FiscalWeek {
 }
 
 /**
- * Get all Fridays in a given month and the previous month (for first week calculation)
+ * Get all Fridays in a given month
  */
 function getFridaysInMonth(year: number, month: number): Date[] {
     const fridays: Date[] = [];
-    
-    // Start from the last week of previous month
-    const prevDate = new Date(year, month - 1, 1);
-    prevDate.setDate(0); // Last day of previous month
-    
-    // Find first Friday from last day of previous month going forward
-    const daysUntilFriday = (5 - prevDate.getDay() + 7) % 7 || 7;
-    const firstFriday = new Date(year, month - 1, prevDate.getDate() + daysUntilFriday);
-    
-    // Collect all Fridays in this month
-    let currentFriday = firstFriday;
-    while (currentFriday.getMonth() === month - 1 || 
-           (currentFriday.getMonth() === month && currentFriday.getDate() <= 7)) {
-        if (currentFriday.getMonth() === month - 1) {
-            fridays.push(new Date(currentFriday));
-        }
-        currentFriday.setDate(currentFriday.getDate() + 7);
-    }
-    
-    // Now get Fridays that belong to this month
-    currentFriday = new Date(year, month - 1, 1);
-    // Find first Friday of this month
+
+    // Days from the 1st to the first Friday (0 when the 1st is a Friday)
     const firstDayMonth = new Date(year, month - 1, 1);
-    const daysToFirstFridayMonth = (5 - firstDayMonth.getDay() + 7) % 7 || 7;
-    currentFriday = new Date(year, month - 1, daysToFirstFridayMonth);
-    
-    fridays.length = 0; // Reset
+    const daysToFirstFriday = (5 - firstDayMonth.getDay() + 7) % 7;
+    const currentFriday = new Date(year, month - 1, 1 + daysToFirstFriday);
+
     while (currentFriday.getMonth() === month - 1) {
         fridays.push(new Date(currentFriday));
         currentFriday.setDate(currentFriday.getDate() + 7);
     }
-    
+
     return fridays;
 }
 
+/**
+ * Format a date as YYYY-MM-DD in local time (toISOString would shift it to UTC)
+ */
+function formatDate(d: Date): string {
+    const month = String(d.getMonth() + 1).padStart(2, '0');
+    const day = String(d.getDate()).padStart(2, '0');
+    return `${d.getFullYear()}-${month}-${day}`;
+}
+
 /**
  * Get all fiscal weeks for a given month
  * Returns array of weeks with their date ranges
@@ -74,8 +62,6 @@ export function getFiscalWeeksForMonth(year: number, month: number): FiscalWeek[
         const startDate = new Date(friday);
         startDate.setDate(startDate.getDate() - 4); // 4 days back from Friday = Monday
         
-        // Format dates
-        const formatDate = (d: Date) => d.toISOString().split('T')[0];
         const monthStr = `${year}-${String(month).padStart(2, '0')}`;
         
         weeks.push({
@@ -118,7 +104,7 @@ export function getCurrentFiscalWeek(): FiscalWeek | null {
     const today = new Date();
     const year = today.getFullYear();
     const month = today.getMonth() + 1;
-    const dateStr = today.toISOString().split('T')[0];
+    const dateStr = formatDate(today);
     
     return getFiscalWeekForDate(dateStr);
 }
@@ -0,0 +1,384 @@
+-- Fiscal weeks 2024-2030 (weeks close on Friday).
+-- Generated by `python -m tools.fiscal sql`; same rules as src/lib/fiscalWeek.ts.
+CREATE TABLE IF NOT EXISTS public.fiscal_weeks (
+  month TEXT NOT NULL,
+  week SMALLINT NOT NULL,
+  start_date DATE NOT NULL,
+  end_date DATE NOT NULL,
+  label TEXT NOT NULL,
+  PRIMARY KEY (month, week)
+);
+CREATE INDEX IF NOT EXISTS idx_fiscal_weeks_range
+  ON public.fiscal_weeks (start_date, end_date);
+ALTER TABLE public.fiscal_weeks ENABLE ROW LEVEL SECURITY;
+DROP POLICY IF EXISTS "Authenticated users can read fiscal_weeks" ON public.fiscal_weeks;
+CREATE POLICY "Authenticated users can read fiscal_weeks"
+  ON public.fiscal_weeks FOR SELECT TO authenticated USING (true);
+
+INSERT INTO public.fiscal_weeks (month, week, start_date, end_date, label) VALUES
+  ('2024-01', 1, '2024-01-01', '2024-01-05', 'Semana 1'),
+  ('2024-01', 2, '2024-01-08', '2024-01-12', 'Semana 2'),
+  ('2024-01', 3, '2024-01-15', '2024-01-19', 'Semana 3'),
+  ('2024-01', 4, '2024-01-22', '2024-01-26', 'Semana 4'),
+  ('2024-02', 1, '2024-01-29', '2024-02-02', 'Semana 1'),
+  ('2024-02', 2, '2024-02-05', '2024-02-09', 'Semana 2'),
+  ('2024-02', 3, '2024-02-12', '2024-02-16', 'Semana 3'),
+  ('2024-02', 4, '2024-02-19', '2024-02-23', 'Semana 4'),
+  ('2024-03', 1, '2024-02-26', '2024-03-01', 'Semana 1'),
+  ('2024-03', 2, '2024-03-04', '2024-03-08', 'Semana 2'),
+  ('2024-03', 3, '2024-03-11', '2024-03-15', 'Semana 3'),
+  ('2024-03', 4, '2024-03-18', '2024-03-22', 'Semana 4'),
+  ('2024-03', 5, '2024-03-25', '2024-03-29', 'Semana 5'),
+  ('2024-04', 1, '2024-04-01', '2024-04-05', 'Semana 1'),
+  ('2024-04', 2, '2024-04-08', '2024-04-12', 'Semana 2'),
+  ('2024-04', 3, '2024-04-15', '2024-04-19', 'Semana 3'),
+  ('2024-04', 4, '2024-04-22', '2024-04-26', 'Semana 4'),
+  ('2024-05', 1, '2024-04-29', '2024-05-03', 'Semana 1'),
+  ('2024-05', 2, '2024-05-06', '2024-05-10', 'Semana 2'),
+  ('2024-05', 3, '2024-05-13', '2024-05-17', 'Semana 3'),
+  ('2024-05', 4, '2024-05-20', '2024-05-24', 'Semana 4'),
+  ('2024-05', 5, '2024-05-27', '2024-05-31', 'Semana 5'),
+  ('2024-06', 1, '2024-06-03', '2024-06-07', 'Semana 1'),
+  ('2024-06', 2, '2024-06-10', '2024-06-14', 'Semana 2'),
+  ('2024-06', 3, '2024-06-17', '2024-06-21', 'Semana 3'),
+  ('2024-06', 4, '2024-06-24', '2024-06-28', 'Semana 4'),
+  ('2024-07', 1, '2024-07-01', '2024-07-05', 'Semana 1'),
+  ('2024-07', 2, '2024-07-08', '2024-07-12', 'Semana 2'),
+  ('2024-07', 3, '2024-07-15', '2024-07-19', 'Semana 3'),
+  ('2024-07', 4, '2024-07-22', '2024-07-26', 'Semana 4'),
+  ('2024-08', 1, '2024-07-29', '2024-08-02', 'Semana 1'),
+  ('2024-08', 2, '2024-08-05', '2024-08-09', 'Semana 2'),
+  ('2024-08', 3, '2024-08-12', '2024-08-16', 'Semana 3'),
+  ('2024-08', 4, '2024-08-19', '2024-08-23', 'Semana 4'),
+  ('2024-08', 5, '2024-08-26', '2024-08-30', 'Semana 5'),
+  ('2024-09', 1, '2024-09-02', '2024-09-06', 'Semana 1'),
+  ('2024-09', 2, '2024-09-09', '2024-09-13', 'Semana 2'),
+  ('2024-09', 3, '2024-09-16', '2024-09-20', 'Semana 3'),
+  ('2024-09', 4, '2024-09-23', '2024-09-27', 'Semana 4'),
+  ('2024-10', 1, '2024-09-30', '2024-10-04', 'Semana 1'),
+  ('2024-10', 2, '2024-10-07', '2024-10-11', 'Semana 2'),
+  ('2024-10', 3, '2024-10-14', '2024-10-18', 'Semana 3'),
+  ('2024-10', 4, '2024-10-21', '2024-10-25', 'Semana 4'),
+  ('2024-11', 1, '2024-10-28', '2024-11-01', 'Semana 1'),
+  ('2024-11', 2, '2024-11-04', '2024-11-08', 'Semana 2'),
+  ('2024-11', 3, '2024-11-11', '2024-11-15', 'Semana 3'),
+  ('2024-11', 4, '2024-11-18', '2024-11-22', 'Semana 4'),
+  ('2024-11', 5, '2024-11-25', '2024-11-29', 'Semana 5'),
+  ('2024-12', 1, '2024-12-02', '2024-12-06', 'Semana 1'),
+  ('2024-12', 2, '2024-12-09', '2024-12-13', 'Semana 2'),
+  ('2024-12', 3, '2024-12-16', '2024-12-20', 'Semana 3'),
+  ('2024-12', 4, '2024-12-23', '2024-12-27', 'Semana 4'),
+  ('2025-01', 1, '2024-12-30', '2025-01-03', 'Semana 1'),
+  ('2025-01', 2, '2025-01-06', '2025-01-10', 'Semana 2'),
+  ('2025-01', 3, '2025-01-13', '2025-01-17', 'Semana 3'),
+  ('2025-01', 4, '2025-01-20', '2025-01-24', 'Semana 4'),
+  ('2025-01', 5, '2025-01-27', '2025-01-31', 'Semana 5'),
+  ('2025-02', 1, '2025-02-03', '2025-02-07', 'Semana 1'),
+  ('2025-02', 2, '2025-02-10', '2025-02-14', 'Semana 2'),
+  ('2025-02', 3, '2025-02-17', '2025-02-21', 'Semana 3'),
+  ('2025-02', 4, '2025-02-24', '2025-02-28', 'Semana 4'),
+  ('2025-03', 1, '2025-03-03', '2025-03-07', 'Semana 1'),
+  ('2025-03', 2, '2025-03-10', '2025-03-14', 'Semana 2'),
+  ('2025-03', 3, '2025-03-17', '2025-03-21', 'Semana 3'),
+  ('2025-03', 4, '2025-03-24', '2025-03-28', 'Semana 4'),
+  ('2025-04', 1, '2025-03-31', '2025-04-04', 'Semana 1'),
+  ('2025-04', 2, '2025-04-07', '2025-04-11', 'Semana 2'),
+  ('2025-04', 3, '2025-04-14', '2025-04-18', 'Semana 3'),
+  ('2025-04', 4, '2025-04-21', '2025-04-25', 'Semana 4'),
+  ('2025-05', 1, '2025-04-28', '2025-05-02', 'Semana 1'),
+  ('2025-05', 2, '2025-05-05', '2025-05-09', 'Semana 2'),
+  ('2025-05', 3, '2025-05-12', '2025-05-16', 'Semana 3'),
+  ('2025-05', 4, '2025-05-19', '2025-05-23', 'Semana 4'),
+  ('2025-05', 5, '2025-05-26', '2025-05-30', 'Semana 5'),
+  ('2025-06', 1, '2025-06-02', '2025-06-06', 'Semana 1'),
+  ('2025-06', 2, '2025-06-09', '2025-06-13', 'Semana 2'),
+  ('2025-06', 3, '2025-06-16', '2025-06-20', 'Semana 3'),
+  ('2025-06', 4, '2025-06-23', '2025-06-27', 'Semana 4'),
+  ('2025-07', 1, '2025-06-30', '2025-07-04', 'Semana 1'),
+  ('2025-07', 2, '2025-07-07', '2025-07-11', 'Semana 2'),
+  ('2025-07', 3, '2025-07-14', '2025-07-18', 'Semana 3'),
+  ('2025-07', 4, '2025-07-21', '2025-07-25', 'Semana 4'),
+  ('2025-08', 1, '2025-07-28', '2025-08-01', 'Semana 1'),
+  ('2025-08', 2, '2025-08-04', '2025-08-08', 'Semana 2'),
+  ('2025-08', 3, '2025-08-11', '2025-08-15', 'Semana 3'),
+  ('2025-08', 4, '2025-08-18', '2025-08-22', 'Semana 4'),
+  ('2025-08', 5, '2025-08-25', '2025-08-29', 'Semana 5'),
+  ('2025-09', 1, '2025-09-01', '2025-09-05', 'Semana 1'),
+  ('2025-09', 2, '2025-09-08', '2025-09-12', 'Semana 2'),
+  ('2025-09', 3, '2025-09-15', '2025-09-19', 'Semana 3'),
+  ('2025-09', 4, '2025-09-22', '2025-09-26', 'Semana 4'),
+  ('2025-10', 1, '2025-09-29', '2025-10-03', 'Semana 1'),
+  ('2025-10', 2, '2025-10-06', '2025-10-10', 'Semana 2'),
+  ('2025-10', 3, '2025-10-13', '2025-10-17', 'Semana 3'),
+  ('2025-10', 4, '2025-10-20', '2025-10-24', 'Semana 4'),
+  ('2025-10', 5, '2025-10-27', '2025-10-31', 'Semana 5'),
+  ('2025-11', 1, '2025-11-03', '2025-11-07', 'Semana 1'),
+  ('2025-11', 2, '2025-11-10', '2025-11-14', 'Semana 2'),
+  ('2025-11', 3, '2025-11-17', '2025-11-21', 'Semana 3'),
+  ('2025-11', 4, '2025-11-24', '2025-11-28', 'Semana 4'),
+  ('2025-12', 1, '2025-12-01', '2025-12-05', 'Semana 1'),
+  ('2025-12', 2, '2025-12-08', '2025-12-12', 'Semana 2'),
+  ('2025-12', 3, '2025-12-15', '2025-12-19', 'Semana 3'),
+  ('2025-12', 4, '2025-12-22', '2025-12-26', 'Semana 4'),
+  ('2026-01', 1, '2025-12-29', '2026-01-02', 'Semana 1'),
+  ('2026-01', 2, '2026-01-05', '2026-01-09', 'Semana 2'),
+  ('2026-01', 3, '2026-01-12', '2026-01-16', 'Semana 3'),
+  ('2026-01', 4, '2026-01-19', '2026-01-23', 'Semana 4'),
+  ('2026-01', 5, '2026-01-26', '2026-01-30', 'Semana 5'),
+  ('2026-02', 1, '2026-02-02', '2026-02-06', 'Semana 1'),
+  ('2026-02', 2, '2026-02-09', '2026-02-13', 'Semana 2'),
+  ('2026-02', 3, '2026-02-16', '2026-02-20', 'Semana 3'),
+  ('2026-02', 4, '2026-02-23', '2026-02-27', 'Semana 4'),
+  ('2026-03', 1, '2026-03-02', '2026-03-06', 'Semana 1'),
+  ('2026-03', 2, '2026-03-09', '2026-03-13', 'Semana 2'),
+  ('2026-03', 3, '2026-03-16', '2026-03-20', 'Semana 3'),
+  ('2026-03', 4, '2026-03-23', '2026-03-27', 'Semana 4'),
+  ('2026-04', 1, '2026-03-30', '2026-04-03', 'Semana 1'),
+  ('2026-04', 2, '2026-04-06', '2026-04-10', 'Semana 2'),
+  ('2026-04', 3, '2026-04-13', '2026-04-17', 'Semana 3'),
+  ('2026-04', 4, '2026-04-20', '2026-04-24', 'Semana 4'),
+  ('2026-05', 1, '2026-04-27', '2026-05-01', 'Semana 1'),
+  ('2026-05', 2, '2026-05-04', '2026-05-08', 'Semana 2'),
+  ('2026-05', 3, '2026-05-11', '2026-05-15', 'Semana 3'),
+  ('2026-05', 4, '2026-05-18', '2026-05-22', 'Semana 4'),
+  ('2026-05', 5, '2026-05-25', '2026-05-29', 'Semana 5'),
+  ('2026-06', 1, '2026-06-01', '2026-06-05', 'Semana 1'),
+  ('2026-06', 2, '2026-06-08', '2026-06-12', 'Semana 2'),
+  ('2026-06', 3, '2026-06-15', '2026-06-19', 'Semana 3'),
+  ('2026-06', 4, '2026-06-22', '2026-06-26', 'Semana 4'),
+  ('2026-07', 1, '2026-06-29', '2026-07-03', 'Semana 1'),
+  ('2026-07', 2, '2026-07-06', '2026-07-10', 'Semana 2'),
+  ('2026-07', 3, '2026-07-13', '2026-07-17', 'Semana 3'),
+  ('2026-07', 4, '2026-07-20', '2026-07-24', 'Semana 4'),
+  ('2026-07', 5, '2026-07-27', '2026-07-31', 'Semana 5'),
+  ('2026-08', 1, '2026-08-03', '2026-08-07', 'Semana 1'),
+  ('2026-08', 2, '2026-08-10', '2026-08-14', 'Semana 2'),
+  ('2026-08', 3, '2026-08-17', '2026-08-21', 'Semana 3'),
+  ('2026-08', 4, '2026-08-24', '2026-08-28', 'Semana 4'),
+  ('2026-09', 1, '2026-08-31', '2026-09-04', 'Semana 1'),
+  ('2026-09', 2, '2026-09-07', '2026-09-11', 'Semana 2'),
+  ('2026-09', 3, '2026-09-14', '2026-09-18', 'Semana 3'),
+  ('2026-09', 4, '2026-09-21', '2026-09-25', 'Semana 4'),
+  ('2026-10', 1, '2026-09-28', '2026-10-02', 'Semana 1'),
+  ('2026-10', 2, '2026-10-05', '2026-10-09', 'Semana 2'),
+  ('2026-10', 3, '2026-10-12', '2026-10-16', 'Semana 3'),
+  ('2026-10', 4, '2026-10-19', '2026-10-23', 'Semana 4'),
+  ('2026-10', 5, '2026-10-26', '2026-10-30', 'Semana 5'),
+  ('2026-11', 1, '2026-11-02', '2026-11-06', 'Semana 1'),
+  ('2026-11', 2, '2026-11-09', '2026-11-13', 'Semana 2'),
+  ('2026-11', 3, '2026-11-16', '2026-11-20', 'Semana 3'),
+  ('2026-11', 4, '2026-11-23', '2026-11-27', 'Semana 4'),
+  ('2026-12', 1, '2026-11-30', '2026-12-04', 'Semana 1'),
+  ('2026-12', 2, '2026-12-07', '2026-12-11', 'Semana 2'),
+  ('2026-12', 3, '2026-12-14', '2026-12-18', 'Semana 3'),
+  ('2026-12', 4, '2026-12-21', '2026-12-25', 'Semana 4'),
+  ('2027-01', 1, '2026-12-28', '2027-01-01', 'Semana 1'),
+  ('2027-01', 2, '2027-01-04', '2027-01-08', 'Semana 2'),
+  ('2027-01', 3, '2027-01-11', '2027-01-15', 'Semana 3'),
+  ('2027-01', 4, '2027-01-18', '2027-01-22', 'Semana 4'),
+  ('2027-01', 5, '2027-01-25', '2027-01-29', 'Semana 5'),
+  ('2027-02', 1, '2027-02-01', '2027-02-05', 'Semana 1'),
+  ('2027-02', 2, '2027-02-08', '2027-02-12', 'Semana 2'),
+  ('2027-02', 3, '2027-02-15', '2027-02-19', 'Semana 3'),
+  ('2027-02', 4, '2027-02-22', '2027-02-26', 'Semana 4'),
+  ('2027-03', 1, '2027-03-01', '2027-03-05', 'Semana 1'),
+  ('2027-03', 2, '2027-03-08', '2027-03-12', 'Semana 2'),
+  ('2027-03', 3, '2027-03-15', '2027-03-19', 'Semana 3'),
+  ('2027-03', 4, '2027-03-22', '2027-03-26', 'Semana 4'),
+  ('2027-04', 1, '2027-03-29', '2027-04-02', 'Semana 1'),
+  ('2027-04', 2, '2027-04-05', '2027-04-09', 'Semana 2'),
+  ('2027-04', 3, '2027-04-12', '2027-04-16', 'Semana 3'),
+  ('2027-04', 4, '2027-04-19', '2027-04-23', 'Semana 4'),
+  ('2027-04', 5, '2027-04-26', '2027-04-30', 'Semana 5'),
+  ('2027-05', 1, '2027-05-03', '2027-05-07', 'Semana 1'),
+  ('2027-05', 2, '2027-05-10', '2027-05-14', 'Semana 2'),
+  ('2027-05', 3, '2027-05-17', '2027-05-21', 'Semana 3'),
+  ('2027-05', 4, '2027-05-24', '2027-05-28', 'Semana 4'),
+  ('2027-06', 1, '2027-05-31', '2027-06-04', 'Semana 1'),
+  ('2027-06', 2, '2027-06-07', '2027-06-11', 'Semana 2'),
+  ('2027-06', 3, '2027-06-14', '2027-06-18', 'Semana 3'),
+  ('2027-06', 4, '2027-06-21', '2027-06-25', 'Semana 4'),
+  ('2027-07', 1, '2027-06-28', '2027-07-02', 'Semana 1'),
+  ('2027-07', 2, '2027-07-05', '2027-07-09', 'Semana 2'),
+  ('2027-07', 3, '2027-07-12', '2027-07-16', 'Semana 3'),
+  ('2027-07', 4, '2027-07-19', '2027-07-23', 'Semana 4'),
+  ('2027-07', 5, '2027-07-26', '2027-07-30', 'Semana 5'),
+  ('2027-08', 1, '2027-08-02', '2027-08-06', 'Semana 1'),
+  ('2027-08', 2, '2027-08-09', '2027-08-13', 'Semana 2'),
+  ('2027-08', 3, '2027-08-16', '2027-08-20', 'Semana 3'),
+  ('2027-08', 4, '2027-08-23', '2027-08-27', 'Semana 4'),
+  ('2027-09', 1, '2027-08-30', '2027-09-03', 'Semana 1'),
+  ('2027-09', 2, '2027-09-06', '2027-09-10', 'Semana 2'),
+  ('2027-09', 3, '2027-09-13', '2027-09-17', 'Semana 3'),
+  ('2027-09', 4, '2027-09-20', '2027-09-24', 'Semana 4'),
+  ('2027-10', 1, '2027-09-27', '2027-10-01', 'Semana 1'),
+  ('2027-10', 2, '2027-10-04', '2027-10-08', 'Semana 2'),
+  ('2027-10', 3, '2027-10-11', '2027-10-15', 'Semana 3'),
+  ('2027-10', 4, '2027-10-18', '2027-10-22', 'Semana 4'),
+  ('2027-10', 5, '2027-10-25', '2027-10-29', 'Semana 5'),
+  ('2027-11', 1, '2027-11-01', '2027-11-05', 'Semana 1'),
+  ('2027-11', 2, '2027-11-08', '2027-11-12', 'Semana 2'),
+  ('2027-11', 3, '2027-11-15', '2027-11-19', 'Semana 3'),
+  ('2027-11', 4, '2027-11-22', '2027-11-26', 'Semana 4'),
+  ('2027-12', 1, '2027-11-29', '2027-12-03', 'Semana 1'),
+  ('2027-12', 2, '2027-12-06', '2027-12-10', 'Semana 2'),
+  ('2027-12', 3, '2027-12-13', '2027-12-17', 'Semana 3'),
+  ('2027-12', 4, '2027-12-20', '2027-12-24', 'Semana 4'),
+  ('2027-12', 5, '2027-12-27', '2027-12-31', 'Semana 5'),
+  ('2028-01', 1, '2028-01-03', '2028-01-07', 'Semana 1'),
+  ('2028-01', 2, '2028-01-10', '2028-01-14', 'Semana 2'),
+  ('2028-01', 3, '2028-01-17', '2028-01-21', 'Semana 3'),
+  ('2028-01', 4, '2028-01-24', '2028-01-28', 'Semana 4'),
+  ('2028-02', 1, '2028-01-31', '2028-02-04', 'Semana 1'),
+  ('2028-02', 2, '2028-02-07', '2028-02-11', 'Semana 2'),
+  ('2028-02', 3, '2028-02-14', '2028-02-18', 'Semana 3'),
+  ('2028-02', 4, '2028-02-21', '2028-02-25', 'Semana 4'),
+  ('2028-03', 1, '2028-02-28', '2028-03-03', 'Semana 1'),
+  ('2028-03', 2, '2028-03-06', '2028-03-10', 'Semana 2'),
+  ('2028-03', 3, '2028-03-13', '2028-03-17', 'Semana 3'),
+  ('2028-03', 4, '2028-03-20', '2028-03-24', 'Semana 4'),
+  ('2028-03', 5, '2028-03-27', '2028-03-31', 'Semana 5'),
+  ('2028-04', 1, '2028-04-03', '2028-04-07', 'Semana 1'),
+  ('2028-04', 2, '2028-04-10', '2028-04-14', 'Semana 2'),
+  ('2028-04', 3, '2028-04-17', '2028-04-21', 'Semana 3'),
+  ('2028-04', 4, '2028-04-24', '2028-04-28', 'Semana 4'),
+  ('2028-05', 1, '2028-05-01', '2028-05-05', 'Semana 1'),
+  ('2028-05', 2, '2028-05-08', '2028-05-12', 'Semana 2'),
+  ('2028-05', 3, '2028-05-15', '2028-05-19', 'Semana 3'),
+  ('2028-05', 4, '2028-05-22', '2028-05-26', 'Semana 4'),
+  ('2028-06', 1, '2028-05-29', '2028-06-02', 'Semana 1'),
+  ('2028-06', 2, '2028-06-05', '2028-06-09', 'Semana 2'),
+  ('2028-06', 3, '2028-06-12', '2028-06-16', 'Semana 3'),
+  ('2028-06', 4, '2028-06-19', '2028-06-23', 'Semana 4'),
+  ('2028-06', 5, '2028-06-26', '2028-06-30', 'Semana 5'),
+  ('2028-07', 1, '2028-07-03', '2028-07-07', 'Semana 1'),
+  ('2028-07', 2, '2028-07-10', '2028-07-14', 'Semana 2'),
+  ('2028-07', 3, '2028-07-17', '2028-07-21', 'Semana 3'),
+  ('2028-07', 4, '2028-07-24', '2028-07-28', 'Semana 4'),
+  ('2028-08', 1, '2028-07-31', '2028-08-04', 'Semana 1'),
+  ('2028-08', 2, '2028-08-07', '2028-08-11', 'Semana 2'),
+  ('2028-08', 3, '2028-08-14', '2028-08-18', 'Semana 3'),
+  ('2028-08', 4, '2028-08-21', '2028-08-25', 'Semana 4'),
+  ('2028-09', 1, '2028-08-28', '2028-09-01', 'Semana 1'),
+  ('2028-09', 2, '2028-09-04', '2028-09-08', 'Semana 2'),
+  ('2028-09', 3, '2028-09-11', '2028-09-15', 'Semana 3'),
+  ('2028-09', 4, '2028-09-18', '2028-09-22', 'Semana 4'),
+  ('2028-09', 5, '2028-09-25', '2028-09-29', 'Semana 5'),
+  ('2028-10', 1, '2028-10-02', '2028-10-06', 'Semana 1'),
+  ('2028-10', 2, '2028-10-09', '2028-10-13', 'Semana 2'),
+  ('2028-10', 3, '2028-10-16', '2028-10-20', 'Semana 3'),
+  ('2028-10', 4, '2028-10-23', '2028-10-27', 'Semana 4'),
+  ('2028-11', 1, '2028-10-30', '2028-11-03', 'Semana 1'),
+  ('2028-11', 2, '2028-11-06', '2028-11-10', 'Semana 2'),
+  ('2028-11', 3, '2028-11-13', '2028-11-17', 'Semana 3'),
+  ('2028-11', 4, '2028-11-20', '2028-11-24', 'Semana 4'),
+  ('2028-12', 1, '2028-11-27', '2028-12-01', 'Semana 1'),
+  ('2028-12', 2, '2028-12-04', '2028-12-08', 'Semana 2'),
+  ('2028-12', 3, '2028-12-11', '2028-12-15', 'Semana 3'),
+  ('2028-12', 4, '2028-12-18', '2028-12-22', 'Semana 4'),
+  ('2028-12', 5, '2028-12-25', '2028-12-29', 'Semana 5'),
+  ('2029-01', 1, '2029-01-01', '2029-01-05', 'Semana 1'),
+  ('2029-01', 2, '2029-01-08', '2029-01-12', 'Semana 2'),
+  ('2029-01', 3, '2029-01-15', '2029-01-19', 'Semana 3'),
+  ('2029-01', 4, '2029-01-22', '2029-01-26', 'Semana 4'),
+  ('2029-02', 1, '2029-01-29', '2029-02-02', 'Semana 1'),
+  ('2029-02', 2, '2029-02-05', '2029-02-09', 'Semana 2'),
+  ('2029-02', 3, '2029-02-12', '2029-02-16', 'Semana 3'),
+  ('2029-02', 4, '2029-02-19', '2029-02-23', 'Semana 4'),
+  ('2029-03', 1, '2029-02-26', '2029-03-02', 'Semana 1'),
+  ('2029-03', 2, '2029-03-05', '2029-03-09', 'Semana 2'),
+  ('2029-03', 3, '2029-03-12', '2029-03-16', 'Semana 3'),
+  ('2029-03', 4, '2029-03-19', '2029-03-23', 'Semana 4'),
+  ('2029-03', 5, '2029-03-26', '2029-03-30', 'Semana 5'),
+  ('2029-04', 1, '2029-04-02', '2029-04-06', 'Semana 1'),
+  ('2029-04', 2, '2029-04-09', '2029-04-13', 'Semana 2'),
+  ('2029-04', 3, '2029-04-16', '2029-04-20', 'Semana 3'),
+  ('2029-04', 4, '2029-04-23', '2029-04-27', 'Semana 4'),
+  ('2029-05', 1, '2029-04-30', '2029-05-04', 'Semana 1'),
+  ('2029-05', 2, '2029-05-07', '2029-05-11', 'Semana 2'),
+  ('2029-05', 3, '2029-05-14', '2029-05-18', 'Semana 3'),
+  ('2029-05', 4, '2029-05-21', '2029-05-25', 'Semana 4'),
+  ('2029-06', 1, '2029-05-28', '2029-06-01', 'Semana 1'),
+  ('2029-06', 2, '2029-06-04', '2029-06-08', 'Semana 2'),
+  ('2029-06', 3, '2029-06-11', '2029-06-15', 'Semana 3'),
+  ('2029-06', 4, '2029-06-18', '2029-06-22', 'Semana 4'),
+  ('2029-06', 5, '2029-06-25', '2029-06-29', 'Semana 5'),
+  ('2029-07', 1, '2029-07-02', '2029-07-06', 'Semana 1'),
+  ('2029-07', 2, '2029-07-09', '2029-07-13', 'Semana 2'),
+  ('2029-07', 3, '2029-07-16', '2029-07-20', 'Semana 3'),
+  ('2029-07', 4, '2029-07-23', '2029-07-27', 'Semana 4'),
+  ('2029-08', 1, '2029-07-30', '2029-08-03', 'Semana 1'),
+  ('2029-08', 2, '2029-08-06', '2029-08-10', 'Semana 2'),
+  ('2029-08', 3, '2029-08-13', '2029-08-17', 'Semana 3'),
+  ('2029-08', 4, '2029-08-20', '2029-08-24', 'Semana 4'),
+  ('2029-08', 5, '2029-08-27', '2029-08-31', 'Semana 5'),
+  ('2029-09', 1, '2029-09-03', '2029-09-07', 'Semana 1'),
+  ('2029-09', 2, '2029-09-10', '2029-09-14', 'Semana 2'),
+  ('2029-09', 3, '2029-09-17', '2029-09-21', 'Semana 3'),
+  ('2029-09', 4, '2029-09-24', '2029-09-28', 'Semana 4'),
+  ('2029-10', 1, '2029-10-01', '2029-10-05', 'Semana 1'),
+  ('2029-10', 2, '2029-10-08', '2029-10-12', 'Semana 2'),
+  ('2029-10', 3, '2029-10-15', '2029-10-19', 'Semana 3'),
+  ('2029-10', 4, '2029-10-22', '2029-10-26', 'Semana 4'),
+  ('2029-11', 1, '2029-10-29', '2029-11-02', 'Semana 1'),
+  ('2029-11', 2, '2029-11-05', '2029-11-09', 'Semana 2'),
+  ('2029-11', 3, '2029-11-12', '2029-11-16', 'Semana 3'),
+  ('2029-11', 4, '2029-11-19', '2029-11-23', 'Semana 4'),
+  ('2029-11', 5, '2029-11-26', '2029-11-30', 'Semana 5'),
+  ('2029-12', 1, '2029-12-03', '2029-12-07', 'Semana 1'),
+  ('2029-12', 2, '2029-12-10', '2029-12-14', 'Semana 2'),
+  ('2029-12', 3, '2029-12-17', '2029-12-21', 'Semana 3'),
+  ('2029-12', 4, '2029-12-24', '2029-12-28', 'Semana 4'),
+  ('2030-01', 1, '2029-12-31', '2030-01-04', 'Semana 1'),
+  ('2030-01', 2, '2030-01-07', '2030-01-11', 'Semana 2'),
+  ('2030-01', 3, '2030-01-14', '2030-01-18', 'Semana 3'),
+  ('2030-01', 4, '2030-01-21', '2030-01-25', 'Semana 4'),
+  ('2030-02', 1, '2030-01-28', '2030-02-01', 'Semana 1'),
+  ('2030-02', 2, '2030-02-04', '2030-02-08', 'Semana 2'),
+  ('2030-02', 3, '2030-02-11', '2030-02-15', 'Semana 3'),
+  ('2030-02', 4, '2030-02-18', '2030-02-22', 'Semana 4'),
+  ('2030-03', 1, '2030-02-25', '2030-03-01', 'Semana 1'),
+  ('2030-03', 2, '2030-03-04', '2030-03-08', 'Semana 2'),
+  ('2030-03', 3, '2030-03-11', '2030-03-15', 'Semana 3'),
+  ('2030-03', 4, '2030-03-18', '2030-03-22', 'Semana 4'),
+  ('2030-03', 5, '2030-03-25', '2030-03-29', 'Semana 5'),
+  ('2030-04', 1, '2030-04-01', '2030-04-05', 'Semana 1'),
+  ('2030-04', 2, '2030-04-08', '2030-04-12', 'Semana 2'),
+  ('2030-04', 3, '2030-04-15', '2030-04-19', 'Semana 3'),
+  ('2030-04', 4, '2030-04-22', '2030-04-26', 'Semana 4'),
+  ('2030-05', 1, '2030-04-29', '2030-05-03', 'Semana 1'),
+  ('2030-05', 2, '2030-05-06', '2030-05-10', 'Semana 2'),
+  ('2030-05', 3, '2030-05-13', '2030-05-17', 'Semana 3'),
+  ('2030-05', 4, '2030-05-20', '2030-05-24', 'Semana 4'),
+  ('2030-05', 5, '2030-05-27', '2030-05-31', 'Semana 5'),
+  ('2030-06', 1, '2030-06-03', '2030-06-07', 'Semana 1'),
+  ('2030-06', 2, '2030-06-10', '2030-06-14', 'Semana 2'),
+  ('2030-06', 3, '2030-06-17', '2030-06-21', 'Semana 3'),
+  ('2030-06', 4, '2030-06-24', '2030-06-28', 'Semana 4'),
+  ('2030-07', 1, '2030-07-01', '2030-07-05', 'Semana 1'),
+  ('2030-07', 2, '2030-07-08', '2030-07-12', 'Semana 2'),
+  ('2030-07', 3, '2030-07-15', '2030-07-19', 'Semana 3'),
+  ('2030-07', 4, '2030-07-22', '2030-07-26', 'Semana 4'),
+  ('2030-08', 1, '2030-07-29', '2030-08-02', 'Semana 1'),
+  ('2030-08', 2, '2030-08-05', '2030-08-09', 'Semana 2'),
+  ('2030-08', 3, '2030-08-12', '2030-08-16', 'Semana 3'),
+  ('2030-08', 4, '2030-08-19', '2030-08-23', 'Semana 4'),
+  ('2030-08', 5, '2030-08-26', '2030-08-30', 'Semana 5'),
+  ('2030-09', 1, '2030-09-02', '2030-09-06', 'Semana 1'),
+  ('2030-09', 2, '2030-09-09', '2030-09-13', 'Semana 2'),
+  ('2030-09', 3, '2030-09-16', '2030-09-20', 'Semana 3'),
+  ('2030-09', 4, '2030-09-23', '2030-09-27', 'Semana 4'),
+  ('2030-10', 1, '2030-09-30', '2030-10-04', 'Semana 1'),
+  ('2030-10', 2, '2030-10-07', '2030-10-11', 'Semana 2'),
+  ('2030-10', 3, '2030-10-14', '2030-10-18', 'Semana 3'),
+  ('2030-10', 4, '2030-10-21', '2030-10-25', 'Semana 4'),
+  ('2030-11', 1, '2030-10-28', '2030-11-01', 'Semana 1'),
+  ('2030-11', 2, '2030-11-04', '2030-11-08', 'Semana 2'),
+  ('2030-11', 3, '2030-11-11', '2030-11-15', 'Semana 3'),
+  ('2030-11', 4, '2030-11-18', '2030-11-22', 'Semana 4'),
+  ('2030-11', 5, '2030-11-25', '2030-11-29', 'Semana 5'),
+  ('2030-12', 1, '2030-12-02', '2030-12-06', 'Semana 1'),
+  ('2030-12', 2, '2030-12-09', '2030-12-13', 'Semana 2'),
+  ('2030-12', 3, '2030-12-16', '2030-12-20', 'Semana 3'),
+  ('2030-12', 4, '2030-12-23', '2030-12-27', 'Semana 4')
+ON CONFLICT (month, week) DO NOTHING;
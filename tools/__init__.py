@@ -0,0 +1,5 @@
+"""Python maintenance tooling for the WindWireless app.
+
+Everything here runs from a checkout of the repository (``python -m tools.<name>``)
+and never touches the Next.js runtime.
+"""
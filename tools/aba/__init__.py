@@ -0,0 +1,19 @@
+"""ABA routing-number directory: build once from the Fed file, look up via mmap.
+
+    python -m tools.aba build routing_numbers.csv --export src/lib/usBanks.json
+    python -m tools.aba lookup 021000021
+    python -m tools.aba verify --dsn postgresql://...
+"""
+
+from .source import SourceError, checksum_ok, read_source
+from .table import RoutingTable, TableError, compile_table, write_table
+
+__all__ = [
+    'RoutingTable',
+    'SourceError',
+    'TableError',
+    'checksum_ok',
+    'compile_table',
+    'read_source',
+    'write_table',
+]
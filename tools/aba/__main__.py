@@ -0,0 +1,155 @@
+"""Command-line entry point: ``python -m tools.aba``.
+
+    build FILE     compile the Fed routing directory (.csv or FedACHdir.txt)
+                   into the binary table; --export writes the Record<string,
+                   string> that src/lib/bankLookup.ts consumes (.json or .ts)
+    lookup N...    print the bank for each routing number
+    verify         check every routing number stored in bank_accounts and
+                   agents (or read from --input) against the table
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from tools.fsutil import atomic_write_text
+from tools.paths import REPO_ROOT
+
+from .source import SourceError, checksum_ok, read_source
+from .table import DEFAULT_TABLE_PATH, RoutingTable, TableError, clean_routing, write_table
+
+# (source, row id, routing number)
+Stored = Tuple[str, str, str]
+
+_STORED_ROUTINGS = """
+SELECT 'bank_accounts', id::text, routing_number FROM public.bank_accounts
+ WHERE coalesce(routing_number, '') <> ''
+UNION ALL
+SELECT 'agents', id::text, bank_routing_number FROM public.agents
+ WHERE coalesce(bank_routing_number, '') <> ''
+"""
+
+
+def export_table(path: Path, table: Dict[str, str]) -> None:
+    body = json.dumps(dict(sorted(table.items())), ensure_ascii=False, indent=2)
+    if path.suffix == '.ts':
+        body = (
+            '// Generated by `python -m tools.aba build --export`; do not edit by hand.\n'
+            f'export const US_BANKS: Record<string, string> = {body};\n'
+        )
+    else:
+        body += '\n'
+    atomic_write_text(path, body)
+
+
+def load_stored(dsn: str) -> List[Stored]:
+    try:
+        import psycopg
+    except ImportError:
+        raise SourceError(
+            'psycopg is required to read from Postgres (pip install "psycopg[binary]")'
+        ) from None
+    with psycopg.connect(dsn) as conn:
+        return conn.execute(_STORED_ROUTINGS).fetchall()
+
+
+def _build(args: argparse.Namespace) -> int:
+    started = time.perf_counter()
+    pairs = read_source(args.source, args.routing_column, args.name_column)
+    stats = write_table(args.table, pairs)
+    if args.export:
+        export_table(args.export, stats.table)
+        print(f'✅ exported {len(stats.table)} banks to {args.export}')
+    for routing in stats.invalid[:10]:
+        print(f'⚠️  skipped {routing!r}: bad ABA checksum')
+    print(
+        f'\n📊 {stats.records} routing numbers written to {args.table} '
+        f'({args.table.stat().st_size} bytes), {len(stats.invalid)} invalid, '
+        f'{stats.duplicates} duplicates, in {time.perf_counter() - started:.2f}s'
+    )
+    return 0
+
+
+def _lookup(args: argparse.Namespace, table: RoutingTable) -> int:
+    missing = 0
+    for routing, name in zip(args.routings, table.lookup_many(args.routings)):
+        missing += name is None
+        print(f'{routing}\t{name or "-"}')
+    return 1 if missing else 0
+
+
+def _verify(args: argparse.Namespace, table: RoutingTable) -> int:
+    if args.input:
+        lines = args.input.read_text(encoding='utf-8').splitlines()
+        stored = [
+            ('input', str(n), line.strip()) for n, line in enumerate(lines, 1) if line.strip()
+        ]
+    elif args.dsn:
+        stored = load_stored(args.dsn)
+    else:
+        print('❌ pass --input FILE or --dsn (or set $DATABASE_URL)', file=sys.stderr)
+        return 2
+
+    started = time.perf_counter()
+    names = table.lookup_many([routing for _, _, routing in stored])
+    elapsed = time.perf_counter() - started
+    invalid = unknown = 0
+    for (source, row_id, routing), name in zip(stored, names):
+        if name is not None:
+            continue
+        if not checksum_ok(clean_routing(routing)):
+            invalid += 1
+            print(f'❌ {source} {row_id}: {routing!r} fails the ABA checksum')
+        else:
+            unknown += 1
+            print(f'⚠️  {source} {row_id}: {routing!r} not in the Fed directory')
+    print(
+        f'\n📊 {len(stored)} routing numbers: {len(stored) - invalid - unknown} known, '
+        f'{unknown} unknown, {invalid} invalid, looked up in {elapsed * 1000:.1f}ms'
+    )
+    return 1 if invalid or unknown else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m tools.aba',
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--table', type=Path, default=REPO_ROOT / DEFAULT_TABLE_PATH)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    build = commands.add_parser('build', help='compile the Fed directory')
+    build.add_argument('source', type=Path)
+    build.add_argument('--routing-column', help='CSV header of the routing number')
+    build.add_argument('--name-column', help='CSV header of the bank name')
+    build.add_argument('--export', type=Path, help='also write the TS lookup table (.json or .ts)')
+
+    lookup = commands.add_parser('lookup', help='look routing numbers up')
+    lookup.add_argument('routings', nargs='+')
+
+    verify = commands.add_parser('verify', help='check stored routing numbers')
+    verify.add_argument('--input', type=Path, help='one routing number per line')
+    verify.add_argument(
+        '--dsn', default=os.environ.get('DATABASE_URL'), help='default: $DATABASE_URL'
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == 'build':
+            return _build(args)
+        with RoutingTable(args.table) as table:
+            return _lookup(args, table) if args.command == 'lookup' else _verify(args, table)
+    except (SourceError, TableError, OSError) as e:
+        print(f'❌ {e}', file=sys.stderr)
+        return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
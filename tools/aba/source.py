@@ -0,0 +1,76 @@
+"""Readers for the Federal Reserve routing directory.
+
+Two local formats are accepted (nothing is downloaded):
+
+* CSV exports such as ``routing_numbers_06_2022.csv`` (the file
+  ``src/lib/bankLookup.ts`` points at); the routing and name columns are found
+  by header, or given explicitly;
+* the Fed's fixed-width ``FedACHdir.txt`` (routing in columns 1-9, customer
+  name in 36-71).
+"""
+
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+from typing import Iterator, Optional, Sequence, Tuple
+
+ROUTING_HEADERS = ('routing_number', 'routing', 'routing number', 'rtn', 'aba', 'aba_number')
+NAME_HEADERS = ('bank_name', 'customer_name', 'name', 'bank', 'institution', 'institution_name')
+
+_FEDACH_ROUTING = slice(0, 9)
+_FEDACH_NAME = slice(35, 71)
+
+
+class SourceError(ValueError):
+    pass
+
+
+def checksum_ok(routing: str) -> bool:
+    """ABA check: 3, 7, 1 weights over the nine digits must sum to a multiple of 10."""
+    if len(routing) != 9 or not routing.isascii() or not routing.isdigit():
+        return False
+    d = [ord(c) - 48 for c in routing]
+    return (3 * (d[0] + d[3] + d[6]) + 7 * (d[1] + d[4] + d[7]) + d[2] + d[5] + d[8]) % 10 == 0
+
+
+def _find_column(header: Sequence[str], wanted: Optional[str], candidates: Sequence[str]) -> int:
+    names = [h.strip().lower() for h in header]
+    for candidate in (wanted.lower(),) if wanted else candidates:
+        if candidate in names:
+            return names.index(candidate)
+    raise SourceError(f'no column named {wanted or " / ".join(candidates)} in {header}')
+
+
+def read_csv(
+    path: Path, routing_column: Optional[str] = None, name_column: Optional[str] = None
+) -> Iterator[Tuple[str, str]]:
+    with open(path, newline='', encoding='utf-8-sig', errors='replace') as f:
+        records = csv.reader(f)
+        header = next(records, None)
+        if header is None:
+            raise SourceError(f'{path}: empty file')
+        r = _find_column(header, routing_column, ROUTING_HEADERS)
+        n = _find_column(header, name_column, NAME_HEADERS)
+        for record in records:
+            if len(record) > max(r, n):
+                yield record[r].strip(), record[n].strip()
+
+
+def read_fedach(path: Path) -> Iterator[Tuple[str, str]]:
+    with open(path, encoding='latin-1') as f:
+        for line in f:
+            if line.strip():
+                yield line[_FEDACH_ROUTING].strip(), line[_FEDACH_NAME].strip()
+
+
+def read_source(
+    path: Path, routing_column: Optional[str] = None, name_column: Optional[str] = None
+) -> Iterator[Tuple[str, str]]:
+    """Yield ``(routing, bank name)`` pairs, unvalidated, in file order."""
+    path = Path(path)
+    if path.suffix.lower() == '.csv':
+        return read_csv(path, routing_column, name_column)
+    if path.suffix.lower() == '.txt':
+        return read_fedach(path)
+    raise SourceError(f'{path}: expected a .csv export or the fixed-width FedACHdir.txt')
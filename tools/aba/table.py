@@ -0,0 +1,171 @@
+"""Compiled routing table: a sorted fixed-width binary file read through mmap.
+
+Layout (little-endian)::
+
+    header   8s magic, u32 record count, u32 offset of the name pool
+    records  count x (u32 routing, u32 name offset, u16 name length), sorted
+    names    UTF-8 bank names, each stored once
+
+Opening a table maps the file and reads the 16-byte header; nothing else is
+parsed. A lookup is a binary search over the records (``struct.unpack_from``
+on the map); ``lookup_many`` does the same for a whole batch with one numpy
+``searchsorted``.
+"""
+
+from __future__ import annotations
+
+import mmap
+import re
+import struct
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from tools.fsutil import atomic_write_bytes
+
+from .source import checksum_ok
+
+MAGIC = b'WWABA\x00\x00\x01'
+HEADER = struct.Struct('<8sII')
+RECORD = struct.Struct('<IIH')
+DEFAULT_TABLE_PATH = Path('.cache') / 'aba-routing.bin'
+
+_NON_DIGIT = re.compile(r'[^0-9]')
+
+
+class TableError(ValueError):
+    pass
+
+
+def clean_routing(routing: str) -> str:
+    """Digits only, as ``lookupBankByRouting`` strips them."""
+    if len(routing) == 9 and routing.isascii() and routing.isdigit():
+        return routing
+    return _NON_DIGIT.sub('', str(routing))
+
+
+@dataclass
+class BuildStats:
+    records: int = 0
+    invalid: List[str] = field(default_factory=list)
+    duplicates: int = 0
+    table: Dict[str, str] = field(default_factory=dict)
+
+
+def compile_table(pairs: Iterable[Tuple[str, str]]) -> Tuple[bytes, BuildStats]:
+    """Validate ``(routing, name)`` pairs and serialize them; the first name per routing wins."""
+    stats = BuildStats()
+    table = stats.table
+    for raw_routing, name in pairs:
+        routing = clean_routing(raw_routing)
+        # Spreadsheet round-trips drop the leading zero of First District routings.
+        if 0 < len(routing) < 9 and raw_routing.strip().isdigit():
+            routing = routing.zfill(9)
+        if not checksum_ok(routing):
+            stats.invalid.append(raw_routing)
+            continue
+        if routing in table:
+            stats.duplicates += 1
+            continue
+        table[routing] = ' '.join(name.split())
+
+    pool = bytearray()
+    offsets: Dict[str, Tuple[int, int]] = {}
+    records = bytearray()
+    for routing in sorted(table):
+        name = table[routing]
+        if name not in offsets:
+            encoded = name.encode('utf-8')[:0xFFFF]
+            offsets[name] = (len(pool), len(encoded))
+            pool += encoded
+        offset, length = offsets[name]
+        records += RECORD.pack(int(routing), offset, length)
+    stats.records = len(table)
+    header = HEADER.pack(MAGIC, len(table), HEADER.size + len(records))
+    return bytes(header + records + pool), stats
+
+
+def write_table(path: Path, pairs: Iterable[Tuple[str, str]]) -> BuildStats:
+    data, stats = compile_table(pairs)
+    atomic_write_bytes(path, data)
+    return stats
+
+
+class RoutingTable:
+    """Read-only view of a compiled table. Use as a context manager or call ``close()``."""
+
+    def __init__(self, path: Path):
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < HEADER.size:
+            raise TableError(f'{path}: truncated routing table')
+        magic, self.count, self._pool = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise TableError(f'{path}: not a routing table (rebuild: python -m tools.aba build)')
+
+    def __enter__(self) -> 'RoutingTable':
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._map.close()
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _record(self, i: int) -> Tuple[int, int, int]:
+        return RECORD.unpack_from(self._map, HEADER.size + i * RECORD.size)
+
+    def _name(self, offset: int, length: int) -> str:
+        start = self._pool + offset
+        return self._map[start : start + length].decode('utf-8')
+
+    def lookup(self, routing: str) -> Optional[str]:
+        """Bank name for ``routing`` (any formatting), or None; mirrors ``lookupBankByRouting``."""
+        clean = clean_routing(routing)
+        if len(clean) != 9:
+            return None
+        key = int(clean)
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            value, offset, length = self._record(mid)
+            if value < key:
+                lo = mid + 1
+            elif value > key:
+                hi = mid
+            else:
+                return self._name(offset, length)
+        return None
+
+    def lookup_many(self, routings: Sequence[str]) -> List[Optional[str]]:
+        """``lookup`` over a batch: one vectorized search over the mapped records."""
+        import numpy as np
+
+        records = np.frombuffer(
+            self._map,
+            dtype=np.dtype([('routing', '<u4'), ('offset', '<u4'), ('length', '<u2')]),
+            count=self.count,
+            offset=HEADER.size,
+        )
+        cleaned = [clean_routing(r) for r in routings]
+        well_formed = np.fromiter((len(c) == 9 for c in cleaned), dtype=bool, count=len(cleaned))
+        keys = np.array([c if len(c) == 9 else '0' for c in cleaned]).astype(np.uint32)
+        out: List[Optional[str]] = [None] * len(cleaned)
+        if not self.count or not len(keys):
+            return out
+        pos = np.minimum(np.searchsorted(records['routing'], keys), self.count - 1)
+        hits = np.flatnonzero(well_formed & (records['routing'][pos] == keys))
+        found = pos[hits]
+        # Many routings share a bank name: decode each pooled name once.
+        names: Dict[int, str] = {}
+        for i, offset, length in zip(
+            hits.tolist(), records['offset'][found].tolist(), records['length'][found].tolist()
+        ):
+            name = names.get(offset)
+            if name is None:
+                name = names[offset] = self._name(offset, length)
+            out[i] = name
+        return out
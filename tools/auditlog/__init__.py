@@ -0,0 +1,25 @@
+"""Archive audit_logs to compressed, date-partitioned files and trim the table.
+
+    python -m tools.auditlog stats
+    python -m tools.auditlog archive --out /backups/audit_logs --delete
+    python -m tools.auditlog verify --out /backups/audit_logs
+"""
+
+from .archive import COLUMNS, FORMATS, ArchiveError, Manifest, Part, count_rows
+from .export import DayResult, archive, cutoff, export_day
+from .store import AuditStore, StoreError
+
+__all__ = [
+    'ArchiveError',
+    'AuditStore',
+    'COLUMNS',
+    'DayResult',
+    'FORMATS',
+    'Manifest',
+    'Part',
+    'StoreError',
+    'archive',
+    'count_rows',
+    'cutoff',
+    'export_day',
+]
@@ -0,0 +1,150 @@
+"""Command-line entry point: ``python -m tools.auditlog``.
+
+    stats     row count, size, oldest / newest row and rows per month
+    archive   write every UTC day older than the cutoff (--keep-days, default
+              90, or --before) to <out>/date=YYYY-MM-DD/part-NNNN.jsonl.gz
+              (or .parquet); with --delete, then remove the archived rows in
+              small transactions
+    verify    read every part of an archive back and compare with its manifest
+
+Nightly, against the live table:
+
+    python -m tools.auditlog archive --out /backups/audit_logs --delete
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import os
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from .archive import FORMATS, ArchiveError, Manifest, count_rows
+from .export import DayResult, archive, cutoff
+from .store import DEFAULT_BATCH, DEFAULT_DELETE_BATCH, AuditStore, StoreError
+
+
+def _stats(args: argparse.Namespace) -> int:
+    with AuditStore(args.dsn) as store:
+        stats = store.stats()
+    size = stats.table_bytes / 2**20
+    print(f'📋 audit_logs: {stats.rows:,} rows, {size:,.1f} MiB with indexes')
+    if stats.oldest:
+        print(f'   oldest {stats.oldest:%Y-%m-%d %H:%M}, newest {stats.newest:%Y-%m-%d %H:%M}')
+    if stats.undated:
+        print(f'⚠️  {stats.undated:,} rows have no created_at and are never archived')
+    for month, count in stats.per_month:
+        print(f'   {month}  {count:>12,}')
+    return 0
+
+
+def _archive(args: argparse.Namespace) -> int:
+    before = cutoff(args.before, args.keep_days)
+    started = time.perf_counter()
+    totals = {'rows': 0, 'bytes': 0, 'deleted': 0, 'kept': 0}
+
+    def report(result: DayResult) -> None:
+        part = result.part
+        verb = 'archived' if result.exported else 'already archived'
+        line = f'✅ {result.day}: {part.rows:,} rows {verb} in {part.path}'
+        if result.exported:
+            line += f' ({part.bytes / 1024:,.0f} KiB)'
+            totals['rows'] += part.rows
+            totals['bytes'] += part.bytes
+        if result.deleted:
+            line += f', {result.deleted:,} deleted'
+            totals['deleted'] += result.deleted
+        print(line)
+        if result.kept:
+            totals['kept'] += 1
+            print(f'⚠️  {result.day}: kept, {result.kept}')
+
+    print(f'ℹ️  archiving audit_logs before {before:%Y-%m-%d} (UTC) to {args.out}')
+    with AuditStore(args.dsn, lock_timeout=args.lock_timeout) as store:
+        results = archive(
+            store,
+            args.out,
+            before,
+            fmt=args.format,
+            batch=args.batch,
+            delete=args.delete,
+            delete_batch=args.delete_batch,
+            pause=args.pause,
+            on_day=report,
+        )
+    print(
+        f'\n📊 {len(results)} days, {totals["rows"]:,} rows written '
+        f'({totals["bytes"] / 2**20:,.1f} MiB), {totals["deleted"]:,} deleted '
+        f'in {time.perf_counter() - started:.1f}s'
+    )
+    return 1 if totals['kept'] else 0
+
+
+def _verify(args: argparse.Namespace) -> int:
+    manifest = Manifest(args.out)
+    if not manifest.parts:
+        print(f'❌ no manifest with parts in {args.out}', file=sys.stderr)
+        return 2
+    bad = 0
+    for part in manifest.parts.values():
+        path = args.out / part.path
+        found = count_rows(path) if path.exists() else None
+        if found != part.rows:
+            bad += 1
+            state = 'missing' if found is None else f'{found:,} rows'
+            print(f'❌ {part.path}: {state}, manifest says {part.rows:,}')
+    print(f'📊 {len(manifest.parts)} parts, {manifest.rows:,} rows, {bad} mismatched')
+    return 1 if bad else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m tools.auditlog',
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        '--dsn', default=os.environ.get('DATABASE_URL'), help='default: $DATABASE_URL'
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    commands.add_parser('stats', parents=[common], help='size and age of audit_logs')
+    run = commands.add_parser('archive', parents=[common], help='archive (and delete) old rows')
+    run.add_argument('--out', type=Path, required=True, help='archive root directory')
+    cut = run.add_mutually_exclusive_group()
+    cut.add_argument('--keep-days', type=int, default=90, help='days kept in the table')
+    cut.add_argument(
+        '--before', type=dt.date.fromisoformat, metavar='YYYY-MM-DD', help='archive before this day'
+    )
+    run.add_argument('--format', choices=sorted(FORMATS), default='jsonl')
+    run.add_argument('--batch', type=int, default=DEFAULT_BATCH, help='rows per cursor fetch')
+    run.add_argument('--delete', action='store_true', help='delete the rows once archived')
+    run.add_argument(
+        '--delete-batch', type=int, default=DEFAULT_DELETE_BATCH, help='rows per delete transaction'
+    )
+    run.add_argument('--pause', type=float, default=0.0, help='seconds between delete batches')
+    run.add_argument('--lock-timeout', default='2s', help='per delete batch (default: 2s)')
+    verify = commands.add_parser('verify', help='check an archive against its manifest')
+    verify.add_argument('--out', type=Path, required=True, help='archive root directory')
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == 'verify':
+            return _verify(args)
+        if not args.dsn:
+            print('❌ pass --dsn (or set $DATABASE_URL)', file=sys.stderr)
+            return 2
+        if args.command == 'stats':
+            return _stats(args)
+        return _archive(args)
+    except (ArchiveError, StoreError, OSError, ValueError) as e:
+        print(f'❌ {e}', file=sys.stderr)
+        return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
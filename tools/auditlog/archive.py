@@ -0,0 +1,217 @@
+"""Date-partitioned archive files for audit_logs rows.
+
+One directory per UTC day, Hive style, so DuckDB, Spark or pandas read the
+archive as one dataset partitioned by ``date``:
+
+    <root>/date=2026-01-05/part-0000.jsonl.gz
+    <root>/date=2026-01-05/part-0001.jsonl.gz   (a later run, never overwritten)
+    <root>/manifest.json
+
+``jsonl`` is gzip'd JSON Lines with ``old_data`` / ``new_data`` embedded as
+the JSON Postgres returned; ``parquet`` (needs pyarrow) keeps them as text
+columns and compresses with zstd. Both are written a batch at a time to a
+temp file that is fsync'd and renamed into place, so a crash leaves either a
+complete part or none.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import gzip
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, IO, List, Optional, Sequence
+
+from tools.fsutil import atomic_write_text
+
+# Column order of the rows the store yields; old_data / new_data are JSON text.
+COLUMNS = (
+    'id',
+    'user_id',
+    'action',
+    'entity_type',
+    'entity_id',
+    'old_data',
+    'new_data',
+    'details',
+    'ip_address',
+    'created_at',
+)
+_JSON_COLUMNS = frozenset(('old_data', 'new_data'))
+MANIFEST = 'manifest.json'
+MANIFEST_VERSION = 1
+
+Row = Sequence[Any]
+
+
+class ArchiveError(RuntimeError):
+    pass
+
+
+@dataclass
+class Part:
+    day: str  # YYYY-MM-DD (UTC)
+    path: str  # relative to the archive root
+    rows: int
+    bytes: int
+    first: str  # created_at of the first row, ISO 8601
+    last: str
+
+
+def _iso(value: Any) -> Optional[str]:
+    return value.isoformat() if isinstance(value, (dt.datetime, dt.date)) else value
+
+
+class _Writer:
+    extension = ''
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.rows = 0
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=f'.{path.name}.', dir=path.parent)
+        self.tmp = Path(tmp)
+        self.file: IO[bytes] = os.fdopen(fd, 'wb')
+
+    def write(self, rows: List[Row]) -> None:
+        raise NotImplementedError
+
+    def _close(self) -> None:
+        pass
+
+    def commit(self) -> int:
+        """Flush, fsync and rename into place; the size in bytes."""
+        self._close()
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.file.close()
+        os.replace(self.tmp, self.path)
+        return self.path.stat().st_size
+
+    def abort(self) -> None:
+        self.file.close()
+        self.tmp.unlink(missing_ok=True)
+
+
+class JsonlWriter(_Writer):
+    extension = '.jsonl.gz'
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        # mtime=0: the same rows always compress to the same bytes.
+        self.gzip = gzip.GzipFile(fileobj=self.file, mode='wb', compresslevel=6, mtime=0)
+
+    def write(self, rows: List[Row]) -> None:
+        lines = []
+        for row in rows:
+            fields = []
+            for name, value in zip(COLUMNS, row):
+                if value is None:
+                    text = 'null'
+                elif name in _JSON_COLUMNS:
+                    text = value  # already JSON, as Postgres printed it
+                else:
+                    text = json.dumps(_iso(value) if name == 'created_at' else str(value))
+                fields.append(f'"{name}":{text}')
+            lines.append('{' + ','.join(fields) + '}\n')
+        self.gzip.write(''.join(lines).encode('utf-8'))
+        self.rows += len(rows)
+
+    def _close(self) -> None:
+        self.gzip.close()
+
+
+class ParquetWriter(_Writer):
+    extension = '.parquet'
+
+    def __init__(self, path: Path):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ArchiveError(
+                'pyarrow is required for --format parquet (pip install pyarrow)'
+            ) from None
+        super().__init__(path)
+        self._pa = pa
+        self.schema = pa.schema(
+            [(name, pa.string()) for name in COLUMNS[:-1]]
+            + [('created_at', pa.timestamp('us', tz='UTC'))]
+        )
+        self.writer = pq.ParquetWriter(self.file, self.schema, compression='zstd')
+
+    def write(self, rows: List[Row]) -> None:
+        columns = list(zip(*rows))
+        arrays = [
+            self._pa.array(
+                [None if v is None else str(v) for v in values]
+                if name != 'created_at'
+                else list(values),
+                type=self.schema.field(name).type,
+            )
+            for name, values in zip(COLUMNS, columns)
+        ]
+        # One row group per batch: the writer holds no more than a batch.
+        self.writer.write_table(self._pa.Table.from_arrays(arrays, schema=self.schema))
+        self.rows += len(rows)
+
+    def _close(self) -> None:
+        self.writer.close()
+
+
+FORMATS = {'jsonl': JsonlWriter, 'parquet': ParquetWriter}
+
+
+def next_part(root: Path, day: str, fmt: str) -> Path:
+    """The first unused ``part-NNNN`` of ``day``: runs add parts, they never overwrite."""
+    directory = root / f'date={day}'
+    extension = FORMATS[fmt].extension
+    number = 0
+    while (directory / f'part-{number:04d}{extension}').exists():
+        number += 1
+    return directory / f'part-{number:04d}{extension}'
+
+
+def count_rows(path: Path) -> int:
+    """Rows in an archive part, read back from disk (streamed, constant memory)."""
+    if path.name.endswith(JsonlWriter.extension):
+        with gzip.open(path, 'rb') as f:
+            return sum(1 for _ in f)
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ArchiveError('pyarrow is required to read parquet parts (pip install pyarrow)')
+    return pq.ParquetFile(path).metadata.num_rows
+
+
+class Manifest:
+    """``manifest.json``: every part written, with its row count and time range."""
+
+    def __init__(self, root: Path):
+        self.path = root / MANIFEST
+        self.parts: Dict[str, Part] = {}
+        try:
+            raw = json.loads(self.path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return
+        except ValueError as e:
+            raise ArchiveError(f'{self.path}: {e}') from None
+        if raw.get('version') != MANIFEST_VERSION:
+            raise ArchiveError(f'{self.path}: version {raw.get("version")} is not supported')
+        self.parts = {p['path']: Part(**p) for p in raw['parts']}
+
+    def add(self, part: Part) -> None:
+        self.parts[part.path] = part
+        payload = {
+            'version': MANIFEST_VERSION,
+            'columns': list(COLUMNS),
+            'parts': [asdict(p) for _, p in sorted(self.parts.items())],
+        }
+        atomic_write_text(self.path, json.dumps(payload, indent=2) + '\n')
+
+    @property
+    def rows(self) -> int:
+        return sum(p.rows for p in self.parts.values())
@@ -0,0 +1,119 @@
+"""Archive audit_logs older than a cutoff, day by day, and optionally delete them.
+
+Per UTC day: stream the rows into a new part, read the part back to count
+its rows, record it in the manifest, and only then delete, and only if the
+table still holds exactly the rows archived (same count, first and last
+``created_at``); otherwise the day is kept and reported. A day already in
+the manifest with the same rows is not exported again, so a run interrupted
+between archiving and deleting picks up where it stopped.
+
+Memory is one batch whatever the table size; locks are one delete batch.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Optional
+
+from .archive import FORMATS, ArchiveError, Manifest, Part, count_rows, next_part
+from .store import DEFAULT_BATCH, DEFAULT_DELETE_BATCH, AuditStore, day_range
+
+_EPOCH = dt.datetime(1970, 1, 1, tzinfo=dt.timezone.utc)
+
+
+@dataclass
+class DayResult:
+    day: str
+    part: Part
+    exported: bool  # False when an identical part was already archived
+    deleted: int = 0
+    kept: Optional[str] = None  # why the rows were not deleted
+
+
+def cutoff(
+    before: Optional[dt.date], keep_days: int, today: Optional[dt.date] = None
+) -> dt.datetime:
+    """Midnight UTC of ``before``, or of ``keep_days`` before today."""
+    today = today or dt.datetime.now(dt.timezone.utc).date()
+    return day_range(before or today - dt.timedelta(keep_days))[0]
+
+
+def _iso(value: Optional[dt.datetime]) -> str:
+    return value.isoformat() if value else ''
+
+
+def export_day(
+    store: AuditStore, root: Path, day: dt.date, fmt: str, batch: int = DEFAULT_BATCH
+) -> Optional[Part]:
+    """Write ``day`` to a new part; None when the day has no rows."""
+    lo, hi = day_range(day)
+    writer = FORMATS[fmt](next_part(root, day.isoformat(), fmt))
+    first = last = None
+    try:
+        for rows in store.stream(lo, hi, batch):
+            writer.write(rows)
+            first = first or rows[0][-1]
+            last = rows[-1][-1]
+        if not writer.rows:
+            writer.abort()
+            return None
+        size = writer.commit()
+    except BaseException:
+        writer.abort()
+        raise
+    on_disk = count_rows(writer.path)
+    if on_disk != writer.rows:
+        raise ArchiveError(f'{writer.path}: {on_disk} rows read back, {writer.rows} written')
+    path = writer.path.relative_to(root).as_posix()
+    return Part(day.isoformat(), path, writer.rows, size, _iso(first), _iso(last))
+
+
+def archive(
+    store: AuditStore,
+    root: Path,
+    before: dt.datetime,
+    fmt: str = 'jsonl',
+    batch: int = DEFAULT_BATCH,
+    delete: bool = False,
+    delete_batch: int = DEFAULT_DELETE_BATCH,
+    pause: float = 0.0,
+    on_day: Optional[Callable[[DayResult], None]] = None,
+) -> List[DayResult]:
+    """Archive every day before ``before`` (midnight UTC), oldest first."""
+    manifest = Manifest(root)
+    results: List[DayResult] = []
+    after = _EPOCH
+    while True:
+        day = store.next_day(after, before)
+        if day is None:
+            return results
+        lo, hi = day_range(day)
+        after = hi
+        rows, first, last = store.span(lo, hi)
+        archived = next(
+            (
+                p
+                for p in manifest.parts.values()
+                if p.day == day.isoformat()
+                and (p.rows, p.first, p.last) == (rows, _iso(first), _iso(last))
+                and (root / p.path).exists()
+            ),
+            None,
+        )
+        part = archived or export_day(store, root, day, fmt, batch)
+        if part is None:
+            continue
+        if archived is None:
+            manifest.add(part)
+        result = DayResult(day.isoformat(), part, exported=archived is None)
+        if delete:
+            now = store.span(lo, hi)
+            if (now[0], _iso(now[1]), _iso(now[2])) != (part.rows, part.first, part.last):
+                result.kept = f'{now[0]} rows in the table, {part.rows} archived: changed since'
+            else:
+                result.deleted = store.delete(lo, hi, delete_batch, pause)
+        results.append(result)
+        if on_day:
+            on_day(result)
@@ -0,0 +1,153 @@
+"""Reading and deleting audit_logs one UTC day at a time, without long locks.
+
+A day is read through a server-side cursor in its own short ``REPEATABLE
+READ`` transaction, ``batch`` rows per fetch, so neither side holds more than
+a batch. Rows leave the table in keyset order, ``delete_batch`` rows per
+committed transaction under a ``lock_timeout``: a row lock it cannot get
+quickly fails the run instead of leaving the compactor queued, holding the
+locks it already took, in front of the app's writes.
+
+Rows are ordered by ``(created_at, id)``; ``idx_audit_logs_created_at`` serves
+the day ranges. Rows whose ``created_at`` is NULL are never touched.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from .archive import COLUMNS, Row
+
+DEFAULT_BATCH = 10_000
+DEFAULT_DELETE_BATCH = 5_000
+TABLE = 'public.audit_logs'
+
+_SELECT = ', '.join(f'{c}::text' if c in ('old_data', 'new_data') else c for c in COLUMNS)
+
+
+class StoreError(RuntimeError):
+    pass
+
+
+@dataclass
+class Stats:
+    rows: int
+    undated: int
+    oldest: Optional[dt.datetime]
+    newest: Optional[dt.datetime]
+    table_bytes: int
+    per_month: List[Tuple[str, int]]
+
+
+def day_range(day: dt.date) -> Tuple[dt.datetime, dt.datetime]:
+    start = dt.datetime(day.year, day.month, day.day, tzinfo=dt.timezone.utc)
+    return start, start + dt.timedelta(days=1)
+
+
+class AuditStore:
+    """Use as a context manager; one autocommit connection in UTC."""
+
+    def __init__(self, dsn: str, lock_timeout: str = '2s'):
+        try:
+            import psycopg
+        except ImportError:
+            raise StoreError(
+                'psycopg is required to read audit_logs (pip install "psycopg[binary]")'
+            ) from None
+        self._psycopg = psycopg
+        try:
+            self.conn = psycopg.connect(dsn, autocommit=True)
+        except psycopg.OperationalError as e:
+            raise StoreError(f'could not connect to Postgres: {e}') from None
+        self.conn.execute("SET TIME ZONE 'UTC'")
+        self.lock_timeout = lock_timeout
+
+    def __enter__(self) -> 'AuditStore':
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.conn.close()
+
+    def stats(self) -> Stats:
+        rows, undated, oldest, newest = self.conn.execute(
+            f'SELECT count(*), count(*) FILTER (WHERE created_at IS NULL),'
+            f' min(created_at), max(created_at) FROM {TABLE}'
+        ).fetchone()
+        size = self.conn.execute(f"SELECT pg_total_relation_size('{TABLE}')").fetchone()[0]
+        per_month = self.conn.execute(
+            f"SELECT to_char(date_trunc('month', created_at), 'YYYY-MM'), count(*)"
+            f' FROM {TABLE} WHERE created_at IS NOT NULL GROUP BY 1 ORDER BY 1'
+        ).fetchall()
+        return Stats(rows, undated, oldest, newest, size, per_month)
+
+    def next_day(self, after: dt.datetime, before: dt.datetime) -> Optional[dt.date]:
+        """The first UTC day at or after ``after`` with rows older than ``before``."""
+        row = self.conn.execute(
+            f'SELECT min(created_at) FROM {TABLE} WHERE created_at >= %s AND created_at < %s',
+            (after, before),
+        ).fetchone()
+        return row[0].date() if row and row[0] is not None else None
+
+    def span(
+        self, lo: dt.datetime, hi: dt.datetime
+    ) -> Tuple[int, Optional[dt.datetime], Optional[dt.datetime]]:
+        """``(rows, first created_at, last created_at)`` of ``lo <= created_at < hi``."""
+        return self.conn.execute(
+            f'SELECT count(*), min(created_at), max(created_at) FROM {TABLE}'
+            ' WHERE created_at >= %s AND created_at < %s',
+            (lo, hi),
+        ).fetchone()
+
+    def stream(self, lo: dt.datetime, hi: dt.datetime, batch: int) -> Iterator[List[Row]]:
+        """Rows with ``lo <= created_at < hi`` by ``(created_at, id)``, ``batch`` at a time."""
+        try:
+            with self.conn.transaction():
+                self.conn.execute('SET TRANSACTION ISOLATION LEVEL REPEATABLE READ READ ONLY')
+                with self.conn.cursor(name='auditlog_export') as cur:
+                    cur.itersize = batch
+                    cur.execute(
+                        f'SELECT {_SELECT} FROM {TABLE}'
+                        ' WHERE created_at >= %s AND created_at < %s ORDER BY created_at, id',
+                        (lo, hi),
+                    )
+                    while True:
+                        rows = cur.fetchmany(batch)
+                        if not rows:
+                            return
+                        yield rows
+        except self._psycopg.Error as e:
+            raise StoreError(f'reading audit_logs failed: {e}') from None
+
+    def delete(
+        self,
+        lo: dt.datetime,
+        hi: dt.datetime,
+        batch: int,
+        pause: float = 0.0,
+        on_batch: Optional[Callable[[int, float], None]] = None,
+    ) -> int:
+        """Delete ``lo <= created_at < hi``, ``batch`` rows per committed transaction."""
+        deleted = 0
+        try:
+            while True:
+                started = time.perf_counter()
+                with self.conn.transaction():
+                    self.conn.execute(f"SET LOCAL lock_timeout = '{self.lock_timeout}'")
+                    cur = self.conn.execute(
+                        f'DELETE FROM {TABLE} WHERE id IN ('
+                        f' SELECT id FROM {TABLE} WHERE created_at >= %s AND created_at < %s'
+                        ' ORDER BY created_at, id LIMIT %s)',
+                        (lo, hi, batch),
+                    )
+                    count = max(cur.rowcount, 0)
+                deleted += count
+                if on_batch:
+                    on_batch(count, time.perf_counter() - started)
+                if count < batch:
+                    return deleted
+                if pause:
+                    time.sleep(pause)
+        except self._psycopg.Error as e:
+            raise StoreError(f'deleting archived rows failed after {deleted}: {e}') from None
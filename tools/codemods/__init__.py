@@ -0,0 +1,27 @@
+"""Codemods: named source transforms applied to the tree in a single pass.
+
+Usage::
+
+    python -m tools.codemods --list
+    python -m tools.codemods fix_padding apply_pageheader
+    python -m tools.codemods --dry-run > codemods.patch
+    python -m tools.codemods --trace run.json --chrome-trace run.trace.json --profile run.pstats
+"""
+
+from . import transforms  # noqa: F401  (registers the built-in transforms)
+from .registry import Transform, available_transforms, get_transform, register
+from .runner import FileResult, RunResult, RunSummary, iter_run, run
+from .trace import Trace
+
+__all__ = [
+    'FileResult',
+    'RunResult',
+    'RunSummary',
+    'Trace',
+    'Transform',
+    'available_transforms',
+    'get_transform',
+    'iter_run',
+    'register',
+    'run',
+]
@@ -0,0 +1,132 @@
+"""Command-line entry point: ``python -m tools.codemods``.
+
+With ``--dry-run`` no source file and no run manifest is written (only the
+cached src listing in .cache/file-index.json is refreshed): the unified diff
+of each changed file is streamed to stdout as soon as its worker finishes
+(pipe it to ``git apply`` to apply it later), and status lines go to stderr.
+
+To see where a sweep spends its time::
+
+    python -m tools.codemods --trace run.json --chrome-trace run.trace.json --profile run.pstats
+
+``--trace`` writes per-transform and per-file timings, scanner rule hits,
+bytes and cache hit rates; ``--chrome-trace`` the same run as a timeline for
+chrome://tracing or Perfetto; ``--profile`` runs every file under cProfile
+and merges the workers' stats into one file.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional, TextIO
+
+from tools.fileindex import FileIndex
+from tools.paths import REPO_ROOT
+
+from . import available_transforms, iter_run
+from .cache import MANIFEST_PATH, Manifest
+from .runner import RunSummary
+from .trace import Trace
+
+
+def _report(trace: Trace, summary: RunSummary, args: argparse.Namespace, status: TextIO) -> None:
+    total = sum(summary.transform_seconds.values()) or 1.0
+    print(
+        f'\n📋 cache hit rate {summary.cache_hit_rate:.0%} '
+        f'({summary.stat_hits} by stat, {summary.digest_hits} by content hash)',
+        file=status,
+    )
+    for name, seconds in sorted(summary.transform_seconds.items(), key=lambda kv: -kv[1]):
+        hits = sum(n for rule, n in summary.matches.items() if rule.startswith(f'{name}/'))
+        print(
+            f'   {name:<22} {seconds:8.3f}s {seconds / total:6.1%}  '
+            f'{summary.transform_files.get(name, 0):>5} files  '
+            f'{summary.transform_changed.get(name, 0):>5} changed  {hits:>6} rule hits',
+            file=status,
+        )
+    if args.trace:
+        trace.write(args.trace, summary)
+        print(f'✅ trace: {args.trace}', file=status)
+    if args.chrome_trace:
+        trace.write_chrome(args.chrome_trace)
+        print(f'✅ Chrome trace: {args.chrome_trace}', file=status)
+    if args.profile:
+        if trace.write_profile(args.profile):
+            print(f'✅ profile: {args.profile}', file=status)
+            status.write(trace.top())
+        else:
+            print('ℹ️  no file needed processing, nothing was profiled', file=status)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m tools.codemods',
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('transforms', nargs='*', help='transform names (default: all)')
+    parser.add_argument('--list', action='store_true', help='list registered transforms')
+    parser.add_argument('--root', type=Path, default=REPO_ROOT, help='repository root')
+    parser.add_argument('--dry-run', action='store_true', help='print diffs instead of writing')
+    parser.add_argument('--summary', type=Path, help='write a JSON run summary to this file')
+    parser.add_argument('--no-cache', action='store_true', help='ignore and do not update the manifest')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--trace', type=Path, help='write a JSON trace (per file and transform)')
+    parser.add_argument('--chrome-trace', type=Path, help='write a Chrome Trace Event file')
+    parser.add_argument('--profile', type=Path, help='cProfile every file; write the merged .pstats')
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for t in available_transforms():
+            print(f'{t.name:<22} v{t.version}  {t.description}')
+        return 0
+
+    status = sys.stderr if args.dry_run else sys.stdout
+    manifest = None if args.no_cache else Manifest(args.root / MANIFEST_PATH)
+    summary = RunSummary()
+    trace = Trace() if args.trace or args.chrome_trace or args.profile else None
+    started, clock = time.time(), time.perf_counter()
+    index = FileIndex(args.root).refresh()
+    if trace is not None:
+        elapsed = time.perf_counter() - clock
+        trace.phase('index', started, elapsed, dirs=len(index.dirs), relisted=len(index.relisted))
+    for f in iter_run(
+        args.transforms or None,
+        root=args.root,
+        jobs=args.jobs,
+        write=not args.dry_run,
+        diff=args.dry_run,
+        manifest=manifest,
+        index=index,
+        profile=args.profile is not None,
+    ):
+        summary.add(f)
+        if trace is not None:
+            trace.add(f)
+        if f.error:
+            print(f'❌ {f.path}: {f.error}', file=status)
+        elif f.diff:
+            sys.stdout.write(f.diff)
+            sys.stdout.flush()
+        elif f.changed:
+            print(f'✅ {f.path} ({", ".join(f.applied)})', file=status)
+
+    verb = 'would change' if args.dry_run else 'updated'
+    print(
+        f'\n📊 {summary.scanned} files scanned, {summary.changed} {verb}, '
+        f'{summary.cached} unchanged since last run, in {summary.elapsed:.2f}s',
+        file=status,
+    )
+    if args.summary:
+        args.summary.write_text(json.dumps(summary.as_dict(), indent=2) + '\n', encoding='utf-8')
+    if trace is not None:
+        _report(trace, summary, args, status)
+    return 1 if summary.errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""Micro-benchmark: single-pass scanner vs. the legacy multi-pass rewrites.
+
+Runs ``apply_pageheader`` + ``fix_padding`` over synthetic 5k-line pages with
+both implementations, checks that they produce identical output and exits
+non-zero if the scanner is slower than the legacy code::
+
+    python -m tools.codemods.bench [--lines 5000] [--repeat 20] [--max-ratio 1.0]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import sys
+import time
+from typing import Callable, List, Optional
+
+from .transforms.padding import fix_padding
+from .transforms.pageheader import apply_pageheader
+
+
+# Reference implementation, as it ran in apply_pageheader_all.py / fix_padding.py.
+def legacy_apply_pageheader(content: str) -> str:
+    if "import PageHeader from '@/components/ui/PageHeader'" not in content:
+        imports = list(re.finditer(r"(import .+ from ['\"].*['\"];?\n)", content))
+        if imports:
+            insert_pos = imports[-1].end()
+            content = (
+                content[:insert_pos]
+                + "import PageHeader from '@/components/ui/PageHeader';\n"
+                + content[insert_pos:]
+            )
+    content = re.sub(r"padding:\s*['\"]0['\"]", "padding: '40px'", content)
+    content = re.sub(r"padding:\s*['\"]32px['\"]", "padding: '40px'", content)
+    if "background: '#f8fafc'" not in content and "minHeight: '100vh'" in content:
+        content = re.sub(r"(minHeight:\s*['\"]100vh['\"])", r"\1, background: '#f8fafc'", content)
+    return content
+
+
+def legacy_fix_padding(content: str) -> str:
+    content = re.sub(r"padding:\s*'0'", "padding: '40px'", content)
+    return re.sub(r"padding:\s*'32px'", "padding: '40px'", content)
+
+
+_FILLER_LINES = (
+    "          <div style={{ display: 'flex', alignItems: 'center', gap: '12px' }}>",
+    "            <span style={{ fontSize: '13px', color: '#64748b' }}>{item.name}</span>",
+    "          <td style={{ padding: '16px 24px', color: '#475569' }}>{item.price}</td>",
+    "      {filteredItems.map(item => (",
+    "          </div>",
+    "  const [loading, setLoading] = useState(true);",
+)
+_REWRITTEN_LINES = (
+    "        <div style={{ padding: '32px', borderRadius: '24px', background: 'white' }}>",
+    "        <section style={{ padding: '0', border: '1px solid #e2e8f0' }}>",
+)
+# Share of lines the rewrites touch; ~2% across src/app/[locale]/dashboard today.
+_REWRITE_DENSITY = 0.02
+
+
+def synthetic_page(lines: int, seed: int = 0) -> str:
+    """A page.tsx-shaped file: an import block, a root container, then filler JSX."""
+    rng = random.Random(seed)
+    header = [
+        "'use client';",
+        '',
+        "import { useEffect, useState } from 'react';",
+        "import { useTranslations } from 'next-intl';",
+        "import { supabase } from '@/lib/supabase';",
+        "import ColumnFilter from '@/components/ui/ColumnFilter';",
+        '',
+        'export default function Page() {',
+        '  return (',
+        "    <div style={{ padding: '32px', minHeight: '100vh' }}>",
+    ]
+    body = [
+        rng.choice(_REWRITTEN_LINES if rng.random() < _REWRITE_DENSITY else _FILLER_LINES)
+        for _ in range(max(0, lines - len(header) - 3))
+    ]
+    return '\n'.join(header + body + ['    </div>', '  );', '}']) + '\n'
+
+
+def _best_of(fn: Callable[[str], str], pages: List[str], repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for page in pages:
+            fn(page)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m tools.codemods.bench', description=__doc__)
+    parser.add_argument('--lines', type=int, default=5000, help='lines per synthetic page')
+    parser.add_argument('--pages', type=int, default=10, help='synthetic pages per round')
+    parser.add_argument('--repeat', type=int, default=20, help='rounds; the best one is kept')
+    parser.add_argument(
+        '--max-ratio', type=float, default=1.0, help='fail if scanner/legacy time exceeds this'
+    )
+    args = parser.parse_args(argv)
+
+    path = 'src/app/[locale]/dashboard/users/page.tsx'
+    pages = [synthetic_page(args.lines, seed) for seed in range(args.pages)]
+
+    def legacy(content: str) -> str:
+        return legacy_fix_padding(legacy_apply_pageheader(content))
+
+    def scanner(content: str) -> str:
+        return fix_padding(path, apply_pageheader(path, content))
+
+    for page in pages:
+        if legacy(page) != scanner(page):
+            print('❌ Scanner output differs from the legacy rewrite')
+            return 1
+
+    legacy_time = _best_of(legacy, pages, args.repeat)
+    scanner_time = _best_of(scanner, pages, args.repeat)
+    ratio = scanner_time / legacy_time
+    per_page = 1000 / args.pages
+    print(f'legacy multi-pass : {legacy_time * per_page:8.3f} ms/page')
+    print(f'single-pass       : {scanner_time * per_page:8.3f} ms/page  ({ratio:.2f}x)')
+    if ratio > args.max_ratio:
+        print(f'❌ Regression: scanner is {ratio:.2f}x the legacy time (limit {args.max_ratio:.2f}x)')
+        return 1
+    print('✅ OK')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
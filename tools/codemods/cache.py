@@ -0,0 +1,83 @@
+"""Persistent manifest of files the codemods have already processed.
+
+Each entry records a file's ``(mtime_ns, size, content hash)`` and the version
+of every transform whose output it already is. A file whose stat matches and
+whose transforms are all up to date is skipped without being opened; a file
+whose stat changed but whose content hash did not is skipped after one read.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, Mapping, Optional
+
+from tools.fsutil import atomic_write_text
+from tools.paths import REPO_ROOT
+
+MANIFEST_VERSION = 1
+MANIFEST_PATH = Path('.cache') / 'codemods-manifest.json'
+
+
+@dataclass
+class Entry:
+    mtime_ns: int
+    size: int
+    digest: str
+    transforms: Dict[str, int] = field(default_factory=dict)
+
+    def same_stat(self, st: os.stat_result) -> bool:
+        return self.mtime_ns == st.st_mtime_ns and self.size == st.st_size
+
+    def covers(self, versions: Mapping[str, int]) -> bool:
+        return all(self.transforms.get(name) == v for name, v in versions.items())
+
+
+class Manifest:
+    """On-disk ``path -> Entry`` map, saved atomically."""
+
+    def __init__(self, path: Path = REPO_ROOT / MANIFEST_PATH):
+        self.path = Path(path)
+        self.entries: Dict[str, Entry] = {}
+        self.dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                raw = json.load(f)
+        except (OSError, ValueError):
+            return
+        if raw.get('version') != MANIFEST_VERSION:
+            return
+        self.entries = {path: Entry(**entry) for path, entry in raw.get('files', {}).items()}
+
+    def get(self, path: str) -> Optional[Entry]:
+        return self.entries.get(path)
+
+    def record(
+        self, path: str, mtime_ns: int, size: int, digest: str, versions: Mapping[str, int]
+    ) -> None:
+        entry = self.entries.get(path)
+        if entry is not None and entry.digest == digest:
+            transforms = {**entry.transforms, **versions}
+        else:
+            transforms = dict(versions)
+        self.entries[path] = Entry(mtime_ns, size, digest, transforms)
+        self.dirty = True
+
+    def forget(self, path: str) -> None:
+        if self.entries.pop(path, None) is not None:
+            self.dirty = True
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        payload = {
+            'version': MANIFEST_VERSION,
+            'files': {path: asdict(e) for path, e in sorted(self.entries.items())},
+        }
+        atomic_write_text(self.path, json.dumps(payload, separators=(',', ':')))
+        self.dirty = False
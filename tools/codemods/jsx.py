@@ -0,0 +1,473 @@
+"""Lightweight JSX-aware tokenizer and structural matcher for TSX sources.
+
+This is not a TypeScript parser: code is skimmed only far enough to skip
+strings, template literals, comments and regex literals and to recognise
+where JSX starts. Inside JSX, tags (with their attributes) and ``{...}``
+expression containers are recorded as tokens carrying source offsets, and
+open/close tags are paired into ``Element``s.
+
+Edits are expressed against those offsets and applied in one linear splice,
+so any number of patches on a file share a single tokenization; the token
+stream itself is memoized per source text::
+
+    doc = JsxDocument(source)
+    price = doc.find('th', text="t('table.price')")
+    doc.insert_after(price, '<th>...</th>')
+    new_source = doc.render()
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+
+class JsxSyntaxError(ValueError):
+    pass
+
+
+class _NotJsx(Exception):
+    """A ``<`` that turned out to be a comparison or a type argument."""
+
+
+@dataclass(frozen=True)
+class Attr:
+    name: str
+    start: int
+    end: int
+    # Raw source of the value ('"x"', "{expr}"), or None for a bare boolean attribute.
+    value: Optional[str] = None
+    value_start: int = -1
+    value_end: int = -1
+
+
+@dataclass(frozen=True)
+class Tag:
+    kind: str  # 'open' | 'close' | 'self'
+    name: str
+    start: int
+    end: int
+    attrs: Tuple[Attr, ...] = ()
+
+
+@dataclass(frozen=True)
+class Expr:
+    """A ``{...}`` expression container among JSX children."""
+
+    start: int
+    end: int
+
+
+Token = Union[Tag, Expr]
+
+
+@dataclass
+class Element:
+    name: str
+    open: Tag
+    close: Optional[Tag]
+    parent: Optional['Element'] = field(default=None, repr=False)
+
+    @property
+    def start(self) -> int:
+        return self.open.start
+
+    @property
+    def end(self) -> int:
+        return self.close.end if self.close else self.open.end
+
+    @property
+    def inner_start(self) -> int:
+        return self.open.end
+
+    @property
+    def inner_end(self) -> int:
+        return self.close.start if self.close else self.open.end
+
+    def attr(self, name: str) -> Optional[Attr]:
+        for attr in self.open.attrs:
+            if attr.name == name:
+                return attr
+        return None
+
+    def contains(self, other: Union['Element', Expr]) -> bool:
+        return self.start <= other.start and other.end <= self.end
+
+
+_CODE_TOKEN = re.compile(
+    r"""
+     (?P<ws>\s+)
+    |(?P<comment>//[^\n]*|/\*.*?(?:\*/|\Z))
+    |(?P<ident>[A-Za-z_$][\w$]*)
+    |(?P<num>\d[\w.]*)
+    |(?P<str>'(?:[^'\\\n]|\\.)*'|"(?:[^"\\\n]|\\.)*")
+    |(?P<punct>.)
+    """,
+    re.S | re.X,
+)
+_TAG_NAME = re.compile(r'[A-Za-z_$][\w$.:-]*')
+_ATTR_NAME = re.compile(r'[A-Za-z_$][\w$:-]*')
+_WS = re.compile(r'\s*')
+_CHILD_STOP = re.compile(r'[<{]')
+_TEMPLATE_STOP = re.compile(r'[`\\]|\$\{')
+
+# After these, a ``<`` opens JSX and a ``/`` opens a regex literal.
+_EXPR_START_PUNCT = frozenset('(,=?:{}[!&|;>+-*%~^')
+_EXPR_START_WORDS = frozenset({'return', 'yield', 'default', 'case', 'else', 'in', 'of', 'typeof'})
+
+
+class _Lexer:
+    def __init__(self, source: str):
+        self.src = source
+        self.n = len(source)
+        self.pos = 0
+        self.tokens: List[Token] = []
+
+    def error(self, message: str) -> JsxSyntaxError:
+        line = self.src.count('\n', 0, self.pos) + 1
+        return JsxSyntaxError(f'line {line}: {message}')
+
+    # -- code -------------------------------------------------------------
+
+    def code(self, until_brace: bool) -> None:
+        """Skim code; with ``until_brace`` stop at (without consuming) the unmatched ``}``."""
+        src = self.src
+        depth = 0
+        prev = ''  # last significant punctuation, or 'a' after an identifier/number
+        word = ''
+        while self.pos < self.n:
+            m = _CODE_TOKEN.match(src, self.pos)
+            kind = m.lastgroup
+            if kind in ('ws', 'comment'):
+                self.pos = m.end()
+                continue
+            if kind in ('ident', 'num'):
+                self.pos = m.end()
+                prev, word = 'a', m.group()
+                continue
+            if kind == 'str':
+                self.pos = m.end()
+                prev, word = 'a', ''
+                continue
+
+            ch = m.group()
+            expr_start = prev == '' or prev in _EXPR_START_PUNCT or (
+                prev == 'a' and word in _EXPR_START_WORDS
+            )
+            if ch == '{':
+                depth += 1
+            elif ch == '}':
+                if depth == 0 and until_brace:
+                    return
+                depth -= 1
+            elif ch == '`':
+                self.template()
+                prev, word = 'a', ''
+                continue
+            elif ch == '/' and expr_start:
+                self.regex_literal()
+                prev, word = 'a', ''
+                continue
+            elif ch == '<' and expr_start and self._looks_like_tag():
+                mark, count = self.pos, len(self.tokens)
+                try:
+                    self.element()
+                    prev, word = 'a', ''
+                    continue
+                except _NotJsx:
+                    self.pos, self.tokens[count:] = mark, []
+            self.pos = m.end()
+            prev, word = ch, ''
+        if until_brace:
+            raise self.error('unterminated { expression')
+
+    def _looks_like_tag(self) -> bool:
+        nxt = self.src[self.pos + 1 : self.pos + 2]
+        return nxt == '>' or nxt.isalpha() or nxt in ('_', '$')
+
+    def template(self) -> None:
+        self.pos += 1  # opening backtick
+        while True:
+            m = _TEMPLATE_STOP.search(self.src, self.pos)
+            if m is None:
+                raise self.error('unterminated template literal')
+            token = m.group()
+            if token == '`':
+                self.pos = m.end()
+                return
+            if token == '\\':
+                self.pos = m.end() + 1
+                continue
+            self.pos = m.end()  # ${
+            self.code(until_brace=True)
+            self.pos += 1
+
+    def regex_literal(self) -> None:
+        src, i, in_class = self.src, self.pos + 1, False
+        while i < self.n and src[i] != '\n':
+            ch = src[i]
+            if ch == '\\':
+                i += 2
+                continue
+            if ch == '[':
+                in_class = True
+            elif ch == ']':
+                in_class = False
+            elif ch == '/' and not in_class:
+                i += 1
+                while i < self.n and (src[i].isalnum() or src[i] == '_'):
+                    i += 1
+                self.pos = i
+                return
+            i += 1
+        # Not a regex after all (e.g. division at line end): treat as punctuation.
+        self.pos += 1
+
+    # -- JSX --------------------------------------------------------------
+
+    def element(self) -> None:
+        tag = self.tag()
+        if tag.kind == 'open':
+            self.children(tag)
+
+    def tag(self) -> Tag:
+        src, start = self.src, self.pos
+        self.pos += 1
+        closing = src.startswith('/', self.pos)
+        if closing:
+            self.pos += 1
+        m = _TAG_NAME.match(src, self.pos)
+        name = m.group() if m else ''
+        self.pos = m.end() if m else self.pos
+        attrs: List[Attr] = []
+        while True:
+            self.pos = _WS.match(src, self.pos).end()
+            if self.pos >= self.n:
+                raise _NotJsx
+            ch = src[self.pos]
+            if ch == '>':
+                self.pos += 1
+                kind = 'close' if closing else 'open'
+                break
+            if src.startswith('/>', self.pos) and not closing:
+                self.pos += 2
+                kind = 'self'
+                break
+            if closing:
+                raise _NotJsx
+            if ch == '{':  # {...spread}
+                attr_start = self.pos
+                self.pos += 1
+                self.code(until_brace=True)
+                self.pos += 1
+                attrs.append(
+                    Attr('...', attr_start, self.pos, src[attr_start : self.pos], attr_start, self.pos)
+                )
+                continue
+            m = _ATTR_NAME.match(src, self.pos)
+            if m is None:
+                raise _NotJsx
+            attrs.append(self.attribute(m))
+        token = Tag(kind, name, start, self.pos, tuple(attrs))
+        self.tokens.append(token)
+        return token
+
+    def attribute(self, name_match: 're.Match[str]') -> Attr:
+        src, start = self.src, name_match.start()
+        self.pos = _WS.match(src, name_match.end()).end()
+        if not src.startswith('=', self.pos):
+            self.pos = name_match.end()
+            return Attr(name_match.group(), start, self.pos)
+        self.pos = _WS.match(src, self.pos + 1).end()
+        value_start = self.pos
+        ch = src[self.pos : self.pos + 1]
+        if ch in ('"', "'"):
+            close = src.find(ch, self.pos + 1)
+            if close < 0:
+                raise _NotJsx
+            self.pos = close + 1
+        elif ch == '{':
+            self.pos += 1
+            self.code(until_brace=True)
+            self.pos += 1
+        elif ch == '<':
+            self.element()
+        else:
+            raise _NotJsx
+        return Attr(
+            name_match.group(), start, self.pos, src[value_start : self.pos], value_start, self.pos
+        )
+
+    def children(self, parent: Tag) -> None:
+        src = self.src
+        while True:
+            m = _CHILD_STOP.search(src, self.pos)
+            if m is None:
+                raise self.error(f'unclosed <{parent.name}>')
+            self.pos = m.start()
+            if m.group() == '{':
+                start = self.pos
+                self.pos += 1
+                self.code(until_brace=True)
+                self.pos += 1
+                self.tokens.append(Expr(start, self.pos))
+            elif src.startswith('</', self.pos):
+                tag = self.tag()
+                if tag.name != parent.name:
+                    raise self.error(f'</{tag.name}> closes <{parent.name}>')
+                return
+            else:
+                self.element()
+
+
+@lru_cache(maxsize=128)
+def tokenize(source: str) -> Tuple[Token, ...]:
+    """JSX tags and expression containers of ``source``, in source order (memoized)."""
+    lexer = _Lexer(source)
+    lexer.code(until_brace=False)
+    return tuple(sorted(lexer.tokens, key=lambda t: t.start))
+
+
+@lru_cache(maxsize=128)
+def _elements(source: str) -> Tuple[Element, ...]:
+    elements: List[Element] = []
+    stack: List[Element] = []
+    for token in tokenize(source):
+        if isinstance(token, Expr):
+            continue
+        if token.kind == 'close':
+            element = stack.pop()
+            element.close = token
+            continue
+        element = Element(token.name, token, None, stack[-1] if stack else None)
+        elements.append(element)
+        if token.kind == 'open':
+            stack.append(element)
+    return tuple(elements)
+
+
+Span = Union[Element, Tag, Attr, Expr, Tuple[int, int]]
+AttrMatcher = Union[str, Callable[[Optional[str]], bool]]
+
+
+def _span(target: Span) -> Tuple[int, int]:
+    if isinstance(target, tuple):
+        return target
+    return target.start, target.end
+
+
+class JsxDocument:
+    """A TSX source plus a batch of pending edits against its token offsets."""
+
+    def __init__(self, source: str):
+        self.source = source
+        self.tokens = tokenize(source)
+        self.elements = _elements(source)
+        self._edits: List[Tuple[int, int, str]] = []
+
+    # -- queries ----------------------------------------------------------
+
+    def text(self, target: Span) -> str:
+        start, end = _span(target)
+        return self.source[start:end]
+
+    def inner(self, element: Element) -> str:
+        return self.source[element.inner_start : element.inner_end]
+
+    def find_all(
+        self,
+        tag: Optional[str] = None,
+        *,
+        attrs: Optional[Dict[str, AttrMatcher]] = None,
+        text: Optional[str] = None,
+        within: Optional[Element] = None,
+    ) -> List[Element]:
+        """Elements matching every given criterion, in source order.
+
+        ``attrs`` maps attribute names to their exact raw value (``'{7}'``,
+        ``'"/logo.png"'``) or to a predicate on it; ``text`` must occur in the
+        element's inner source.
+        """
+        found = []
+        for element in self.elements:
+            if tag is not None and element.name != tag:
+                continue
+            if within is not None and not within.contains(element):
+                continue
+            if attrs and not all(
+                self._attr_matches(element, name, want) for name, want in attrs.items()
+            ):
+                continue
+            if text is not None and text not in self.inner(element):
+                continue
+            found.append(element)
+        return found
+
+    def find(self, tag: Optional[str] = None, **criteria) -> Optional[Element]:
+        found = self.find_all(tag, **criteria)
+        return found[0] if found else None
+
+    def find_exprs(self, text: str, within: Optional[Element] = None) -> List[Expr]:
+        """``{...}`` children whose source contains ``text``."""
+        return [
+            token
+            for token in self.tokens
+            if isinstance(token, Expr)
+            and (within is None or within.contains(token))
+            and text in self.source[token.start : token.end]
+        ]
+
+    def _attr_matches(self, element: Element, name: str, want: AttrMatcher) -> bool:
+        attr = element.attr(name)
+        value = attr.value if attr else None
+        if callable(want):
+            return want(value)
+        return value is not None and value == want
+
+    def indent_of(self, target: Span) -> str:
+        """Leading whitespace of the line ``target`` starts on."""
+        start, _ = _span(target)
+        line_start = self.source.rfind('\n', 0, start) + 1
+        m = _WS.match(self.source, line_start)
+        return self.source[line_start : min(m.end(), start)]
+
+    # -- edits ------------------------------------------------------------
+
+    def replace(self, target: Span, text: str) -> None:
+        start, end = _span(target)
+        self._edits.append((start, end, text))
+
+    def insert_before(self, target: Span, text: str) -> None:
+        start, _ = _span(target)
+        self._edits.append((start, start, text))
+
+    def insert_after(self, target: Span, text: str) -> None:
+        _, end = _span(target)
+        self._edits.append((end, end, text))
+
+    def remove(self, target: Span) -> None:
+        self.replace(target, '')
+
+    def render(self) -> str:
+        """Apply every pending edit in one pass and return the new source."""
+        if not self._edits:
+            return self.source
+        edits = sorted(enumerate(self._edits), key=lambda e: (e[1][0], e[1][1], e[0]))
+        out: List[str] = []
+        pos = 0
+        for _, (start, end, text) in edits:
+            if start < pos:
+                raise ValueError(f'overlapping edits at offset {start}')
+            out.append(self.source[pos:start])
+            out.append(text)
+            pos = end
+        out.append(self.source[pos:])
+        return ''.join(out)
+
+
+def reindent(block: str, indent: str) -> str:
+    """Indent every non-empty line of a dedented ``block`` by ``indent``."""
+    return '\n'.join(indent + line if line.strip() else line for line in block.split('\n'))
+
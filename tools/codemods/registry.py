@@ -0,0 +1,65 @@
+"""Registry of named source transforms."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from tools.paths import match_glob
+
+# (repo-relative path, file content) -> new file content
+TransformFn = Callable[[str, str], str]
+
+
+@dataclass(frozen=True)
+class Transform:
+    """A pure text rewrite applied to every file matching ``include``."""
+
+    name: str
+    description: str
+    include: Tuple[str, ...]
+    apply: TransformFn
+    version: int = 1
+
+    def matches(self, path: str) -> bool:
+        return any(match_glob(path, pattern) for pattern in self.include)
+
+
+_REGISTRY: Dict[str, Transform] = {}
+
+
+def register(
+    name: str,
+    *,
+    include: Iterable[str],
+    description: str = '',
+    version: int = 1,
+) -> Callable[[TransformFn], TransformFn]:
+    """Decorator registering ``fn`` as the transform called ``name``."""
+
+    def decorator(fn: TransformFn) -> TransformFn:
+        if name in _REGISTRY:
+            raise ValueError(f'Transform already registered: {name}')
+        summary = description or next(iter((fn.__doc__ or '').strip().splitlines()), '')
+        _REGISTRY[name] = Transform(
+            name=name,
+            description=summary,
+            include=tuple(include),
+            apply=fn,
+            version=version,
+        )
+        return fn
+
+    return decorator
+
+
+def get_transform(name: str) -> Transform:
+    try:
+        return _REGISTRY[name]
+    except KeyError:
+        known = ', '.join(sorted(_REGISTRY)) or '(none)'
+        raise KeyError(f'Unknown transform {name!r}. Available: {known}') from None
+
+
+def available_transforms() -> List[Transform]:
+    return [_REGISTRY[name] for name in sorted(_REGISTRY)]
@@ -0,0 +1,318 @@
+"""Single-pass, parallel codemod runner.
+
+Candidate files come from the cached ``FileIndex`` queried by each
+transform's globs; each file is read once, every selected transform is
+applied to it in memory, and the result is written back at most once. Files
+the manifest already knows about are skipped (see ``cache``).
+
+Results are streamed back as workers finish (``iter_run``). A worker hands
+back only its file's metadata and, in dry-run mode, that file's unified diff,
+so memory use does not grow with the size of the tree.
+
+Every result carries its own profile: when and where (worker pid) the file
+was processed, seconds spent reading, in each transform and writing, and the
+scanner rule hits per transform. With ``profile=True`` the worker also runs
+the file under ``cProfile`` and ships the raw stats back for merging (see
+``trace``).
+"""
+
+from __future__ import annotations
+
+import cProfile
+import difflib
+import multiprocessing
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from tools.fileindex import FileIndex
+from tools.fsutil import atomic_write_bytes, content_hash
+from tools.paths import REPO_ROOT
+
+from .cache import Manifest
+from .registry import Transform, available_transforms, get_transform
+from .scanner import take_matches
+
+# (root, path, transform names, write?, diff?, digest known to the manifest, cProfile?)
+Job = Tuple[str, str, Tuple[str, ...], bool, bool, Optional[str], bool]
+
+# Below this many files to process, a process pool costs more than it saves.
+_POOL_THRESHOLD = 32
+
+
+@dataclass
+class FileResult:
+    path: str
+    changed: bool = False
+    applied: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+    cached: bool = False
+    bytes_read: int = 0
+    bytes_written: int = 0
+    # Seconds spent in each transform on this file.
+    timings: Dict[str, float] = field(default_factory=dict)
+    # Scanner rule hits, as 'transform/rule' -> count.
+    matches: Dict[str, int] = field(default_factory=dict)
+    # Worker pid, wall-clock start (time.time()) and seconds spent on the file.
+    worker: int = 0
+    started: float = 0.0
+    elapsed: float = 0.0
+    read_seconds: float = 0.0
+    write_seconds: float = 0.0
+    # Raw cProfile stats of the file (profile=True only).
+    profile: Optional[Dict[Any, Any]] = None
+    # Unified diff of the change (dry runs only).
+    diff: Optional[str] = None
+    # Post-run (mtime_ns, size, digest), used to refresh the manifest.
+    stamp: Optional[Tuple[int, int, str]] = None
+
+
+@dataclass
+class RunResult:
+    files: List[FileResult] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def changed(self) -> List[FileResult]:
+        return [f for f in self.files if f.changed]
+
+    @property
+    def errors(self) -> List[FileResult]:
+        return [f for f in self.files if f.error]
+
+    @property
+    def cached(self) -> List[FileResult]:
+        return [f for f in self.files if f.cached]
+
+
+class RunSummary:
+    """Running totals over a stream of ``FileResult``s."""
+
+    def __init__(self) -> None:
+        self.scanned = self.changed = self.cached = self.errors = 0
+        # Cache hits: skipped on a stat alone, or after one read by content hash.
+        self.stat_hits = self.digest_hits = 0
+        self.bytes_read = self.bytes_rewritten = 0
+        self.transform_seconds: Dict[str, float] = {}
+        self.transform_files: Dict[str, int] = {}
+        self.transform_changed: Dict[str, int] = {}
+        self.matches: Dict[str, int] = {}
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+
+    def add(self, result: FileResult) -> None:
+        self.scanned += 1
+        self.changed += result.changed
+        self.cached += result.cached
+        if result.cached:
+            if result.bytes_read:
+                self.digest_hits += 1
+            else:
+                self.stat_hits += 1
+        self.errors += result.error is not None
+        self.bytes_read += result.bytes_read
+        self.bytes_rewritten += result.bytes_written
+        for name, seconds in result.timings.items():
+            self.transform_seconds[name] = self.transform_seconds.get(name, 0.0) + seconds
+            self.transform_files[name] = self.transform_files.get(name, 0) + 1
+        for name in result.applied:
+            self.transform_changed[name] = self.transform_changed.get(name, 0) + 1
+        for rule, count in result.matches.items():
+            self.matches[rule] = self.matches.get(rule, 0) + count
+        self.elapsed = time.perf_counter() - self.started
+
+    @property
+    def cache_hit_rate(self) -> float:
+        return self.cached / self.scanned if self.scanned else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'files_scanned': self.scanned,
+            'files_changed': self.changed,
+            'files_cached': self.cached,
+            'cache_stat_hits': self.stat_hits,
+            'cache_digest_hits': self.digest_hits,
+            'cache_hit_rate': round(self.cache_hit_rate, 4),
+            'errors': self.errors,
+            'bytes_read': self.bytes_read,
+            'bytes_rewritten': self.bytes_rewritten,
+            'transform_seconds': {
+                name: round(seconds, 6) for name, seconds in sorted(self.transform_seconds.items())
+            },
+            'transform_files': dict(sorted(self.transform_files.items())),
+            'transform_changed': dict(sorted(self.transform_changed.items())),
+            'regex_matches': dict(sorted(self.matches.items())),
+            'elapsed_seconds': round(self.elapsed, 6),
+        }
+
+
+def plan(
+    transforms: Sequence[Transform], root: Path, index: Optional[FileIndex] = None
+) -> Iterator[Tuple[str, Tuple[str, ...]]]:
+    """Pair each matching file with the names of the transforms that apply to it."""
+    if index is None:
+        index = FileIndex(root).refresh()
+    names_by_path: Dict[str, List[str]] = {}
+    for t in transforms:
+        for path in index.glob(*t.include):
+            names_by_path.setdefault(path, []).append(t.name)
+    for path, names in sorted(names_by_path.items()):
+        yield path, tuple(names)
+
+
+def apply_transforms(
+    path: str,
+    content: str,
+    names: Sequence[str],
+    timings: Optional[Dict[str, float]] = None,
+    matches: Optional[Dict[str, int]] = None,
+) -> Tuple[str, List[str]]:
+    """Run ``names`` over ``content`` in order; return the result and the names that changed it."""
+    applied = []
+    take_matches()
+    for name in names:
+        started = time.perf_counter()
+        updated = get_transform(name).apply(path, content)
+        if timings is not None:
+            timings[name] = time.perf_counter() - started
+        if matches is not None:
+            for rule, count in take_matches().items():
+                matches[f'{name}/{rule}'] = count
+        if updated != content:
+            applied.append(name)
+            content = updated
+    return content, applied
+
+
+def unified_diff(path: str, before: str, after: str) -> str:
+    """``git apply``-compatible diff of one file."""
+    lines = []
+    for line in difflib.unified_diff(
+        before.splitlines(keepends=True),
+        after.splitlines(keepends=True),
+        fromfile=f'a/{path}',
+        tofile=f'b/{path}',
+    ):
+        lines.append(line)
+        if not line.endswith('\n'):
+            lines.append('\n\\ No newline at end of file\n')
+    return ''.join(lines)
+
+
+def _rewrite(job: Job, result: FileResult) -> None:
+    root, path, names, write, diff, known_digest, _ = job
+    full_path = os.path.join(root, path)
+    started = time.perf_counter()
+    with open(full_path, 'rb') as f:
+        raw = f.read()
+    result.read_seconds = time.perf_counter() - started
+    result.bytes_read = len(raw)
+    digest = content_hash(raw)
+    if digest == known_digest:
+        # Touched but not modified: nothing to re-run.
+        result.cached = True
+    else:
+        original = raw.decode('utf-8')
+        content, result.applied = apply_transforms(
+            path, original, names, result.timings, result.matches
+        )
+        if content != original:
+            result.changed = True
+            raw = content.encode('utf-8')
+            result.bytes_written = len(raw)
+            if diff:
+                result.diff = unified_diff(path, original, content)
+            if not write:
+                return
+            digest = content_hash(raw)
+            started = time.perf_counter()
+            atomic_write_bytes(full_path, raw)
+            result.write_seconds = time.perf_counter() - started
+    st = os.stat(full_path)
+    result.stamp = (st.st_mtime_ns, st.st_size, digest)
+
+
+def _process_file(job: Job) -> FileResult:
+    result = FileResult(path=job[1], worker=os.getpid(), started=time.time())
+    started = time.perf_counter()
+    profiler = cProfile.Profile() if job[6] else None
+    try:
+        if profiler is None:
+            _rewrite(job, result)
+        else:
+            profiler.runcall(_rewrite, job, result)
+    except Exception as e:  # noqa: BLE001 - reported per file, never aborts the sweep
+        result.error = f'{type(e).__name__}: {e}'
+    result.elapsed = time.perf_counter() - started
+    if profiler is not None:
+        profiler.create_stats()
+        result.profile = profiler.stats  # type: ignore[attr-defined]
+    return result
+
+
+def iter_run(
+    names: Optional[Sequence[str]] = None,
+    *,
+    root: Path = REPO_ROOT,
+    jobs: Optional[int] = None,
+    write: bool = True,
+    diff: bool = False,
+    manifest: Optional[Manifest] = None,
+    index: Optional[FileIndex] = None,
+    profile: bool = False,
+) -> Iterator[FileResult]:
+    """Apply the named transforms (all registered ones by default), yielding per-file results.
+
+    Files the ``manifest`` shows as already processed by the current version of
+    every selected transform come first, as cached, after a single ``stat``;
+    the rest follow in completion order. With ``diff`` each changed file's
+    unified diff travels on its result; with ``profile`` its cProfile stats.
+    ``index`` is the file index to plan from (refreshed here when omitted).
+    """
+    transforms = [get_transform(n) for n in names] if names else available_transforms()
+    versions = {t.name: t.version for t in transforms}
+
+    todo: List[Job] = []
+    for path, file_names in plan(transforms, root, index):
+        known_digest = None
+        if manifest is not None:
+            entry = manifest.get(path)
+            if entry is not None and entry.covers({n: versions[n] for n in file_names}):
+                if entry.same_stat(os.stat(root / path)):
+                    yield FileResult(path=path, cached=True)
+                    continue
+                known_digest = entry.digest
+        todo.append((str(root), path, file_names, write, diff, known_digest, profile))
+    names_by_path = {job[1]: job[2] for job in todo}
+
+    jobs = jobs or os.cpu_count() or 1
+    pool = None
+    if jobs > 1 and len(todo) >= _POOL_THRESHOLD:
+        pool = multiprocessing.Pool(jobs)
+        results: Iterable[FileResult] = pool.imap_unordered(_process_file, todo, chunksize=4)
+    else:
+        results = map(_process_file, todo)
+    try:
+        for result in results:
+            if manifest is not None:
+                if result.stamp is None:
+                    manifest.forget(result.path)
+                else:
+                    mtime_ns, size, digest = result.stamp
+                    file_versions = {n: versions[n] for n in names_by_path[result.path]}
+                    manifest.record(result.path, mtime_ns, size, digest, file_versions)
+            yield result
+    finally:
+        if pool is not None:
+            pool.terminate()
+        if manifest is not None and write:
+            manifest.save()
+
+
+def run(names: Optional[Sequence[str]] = None, **options: Any) -> RunResult:
+    """Like ``iter_run``, but collects the results."""
+    started = time.perf_counter()
+    files = list(iter_run(names, **options))
+    return RunResult(files=files, elapsed=time.perf_counter() - started)
@@ -0,0 +1,99 @@
+"""Single-pass rewrite scanner.
+
+Several regex rewrites are described as a table of rules, each with a
+precompiled pattern and a replacement callback. ``Scanner.scan`` collects the
+hits of every rule, walks them once in position order (leftmost first, ties
+going to the earlier rule, overlapping hits dropped, exactly like an ordered
+alternation) and builds the output in a single join, instead of copying the
+whole file once per ``re.sub``.
+
+The hits are gathered per rule rather than with one ``a|b|c`` regex on
+purpose: CPython's ``re`` has no multi-literal prefilter, so an alternation is
+tried at every offset and scans several times slower than a handful of
+literal-prefixed patterns, each of which jumps straight to its candidates.
+
+A callback receives the rule's match and a state dict shared by the scan, and
+returns:
+
+* ``None`` to keep the matched text,
+* a string to replace it, or
+* a zero-argument callable, resolved after the scan, for decisions that depend
+  on the whole file (e.g. "is this the last import?").
+
+Every scan adds its hits per rule name to a process-wide tally, which the
+runner drains after each transform (``take_matches``) for its profile.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Match, Optional, Sequence, Union
+
+Replacement = Union[None, str, Callable[[], Optional[str]]]
+Callback = Callable[[Match[str], Dict[str, Any]], Replacement]
+
+# Rule name -> hits since the last take_matches().
+_matches: Dict[str, int] = {}
+
+
+def take_matches() -> Dict[str, int]:
+    """Hits per rule since the previous call, and reset the tally."""
+    global _matches
+    taken, _matches = _matches, {}
+    return taken
+
+
+@dataclass(frozen=True)
+class Rule:
+    """One entry of the scanner's dispatch table."""
+
+    name: str
+    pattern: str
+    callback: Callback
+
+
+class Scanner:
+    def __init__(self, rules: Sequence[Rule], flags: int = 0):
+        self.rules = [
+            (rule.name, re.compile(rule.pattern, flags), rule.callback) for rule in rules
+        ]
+
+    def scan(self, content: str, state: Optional[Dict[str, Any]] = None) -> str:
+        """Rewrite ``content`` in one pass; ``state`` is shared by the callbacks."""
+        state = {} if state is None else state
+        hits = []
+        for order, (name, regex, callback) in enumerate(self.rules):
+            found = len(hits)
+            for m in regex.finditer(content):
+                hits.append((m.start(), order, m, callback))
+            if len(hits) > found:
+                _matches[name] = _matches.get(name, 0) + len(hits) - found
+        if not hits:
+            return content
+        hits.sort(key=lambda hit: (hit[0], hit[1]))
+
+        edits = []
+        end = 0
+        for start, _, m, callback in hits:
+            if start < end:
+                continue
+            end = m.end()
+            replacement = callback(m, state)
+            if replacement is not None:
+                edits.append((start, end, replacement))
+        if not edits:
+            return content
+
+        out: List[str] = []
+        pos = 0
+        for start, end, replacement in edits:
+            if callable(replacement):
+                replacement = replacement()
+                if replacement is None:
+                    continue
+            out.append(content[pos:start])
+            out.append(replacement)
+            pos = end
+        out.append(content[pos:])
+        return ''.join(out)
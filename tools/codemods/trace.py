@@ -0,0 +1,183 @@
+"""Profile of a codemod run: a JSON trace, a Chrome trace and merged cProfile stats.
+
+``Trace`` collects the per-file records the runner sends back (see
+``FileResult``) plus the run's own phases, such as refreshing the file
+index. It writes:
+
+* a JSON trace: the run summary (per-transform seconds, files and changes,
+  scanner rule hits, bytes, cache hit rates) followed by one record per
+  processed file;
+* a Chrome trace (``chrome://tracing`` or https://ui.perfetto.dev): one row
+  per worker, one slice per file, with its read, transform and write steps
+  nested under it, laid end to end in the order they ran;
+* with cProfile on, the stats of every file merged into one ``.pstats``
+  file (``python -m pstats`` / snakeviz read it).
+
+Files the manifest skipped on a stat alone were never sent to a worker and
+appear only in the summary counts.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import pstats
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from tools.fsutil import atomic_write_text
+
+from .runner import FileResult, RunSummary
+
+TRACE_VERSION = 1
+
+
+class _Profile:
+    """The part of a ``cProfile.Profile`` that ``pstats.Stats`` reads."""
+
+    def __init__(self, stats: Dict[Any, Any]):
+        self.stats = stats
+
+    def create_stats(self) -> None:
+        pass
+
+
+class Trace:
+    def __init__(self) -> None:
+        self.origin = time.time()
+        self.files: List[Dict[str, Any]] = []
+        self.phases: List[Dict[str, Any]] = []
+        self.stats: Optional[pstats.Stats] = None
+
+    def phase(self, name: str, started: float, elapsed: float, **details: Any) -> None:
+        """A step of the run itself; ``started`` is a ``time.time()`` value."""
+        self.phases.append({'name': name, 'started': started, 'elapsed': elapsed, **details})
+
+    def add(self, result: FileResult) -> None:
+        if result.profile is not None:
+            profile = _Profile(result.profile)
+            if self.stats is None:
+                self.stats = pstats.Stats(profile)  # type: ignore[arg-type]
+            else:
+                self.stats.add(profile)  # type: ignore[arg-type]
+            result.profile = None
+        if not result.worker:
+            return
+        self.files.append(
+            {
+                'path': result.path,
+                'worker': result.worker,
+                'started': result.started,
+                'elapsed': result.elapsed,
+                'read_seconds': result.read_seconds,
+                'write_seconds': result.write_seconds,
+                'bytes_read': result.bytes_read,
+                'bytes_written': result.bytes_written,
+                'cached': result.cached,
+                'changed': result.changed,
+                'applied': result.applied,
+                'timings': result.timings,
+                'matches': result.matches,
+                'error': result.error,
+            }
+        )
+
+    def as_dict(self, summary: RunSummary) -> Dict[str, Any]:
+        def relative(record: Dict[str, Any]) -> Dict[str, Any]:
+            rounded = {k: round(v, 6) if isinstance(v, float) else v for k, v in record.items()}
+            rounded['started'] = round(record['started'] - self.origin, 6)
+            if 'timings' in record:
+                rounded['timings'] = {k: round(v, 6) for k, v in record['timings'].items()}
+            return rounded
+
+        return {
+            'version': TRACE_VERSION,
+            'summary': summary.as_dict(),
+            'phases': [relative(p) for p in self.phases],
+            'files': [relative(f) for f in sorted(self.files, key=lambda f: f['started'])],
+        }
+
+    def chrome(self) -> Dict[str, Any]:
+        """The trace in Chrome's Trace Event Format (complete events, microseconds)."""
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = [
+            {'name': 'process_name', 'ph': 'M', 'pid': pid, 'args': {'name': 'codemods'}},
+            {'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': 0, 'args': {'name': 'runner'}},
+        ]
+
+        def span(name: str, cat: str, tid: int, start: float, seconds: float, **args: Any) -> None:
+            events.append(
+                {
+                    'name': name,
+                    'cat': cat,
+                    'ph': 'X',
+                    'pid': pid,
+                    'tid': tid,
+                    'ts': round((start - self.origin) * 1e6, 1),
+                    'dur': round(seconds * 1e6, 1),
+                    'args': args,
+                }
+            )
+
+        for phase in self.phases:
+            details = {k: v for k, v in phase.items() if k not in ('name', 'started', 'elapsed')}
+            span(phase['name'], 'phase', 0, phase['started'], phase['elapsed'], **details)
+        for worker in sorted({f['worker'] for f in self.files}):
+            events.append(
+                {
+                    'name': 'thread_name',
+                    'ph': 'M',
+                    'pid': pid,
+                    'tid': worker,
+                    'args': {'name': f'worker {worker}'},
+                }
+            )
+        for f in self.files:
+            tid, start = f['worker'], f['started']
+            span(
+                f['path'],
+                'file',
+                tid,
+                start,
+                f['elapsed'],
+                bytes_read=f['bytes_read'],
+                bytes_written=f['bytes_written'],
+                applied=f['applied'],
+                cached=f['cached'],
+                error=f['error'],
+            )
+            span('read', 'io', tid, start, f['read_seconds'])
+            at = start + f['read_seconds']
+            for name, seconds in f['timings'].items():
+                prefix = f'{name}/'
+                hits = {k[len(prefix):]: v for k, v in f['matches'].items() if k.startswith(prefix)}
+                span(name, 'transform', tid, at, seconds, changed=name in f['applied'], **hits)
+                at += seconds
+            if f['write_seconds']:
+                span('write', 'io', tid, at, f['write_seconds'])
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def write(self, path: Path, summary: RunSummary) -> None:
+        atomic_write_text(path, json.dumps(self.as_dict(summary), indent=1) + '\n')
+
+    def write_chrome(self, path: Path) -> None:
+        atomic_write_text(path, json.dumps(self.chrome(), separators=(',', ':')))
+
+    def write_profile(self, path: Path) -> bool:
+        """Dump the merged cProfile stats; False when nothing was profiled."""
+        if self.stats is None:
+            return False
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.stats.dump_stats(str(path))
+        return True
+
+    def top(self, limit: int = 15, sort: str = 'cumulative') -> str:
+        """The ``limit`` heaviest functions of the merged profile, as pstats prints them."""
+        if self.stats is None:
+            return ''
+        out = io.StringIO()
+        self.stats.stream = out  # type: ignore[attr-defined]
+        self.stats.sort_stats(sort).print_stats(limit)
+        return out.getvalue()
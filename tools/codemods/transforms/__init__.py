@@ -0,0 +1,3 @@
+"""Built-in transforms. Importing this package registers them."""
+
+from . import inventory_ui, pageheader, padding, sidebar  # noqa: F401
@@ -0,0 +1,72 @@
+"""Add responsible/date columns to the inventory table (ported from ``update_inventory_ui.py``).
+
+Edits are anchored on the table's structure (the ``<th>`` holding
+``t('table.status')``, the ``<td>`` rendering ``{item.status}``, ...) rather than
+on the exact markup, so they survive reformatting and unrelated edits.
+"""
+
+from __future__ import annotations
+
+from ..jsx import JsxDocument, reindent
+from ..registry import register
+
+INVENTORY_PAGE = ('src/app/[locale]/dashboard/inventory/page.tsx',)
+
+NEW_COLUMNS = ('responsible', 'date')
+
+RESPONSIBLE_CELL = """\
+<td style={{ padding: '16px 24px', color: '#64748b', fontSize: '13px' }}>
+  {item.creator?.full_name || '---'}
+</td>"""
+
+DATE_CELL = """\
+<td style={{ padding: '16px 24px', color: '#64748b', fontSize: '12px' }}>
+  {new Date(item.created_at).toLocaleString('pt-BR', { day: '2-digit', month: '2-digit', year: '2-digit', hour: '2-digit', minute: '2-digit' })}
+</td>"""
+
+# Header widths rebalanced to make room for the two new columns.
+HEADER_WIDTHS = {
+    "t('table.price')": ("width: '10%'", "width: '8%'"),
+    "t('table.actions')": ("width: '15%'", "width: '10%'"),
+}
+
+
+def _add_headers(doc: JsxDocument) -> None:
+    status = doc.find('th', text="t('table.status')")
+    if status is None:
+        return
+    indent = doc.indent_of(status)
+    headers = ''.join(
+        f"\n{indent}{doc.text(status.open)}{{t('table.{column}')}}</th>"
+        for column in NEW_COLUMNS
+        if doc.find('th', text=f"t('table.{column}')") is None
+    )
+    if headers:
+        doc.insert_after(status, headers)
+
+    for text, (old, new) in HEADER_WIDTHS.items():
+        th = doc.find('th', text=text)
+        style = th.attr('style') if th else None
+        if style is not None and old in style.value:
+            doc.replace(style, f'style={style.value.replace(old, new)}')
+
+
+def _add_cells(doc: JsxDocument) -> None:
+    status = doc.find('td', text='{item.status}')
+    if status is None or doc.find('td', text='item.creator'):
+        return
+    indent = doc.indent_of(status)
+    cells = ''.join('\n' + reindent(cell, indent) for cell in (RESPONSIBLE_CELL, DATE_CELL))
+    doc.insert_after(status, cells)
+
+
+@register('update_inventory_ui', include=INVENTORY_PAGE, version=2)
+def update_inventory_ui(path: str, content: str) -> str:
+    """Widen the inventory table with the responsible and date columns."""
+    doc = JsxDocument(content)
+    for td in doc.find_all('td', attrs={'colSpan': '{7}'}):
+        doc.replace(td.attr('colSpan'), 'colSpan={9}')
+    _add_headers(doc)
+    _add_cells(doc)
+    # ConfirmModal has no 'warning' variant.
+    return doc.render().replace("'warning'", "'info'")
@@ -0,0 +1,18 @@
+"""Normalize dashboard page padding to 40px (ported from ``fix_padding.py``)."""
+
+from __future__ import annotations
+
+from ..registry import register
+from ..scanner import Rule, Scanner
+
+DASHBOARD_PAGES = ('src/app/[locale]/dashboard/**/page.tsx',)
+
+PADDING_SCANNER = Scanner(
+    [Rule('padding', r"padding:\s*'(?:0|32px)'", lambda m, state: "padding: '40px'")]
+)
+
+
+@register('fix_padding', include=DASHBOARD_PAGES)
+def fix_padding(path: str, content: str) -> str:
+    """Replace padding '0' / '32px' with the standard '40px'."""
+    return PADDING_SCANNER.scan(content)
@@ -0,0 +1,76 @@
+"""Apply the unified PageHeader layout (ported from ``apply_pageheader_all.py``)."""
+
+from __future__ import annotations
+
+from ..registry import register
+from ..scanner import Rule, Scanner
+
+PAGEHEADER_IMPORT_STMT = "import PageHeader from '@/components/ui/PageHeader'"
+PAGEHEADER_IMPORT = PAGEHEADER_IMPORT_STMT + ';\n'
+PAGE_BACKGROUND = "background: '#f8fafc'"
+
+# Pages migrated to the shared PageHeader in the design unification sweep.
+PAGEHEADER_PAGES = tuple(
+    f'src/app/[locale]/dashboard/{slug}/page.tsx'
+    for slug in (
+        'cost-centers',
+        'users',
+        'agents',
+        'product-types',
+        'manufacturers',
+        'models',
+        'stock-locations',
+    )
+)
+
+
+def _on_import(m, state):
+    if PAGEHEADER_IMPORT_STMT in m.group():
+        state['has_import'] = True
+    start = state['last_import'] = m.start()
+
+    def resolve():
+        if state['last_import'] == start and not state.get('has_import'):
+            return m.group() + PAGEHEADER_IMPORT
+        return None
+
+    return resolve
+
+
+def _on_padding(m, state):
+    return "padding: '40px'"
+
+
+def _on_background(m, state):
+    state['has_background'] = True
+    return None
+
+
+def _on_min_height(m, state):
+    if m.group() == "minHeight: '100vh'":
+        state['has_min_height'] = True
+
+    def resolve():
+        if state.get('has_min_height') and not state.get('has_background'):
+            return f'{m.group()}, {PAGE_BACKGROUND}'
+        return None
+
+    return resolve
+
+
+# One linear pass: the last import (insertion point), padding normalization and
+# the page background are all found by the same scan.
+PAGEHEADER_SCANNER = Scanner(
+    [
+        Rule('imports', r"import .+ from ['\"].*['\"];?\n", _on_import),
+        Rule('padding', r"padding:\s*['\"](?:0|32px)['\"]", _on_padding),
+        Rule('background', PAGE_BACKGROUND, _on_background),
+        Rule('min_height', r"minHeight:\s*['\"]100vh['\"]", _on_min_height),
+    ]
+)
+
+
+@register('apply_pageheader', include=PAGEHEADER_PAGES)
+def apply_pageheader(path: str, content: str) -> str:
+    """Import PageHeader, normalize padding and add the page background."""
+    return PAGEHEADER_SCANNER.scan(content)
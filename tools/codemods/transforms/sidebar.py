@@ -0,0 +1,48 @@
+"""Static Wind Wireless logo in the sidebar header (ported from ``fix_logo.py`` / ``fix_logo2.py``).
+
+The company-logo conditional and the ``{companyName}`` label are located as
+JSX expressions inside the header, so the edit no longer depends on line
+numbers or on the exact formatting of the old markup.
+"""
+
+from __future__ import annotations
+
+from ..jsx import JsxDocument, reindent
+from ..registry import register
+
+SIDEBAR = ('src/components/dashboard/Sidebar.tsx',)
+
+LOGO = """\
+<img
+  src="/images/wind_wireless.png"
+  alt="WindSystem Logo"
+  style={{
+    minWidth: '36px',
+    width: '36px',
+    height: '36px',
+    borderRadius: '11px',
+    objectFit: 'contain',
+    background: 'white',
+    padding: '4px',
+    boxShadow: '0 4px 12px rgba(0, 0, 0, 0.1)',
+  }}
+/>"""
+
+BRAND_LABEL = """\
+{!isCollapsed && (
+  <span style={{ fontSize: '18px', fontWeight: '850', color: '#1e293b', letterSpacing: '-0.02em', whiteSpace: 'nowrap' }}>
+    WIND WIRELESS
+  </span>
+)}"""
+
+
+@register('sidebar_logo', include=SIDEBAR)
+def sidebar_logo(path: str, content: str) -> str:
+    """Replace the dynamic company logo/name with the static Wind Wireless brand."""
+    doc = JsxDocument(content)
+    for expr in doc.find_exprs('companyLogo ?'):
+        doc.replace(expr, reindent(LOGO, doc.indent_of(expr)).lstrip())
+    for expr in doc.find_exprs('{companyName}'):
+        if '!isCollapsed' in doc.text(expr):
+            doc.replace(expr, reindent(BRAND_LABEL, doc.indent_of(expr)).lstrip())
+    return doc.render()
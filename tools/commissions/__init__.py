@@ -0,0 +1,28 @@
+"""Batch recalculation of ``commissions`` from a period's sales orders.
+
+    python -m tools.commissions recalc --dsn postgresql://... --month 2026-09 [--dry-run]
+    python -m tools.commissions bench [--items 1000000]
+"""
+
+from .diff import STATUSES, Existing, Plan, changes, diff
+from .rules import Expected, Items, Orders, PriceTable, compute, compute_rowwise
+from .store import CommissionStore, Period, StoreError
+from .synthetic import synthetic_month
+
+__all__ = [
+    'STATUSES',
+    'CommissionStore',
+    'Existing',
+    'Expected',
+    'Items',
+    'Orders',
+    'Period',
+    'Plan',
+    'PriceTable',
+    'StoreError',
+    'changes',
+    'compute',
+    'compute_rowwise',
+    'diff',
+    'synthetic_month',
+]
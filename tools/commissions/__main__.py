@@ -0,0 +1,239 @@
+"""Command-line entry point: ``python -m tools.commissions``.
+
+    recalc   recompute the commissions of a period's sales orders (by
+             order_date) and write back only the rows that changed;
+             --dry-run reports the changes and writes nothing
+    bench    time the recomputation and diff of a synthetic month, checked
+             against the row-by-row rules on a sample; no database needed
+
+Run ``recalc`` over every period a ``price_table`` entry or a commission
+rate changed in. Paid commissions are never rewritten, only reported.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .diff import Plan, changes, diff
+from .rules import BASES, KEY_COLUMNS, RATES, Expected, compute, compute_rowwise
+from .store import DEFAULT_BATCH_SIZE, CommissionStore, Period, StoreError
+from .synthetic import synthetic_month
+
+_SOURCES = dict(
+    zip(KEY_COLUMNS, ('product', 'model/capacity/grade', 'model/capacity', 'model'))
+)
+
+
+def _month(value: str) -> Tuple[dt.date, dt.date]:
+    try:
+        first = dt.datetime.strptime(value, '%Y-%m').date()
+    except ValueError:
+        raise argparse.ArgumentTypeError('expected YYYY-MM') from None
+    return first, (first.replace(day=28) + dt.timedelta(days=4)).replace(day=1)
+
+
+def _date(value: str) -> dt.date:
+    try:
+        return dt.date.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError('expected YYYY-MM-DD') from None
+
+
+def _money(cents: int, sign: bool = False) -> str:
+    text = f'${abs(cents) / 100:,.2f}'
+    if cents < 0:
+        return '-' + text
+    return '+' + text if sign else text
+
+
+def _report(period: Period, expected: Expected, plan: Plan) -> None:
+    priced = {_SOURCES[k]: v for k, v in expected.cost_source.items() if k in _SOURCES and v}
+    if priced:
+        levels = ', '.join(f'{count:,} by {level}' for level, count in priced.items())
+        print(
+            f"📋 item costs: {sum(priced.values()):,} from price_table ({levels}), "
+            f"{expected.cost_source['snapshot']:,} from the order snapshot"
+        )
+    print(
+        f'📊 {len(plan.inserts):,} new, {len(plan.updates):,} updated, '
+        f'{len(plan.cancels):,} cancelled, {plan.unchanged:,} unchanged; '
+        f'commission total {_money(plan.delta_cents, sign=True)}'
+    )
+    if len(plan.locked):
+        print(f'⚠️  {len(plan.locked):,} paid commissions differ; left as they are')
+    if len(plan.duplicates):
+        print(
+            f'⚠️  {len(plan.duplicates):,} extra live commissions on orders that already '
+            'have one; only the oldest was compared'
+        )
+    if period.unknown_orders:
+        print(
+            f'⚠️  {period.unknown_orders:,} rows of orders that changed period while read; '
+            'skipped'
+        )
+
+
+def _recalc(args: argparse.Namespace) -> int:
+    if args.month:
+        since, until = args.month
+    elif args.since and args.until:
+        since, until = args.since, args.until
+    else:
+        print('❌ pass --month, or --since and --until', file=sys.stderr)
+        return 2
+    if until <= since:
+        print('❌ --until must be after --since', file=sys.stderr)
+        return 2
+    if not args.dsn:
+        print('❌ pass --dsn (or set $DATABASE_URL)', file=sys.stderr)
+        return 2
+
+    with CommissionStore(args.dsn, args.batch_size) as store:
+        started = time.perf_counter()
+        period = store.load(since, until)
+        print(
+            f'ℹ️  read {len(period.orders):,} orders, {len(period.items):,} items, '
+            f'{len(period.prices):,} price entries and {len(period.existing):,} commissions '
+            f'from {since} to {until} (exclusive) in {time.perf_counter() - started:.2f}s'
+        )
+        expected = compute(period.orders, period.items, period.prices, args.base, args.rates)
+        plan = diff(period.orders, expected, period.existing)
+        _report(period, expected, plan)
+        if args.dry_run or not plan.changes:
+            print('ℹ️  dry run: nothing written' if plan.changes else '✅ nothing to write')
+            return 0
+        started = time.perf_counter()
+        rows = changes(plan, period.orders, expected, period.existing, period.salespeople)
+        written = store.apply(rows)
+    skipped = plan.changes - sum(written.values())
+    print(
+        f"✅ {written['insert']:,} inserted, {written['update']:,} updated, "
+        f"{written['cancel']:,} cancelled in {time.perf_counter() - started:.2f}s"
+    )
+    if skipped:
+        print(f'⚠️  {skipped:,} commissions were paid or removed meanwhile; left as they are')
+    return 0
+
+
+def _head(columns: Any, n: int) -> Any:
+    return type(columns)(**{k: v[:n] for k, v in vars(columns).items()})
+
+
+def _bench(args: argparse.Namespace) -> int:
+    started = time.perf_counter()
+    period = synthetic_month(args.items, args.seed)
+    generated = time.perf_counter() - started
+    print(
+        f'ℹ️  synthetic month: {len(period.items):,} items in {len(period.orders):,} orders, '
+        f'{len(period.prices):,} price entries, {len(period.existing):,} commissions '
+        f'({generated:.2f}s)'
+    )
+    timings: Dict[str, float] = {}
+    started = time.perf_counter()
+    expected = compute(period.orders, period.items, period.prices, args.base, args.rates)
+    timings['compute'] = time.perf_counter() - started
+    started = time.perf_counter()
+    plan = diff(period.orders, expected, period.existing)
+    timings['diff'] = time.perf_counter() - started
+    started = time.perf_counter()
+    rows = sum(
+        1 for _ in changes(plan, period.orders, expected, period.existing, period.salespeople)
+    )
+    timings['rows'] = time.perf_counter() - started
+    _report(period, expected, plan)
+    vectorized = timings['compute'] + timings['diff']
+    print(
+        f"📊 compute {timings['compute']:.3f}s + diff {timings['diff']:.3f}s: "
+        f'{len(period.items) / vectorized:,.0f} items/s; {rows:,} changed rows serialized in '
+        f"{timings['rows']:.3f}s, {-(-rows // args.batch_size)} write batches of "
+        f'{args.batch_size:,}'
+    )
+
+    # Row by row over the orders of the first --check items.
+    cut = min(args.check, len(period.items))
+    orders = int(period.items.order[cut - 1]) + 1 if cut else 0
+    cut = int(np.searchsorted(period.items.order, orders))
+    started = time.perf_counter()
+    reference = compute_rowwise(
+        _head(period.orders, orders),
+        _head(period.items, cut),
+        period.prices,
+        args.base,
+        args.rates,
+    )
+    elapsed = time.perf_counter() - started
+    same = np.array_equal(reference.base_cents, expected.base_cents[:orders]) and np.array_equal(
+        reference.rate_bp, expected.rate_bp[:orders]
+    )
+    rate = cut / elapsed if elapsed else float('inf')
+    print(
+        f'📊 row by row: {cut:,} items in {elapsed:.2f}s, {rate:,.0f} items/s '
+        f'({len(period.items) / vectorized / rate:,.1f}x slower)'
+    )
+    if not same:
+        print('❌ the row-by-row results differ from the vectorized ones', file=sys.stderr)
+        return 1
+    print(f'✅ identical commissions for the {orders:,} orders checked')
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m tools.commissions',
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        '--base', choices=BASES, default='profit', help='commission base (default: profit)'
+    )
+    common.add_argument(
+        '--rates',
+        choices=RATES,
+        default='order',
+        help="the order's commission_percent, or the customer's default (default: order)",
+    )
+    common.add_argument(
+        '--batch-size',
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f'rows per fetch and per write (default: {DEFAULT_BATCH_SIZE:,})',
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    recalc = commands.add_parser('recalc', parents=[common], help='recompute a period')
+    recalc.add_argument('--dsn', default=os.environ.get('DATABASE_URL'), help='Postgres DSN')
+    recalc.add_argument('--month', type=_month, help='YYYY-MM')
+    recalc.add_argument('--since', type=_date, help='first order_date, YYYY-MM-DD')
+    recalc.add_argument('--until', type=_date, help='order_date after the last, YYYY-MM-DD')
+    recalc.add_argument('--dry-run', action='store_true', help='report the changes only')
+
+    bench = commands.add_parser('bench', parents=[common], help='benchmark a synthetic month')
+    bench.add_argument('--items', type=int, default=1_000_000, help='default: 1,000,000')
+    bench.add_argument('--seed', type=int, default=0)
+    bench.add_argument(
+        '--check',
+        type=int,
+        default=100_000,
+        help='items to check against the row-by-row rules (default: 100,000)',
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == 'bench':
+            return _bench(args)
+        return _recalc(args)
+    except (StoreError, OSError, ValueError) as e:
+        print(f'❌ {e}', file=sys.stderr)
+        return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,134 @@
+"""Diff the recomputed commissions against the ``commissions`` rows.
+
+Each order has at most one *live* row (not cancelled); when there are more
+the first created is the order's and the others are reported, untouched.
+
+* an active order with no live row and a commission above zero gets one;
+* a pending or released row whose order total, percent or salesperson
+  differ from the recomputed ones is updated in place;
+* a pending or released row whose order is cancelled, deleted or no longer
+  has a salesperson is cancelled;
+* a paid row is never rewritten: when it differs it is reported as locked.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .rules import Expected, Orders, commission_cents
+
+STATUSES = ('pending', 'released', 'paid', 'cancelled')
+PENDING, RELEASED, PAID, CANCELLED = range(len(STATUSES))
+
+# (kind, commission id, order id, salesperson id, order_total, commission_percent);
+# kind is 'insert' (no id), 'update' or 'cancel' (no amounts).
+Change = Tuple[str, Optional[str], str, Optional[str], Optional[str], Optional[str]]
+
+
+@dataclass
+class Existing:
+    """The ``commissions`` rows of the period's orders, oldest first."""
+
+    ids: List[str]
+    order: np.ndarray  # int32 index into Orders
+    salesperson: np.ndarray  # int32 code, shared with Orders
+    base_cents: np.ndarray  # int64, order_total
+    rate_bp: np.ndarray  # int32, commission_percent * 100
+    status: np.ndarray  # int8 index into STATUSES
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+@dataclass
+class Plan:
+    inserts: np.ndarray  # order indices
+    updates: np.ndarray  # row indices into Existing
+    cancels: np.ndarray  # row indices
+    locked: np.ndarray  # paid rows that differ, row indices
+    duplicates: np.ndarray  # extra live rows, row indices
+    unchanged: int
+    delta_cents: int  # change of the period's commission_amount total
+
+    @property
+    def changes(self) -> int:
+        return len(self.inserts) + len(self.updates) + len(self.cancels)
+
+
+def diff(orders: Orders, expected: Expected, existing: Existing) -> Plan:
+    live = np.flatnonzero(existing.status != CANCELLED)
+    # np.unique's first occurrences: the oldest live row of each order.
+    _, first = np.unique(existing.order[live], return_index=True)
+    current = live[np.sort(first)]
+    duplicates = np.setdiff1d(live, current)
+
+    has_row = np.zeros(len(orders), dtype=bool)
+    has_row[existing.order[current]] = True
+    amount = expected.amount_cents
+    inserts = np.flatnonzero(orders.active & ~has_row & (amount > 0))
+
+    o = existing.order[current]
+    differs = (
+        (existing.base_cents[current] != expected.base_cents[o])
+        | (existing.rate_bp[current] != expected.rate_bp[o])
+        | (existing.salesperson[current] != orders.salesperson[o])
+    )
+    status = existing.status[current]
+    writable = (status == PENDING) | (status == RELEASED)
+    active = orders.active[o]
+    updates = current[writable & active & differs]
+    cancels = current[writable & ~active]
+    locked = current[~writable & (differs | ~active)]
+
+    old = commission_cents(existing.base_cents, existing.rate_bp)
+    delta = (
+        amount[inserts].sum()
+        + (amount[existing.order[updates]] - old[updates]).sum()
+        - old[cancels].sum()
+    )
+    return Plan(
+        inserts=inserts,
+        updates=updates,
+        cancels=cancels,
+        locked=locked,
+        duplicates=duplicates,
+        unchanged=len(current) - len(updates) - len(cancels) - len(locked),
+        delta_cents=int(delta),
+    )
+
+
+def _decimal(value: int) -> str:
+    """Cents (or hundredths of a percent) as a ``DECIMAL(_, 2)`` literal."""
+    sign = '-' if value < 0 else ''
+    value = abs(value)
+    return f'{sign}{value // 100}.{value % 100:02d}'
+
+
+def changes(
+    plan: Plan,
+    orders: Orders,
+    expected: Expected,
+    existing: Existing,
+    salespeople: List[str],
+) -> Iterator[Change]:
+    """The rows to write, ``salespeople`` mapping codes back to ids."""
+
+    def row(kind: str, commission: Optional[str], o: int) -> Change:
+        return (
+            kind,
+            commission,
+            orders.ids[o],
+            salespeople[orders.salesperson[o]],
+            _decimal(int(expected.base_cents[o])),
+            _decimal(int(expected.rate_bp[o])),
+        )
+
+    for o in plan.inserts.tolist():
+        yield row('insert', None, o)
+    for r in plan.updates.tolist():
+        yield row('update', existing.ids[r], int(existing.order[r]))
+    for r in plan.cancels.tolist():
+        yield ('cancel', existing.ids[r], orders.ids[existing.order[r]], None, None, None)
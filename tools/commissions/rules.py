@@ -0,0 +1,240 @@
+"""Commission rules over a period's orders, as whole-column array operations.
+
+The commission of a sales order is ``commission_percent`` of its *base*:
+
+* ``profit`` (default; what the estimate screens show): the sum over its
+  items of ``(unit_price - cost) * quantity``, less ``discount_amount``
+  when ``deduct_discount_from_commission`` is set, never below zero;
+* ``total``: the order total as ``update_sales_order_totals()`` computes
+  it, items less discount plus shipping.
+
+An item's cost is the ``price_table`` entry in effect on the order date:
+the one for its ``product_id``, else for its model, capacity and grade,
+else for its model and capacity, else for its model alone (an entry with no
+capacity or grade applies to all of them). The most recent entry starting
+on or before the order date wins, if it has not expired. Items no entry
+covers keep the ``cost_price`` snapshot taken when the order was created.
+
+The rate is the order's own ``commission_percent``, or with
+``rates='customer'`` the customer's current ``default_commission_percent``.
+Money is integer cents and rates integer hundredths of a percent
+(``DECIMAL(5,2)``), so the arithmetic is exact.
+
+``compute_rowwise`` applies the same rules one item at a time; it is the
+reference the vectorized ``compute`` is checked against.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    raise ImportError('numpy is required for commission rules (pip install numpy)') from None
+
+BASES = ('profit', 'total')
+RATES = ('order', 'customer')
+NO_KEY = -1
+# Composite (key, day) sort keys: days since 1970 are offset into 22 bits.
+_DAY_BITS = 22
+_DAY_OFFSET = 1 << (_DAY_BITS - 1)
+NO_START = -_DAY_OFFSET  # valid_from of an entry with none
+NO_EXPIRY = 2**31 - 1  # valid_until of an entry with none
+# Cost lookups in priority order; each only fills the items the previous left.
+KEY_COLUMNS = ('product_key', 'model_key', 'model_capacity_key', 'model_only_key')
+
+
+@dataclass
+class Orders:
+    """One entry per order of the period, in the order of ``ids``."""
+
+    ids: List[str]
+    salesperson: np.ndarray  # int32 code, -1 when unassigned
+    active: np.ndarray  # bool: not cancelled, not deleted, has a salesperson
+    day: np.ndarray  # int32, order_date as days since 1970-01-01
+    rate_bp: np.ndarray  # int32, the order's commission_percent * 100
+    customer_rate_bp: np.ndarray  # int32, the customer's default_commission_percent * 100
+    discount_cents: np.ndarray  # int64
+    shipping_cents: np.ndarray  # int64
+    deduct_discount: np.ndarray  # bool
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+
+@dataclass
+class Items:
+    order: np.ndarray  # int32 index into Orders
+    quantity: np.ndarray  # int64
+    unit_cents: np.ndarray  # int64
+    snapshot_cost_cents: np.ndarray  # int64, sales_order_items.cost_price
+    # int64 codes into the PriceTable's keys, NO_KEY when no entry has the key
+    product_key: np.ndarray
+    model_key: np.ndarray  # model + capacity + grade
+    model_capacity_key: np.ndarray
+    model_only_key: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+
+@dataclass
+class PriceTable:
+    key: np.ndarray  # int64 code (see Items)
+    valid_from: np.ndarray  # int32 day, NO_START when open-ended
+    valid_until: np.ndarray  # int32 day, NO_EXPIRY when open-ended
+    cost_cents: np.ndarray  # int64
+
+    def __len__(self) -> int:
+        return len(self.key)
+
+    @classmethod
+    def empty(cls) -> 'PriceTable':
+        int32 = np.zeros(0, dtype=np.int32)
+        int64 = np.zeros(0, dtype=np.int64)
+        return cls(int64, int32, int32, int64)
+
+
+@dataclass
+class Expected:
+    """What the ``commissions`` row of each order should hold."""
+
+    base_cents: np.ndarray  # int64, written to commissions.order_total
+    rate_bp: np.ndarray  # int32, written to commissions.commission_percent
+    cost_source: Dict[str, int]  # items costed from each source
+
+    @property
+    def amount_cents(self) -> np.ndarray:
+        return commission_cents(self.base_cents, self.rate_bp)
+
+
+def commission_cents(base_cents: np.ndarray, rate_bp: np.ndarray) -> np.ndarray:
+    """``order_total * commission_percent / 100`` rounded to cents, as Postgres does."""
+    product = base_cents.astype(np.int64) * rate_bp.astype(np.int64)
+    return np.sign(product) * ((np.abs(product) + 5_000) // 10_000)
+
+
+def _composite(key: np.ndarray, day: np.ndarray) -> np.ndarray:
+    return (key.astype(np.int64) << _DAY_BITS) + (day.astype(np.int64) + _DAY_OFFSET)
+
+
+def item_costs(orders: Orders, items: Items, prices: PriceTable) -> tuple:
+    """``(cost cents per item, per-item source: 0 snapshot, 1.. the KEY_COLUMNS pass + 1)``."""
+    cost = items.snapshot_cost_cents.copy()
+    source = np.zeros(len(items), dtype=np.int8)
+    if not len(prices) or not len(items):
+        return cost, source
+    # Among entries starting the same day the longest-lived (then dearest) one wins.
+    order = np.lexsort((prices.cost_cents, prices.valid_until, prices.valid_from, prices.key))
+    sorted_keys = prices.key[order]
+    composite = _composite(sorted_keys, prices.valid_from[order])
+    until = prices.valid_until[order]
+    costs = prices.cost_cents[order]
+    day = orders.day[items.order]
+    for rank, column in enumerate(KEY_COLUMNS, start=1):
+        pending = source == 0
+        keys = getattr(items, column)
+        candidates = np.flatnonzero(pending & (keys != NO_KEY))
+        if not len(candidates):
+            continue
+        wanted = keys[candidates]
+        at = np.searchsorted(composite, _composite(wanted, day[candidates]), side='right') - 1
+        found = at >= 0
+        at = np.where(found, at, 0)
+        found &= (sorted_keys[at] == wanted) & (until[at] >= day[candidates])
+        hit = candidates[found]
+        cost[hit] = costs[at[found]]
+        source[hit] = rank
+    return cost, source
+
+
+def compute(
+    orders: Orders,
+    items: Items,
+    prices: Optional[PriceTable] = None,
+    base: str = 'profit',
+    rates: str = 'order',
+) -> Expected:
+    if base not in BASES:
+        raise ValueError(f'base must be one of {", ".join(BASES)}')
+    if rates not in RATES:
+        raise ValueError(f'rates must be one of {", ".join(RATES)}')
+    n = len(orders)
+    if base == 'profit':
+        cost, source = item_costs(orders, items, prices or PriceTable.empty())
+        margin = (items.unit_cents - cost) * items.quantity
+        # Sums of integer cents stay exact in float64 below 2**53 (90 trillion dollars).
+        totals = np.bincount(items.order, weights=margin, minlength=n).round().astype(np.int64)
+        totals -= np.where(orders.deduct_discount, orders.discount_cents, 0)
+    else:
+        source = np.zeros(len(items), dtype=np.int8)
+        revenue = items.unit_cents * items.quantity
+        totals = np.bincount(items.order, weights=revenue, minlength=n).round().astype(np.int64)
+        totals += orders.shipping_cents - orders.discount_cents
+    counts = np.bincount(source, minlength=len(KEY_COLUMNS) + 1)
+    return Expected(
+        base_cents=np.maximum(totals, 0),
+        rate_bp=(orders.rate_bp if rates == 'order' else orders.customer_rate_bp).copy(),
+        cost_source={
+            'snapshot': int(counts[0]),
+            **{column: int(count) for column, count in zip(KEY_COLUMNS, counts[1:])},
+        },
+    )
+
+
+def compute_rowwise(
+    orders: Orders,
+    items: Items,
+    prices: Optional[PriceTable] = None,
+    base: str = 'profit',
+    rates: str = 'order',
+) -> Expected:
+    """``compute``, one item and one price entry at a time."""
+    entries: Dict[int, List[tuple]] = {}
+    if prices is not None:
+        for key, start, end, cost in zip(
+            prices.key.tolist(),
+            prices.valid_from.tolist(),
+            prices.valid_until.tolist(),
+            prices.cost_cents.tolist(),
+        ):
+            entries.setdefault(key, []).append((start, end, cost))
+    days = orders.day.tolist()
+    totals = [0] * len(orders)
+    counts = dict.fromkeys(['snapshot', *KEY_COLUMNS], 0)
+    keys = [getattr(items, column).tolist() for column in KEY_COLUMNS]
+    for i, (order, quantity, unit, snapshot) in enumerate(
+        zip(
+            items.order.tolist(),
+            items.quantity.tolist(),
+            items.unit_cents.tolist(),
+            items.snapshot_cost_cents.tolist(),
+        )
+    ):
+        if base == 'total':
+            totals[order] += unit * quantity
+            counts['snapshot'] += 1
+            continue
+        cost, source = snapshot, 'snapshot'
+        for column, column_keys in zip(KEY_COLUMNS, keys):
+            started = [e for e in entries.get(column_keys[i], ()) if e[0] <= days[order]]
+            if started:
+                start, end, price = max(started)
+                if end >= days[order]:
+                    cost, source = price, column
+                    break
+        counts[source] += 1
+        totals[order] += (unit - cost) * quantity
+    for o in range(len(orders)):
+        if base == 'total':
+            totals[o] += int(orders.shipping_cents[o]) - int(orders.discount_cents[o])
+        elif orders.deduct_discount[o]:
+            totals[o] -= int(orders.discount_cents[o])
+    rate = orders.rate_bp if rates == 'order' else orders.customer_rate_bp
+    return Expected(
+        base_cents=np.maximum(np.array(totals, dtype=np.int64), 0),
+        rate_bp=rate.copy(),
+        cost_source=counts,
+    )
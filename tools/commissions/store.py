@@ -0,0 +1,294 @@
+"""Read a period into columns and write the changed commissions back.
+
+Orders, items, price entries and commissions are read through server-side
+cursors in ``batch_size`` chunks, with money cast to integer cents and
+dates to day numbers in SQL so no ``Decimal`` or ``date`` is built per row.
+
+The write-back runs in one transaction, like ``tools.inventory_import``:
+each batch of changes is sent with ``COPY`` into a temporary table and
+applied with one ``UPDATE ... FROM`` per kind and one ``INSERT ... SELECT``,
+so the round trips grow with the number of batches, not rows. The updates
+re-check that the row is still pending or released, so a commission paid
+since it was read is left alone.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .diff import STATUSES, Change, Existing
+from .rules import NO_EXPIRY, NO_KEY, NO_START, Items, Orders, PriceTable
+
+DEFAULT_BATCH_SIZE = 50_000
+
+_EPOCH = "DATE '1970-01-01'"
+_PERIOD = 'o.order_date >= %s AND o.order_date < %s'
+
+_ORDERS = f"""
+SELECT o.id::text, o.salesperson_id::text,
+       o.status <> 'cancelled' AND o.deleted_at IS NULL AND o.salesperson_id IS NOT NULL,
+       o.order_date - {_EPOCH},
+       round(coalesce(o.commission_percent, 0) * 100)::int,
+       round(coalesce(a.default_commission_percent, 0) * 100)::int,
+       round(coalesce(o.discount_amount, 0) * 100)::bigint,
+       round(coalesce(o.shipping_cost, 0) * 100)::bigint,
+       coalesce(o.deduct_discount_from_commission, false)
+FROM public.sales_orders o
+LEFT JOIN public.agents a ON a.id = o.customer_id
+WHERE {_PERIOD}
+"""
+
+_ITEMS = f"""
+SELECT i.order_id::text, i.quantity, round(i.unit_price * 100)::bigint,
+       round(coalesce(i.cost_price, 0) * 100)::bigint,
+       i.product_id::text, coalesce(i.model, ''), coalesce(i.capacity, ''), coalesce(i.grade, '')
+FROM public.sales_order_items i
+JOIN public.sales_orders o ON o.id = i.order_id
+WHERE {_PERIOD}
+"""
+
+_PRICES = f"""
+SELECT product_id::text, coalesce(model, ''), coalesce(capacity, ''), coalesce(grade, ''),
+       round(cost_price * 100)::bigint,
+       coalesce(valid_from - {_EPOCH}, %s), coalesce(valid_until - {_EPOCH}, %s)
+FROM public.price_table
+WHERE cost_price IS NOT NULL AND (product_id IS NOT NULL OR coalesce(model, '') <> '')
+"""
+
+_COMMISSIONS = f"""
+SELECT c.id::text, c.order_id::text, c.salesperson_id::text,
+       round(c.order_total * 100)::bigint, round(c.commission_percent * 100)::int, c.status
+FROM public.commissions c
+JOIN public.sales_orders o ON o.id = c.order_id
+WHERE {_PERIOD}
+ORDER BY c.created_at, c.id
+"""
+
+_STAGE = """
+CREATE TEMP TABLE commission_changes (
+    kind text NOT NULL,
+    id uuid,
+    order_id uuid NOT NULL,
+    salesperson_id uuid,
+    order_total numeric(12,2),
+    commission_percent numeric(5,2)
+) ON COMMIT DROP
+"""
+
+_APPLY = {
+    'update': """
+UPDATE public.commissions c
+SET order_total = x.order_total, commission_percent = x.commission_percent,
+    salesperson_id = x.salesperson_id, updated_at = now()
+FROM commission_changes x
+WHERE x.kind = 'update' AND c.id = x.id AND c.status IN ('pending', 'released')
+""",
+    'cancel': """
+UPDATE public.commissions c
+SET status = 'cancelled', updated_at = now()
+FROM commission_changes x
+WHERE x.kind = 'cancel' AND c.id = x.id AND c.status IN ('pending', 'released')
+""",
+    'insert': """
+INSERT INTO public.commissions (order_id, salesperson_id, order_total, commission_percent)
+SELECT order_id, salesperson_id, order_total, commission_percent
+FROM commission_changes
+WHERE kind = 'insert'
+""",
+}
+
+
+class StoreError(RuntimeError):
+    pass
+
+
+@dataclass
+class Period:
+    since: dt.date
+    until: dt.date  # exclusive
+    orders: Orders
+    items: Items
+    prices: PriceTable
+    existing: Existing
+    salespeople: List[str]  # salesperson code -> id
+    unknown_orders: int = 0  # items or commissions of orders outside the read
+
+
+class _Codes:
+    """Dense integer codes for the distinct values of a column."""
+
+    def __init__(self) -> None:
+        self.values: List[str] = []
+        self.index: Dict[str, int] = {}
+
+    def add(self, value: Optional[str]) -> int:
+        if value is None:
+            return NO_KEY
+        code = self.index.get(value)
+        if code is None:
+            code = self.index[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def lookup(self, values: Iterable[Optional[str]], count: int) -> np.ndarray:
+        index = self.index
+        return np.fromiter((index.get(v, NO_KEY) for v in values), dtype=np.int64, count=count)
+
+
+def _model_key(model: str, capacity: str, grade: str) -> Optional[str]:
+    return f'm:{model}\x1f{capacity}\x1f{grade}' if model else None
+
+
+def _connect(dsn: str) -> Any:
+    try:
+        import psycopg
+    except ImportError:
+        raise StoreError(
+            'psycopg is required to read from Postgres (pip install "psycopg[binary]")'
+        ) from None
+    try:
+        return psycopg.connect(dsn)
+    except psycopg.OperationalError as e:
+        raise StoreError(f'could not connect to Postgres: {e}') from e
+
+
+class CommissionStore:
+    """Context manager: commits on a clean exit, rolls back on an exception."""
+
+    def __init__(self, dsn: str, batch_size: int = DEFAULT_BATCH_SIZE):
+        if batch_size < 1:
+            raise ValueError('batch size must be at least 1')
+        self.dsn = dsn
+        self.batch_size = batch_size
+        self.conn: Any = None
+
+    def __enter__(self) -> 'CommissionStore':
+        self.conn = _connect(self.dsn)
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        try:
+            if exc_type is None:
+                self.conn.commit()
+            else:
+                self.conn.rollback()
+        finally:
+            self.conn.close()
+
+    def _columns(self, name: str, sql: str, params: Sequence[Any], width: int) -> List[list]:
+        columns: List[list] = [[] for _ in range(width)]
+        with self.conn.cursor(name=f'commissions_{name}') as cur:
+            cur.itersize = self.batch_size
+            cur.execute(sql, params)
+            while True:
+                batch = cur.fetchmany(self.batch_size)
+                if not batch:
+                    return columns
+                for column, values in zip(columns, zip(*batch)):
+                    column.extend(values)
+
+    def load(self, since: dt.date, until: dt.date) -> Period:
+        """The orders dated in ``[since, until)``, their items and commissions."""
+        period = (since, until)
+        (ids, salesperson, active, day, rate, customer_rate, discount, shipping, deduct) = (
+            self._columns('orders', _ORDERS, period, 9)
+        )
+        order_index = {order_id: i for i, order_id in enumerate(ids)}
+        people = _Codes()
+        orders = Orders(
+            ids=ids,
+            salesperson=np.array([people.add(s) for s in salesperson], dtype=np.int32),
+            active=np.array(active, dtype=bool),
+            day=np.array(day, dtype=np.int32),
+            rate_bp=np.array(rate, dtype=np.int32),
+            customer_rate_bp=np.array(customer_rate, dtype=np.int32),
+            discount_cents=np.array(discount, dtype=np.int64),
+            shipping_cents=np.array(shipping, dtype=np.int64),
+            deduct_discount=np.array(deduct, dtype=bool),
+        )
+
+        keys = _Codes()
+        products, models, capacities, grades, cost, start, end = self._columns(
+            'prices', _PRICES, (NO_START, NO_EXPIRY), 7
+        )
+        prices = PriceTable(
+            key=np.array(
+                [
+                    keys.add(f'p:{p}' if p else _model_key(m, c, g))
+                    for p, m, c, g in zip(products, models, capacities, grades)
+                ],
+                dtype=np.int64,
+            ),
+            valid_from=np.array(start, dtype=np.int32),
+            valid_until=np.array(end, dtype=np.int32),
+            cost_cents=np.array(cost, dtype=np.int64),
+        )
+
+        (item_orders, quantity, unit, snapshot, products, models, capacities, grades) = (
+            self._columns('items', _ITEMS, period, 8)
+        )
+        n = len(item_orders)
+        order = np.fromiter((order_index.get(o, -1) for o in item_orders), np.int32, n)
+        items = Items(
+            order=order,
+            quantity=np.array(quantity, dtype=np.int64),
+            unit_cents=np.array(unit, dtype=np.int64),
+            snapshot_cost_cents=np.array(snapshot, dtype=np.int64),
+            product_key=keys.lookup((p and f'p:{p}' for p in products), n),
+            model_key=keys.lookup(map(_model_key, models, capacities, grades), n),
+            model_capacity_key=keys.lookup(
+                (_model_key(m, c, '') for m, c in zip(models, capacities)), n
+            ),
+            model_only_key=keys.lookup((_model_key(m, '', '') for m in models), n),
+        )
+
+        (commission_ids, commission_orders, sellers, base, percent, status) = self._columns(
+            'existing', _COMMISSIONS, period, 6
+        )
+        status_index = {s: i for i, s in enumerate(STATUSES)}
+        existing = Existing(
+            ids=commission_ids,
+            order=np.array([order_index.get(o, -1) for o in commission_orders], dtype=np.int32),
+            salesperson=np.array([people.add(s) for s in sellers], dtype=np.int32),
+            base_cents=np.array(base, dtype=np.int64),
+            rate_bp=np.array(percent, dtype=np.int32),
+            status=np.array([status_index[s] for s in status], dtype=np.int8),
+        )
+        # An order that moved into the period between the reads: leave it for the next run.
+        unknown = int((items.order < 0).sum() + (existing.order < 0).sum())
+        if unknown:
+            known = items.order >= 0
+            items = Items(**{k: v[known] for k, v in vars(items).items()})
+            known = existing.order >= 0
+            existing = Existing(
+                ids=[i for i, keep in zip(existing.ids, known.tolist()) if keep],
+                **{k: v[known] for k, v in vars(existing).items() if k != 'ids'},
+            )
+        return Period(since, until, orders, items, prices, existing, people.values, unknown)
+
+    def apply(self, changes: Iterable[Change]) -> Dict[str, int]:
+        """Write ``changes`` in batches; the rows each kind actually changed."""
+        written = dict.fromkeys(_APPLY, 0)
+        changes = iter(changes)
+        with self.conn.cursor() as cur:
+            cur.execute(_STAGE)
+            while True:
+                batch: List[Tuple] = list(islice(changes, self.batch_size))
+                if not batch:
+                    return written
+                with cur.copy(
+                    'COPY commission_changes '
+                    '(kind, id, order_id, salesperson_id, order_total, commission_percent) '
+                    'FROM STDIN'
+                ) as copy:
+                    for row in batch:
+                        copy.write_row(row)
+                for kind, sql in _APPLY.items():
+                    cur.execute(sql)
+                    written[kind] += max(cur.rowcount, 0)
+                cur.execute('TRUNCATE commission_changes')
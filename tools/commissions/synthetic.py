@@ -0,0 +1,125 @@
+"""A synthetic month of orders for benchmarking, shaped like the real tables.
+
+Ten items per order on average, forty salespeople, and a ``price_table``
+with entries at each level of the cost lookup whose cost changed mid-month.
+The ``commissions`` rows are the ones computed before that change, so the
+diff finds what a real re-price would: most open rows updated, a few
+missing, cancelled orders to cancel, paid rows locked.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from typing import Tuple
+
+import numpy as np
+
+from .diff import CANCELLED, PAID, PENDING, RELEASED, Existing
+from .rules import NO_EXPIRY, NO_KEY, Items, Orders, PriceTable, compute
+from .store import Period
+
+SALESPEOPLE = 40
+PRODUCTS = 3_000
+MONTH = dt.date(2026, 9, 1)
+_EPOCH = dt.date(1970, 1, 1)
+# Products [0, 2400) are priced by product_id, then by model/capacity/grade,
+# by model and capacity (four products each), by model (ten each); the rest
+# have no entry and keep their snapshot cost.
+_LEVELS = ((2_400, 0, 1), (2_700, 10_000, 1), (2_900, 20_000, 4), (2_950, 30_000, 10))
+
+
+def _uuid(kind: int, n: int) -> str:
+    return f'00000000-0000-4000-{8000 + kind:04x}-{n:012x}'
+
+
+def _keys(product: np.ndarray) -> Tuple[np.ndarray, ...]:
+    keys = []
+    start = 0
+    for end, offset, per in _LEVELS:
+        level = (product >= start) & (product < end)
+        keys.append(np.where(level, offset + product // per, NO_KEY).astype(np.int64))
+        start = end
+    return tuple(keys)
+
+
+def _price_table(base_cost: np.ndarray, change_day: int, change: np.ndarray) -> PriceTable:
+    """Two entries per key: the month's first half at cost, the rest at ``change``."""
+    products = np.arange(_LEVELS[-1][0])
+    key = np.max(np.stack(_keys(products)), axis=0)
+    key, first = np.unique(key, return_index=True)
+    cost = base_cost[products[first]]
+    n = len(key)
+    return PriceTable(
+        key=np.concatenate([key, key]),
+        valid_from=np.concatenate(
+            [np.full(n, change_day - 400), np.full(n, change_day)]
+        ).astype(np.int32),
+        valid_until=np.concatenate([np.full(n, change_day - 1), np.full(n, NO_EXPIRY)]).astype(
+            np.int32
+        ),
+        cost_cents=np.concatenate([cost, np.round(cost * change[: n]).astype(np.int64)]),
+    )
+
+
+def synthetic_month(items: int = 1_000_000, seed: int = 0) -> Period:
+    rng = np.random.default_rng(seed)
+    n_orders = max(1, items // 10)
+    day0 = (MONTH - _EPOCH).days
+    until = (MONTH.replace(day=28) + dt.timedelta(days=4)).replace(day=1)
+
+    salesperson = rng.integers(0, SALESPEOPLE, n_orders, dtype=np.int32)
+    salesperson[rng.random(n_orders) < 0.02] = NO_KEY
+    cancelled = rng.random(n_orders) < 0.03
+    discount = np.where(rng.random(n_orders) < 0.3, rng.integers(0, 5_000, n_orders), 0)
+    rates = np.array([200, 300, 500, 750], dtype=np.int32)
+    orders = Orders(
+        ids=[_uuid(1, i) for i in range(n_orders)],
+        salesperson=salesperson,
+        active=~cancelled & (salesperson != NO_KEY),
+        day=(day0 + rng.integers(0, (until - MONTH).days, n_orders)).astype(np.int32),
+        rate_bp=rng.choice(rates, n_orders),
+        customer_rate_bp=rng.choice(rates, n_orders),
+        discount_cents=discount.astype(np.int64),
+        shipping_cents=rng.integers(0, 4_000, n_orders).astype(np.int64),
+        deduct_discount=rng.random(n_orders) < 0.5,
+    )
+
+    base_cost = rng.integers(8_000, 90_000, PRODUCTS).astype(np.int64)
+    product = rng.integers(0, PRODUCTS, items)
+    product_key, model_key, model_capacity_key, model_only_key = _keys(product)
+    markup = rng.uniform(1.02, 1.3, items)
+    item_columns = Items(
+        order=np.sort(rng.integers(0, n_orders, items)).astype(np.int32),
+        quantity=np.where(rng.random(items) < 0.8, 1, rng.integers(2, 6, items)).astype(np.int64),
+        unit_cents=np.round(base_cost[product] * markup).astype(np.int64),
+        snapshot_cost_cents=base_cost[product],
+        product_key=product_key,
+        model_key=model_key,
+        model_capacity_key=model_capacity_key,
+        model_only_key=model_only_key,
+    )
+
+    # The costs of the month's second half change by up to 5%; the rows were
+    # computed when they had not, with 1% of the orders at another rate since.
+    change_day = day0 + 15
+    change = rng.uniform(0.95, 1.05, PRODUCTS)
+    before = compute(orders, item_columns, _price_table(base_cost, change_day, np.ones(PRODUCTS)))
+    prices = _price_table(base_cost, change_day, change)
+    before.rate_bp[rng.random(n_orders) < 0.01] = rng.choice(rates)
+
+    has_row = (salesperson != NO_KEY) & (before.amount_cents > 0) & (rng.random(n_orders) < 0.95)
+    rows = np.flatnonzero(has_row)
+    status = rng.choice(
+        np.array([PENDING, RELEASED, PAID], dtype=np.int8), len(rows), p=[0.6, 0.25, 0.15]
+    )
+    status[rng.random(len(rows)) < 0.01] = CANCELLED
+    existing = Existing(
+        ids=[_uuid(2, i) for i in range(len(rows))],
+        order=rows.astype(np.int32),
+        salesperson=salesperson[rows],
+        base_cents=before.base_cents[rows],
+        rate_bp=before.rate_bp[rows],
+        status=status,
+    )
+    salespeople = [_uuid(3, i) for i in range(SALESPEOPLE)]
+    return Period(MONTH, until, orders, item_columns, prices, existing, salespeople)
@@ -0,0 +1,24 @@
+"""TypeScript ``Database`` types generated from supabase/migrations, offline.
+
+    python -m tools.dbtypes --check
+    python -m tools.dbtypes --write
+    python -m tools.dbtypes > /tmp/supabase.ts
+"""
+
+from .deltas import DeltaCache, parse_migration, statement_deltas
+from .render import Rendered, render, table_block
+from .schema import Column, Constraint, Function, Schema, Table
+
+__all__ = [
+    'Column',
+    'Constraint',
+    'DeltaCache',
+    'Function',
+    'Rendered',
+    'Schema',
+    'Table',
+    'parse_migration',
+    'render',
+    'statement_deltas',
+    'table_block',
+]
@@ -0,0 +1,169 @@
+"""Command-line entry point: ``python -m tools.dbtypes``.
+
+Replays supabase/migrations in the order a fresh database needs (the
+``--defer`` order of tools.migrations, dev-only files skipped) and prints the
+``Database`` types ``supabase gen types typescript`` would print for the
+result, with no database involved.
+
+    --write    write src/types/supabase.ts (or --output) instead of printing
+    --check    compare with src/types/supabase.ts: per-table drift, exit 1 if any
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from tools.fsutil import atomic_write_text
+from tools.migrations.plan import MIGRATIONS_DIR, Migration, Plan, dev_only_names, order_key
+from tools.paths import REPO_ROOT
+
+from .deltas import CACHE_PATH, DeltaCache
+from .render import render
+from .schema import Schema
+
+TYPES_PATH = Path('src') / 'types' / 'supabase.ts'
+
+_TABLE = re.compile(r'^      (\w+|"[^"]+"): \{\n(.*?)^      \}$', re.MULTILINE | re.DOTALL)
+_ROW = re.compile(r'^        Row: \{\n(.*?)^        \}$', re.MULTILINE | re.DOTALL)
+
+
+def migration_order(root: Path, cache: DeltaCache, include_dev_only: bool) -> List[str]:
+    """Migration paths (relative to ``root``) in replay order, parsed through ``cache``."""
+    directory = root / MIGRATIONS_DIR
+    paths = sorted(
+        (p.relative_to(root).as_posix() for p in directory.glob('*.sql')),
+        key=lambda path: order_key(path.rsplit('/', 1)[-1]),
+    )
+    entries = cache.load(paths)
+    dev_only = dev_only_names(directory)
+    # The planner only needs each file's effects, which the cache keeps.
+    stubs = [
+        Migration(root / path, '', e.digest, [], e.parsed.effects, Path(path).name in dev_only)
+        for path, e in entries.items()
+    ]
+    sequence = Plan(stubs, defer=True).sequence
+    return [
+        m.path.relative_to(root).as_posix()
+        for m in sequence
+        if include_dev_only or not m.dev_only
+    ]
+
+
+def read_types(path: Path) -> str:
+    """The committed types file; the Supabase CLI on Windows writes UTF-16 and CRLF."""
+    raw = path.read_bytes()
+    utf16 = raw[:2] in (b'\xff\xfe', b'\xfe\xff')
+    text = raw.decode('utf-16') if utf16 else raw.decode('utf-8-sig')
+    return text.replace('\r\n', '\n')
+
+
+def _tables(text: str) -> Dict[str, str]:
+    tables = text.split('    Tables: {\n', 1)[-1].split('\n    Views: {', 1)[0]
+    return {m.group(1).strip('"'): m.group(2) for m in _TABLE.finditer(tables)}
+
+
+def _row(block: str) -> Dict[str, str]:
+    match = _ROW.search(block)
+    fields = match.group(1).splitlines() if match else []
+    return dict(line.strip().split(': ', 1) for line in fields if ': ' in line)  # type: ignore
+
+
+def drift(old: str, new: str) -> List[Tuple[str, str]]:
+    """``(table, message)`` for every table whose block differs between two types files."""
+    before, after = _tables(old), _tables(new)
+    notes: List[Tuple[str, str]] = []
+    for name in sorted(set(before) | set(after)):
+        if name not in before:
+            notes.append((name, 'missing from the file (the migrations create it)'))
+        elif name not in after:
+            notes.append((name, 'in the file only (no migration creates it, or one drops it)'))
+        elif before[name] != after[name]:
+            old_row, new_row = _row(before[name]), _row(after[name])
+            changes = [f'+{c}' for c in sorted(set(new_row) - set(old_row))]
+            changes += [f'-{c}' for c in sorted(set(old_row) - set(new_row))]
+            changes += [
+                f'~{c}: {old_row[c]} -> {new_row[c]}'
+                for c in sorted(set(old_row) & set(new_row))
+                if old_row[c] != new_row[c]
+            ]
+            notes.append((name, ', '.join(changes) or 'keys, defaults or relationships differ'))
+    if old.split('    Tables: {', 1)[0] != new.split('    Tables: {', 1)[0]:
+        notes.append(('-', 'header differs'))
+    old_rest, new_rest = old.split('\n    Views: {', 1)[-1], new.split('\n    Views: {', 1)[-1]
+    if old_rest != new_rest:
+        notes.append(('-', 'functions, enums or helper types differ'))
+    return notes
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m tools.dbtypes',
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--root', type=Path, default=REPO_ROOT)
+    action = parser.add_mutually_exclusive_group()
+    action.add_argument('--write', action='store_true', help='write the types file')
+    action.add_argument('--check', action='store_true', help='report drift from the types file')
+    parser.add_argument(
+        '--output', type=Path, metavar='PATH', help=f'types file (default: {TYPES_PATH})'
+    )
+    parser.add_argument(
+        '--include-dev-only', action='store_true', help='replay DEV_ONLY_MIGRATIONS.md files too'
+    )
+    parser.add_argument(
+        '--no-cache', action='store_true', help='ignore and do not update the delta cache'
+    )
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    root = args.root.resolve()
+    output = args.output or root / TYPES_PATH
+    cache = DeltaCache(root, root / CACHE_PATH, persist=not args.no_cache)
+    schema = Schema()
+    try:
+        paths = migration_order(root, cache, args.include_dev_only)
+        for path in paths:
+            schema.replay(cache.files[path].parsed.deltas)
+        result = render(schema, cache.rendered)
+        cache.save(result.blocks)
+    except (OSError, ValueError) as e:
+        print(f'❌ {e}', file=sys.stderr)
+        return 2
+    elapsed = time.perf_counter() - started
+
+    status = 0
+    if args.check:
+        try:
+            notes = drift(read_types(output), result.text)
+        except OSError as e:
+            print(f'❌ {e}', file=sys.stderr)
+            return 2
+        for table, message in notes:
+            print(f'⚠️  {table}: {message}')
+        if notes:
+            print(f'\n❌ {output} is out of date: python -m tools.dbtypes --write')
+            status = 1
+        else:
+            print(f'✅ {output} matches the migrations')
+    elif args.write:
+        atomic_write_text(output, result.text)
+        print(f'✅ {output} written')
+    else:
+        sys.stdout.write(result.text)
+    print(
+        f'📊 {len(paths)} migrations ({len(cache.parsed)} parsed), {len(schema.tables)} tables '
+        f'({len(result.rendered)} rendered), {len(schema.enums)} enums, '
+        f'{len(schema.functions)} functions in {elapsed:.2f}s',
+        file=sys.stderr if not (args.check or args.write) else sys.stdout,
+    )
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,690 @@
+"""Reduce migration files to the schema changes they make.
+
+Each file becomes a list of JSON-able deltas (``{'op': ..., ...}``):
+
+    create_table / drop_table / rename_table
+    add_column / drop_column / alter_column / rename_column
+    add_constraint / drop_constraint / rename_constraint
+    unique_index / drop_index
+    create_enum / add_enum_value / rename_enum_value / rename_type / drop_type
+    function / drop_function
+
+Only what the generated types depend on is kept: column types, nullability,
+defaults, identity and generated columns, keys and foreign keys, enums and
+function signatures. Statements inside ``DO`` blocks count too.
+
+Deltas per file are cached in ``.cache/dbtypes.json`` keyed by
+``(mtime_ns, size, content hash)``, together with the file's planner effects
+so the deferred migration order needs no re-parse either. The same file
+keeps the rendered TypeScript of each table keyed by a digest of the table,
+which is what lets one new migration re-render only the tables it changes.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from tools.fsutil import atomic_write_text, content_hash
+from tools.migrations.plan import Effects, statement_effects
+from tools.migrations.sql import Token, block_statements, read_name, split_statements, tokenize
+from tools.paths import REPO_ROOT
+
+CACHE_VERSION = 1
+CACHE_PATH = Path('.cache') / 'dbtypes.json'
+
+Delta = Dict[str, Any]
+
+_RELEVANT = frozenset(('create', 'alter', 'drop'))
+_TABLE_CONSTRAINTS = frozenset(('constraint', 'primary', 'unique', 'foreign', 'check', 'exclude'))
+# Words that end a column type and start its constraints.
+_COLUMN_CLAUSES = frozenset(
+    'not null default primary unique references check constraint generated collate '
+    'deferrable initially using'.split()
+)
+_ARG_MODES = frozenset(('in', 'out', 'inout', 'variadic'))
+# Multi-word type names: the words that may follow each word.
+_TYPE_WORDS = {
+    'double': ('precision',),
+    'character': ('varying',),
+    'bit': ('varying',),
+    'timestamp': ('with', 'without'),
+    'time': ('with', 'without', 'zone'),
+    'with': ('time',),
+    'without': ('time',),
+}
+
+_TYPE_ALIASES = {
+    'integer': 'int4',
+    'int': 'int4',
+    'smallint': 'int2',
+    'bigint': 'int8',
+    'serial': 'int4',
+    'serial4': 'int4',
+    'smallserial': 'int2',
+    'serial2': 'int2',
+    'bigserial': 'int8',
+    'serial8': 'int8',
+    'real': 'float4',
+    'float': 'float8',
+    'double precision': 'float8',
+    'decimal': 'numeric',
+    'boolean': 'bool',
+    'character varying': 'varchar',
+    'character': 'bpchar',
+    'char': 'bpchar',
+    'timestamp without time zone': 'timestamp',
+    'timestamp with time zone': 'timestamptz',
+    'time without time zone': 'time',
+    'time with time zone': 'timetz',
+}
+_SERIAL = frozenset(('serial', 'serial2', 'serial4', 'serial8', 'smallserial', 'bigserial'))
+
+
+def _word(tokens: Tuple[Token, ...], i: int) -> str:
+    return tokens[i].value if i < len(tokens) and tokens[i].kind == 'word' else ''
+
+
+def _skip(tokens: Tuple[Token, ...], i: int, *words: str) -> int:
+    while _word(tokens, i) in words and _word(tokens, i):
+        i += 1
+    return i
+
+
+def _is(tokens: Tuple[Token, ...], i: int, op: str) -> bool:
+    return i < len(tokens) and tokens[i].kind == 'op' and tokens[i].value == op
+
+
+def _group(tokens: Tuple[Token, ...], i: int) -> Tuple[Tuple[Token, ...], int]:
+    """The tokens inside the parenthesized group opening at ``tokens[i]``, and the index after."""
+    depth = 0
+    for j in range(i, len(tokens)):
+        if tokens[j].kind != 'op':
+            continue
+        depth += tokens[j].value == '('
+        depth -= tokens[j].value == ')'
+        if depth == 0:
+            return tokens[i + 1 : j], j + 1
+    return tokens[i + 1 :], len(tokens)
+
+
+def _split_commas(tokens: Tuple[Token, ...]) -> List[Tuple[Token, ...]]:
+    parts: List[Tuple[Token, ...]] = []
+    depth, start = 0, 0
+    for j, token in enumerate(tokens):
+        if token.kind != 'op':
+            continue
+        depth += token.value in ('(', '[')
+        depth -= token.value in (')', ']')
+        if token.value == ',' and depth == 0:
+            parts.append(tokens[start:j])
+            start = j + 1
+    parts.append(tokens[start:])
+    return [p for p in parts if p]
+
+
+def _ident(tokens: Tuple[Token, ...], i: int) -> Optional[str]:
+    return tokens[i].value if i < len(tokens) and tokens[i].kind in ('word', 'qident') else None
+
+
+def _idents(tokens: Tuple[Token, ...]) -> List[str]:
+    """``(a, b)`` contents as names; an expression element becomes ''."""
+    return [
+        part[0].value if len(part) == 1 and part[0].kind in ('word', 'qident') else ''
+        for part in _split_commas(tokens)
+    ]
+
+
+def read_type(tokens: Tuple[Token, ...], i: int) -> Tuple[Dict[str, Any], int]:
+    """The type starting at ``tokens[i]`` as ``{'type', 'array', 'serial'}``, and the index after.
+
+    Names are normalized to Postgres' internal ones (``integer`` -> ``int4``);
+    type modifiers (``numeric(10, 2)``, ``varchar(255)``) are dropped.
+    """
+    words: List[str] = []
+    array = False
+    while i < len(tokens):
+        token = tokens[i]
+        if token.kind in ('word', 'qident'):
+            if token.kind == 'word' and token.value in _COLUMN_CLAUSES:
+                break
+            if token.value == 'array':
+                array = True
+            elif not words or _is(tokens, i - 1, '.'):
+                words.append(token.value)
+            elif token.value in _TYPE_WORDS.get(words[-1], ()):
+                words.append(token.value)
+            else:
+                break
+            i += 1
+        elif _is(tokens, i, '.'):
+            i += 1
+        elif _is(tokens, i, '('):
+            _, i = _group(tokens, i)
+        elif _is(tokens, i, '['):
+            array = True
+            while i < len(tokens) and not _is(tokens, i, ']'):
+                i += 1
+            i += 1
+        else:
+            break
+    if len(words) > 1 and words[0] in ('public', 'pg_catalog'):
+        words = words[1:]
+    name = ' '.join(words)
+    # ``timestamptz``, ``varchar`` and friends already are internal names.
+    return {
+        'type': _TYPE_ALIASES.get(name, name),
+        'array': array,
+        'serial': name in _SERIAL,
+    }, i
+
+
+def _references(tokens: Tuple[Token, ...], i: int) -> Tuple[Optional[str], List[str], int]:
+    """``REFERENCES t (cols)`` from ``tokens[i]`` (just after REFERENCES)."""
+    target, i = read_name(tokens, i)
+    columns: List[str] = []
+    if _is(tokens, i, '('):
+        inner, i = _group(tokens, i)
+        columns = _idents(inner)
+    return target, columns, i
+
+
+def _constraint(tokens: Tuple[Token, ...]) -> Optional[Delta]:
+    """A table constraint (``[CONSTRAINT n] PRIMARY KEY (a) | UNIQUE (a) | FOREIGN KEY ...``)."""
+    name, i = None, 0
+    if _word(tokens, 0) == 'constraint':
+        name, i = _ident(tokens, 1), 2
+    kind = _word(tokens, i)
+    if kind not in ('primary', 'unique', 'foreign'):
+        return None
+    i = _skip(tokens, i + 1, 'key', 'nulls', 'not', 'distinct')
+    if not _is(tokens, i, '('):
+        return None
+    inner, i = _group(tokens, i)
+    columns = _idents(inner)
+    if '' in columns:
+        return None
+    constraint: Delta = {'kind': kind, 'name': name, 'columns': columns}
+    if kind == 'foreign':
+        if _word(tokens, i) != 'references':
+            return None
+        target, ref_columns, _ = _references(tokens, i + 1)
+        constraint.update(ref_table=target, ref_columns=ref_columns)
+    return constraint
+
+
+def column_definition(tokens: Tuple[Token, ...]) -> Tuple[Optional[Delta], List[Delta]]:
+    """``name type [constraints]`` -> the column and the constraints declared on it."""
+    name = _ident(tokens, 0)
+    if name is None:
+        return None, []
+    kind, i = read_type(tokens, 1)
+    column: Delta = {
+        'name': name,
+        'type': kind['type'],
+        'array': kind['array'],
+        'nullable': True,
+        'default': kind['serial'],
+        'identity': None,
+        'generated': False,
+    }
+    if kind['serial']:
+        column['nullable'] = False
+    constraints: List[Delta] = []
+    pending: Optional[str] = None
+    while i < len(tokens):
+        word = _word(tokens, i)
+        if _is(tokens, i, '('):
+            _, i = _group(tokens, i)
+            continue
+        if word == 'constraint':
+            pending = _ident(tokens, i + 1)
+            i += 2
+            continue
+        if word == 'not' and _word(tokens, i + 1) == 'null':
+            column['nullable'] = False
+            i += 2
+            continue
+        if word == 'default':
+            column['default'] = True
+        elif word == 'primary':
+            column['nullable'] = False
+            constraints.append({'kind': 'primary', 'name': pending, 'columns': [name]})
+            pending = None
+        elif word == 'unique':
+            constraints.append({'kind': 'unique', 'name': pending, 'columns': [name]})
+            pending = None
+        elif word == 'references':
+            target, ref_columns, i = _references(tokens, i + 1)
+            constraints.append(
+                {
+                    'kind': 'foreign',
+                    'name': pending,
+                    'columns': [name],
+                    'ref_table': target,
+                    'ref_columns': ref_columns,
+                }
+            )
+            pending = None
+            continue
+        elif word == 'generated':
+            j = _skip(tokens, i + 1, 'always', 'by', 'default', 'as')
+            if _word(tokens, j) == 'identity':
+                column['identity'] = 'default' if _word(tokens, i + 1) == 'by' else 'always'
+                column['nullable'] = False
+            else:
+                # Postgres keeps the expression in pg_attrdef, as a default.
+                column['generated'] = column['default'] = True
+            i = j
+            continue
+        i += 1
+    return column, constraints
+
+
+def _create_table(tokens: Tuple[Token, ...], i: int, deltas: List[Delta]) -> None:
+    if_not_exists = _word(tokens, i) == 'if'
+    table, i = read_name(tokens, _skip(tokens, i, 'if', 'not', 'exists'))
+    if table is None or not _is(tokens, i, '('):
+        return  # CREATE TABLE ... AS / PARTITION OF: no column list to read
+    body, _ = _group(tokens, i)
+    columns: List[Delta] = []
+    constraints: List[Delta] = []
+    for element in _split_commas(body):
+        if _word(element, 0) in _TABLE_CONSTRAINTS:
+            constraint = _constraint(element)
+            if constraint is not None:
+                constraints.append(constraint)
+        elif _word(element, 0) != 'like':
+            column, declared = column_definition(element)
+            if column is not None:
+                columns.append(column)
+                constraints.extend(declared)
+    deltas.append(
+        {
+            'op': 'create_table',
+            'table': table,
+            'if_not_exists': if_not_exists,
+            'columns': columns,
+            'constraints': constraints,
+        }
+    )
+
+
+def _alter_column(table: str, column: str, action: Tuple[Token, ...]) -> Optional[Delta]:
+    words = [t.value for t in action if t.kind == 'word'][:4]
+    delta: Delta = {'op': 'alter_column', 'table': table, 'column': column}
+    if words[:1] == ['type'] or words[:3] == ['set', 'data', 'type']:
+        start = next(j for j, t in enumerate(action) if t.kind == 'word' and t.value == 'type')
+        kind, _ = read_type(action, start + 1)
+        delta.update(type=kind['type'], array=kind['array'])
+    elif words[:3] == ['set', 'not', 'null']:
+        delta['nullable'] = False
+    elif words[:3] == ['drop', 'not', 'null']:
+        delta['nullable'] = True
+    elif words[:2] == ['set', 'default']:
+        delta['default'] = True
+    elif words[:2] == ['drop', 'default']:
+        delta['default'] = False
+    elif words[:1] == ['add'] and 'identity' in _words(action):
+        delta['identity'] = 'default' if 'by' in words else 'always'
+    elif words[:2] == ['drop', 'identity']:
+        delta['identity'] = None
+    elif words[:2] == ['drop', 'expression']:
+        delta['generated'] = False
+    else:
+        return None
+    return delta
+
+
+def _alter_table(tokens: Tuple[Token, ...], i: int, deltas: List[Delta]) -> None:
+    table, i = read_name(tokens, _skip(tokens, i, 'if', 'exists', 'only'))
+    if table is None:
+        return
+    for action in _split_commas(tokens[i:]):
+        verb = _word(action, 0)
+        if verb == 'add':
+            j = 1
+            if _word(action, 1) in _TABLE_CONSTRAINTS:
+                constraint = _constraint(action[1:])
+                if constraint is not None:
+                    deltas.append({'op': 'add_constraint', 'table': table, **constraint})
+                continue
+            j = _skip(action, j, 'column')
+            if_not_exists = _word(action, j) == 'if'
+            j = _skip(action, j, 'if', 'not', 'exists')
+            column, declared = column_definition(action[j:])
+            if column is not None:
+                deltas.append(
+                    {
+                        'op': 'add_column',
+                        'table': table,
+                        'column': column,
+                        'constraints': declared,
+                        'if_not_exists': if_not_exists,
+                    }
+                )
+        elif verb == 'drop':
+            if _word(action, 1) == 'constraint':
+                name = _ident(action, _skip(action, 2, 'if', 'exists'))
+                deltas.append({'op': 'drop_constraint', 'table': table, 'name': name})
+            else:
+                name = _ident(action, _skip(action, 1, 'column', 'if', 'exists'))
+                deltas.append({'op': 'drop_column', 'table': table, 'column': name})
+        elif verb == 'alter':
+            j = _skip(action, 1, 'column')
+            column = _ident(action, j)
+            if column is not None:
+                delta = _alter_column(table, column, action[j + 1 :])
+                if delta is not None:
+                    deltas.append(delta)
+        elif verb == 'rename':
+            if _word(action, 1) == 'to':
+                new_name, _ = read_name(action, 2)
+                deltas.append({'op': 'rename_table', 'table': table, 'to': new_name})
+            elif _word(action, 1) == 'constraint':
+                old, new = _ident(action, 2), _ident(action, 4)
+                deltas.append({'op': 'rename_constraint', 'table': table, 'name': old, 'to': new})
+            else:
+                j = _skip(action, 1, 'column')
+                old, new = _ident(action, j), _ident(action, j + 2)
+                deltas.append({'op': 'rename_column', 'table': table, 'column': old, 'to': new})
+
+
+def _unique_index(tokens: Tuple[Token, ...], i: int, deltas: List[Delta]) -> None:
+    """``CREATE UNIQUE INDEX [name] ON t (a, b)``; partial and expression indexes do not count."""
+    i = _skip(tokens, i, 'concurrently', 'if', 'not', 'exists')
+    name = _ident(tokens, i) if _word(tokens, i) != 'on' else None
+    j = next((k for k in range(i, len(tokens)) if _word(tokens, k) == 'on'), None)
+    if j is None:
+        return
+    table, k = read_name(tokens, _skip(tokens, j + 1, 'only'))
+    if _word(tokens, k) == 'using':
+        k += 2
+    if table is None or not _is(tokens, k, '('):
+        return
+    inner, k = _group(tokens, k)
+    columns = _idents(inner)
+    if '' in columns or _word(tokens, k) == 'where':
+        return
+    deltas.append({'op': 'unique_index', 'table': table, 'name': name, 'columns': columns})
+
+
+def _enum(tokens: Tuple[Token, ...], i: int, deltas: List[Delta]) -> None:
+    name, i = read_name(tokens, i)
+    if name is None or _word(tokens, i) != 'as' or _word(tokens, i + 1) != 'enum':
+        return
+    values: List[str] = []
+    if _is(tokens, i + 2, '('):
+        inner, _ = _group(tokens, i + 2)
+        values = [t.value[1:-1].replace("''", "'") for t in inner if t.kind == 'string']
+    deltas.append({'op': 'create_enum', 'name': name, 'values': values})
+
+
+def _alter_type(tokens: Tuple[Token, ...], deltas: List[Delta]) -> None:
+    name, i = read_name(tokens, 2)
+    if name is None:
+        return
+    verb = _word(tokens, i)
+    strings = [t.value[1:-1].replace("''", "'") for t in tokens[i:] if t.kind == 'string']
+    if verb == 'add' and _word(tokens, i + 1) == 'value' and strings:
+        where = next((w for w in ('before', 'after') if w in _words(tokens[i:])), None)
+        delta: Delta = {'op': 'add_enum_value', 'name': name, 'value': strings[0]}
+        if where and len(strings) > 1:
+            delta[where] = strings[1]
+        deltas.append(delta)
+    elif verb == 'rename' and _word(tokens, i + 1) == 'value' and len(strings) == 2:
+        deltas.append(
+            {'op': 'rename_enum_value', 'name': name, 'value': strings[0], 'to': strings[1]}
+        )
+    elif verb == 'rename' and _word(tokens, i + 1) == 'to':
+        new_name, _ = read_name(tokens, i + 2)
+        deltas.append({'op': 'rename_type', 'name': name, 'to': new_name})
+
+
+def _words(tokens: Tuple[Token, ...]) -> List[str]:
+    return [t.value for t in tokens if t.kind == 'word']
+
+
+def _arguments(tokens: Tuple[Token, ...]) -> List[Delta]:
+    args: List[Delta] = []
+    for part in _split_commas(tokens):
+        mode = _word(part, 0) if _word(part, 0) in _ARG_MODES else 'in'
+        j = 1 if _word(part, 0) in _ARG_MODES else 0
+        name = None
+        follows = part[j + 1] if j + 1 < len(part) else None
+        named = follows is not None and follows.kind in ('word', 'qident')
+        if named and _word(part, j) not in _TYPE_WORDS and follows.value not in ('default',):
+            name, j = part[j].value, j + 1
+        kind, k = read_type(part, j)
+        rest = _words(part[k:])
+        default = 'default' in rest or any(t.kind == 'op' and t.value == '=' for t in part[k:])
+        args.append(
+            {
+                'name': name,
+                'mode': mode,
+                'type': kind['type'],
+                'array': kind['array'],
+                'default': default,
+            }
+        )
+    return args
+
+
+def _function(tokens: Tuple[Token, ...], i: int, deltas: List[Delta]) -> None:
+    name, i = read_name(tokens, i)
+    if name is None or not _is(tokens, i, '('):
+        return
+    inner, i = _group(tokens, i)
+    args = _arguments(inner)
+    returns: Delta = {'type': 'void', 'array': False, 'setof': False, 'columns': None}
+    if _word(tokens, i) == 'returns':
+        j = i + 1
+        if _word(tokens, j) == 'table' and _is(tokens, j + 1, '('):
+            columns, _ = _group(tokens, j + 1)
+            returns['columns'] = [
+                {'name': c['name'], 'type': c['type'], 'array': c['array']}
+                for c in _arguments(columns)
+            ]
+            returns['setof'] = True
+        else:
+            returns['setof'] = _word(tokens, j) == 'setof'
+            kind, _ = read_type(tokens, j + 1 if returns['setof'] else j)
+            returns.update(type=kind['type'], array=kind['array'])
+    else:
+        # A procedure, or OUT parameters that build a record.
+        outs = [a for a in args if a['mode'] in ('out', 'inout')]
+        if outs:
+            returns['columns'] = [
+                {'name': a['name'], 'type': a['type'], 'array': a['array']} for a in outs
+            ]
+    deltas.append({'op': 'function', 'name': name, 'args': args, 'returns': returns})
+
+
+def _drop(tokens: Tuple[Token, ...], deltas: List[Delta]) -> None:
+    kind = _word(tokens, 1)
+    i = _skip(tokens, 2, 'if', 'exists', 'concurrently')
+    cascade = 'cascade' in _words(tokens[-1:])
+    found: List[Tuple[str, Optional[List[str]]]] = []
+    while i < len(tokens):
+        name, i = read_name(tokens, i)
+        if name is None:
+            break
+        signature = None
+        if _is(tokens, i, '('):
+            inner, i = _group(tokens, i)
+            signature = [
+                a['type'] + '[]' * a['array'] for a in _arguments(inner) if a['mode'] != 'out'
+            ]
+        found.append((name, signature))
+        if not _is(tokens, i, ','):
+            break
+        i += 1
+    if kind == 'table':
+        tables = [name for name, _ in found]
+        deltas.append({'op': 'drop_table', 'tables': tables, 'cascade': cascade})
+    elif kind == 'type':
+        names = [name for name, _ in found]
+        deltas.append({'op': 'drop_type', 'names': names, 'cascade': cascade})
+    elif kind == 'index':
+        deltas.append({'op': 'drop_index', 'names': [name for name, _ in found]})
+    elif kind == 'function':
+        for name, signature in found:
+            deltas.append({'op': 'drop_function', 'name': name, 'signature': signature})
+
+
+def statement_deltas(tokens: Tuple[Token, ...]) -> List[Delta]:
+    """The schema changes of one statement."""
+    deltas: List[Delta] = []
+    verb = _word(tokens, 0)
+    if verb == 'create':
+        i = _skip(tokens, 1, 'or', 'replace', 'temp', 'temporary', 'unlogged', 'global', 'local')
+        kind = _word(tokens, i)
+        if kind == 'table' and _word(tokens, i - 1) not in ('temp', 'temporary'):
+            _create_table(tokens, i + 1, deltas)
+        elif kind == 'unique' and _word(tokens, i + 1) == 'index':
+            _unique_index(tokens, i + 2, deltas)
+        elif kind == 'type':
+            _enum(tokens, i + 1, deltas)
+        elif kind == 'function':
+            _function(tokens, i + 1, deltas)
+    elif verb == 'alter':
+        kind = _word(tokens, 1)
+        if kind == 'table':
+            _alter_table(tokens, 2, deltas)
+        elif kind == 'type':
+            _alter_type(tokens, deltas)
+    elif verb == 'drop':
+        _drop(tokens, deltas)
+    elif verb == 'do':
+        for token in tokens:
+            if token.kind == 'body':
+                for statement in block_statements(tuple(tokenize(token.value)), _RELEVANT):
+                    deltas.extend(statement_deltas(statement))
+    return deltas
+
+
+@dataclass
+class Parsed:
+    deltas: List[Delta]
+    effects: Effects
+
+
+def parse_migration(text: str) -> Parsed:
+    deltas: List[Delta] = []
+    effects = Effects()
+    for statement in split_statements(text):
+        deltas.extend(statement_deltas(statement.tokens))
+        effects.update(statement_effects(statement.tokens))
+    return Parsed(deltas, effects)
+
+
+def _effects_json(effects: Effects) -> Dict[str, Any]:
+    return {
+        'creates': sorted(effects.creates),
+        'writes': sorted(effects.writes),
+        'names': sorted(effects.names),
+        'isolated': effects.isolated,
+    }
+
+
+def _effects(raw: Dict[str, Any]) -> Effects:
+    return Effects(
+        set(raw['creates']), set(raw['writes']), set(raw['names']), raw.get('isolated')
+    )
+
+
+@dataclass
+class _Entry:
+    mtime_ns: int
+    size: int
+    digest: str
+    parsed: Parsed = field(default_factory=lambda: Parsed([], Effects()))
+
+
+class DeltaCache:
+    """``migration -> deltas`` plus ``table digest -> rendered TypeScript``."""
+
+    def __init__(
+        self, root: Path = REPO_ROOT, cache_path: Optional[Path] = None, persist: bool = True
+    ):
+        self.root = Path(root)
+        self.cache_path = self.root / CACHE_PATH if cache_path is None else cache_path
+        self.persist = persist
+        self.files: Dict[str, _Entry] = {}
+        self.rendered: Dict[str, str] = {}
+        self.parsed: List[str] = []
+        self._dirty = False
+        if persist:
+            self._load()
+
+    def _load(self) -> None:
+        try:
+            raw = json.loads(self.cache_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        if raw.get('version') != CACHE_VERSION:
+            return
+        self.files = {
+            path: _Entry(
+                e['mtime_ns'], e['size'], e['digest'], Parsed(e['deltas'], _effects(e['effects']))
+            )
+            for path, e in raw.get('files', {}).items()
+        }
+        self.rendered = raw.get('rendered', {})
+
+    def save(self, rendered: Optional[Dict[str, str]] = None) -> None:
+        """Persist the deltas; ``rendered`` replaces the table blocks (the live ones only)."""
+        if rendered is not None and rendered != self.rendered:
+            self.rendered = rendered
+            self._dirty = True
+        if not self._dirty or not self.persist:
+            return
+        payload = {
+            'version': CACHE_VERSION,
+            'files': {
+                path: {
+                    'mtime_ns': e.mtime_ns,
+                    'size': e.size,
+                    'digest': e.digest,
+                    'deltas': e.parsed.deltas,
+                    'effects': _effects_json(e.parsed.effects),
+                }
+                for path, e in sorted(self.files.items())
+            },
+            'rendered': dict(sorted(self.rendered.items())),
+        }
+        atomic_write_text(self.cache_path, json.dumps(payload, separators=(',', ':')))
+        self._dirty = False
+
+    def entry(self, path: str) -> _Entry:
+        """The entry of ``path`` (relative to the root), reparsed only if its content changed."""
+        full_path = self.root / path
+        st = os.stat(full_path)
+        entry = self.files.get(path)
+        if entry is not None and entry.mtime_ns == st.st_mtime_ns and entry.size == st.st_size:
+            return entry
+        raw = full_path.read_bytes()
+        digest = content_hash(raw)
+        if entry is None or entry.digest != digest:
+            try:
+                parsed = parse_migration(raw.decode('utf-8'))
+            except ValueError as e:
+                raise ValueError(f'{path}: {e}') from None
+            entry = _Entry(st.st_mtime_ns, st.st_size, digest, parsed)
+            self.parsed.append(path)
+        else:
+            entry = _Entry(st.st_mtime_ns, st.st_size, digest, entry.parsed)
+        self.files[path] = entry
+        self._dirty = True
+        return entry
+
+    def load(self, paths: Iterable[str]) -> Dict[str, _Entry]:
+        """Entries for ``paths``; files no longer listed are forgotten."""
+        found = {path: self.entry(path) for path in paths}
+        for stale in [p for p in self.files if p not in found]:
+            del self.files[stale]
+            self._dirty = True
+        return found
@@ -0,0 +1,406 @@
+"""Render a :class:`~tools.dbtypes.schema.Schema` as ``supabase gen types typescript`` does.
+
+The output follows the CLI's layout line for line (tables, columns and
+relationships sorted by name, prettier's 80-column wrapping of unions and
+arrays, the helper types at the end), so regenerating
+``src/types/supabase.ts`` from the migrations only shows real schema changes
+in the diff.
+
+Column types map as postgres-meta maps them: numbers, strings, ``Json``,
+enums as ``Database["public"]["Enums"][...]``; anything else is ``unknown``.
+A column is optional in ``Insert`` when it is nullable, has a default (a stored
+generated column's expression is one, as in pg_attrdef) or is an identity;
+``GENERATED ALWAYS`` identity columns are ``never``.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Sequence
+
+from tools.fsutil import content_hash
+
+from .schema import Column, Function, Schema, Table
+
+POSTGREST_VERSION = '14.1'
+# prettier's printWidth in the CLI output.
+WIDTH = 80
+
+_NUMBER = frozenset(('int2', 'int4', 'int8', 'float4', 'float8', 'numeric'))
+_STRING = frozenset(
+    'bytea bpchar varchar date text citext time timetz timestamp timestamptz uuid vector'.split()
+)
+_TRIGGERS = frozenset(('trigger', 'event_trigger'))
+_IDENTIFIER = re.compile(r'^[A-Za-z_$][A-Za-z0-9_$]*$')
+
+HEADER = """export type Json =
+  | string
+  | number
+  | boolean
+  | null
+  | { [key: string]: Json | undefined }
+  | Json[]
+"""
+
+HELPERS = """type DatabaseWithoutInternals = Omit<Database, "__InternalSupabase">
+
+type DefaultSchema = DatabaseWithoutInternals[Extract<keyof Database, "public">]
+
+export type Tables<
+  DefaultSchemaTableNameOrOptions extends
+    | keyof (DefaultSchema["Tables"] & DefaultSchema["Views"])
+    | { schema: keyof DatabaseWithoutInternals },
+  TableName extends DefaultSchemaTableNameOrOptions extends {
+    schema: keyof DatabaseWithoutInternals
+  }
+    ? keyof (DatabaseWithoutInternals[DefaultSchemaTableNameOrOptions["schema"]]["Tables"] &
+        DatabaseWithoutInternals[DefaultSchemaTableNameOrOptions["schema"]]["Views"])
+    : never = never,
+> = DefaultSchemaTableNameOrOptions extends {
+  schema: keyof DatabaseWithoutInternals
+}
+  ? (DatabaseWithoutInternals[DefaultSchemaTableNameOrOptions["schema"]]["Tables"] &
+      DatabaseWithoutInternals[DefaultSchemaTableNameOrOptions["schema"]]["Views"])[TableName] extends {
+      Row: infer R
+    }
+    ? R
+    : never
+  : DefaultSchemaTableNameOrOptions extends keyof (DefaultSchema["Tables"] &
+        DefaultSchema["Views"])
+    ? (DefaultSchema["Tables"] &
+        DefaultSchema["Views"])[DefaultSchemaTableNameOrOptions] extends {
+        Row: infer R
+      }
+      ? R
+      : never
+    : never
+
+export type TablesInsert<
+  DefaultSchemaTableNameOrOptions extends
+    | keyof DefaultSchema["Tables"]
+    | { schema: keyof DatabaseWithoutInternals },
+  TableName extends DefaultSchemaTableNameOrOptions extends {
+    schema: keyof DatabaseWithoutInternals
+  }
+    ? keyof DatabaseWithoutInternals[DefaultSchemaTableNameOrOptions["schema"]]["Tables"]
+    : never = never,
+> = DefaultSchemaTableNameOrOptions extends {
+  schema: keyof DatabaseWithoutInternals
+}
+  ? DatabaseWithoutInternals[DefaultSchemaTableNameOrOptions["schema"]]["Tables"][TableName] extends {
+      Insert: infer I
+    }
+    ? I
+    : never
+  : DefaultSchemaTableNameOrOptions extends keyof DefaultSchema["Tables"]
+    ? DefaultSchema["Tables"][DefaultSchemaTableNameOrOptions] extends {
+        Insert: infer I
+      }
+      ? I
+      : never
+    : never
+
+export type TablesUpdate<
+  DefaultSchemaTableNameOrOptions extends
+    | keyof DefaultSchema["Tables"]
+    | { schema: keyof DatabaseWithoutInternals },
+  TableName extends DefaultSchemaTableNameOrOptions extends {
+    schema: keyof DatabaseWithoutInternals
+  }
+    ? keyof DatabaseWithoutInternals[DefaultSchemaTableNameOrOptions["schema"]]["Tables"]
+    : never = never,
+> = DefaultSchemaTableNameOrOptions extends {
+  schema: keyof DatabaseWithoutInternals
+}
+  ? DatabaseWithoutInternals[DefaultSchemaTableNameOrOptions["schema"]]["Tables"][TableName] extends {
+      Update: infer U
+    }
+    ? U
+    : never
+  : DefaultSchemaTableNameOrOptions extends keyof DefaultSchema["Tables"]
+    ? DefaultSchema["Tables"][DefaultSchemaTableNameOrOptions] extends {
+        Update: infer U
+      }
+      ? U
+      : never
+    : never
+
+export type Enums<
+  DefaultSchemaEnumNameOrOptions extends
+    | keyof DefaultSchema["Enums"]
+    | { schema: keyof DatabaseWithoutInternals },
+  EnumName extends DefaultSchemaEnumNameOrOptions extends {
+    schema: keyof DatabaseWithoutInternals
+  }
+    ? keyof DatabaseWithoutInternals[DefaultSchemaEnumNameOrOptions["schema"]]["Enums"]
+    : never = never,
+> = DefaultSchemaEnumNameOrOptions extends {
+  schema: keyof DatabaseWithoutInternals
+}
+  ? DatabaseWithoutInternals[DefaultSchemaEnumNameOrOptions["schema"]]["Enums"][EnumName]
+  : DefaultSchemaEnumNameOrOptions extends keyof DefaultSchema["Enums"]
+    ? DefaultSchema["Enums"][DefaultSchemaEnumNameOrOptions]
+    : never
+
+export type CompositeTypes<
+  PublicCompositeTypeNameOrOptions extends
+    | keyof DefaultSchema["CompositeTypes"]
+    | { schema: keyof DatabaseWithoutInternals },
+  CompositeTypeName extends PublicCompositeTypeNameOrOptions extends {
+    schema: keyof DatabaseWithoutInternals
+  }
+    ? keyof DatabaseWithoutInternals[PublicCompositeTypeNameOrOptions["schema"]]["CompositeTypes"]
+    : never = never,
+> = PublicCompositeTypeNameOrOptions extends {
+  schema: keyof DatabaseWithoutInternals
+}
+  ? DatabaseWithoutInternals[PublicCompositeTypeNameOrOptions["schema"]]["CompositeTypes"][CompositeTypeName]
+  : PublicCompositeTypeNameOrOptions extends keyof DefaultSchema["CompositeTypes"]
+    ? DefaultSchema["CompositeTypes"][PublicCompositeTypeNameOrOptions]
+    : never
+"""
+
+
+@dataclass
+class Rendered:
+    text: str
+    blocks: Dict[str, str]  # table digest -> block, for the next run
+    rendered: List[str]  # tables whose block was not in the cache
+
+
+def _key(name: str) -> str:
+    return name if _IDENTIFIER.match(name) else json.dumps(name)
+
+
+def _quoted(values: Sequence[str]) -> List[str]:
+    return [json.dumps(v, ensure_ascii=False) for v in values]
+
+
+class _Types:
+    def __init__(self, schema: Schema):
+        self.enums = set(schema.enums)
+        self.tables = set(schema.tables)
+
+    def ts(self, pg_type: str, array: bool = False) -> str:
+        if pg_type == 'bool':
+            base = 'boolean'
+        elif pg_type in _NUMBER:
+            base = 'number'
+        elif pg_type in _STRING:
+            base = 'string'
+        elif pg_type in ('json', 'jsonb'):
+            base = 'Json'
+        elif pg_type == 'void':
+            base = 'undefined'
+        elif pg_type == 'record':
+            base = 'Record<string, unknown>'
+        elif pg_type in self.enums:
+            base = f'Database["public"]["Enums"]["{pg_type}"]'
+        elif pg_type in self.tables:
+            base = f'Database["public"]["Tables"]["{pg_type}"]["Row"]'
+        else:
+            base = 'unknown'
+        return base + '[]' if array else base
+
+    def column(self, column: Column) -> str:
+        kind = self.ts(column.type, column.array)
+        return f'{kind} | null' if column.nullable else kind
+
+
+def _union(indent: str, name: str, values: List[str]) -> List[str]:
+    """``name: "a" | "b"``, or one ``| "a"`` per line past the print width."""
+    single = f'{indent}{name}: {" | ".join(values) or "never"}'
+    if len(single) <= WIDTH or len(values) < 2:
+        return [single]
+    return [f'{indent}{name}:'] + [f'{indent}  | {v}' for v in values]
+
+
+def _array(indent: str, name: str, values: List[str]) -> List[str]:
+    single = f'{indent}{name}: [{", ".join(values)}],'
+    if len(single) <= WIDTH or not values:
+        return [single]
+    return [f'{indent}{name}: ['] + [f'{indent}  {v},' for v in values] + [f'{indent}],']
+
+
+def _object(indent: str, name: str, fields: List[str], suffix: str = '') -> List[str]:
+    """``name: { a: T; b: U }`` when it fits, else one field per line."""
+    if not fields:
+        return [f'{indent}{name}: {{}}{suffix}']
+    single = f'{indent}{name}: {{ {"; ".join(fields)} }}{suffix}'
+    if len(single) <= WIDTH:
+        return [single]
+    return [f'{indent}{name}: {{'] + [f'{indent}  {f}' for f in fields] + [f'{indent}}}{suffix}']
+
+
+def digest(table: Table, schema: Schema) -> str:
+    """Changes whenever the table's block would: the table itself, the enums its
+    columns use and which of the tables it references exist."""
+    used = sorted({c.type for c in table.columns.values()} & set(schema.enums))
+    refs = sorted(
+        {c.ref_table for c in table.constraints.values() if c.ref_table in schema.tables}
+    )
+    return content_hash(json.dumps([asdict(table), used, refs], sort_keys=True).encode())
+
+
+def table_block(table: Table, schema: Schema, types: Optional[_Types] = None) -> str:
+    types = types or _Types(schema)
+    columns = [table.columns[name] for name in sorted(table.columns)]
+    lines = [f'      {_key(table.name)}: {{']
+    sections = []
+    for section in ('Row', 'Insert', 'Update'):
+        fields = []
+        for c in columns:
+            if section == 'Row':
+                fields.append(f'{_key(c.name)}: {types.column(c)}')
+            elif c.identity == 'always':
+                fields.append(f'{_key(c.name)}?: never')
+            else:
+                optional = section == 'Update' or c.nullable or c.default or bool(c.identity)
+                fields.append(f'{_key(c.name)}{"?" if optional else ""}: {types.column(c)}')
+        sections.append((section, fields))
+    for section, fields in sections:
+        if fields:
+            lines.append(f'        {section}: {{')
+            lines.extend(f'          {f}' for f in fields)
+            lines.append('        }')
+        else:
+            lines.append(f'        {section}: {{}}')
+    relationships = sorted(
+        (
+            c
+            for c in table.constraints.values()
+            if c.kind == 'foreign' and c.ref_table in schema.tables
+        ),
+        key=lambda c: c.name,
+    )
+    if relationships:
+        lines.append('        Relationships: [')
+        for fk in relationships:
+            lines += [
+                '          {',
+                f'            foreignKeyName: {json.dumps(fk.name)}',
+                f'            columns: [{", ".join(_quoted(fk.columns))}]',
+                f'            isOneToOne: {"true" if table.is_unique(fk.columns) else "false"}',
+                f'            referencedRelation: {json.dumps(fk.ref_table)}',
+                f'            referencedColumns: [{", ".join(_quoted(fk.ref_columns))}]',
+                '          },',
+            ]
+        lines.append('        ]')
+    else:
+        lines.append('        Relationships: []')
+    lines.append('      }')
+    return '\n'.join(lines)
+
+
+def _returns(function: Function, types: _Types) -> str:
+    returns = function.returns
+    if returns['columns']:
+        fields = [
+            f'{_key(c["name"] or "")}: {types.ts(c["type"], c["array"])}'
+            for c in returns['columns']
+        ]
+        shape = f'{{ {"; ".join(fields)} }}'
+    else:
+        shape = types.ts(returns['type'], returns['array'])
+    return shape + '[]' if returns['setof'] else shape
+
+
+def _args(function: Function, types: _Types) -> List[str]:
+    return [
+        f'{_key(a.name)}{"?" if a.default else ""}: {types.ts(a.type, a.array)}'
+        for a in function.args
+        if a.name and a.mode != 'out'
+    ]
+
+
+def _function_lines(name: str, overloads: List[Function], types: _Types) -> List[str]:
+    if len(overloads) == 1:
+        function = overloads[0]
+        fields = _args(function, types)
+        lines = [f'      {_key(name)}: {{']
+        if fields:
+            lines += _object('        ', 'Args', fields)
+        else:
+            lines.append('        Args: never')
+        lines.append(f'        Returns: {_returns(function, types)}')
+        return lines + ['      }']
+    variants = []
+    for function in overloads:
+        fields = _args(function, types)
+        args = f'{{ {"; ".join(fields)} }}' if fields else 'never'
+        variants.append(f'{{ Args: {args}; Returns: {_returns(function, types)} }}')
+    return [f'      {_key(name)}:'] + [f'        | {v}' for v in variants]
+
+
+def render(
+    schema: Schema,
+    blocks: Optional[Dict[str, str]] = None,
+    postgrest_version: str = POSTGREST_VERSION,
+) -> Rendered:
+    """The ``supabase.ts`` text; table blocks come from ``blocks`` when their digest is there."""
+    blocks = blocks or {}
+    types = _Types(schema)
+    live: Dict[str, str] = {}
+    rendered: List[str] = []
+    out = [
+        HEADER,
+        'export type Database = {',
+        '  // Allows to automatically instantiate createClient with right options',
+        "  // instead of createClient<Database, { PostgrestVersion: 'XX' }>(URL, KEY)",
+        '  __InternalSupabase: {',
+        f'    PostgrestVersion: {json.dumps(postgrest_version)}',
+        '  }',
+        '  public: {',
+        '    Tables: {',
+    ]
+    for name in sorted(schema.tables):
+        table = schema.tables[name]
+        key = digest(table, schema)
+        block = blocks.get(key)
+        if block is None:
+            block = table_block(table, schema, types)
+            rendered.append(name)
+        live[key] = block
+        out.append(block)
+    if not schema.tables:
+        out.append('      [_ in never]: never')
+    out += ['    }', '    Views: {', '      [_ in never]: never', '    }', '    Functions: {']
+    # Trigger functions are not callable through PostgREST, so the CLI leaves them out.
+    functions: Dict[str, List[Function]] = {}
+    for name, overloads in schema.functions.items():
+        callable_ = [f for f in overloads.values() if f.returns['type'] not in _TRIGGERS]
+        if callable_:
+            functions[name] = callable_
+    for name in sorted(functions):
+        out += _function_lines(name, functions[name], types)
+    if not functions:
+        out.append('      [_ in never]: never')
+    out += ['    }', '    Enums: {']
+    enum_names = sorted(schema.enums)
+    for name in enum_names:
+        out += _union('      ', _key(name), _quoted(schema.enums[name]))
+    if not enum_names:
+        out.append('      [_ in never]: never')
+    out += [
+        '    }',
+        '    CompositeTypes: {',
+        '      [_ in never]: never',
+        '    }',
+        '  }',
+        '}',
+        '',
+        HELPERS,
+        'export const Constants = {',
+        '  public: {',
+    ]
+    if enum_names:
+        out.append('    Enums: {')
+        for name in enum_names:
+            out += _array('      ', _key(name), _quoted(schema.enums[name]))
+        out.append('    },')
+    else:
+        out.append('    Enums: {},')
+    out += ['  },', '} as const', '']
+    return Rendered('\n'.join(out), live, rendered)
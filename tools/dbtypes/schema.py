@@ -0,0 +1,297 @@
+"""The public schema as the migrations leave it, rebuilt from their deltas.
+
+Replay follows Postgres where the types can tell: ``CREATE TABLE IF NOT
+EXISTS`` on an existing table and ``ADD COLUMN IF NOT EXISTS`` on an existing
+column do nothing, dropping a column drops the keys on it, ``DROP TABLE ...
+CASCADE`` drops the foreign keys pointing at the table, and renaming a type
+(the ``user_role`` -> ``user_role_old`` dance) carries its columns along.
+Unnamed constraints get Postgres' default names, which is what
+``foreignKeyName`` shows and what later ``DROP CONSTRAINT`` statements use.
+Objects outside ``public`` are ignored.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from .deltas import Delta
+
+# makeObjectName() truncates generated names to NAMEDATALEN - 1 bytes.
+_MAX_NAME = 63
+_LABELS = {'primary': 'pkey', 'unique': 'key', 'foreign': 'fkey'}
+
+
+@dataclass
+class Column:
+    name: str
+    type: str  # internal name (int4, timestamptz) or an enum
+    array: bool = False
+    nullable: bool = True
+    default: bool = False
+    identity: Optional[str] = None  # always | default
+    generated: bool = False
+
+
+@dataclass
+class Constraint:
+    kind: str  # primary | unique | foreign
+    name: str
+    columns: List[str]
+    ref_table: Optional[str] = None
+    ref_columns: List[str] = field(default_factory=list)
+
+
+@dataclass
+class Table:
+    name: str
+    columns: Dict[str, Column] = field(default_factory=dict)
+    constraints: Dict[str, Constraint] = field(default_factory=dict)
+    unique_indexes: Dict[str, List[str]] = field(default_factory=dict)
+
+    @property
+    def primary_key(self) -> List[str]:
+        return next((c.columns for c in self.constraints.values() if c.kind == 'primary'), [])
+
+    def is_unique(self, columns: List[str]) -> bool:
+        keys = [c.columns for c in self.constraints.values() if c.kind != 'foreign']
+        return any(set(k) == set(columns) for k in keys + list(self.unique_indexes.values()))
+
+
+@dataclass
+class Argument:
+    name: Optional[str]
+    type: str
+    array: bool = False
+    default: bool = False
+    mode: str = 'in'
+
+
+@dataclass
+class Function:
+    name: str
+    args: List[Argument]
+    returns: Dict[str, Any]  # {type, array, setof, columns: [{name, type, array}] | None}
+
+    @property
+    def signature(self) -> Tuple[str, ...]:
+        return tuple(a.type + '[]' * a.array for a in self.args if a.mode != 'out')
+
+
+def default_name(table: str, columns: List[str], label: str) -> str:
+    """``{table}_{columns}_{label}``, truncated the way makeObjectName() does."""
+    name1, name2 = table, '_'.join(columns)
+    available = _MAX_NAME - len(label) - 1 - (1 if name2 else 0)
+    while len(name1) + len(name2) > available:
+        if len(name1) > len(name2):
+            name1 = name1[:-1]
+        else:
+            name2 = name2[:-1]
+    return '_'.join(p for p in (name1, name2, label) if p)
+
+
+def _public(name: Optional[str]) -> bool:
+    return bool(name) and '.' not in name  # type: ignore[operator]
+
+
+class Schema:
+    def __init__(self) -> None:
+        self.tables: Dict[str, Table] = {}
+        self.enums: Dict[str, List[str]] = {}
+        self.functions: Dict[str, Dict[Tuple[str, ...], Function]] = {}
+
+    def replay(self, deltas: List[Delta]) -> None:
+        for delta in deltas:
+            getattr(self, '_' + delta['op'])(delta)
+
+    def _table(self, name: Optional[str]) -> Optional[Table]:
+        return self.tables.get(name) if name else None
+
+    def _add_constraint(self, delta: Delta) -> None:
+        table = self._table(delta['table'])
+        if table is None or not delta['columns']:
+            return
+        kind, name = delta['kind'], delta.get('name')
+        if name is None:
+            label = _LABELS[kind]
+            columns = [] if kind == 'primary' else delta['columns']
+            name = default_name(table.name, columns, label)
+            number = 0
+            while name in table.constraints:
+                number += 1
+                name = default_name(table.name, columns, f'{label}{number}')
+        ref_columns = list(delta.get('ref_columns') or [])
+        if kind == 'foreign' and not ref_columns:
+            target = self._table(delta.get('ref_table'))
+            ref_columns = target.primary_key if target else ['id']
+        if kind == 'primary':
+            for column in delta['columns']:
+                if column in table.columns:
+                    table.columns[column].nullable = False
+        table.constraints[name] = Constraint(
+            kind, name, list(delta['columns']), delta.get('ref_table'), ref_columns
+        )
+
+    def _column(self, table: Table, raw: Delta, constraints: List[Delta]) -> None:
+        table.columns[raw['name']] = Column(**raw)
+        for constraint in constraints:
+            self._add_constraint({'table': table.name, **constraint})
+
+    def _create_table(self, delta: Delta) -> None:
+        name = delta['table']
+        if not _public(name) or (name in self.tables and delta['if_not_exists']):
+            return
+        table = self.tables[name] = Table(name)
+        for raw in delta['columns']:
+            table.columns[raw['name']] = Column(**raw)
+        for constraint in delta['constraints']:
+            self._add_constraint({'table': name, **constraint})
+
+    def _drop_table(self, delta: Delta) -> None:
+        dropped = {name for name in delta['tables'] if self.tables.pop(name, None) is not None}
+        if not dropped:
+            return
+        for table in self.tables.values():
+            for name, constraint in list(table.constraints.items()):
+                if constraint.kind == 'foreign' and constraint.ref_table in dropped:
+                    del table.constraints[name]
+
+    def _rename_table(self, delta: Delta) -> None:
+        table = self.tables.pop(delta['table'], None)
+        if table is None or not _public(delta['to']):
+            return
+        table.name = delta['to']
+        self.tables[table.name] = table
+        for other in self.tables.values():
+            for constraint in other.constraints.values():
+                if constraint.ref_table == delta['table']:
+                    constraint.ref_table = table.name
+
+    def _add_column(self, delta: Delta) -> None:
+        table = self._table(delta['table'])
+        if table is None or delta['column']['name'] in table.columns:
+            return
+        self._column(table, delta['column'], delta['constraints'])
+
+    def _drop_column(self, delta: Delta) -> None:
+        table = self._table(delta['table'])
+        if table is None or table.columns.pop(delta['column'], None) is None:
+            return
+        for name, constraint in list(table.constraints.items()):
+            if delta['column'] in constraint.columns:
+                del table.constraints[name]
+        for name, columns in list(table.unique_indexes.items()):
+            if delta['column'] in columns:
+                del table.unique_indexes[name]
+
+    def _alter_column(self, delta: Delta) -> None:
+        table = self._table(delta['table'])
+        column = table.columns.get(delta['column']) if table else None
+        if column is None:
+            return
+        for key in ('type', 'array', 'nullable', 'default', 'identity', 'generated'):
+            if key in delta:
+                setattr(column, key, delta[key])
+        if delta.get('identity'):
+            column.nullable = False
+
+    def _rename_column(self, delta: Delta) -> None:
+        table = self._table(delta['table'])
+        if table is None or delta['column'] not in table.columns or not delta['to']:
+            return
+        old, new = delta['column'], delta['to']
+        column = table.columns.pop(old)
+        column.name = new
+        table.columns[new] = column
+
+        def renamed(columns: List[str]) -> List[str]:
+            return [new if c == old else c for c in columns]
+
+        for constraint in table.constraints.values():
+            constraint.columns = renamed(constraint.columns)
+        for name, columns in table.unique_indexes.items():
+            table.unique_indexes[name] = renamed(columns)
+        for other in self.tables.values():
+            for constraint in other.constraints.values():
+                if constraint.ref_table == table.name:
+                    constraint.ref_columns = renamed(constraint.ref_columns)
+
+    def _drop_constraint(self, delta: Delta) -> None:
+        table = self._table(delta['table'])
+        if table is not None:
+            table.constraints.pop(delta['name'], None)
+
+    def _rename_constraint(self, delta: Delta) -> None:
+        table = self._table(delta['table'])
+        constraint = table.constraints.pop(delta['name'], None) if table else None
+        if constraint is not None and table is not None:
+            constraint.name = delta['to']
+            table.constraints[constraint.name] = constraint
+
+    def _unique_index(self, delta: Delta) -> None:
+        table = self._table(delta['table'])
+        if table is not None:
+            name = delta['name'] or default_name(table.name, delta['columns'], 'idx')
+            table.unique_indexes[name] = list(delta['columns'])
+
+    def _drop_index(self, delta: Delta) -> None:
+        for name in delta['names']:
+            for table in self.tables.values():
+                table.unique_indexes.pop(name, None)
+                # Unique and primary keys are indexes too (DROP INDEX fails on them,
+                # but a migration that tries is simply skipped here).
+
+    def _create_enum(self, delta: Delta) -> None:
+        if _public(delta['name']):
+            self.enums[delta['name']] = list(delta['values'])
+
+    def _add_enum_value(self, delta: Delta) -> None:
+        values = self.enums.get(delta['name'])
+        if values is None or delta['value'] in values:
+            return
+        anchor = delta.get('before') or delta.get('after')
+        if anchor in values:
+            values.insert(values.index(anchor) + ('after' in delta), delta['value'])
+        else:
+            values.append(delta['value'])
+
+    def _rename_enum_value(self, delta: Delta) -> None:
+        values = self.enums.get(delta['name'], [])
+        if delta['value'] in values:
+            values[values.index(delta['value'])] = delta['to']
+
+    def _rename_type(self, delta: Delta) -> None:
+        old, new = delta['name'], delta['to']
+        if old not in self.enums or not _public(new):
+            return
+        self.enums[new] = self.enums.pop(old)
+        for table in self.tables.values():
+            for column in table.columns.values():
+                if column.type == old:
+                    column.type = new
+
+    def _drop_type(self, delta: Delta) -> None:
+        for name in delta['names']:
+            if self.enums.pop(name, None) is None or not delta['cascade']:
+                continue
+            for table in self.tables.values():
+                for column in [c for c in table.columns.values() if c.type == name]:
+                    self._drop_column({'table': table.name, 'column': column.name})
+
+    def _function(self, delta: Delta) -> None:
+        if not _public(delta['name']):
+            return
+        args = [Argument(**a) for a in delta['args']]
+        function = Function(delta['name'], args, delta['returns'])
+        self.functions.setdefault(function.name, {})[function.signature] = function
+
+    def _drop_function(self, delta: Delta) -> None:
+        overloads = self.functions.get(delta['name'])
+        if overloads is None:
+            return
+        if delta['signature'] is None:
+            overloads.clear()
+        else:
+            overloads.pop(tuple(delta['signature']), None)
+        if not overloads:
+            del self.functions[delta['name']]
@@ -0,0 +1,26 @@
+"""Batch-render estimate PDFs in the layout ``/api/estimates/[id]/pdf`` serves.
+
+    python -m tools.estimate_pdf render --out estimates.zip --since 2026-01-01
+    python -m tools.estimate_pdf render --fixture estimates.json --out pdfs/
+    python -m tools.estimate_pdf bench --estimates 5000 --workers 1,4,8
+"""
+
+from .batch import DirectorySink, Sink, ZipSink, open_sink, render_all
+from .layout import Rendered, Template
+from .pdf import Writer
+from .source import EstimateStore, SourceError, load_fixture, synthetic
+
+__all__ = [
+    'DirectorySink',
+    'EstimateStore',
+    'Rendered',
+    'Sink',
+    'SourceError',
+    'Template',
+    'Writer',
+    'ZipSink',
+    'load_fixture',
+    'open_sink',
+    'render_all',
+    'synthetic',
+]
@@ -0,0 +1,146 @@
+"""Command-line entry point: ``python -m tools.estimate_pdf``.
+
+    render   estimates from Postgres (--dsn) or a JSON fixture (--fixture) to
+             Estimate_<number>.pdf files in --out, or into one zip when --out
+             ends in .zip; --number / --status / --since / --until pick them
+    bench    render synthetic estimates and report pages per second, once per
+             --workers value (nothing is written unless --out is given)
+
+The layout is the one ``/api/estimates/[id]/pdf`` serves.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from .batch import DEFAULT_CHUNK, Sink, open_sink, render_all
+from .layout import Record
+from .source import EstimateStore, SourceError, load_fixture, synthetic
+
+
+def _write(
+    estimates: Iterable[Record], company: Record, args: argparse.Namespace, out: Optional[Sink]
+) -> int:
+    """Render into ``out`` (or nowhere), print the throughput; the estimates rendered."""
+    started = time.perf_counter()
+    count = pages = size = 0
+    try:
+        for rendered in render_all(estimates, company, args.workers, args.chunk):
+            if out is not None:
+                out.write(rendered)
+            count += 1
+            pages += rendered.pages
+            size += len(rendered.data)
+        if out is not None:
+            out.close()
+    except BaseException:
+        if out is not None:
+            out.abort()
+        raise
+    elapsed = time.perf_counter() - started
+    workers = args.workers or os.cpu_count() or 1
+    print(
+        f'📊 workers={workers}: {count:,} estimates, {pages:,} pages, '
+        f'{size / 2**20:,.1f} MiB in {elapsed:.2f}s: {pages / max(elapsed, 1e-9):,.0f} pages/s, '
+        f'{count / max(elapsed, 1e-9):,.0f} estimates/s'
+    )
+    return count
+
+
+def _render(args: argparse.Namespace) -> int:
+    if args.fixture:
+        company, estimates = load_fixture(args.fixture)
+        count = _write(estimates, company, args, open_sink(args.out))
+    else:
+        with EstimateStore(args.dsn) as store:
+            company = store.company()
+            selected = store.estimates(args.number, args.status, args.since, args.until)
+            count = _write(selected, company, args, open_sink(args.out))
+    if not count:
+        print('⚠️  no estimates matched')
+        return 1
+    print(f'✅ {args.out}')
+    return 0
+
+
+def _bench(args: argparse.Namespace) -> int:
+    estimates = list(synthetic(args.estimates, args.max_items, args.seed))
+    company = {
+        'company_name': 'Wind Wireless, LLC',
+        'company_address': '175 SW 7th St, Ste 1602, Miami, FL 33130',
+        'company_phone': '+1 305 555 0199',
+        'company_email': 'sales@windwireless.example',
+    }
+    for workers in args.workers_list:
+        args.workers = workers
+        _write(estimates, company, args, open_sink(args.out) if args.out else None)
+    return 0
+
+
+def _workers(value: str) -> List[int]:
+    workers = [int(v) for v in value.split(',') if v.strip()]
+    if not workers or min(workers) < 1:
+        raise argparse.ArgumentTypeError('expected positive counts, e.g. 1,4,8')
+    return workers
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m tools.estimate_pdf',
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        '--chunk', type=int, default=DEFAULT_CHUNK, help='estimates per worker task'
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    render = commands.add_parser('render', parents=[common], help='render estimates to PDF')
+    render.add_argument(
+        '--dsn', default=os.environ.get('DATABASE_URL'), help='default: $DATABASE_URL'
+    )
+    render.add_argument('--fixture', type=Path, help='JSON estimates instead of Postgres')
+    render.add_argument('--out', type=Path, required=True, help='directory, or a .zip file')
+    render.add_argument('--workers', type=int, help='render processes (default: CPU count)')
+    render.add_argument(
+        '--number', type=int, action='append', default=[], help='estimate_number (repeatable)'
+    )
+    render.add_argument('--status', action='append', default=[], help='status (repeatable)')
+    render.add_argument('--since', type=dt.date.fromisoformat, metavar='YYYY-MM-DD')
+    render.add_argument('--until', type=dt.date.fromisoformat, metavar='YYYY-MM-DD')
+
+    bench = commands.add_parser('bench', parents=[common], help='pages per second')
+    bench.add_argument('--estimates', type=int, default=2000, help='synthetic estimates')
+    bench.add_argument('--max-items', type=int, default=40, help='items per estimate, at most')
+    bench.add_argument('--seed', type=int, default=0)
+    bench.add_argument(
+        '--workers',
+        dest='workers_list',
+        type=_workers,
+        default=sorted({1, os.cpu_count() or 1}),
+        help='comma-separated process counts (default: 1,<CPU count>)',
+    )
+    bench.add_argument('--out', type=Path, help='also write the files (directory or .zip)')
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == 'bench':
+            return _bench(args)
+        if not (args.dsn or args.fixture):
+            print('❌ pass --fixture or --dsn (or set $DATABASE_URL)', file=sys.stderr)
+            return 2
+        return _render(args)
+    except (SourceError, OSError, ValueError) as e:
+        print(f'❌ {e}', file=sys.stderr)
+        return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
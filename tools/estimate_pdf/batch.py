@@ -0,0 +1,130 @@
+"""Render many estimates across a process pool and stream the files out.
+
+Each worker compiles the :class:`~.layout.Template` once, in the pool
+initializer, and reuses it for every estimate it is sent. Estimates go out
+in chunks with a bounded number in flight, and results come back in input
+order as they complete, so neither the source nor the sink ever holds more
+than a few chunks: a run over every estimate in the database has the
+footprint of a small one.
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+import tempfile
+import zipfile
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Deque, Iterable, Iterator, List, Optional
+
+from tools.fsutil import atomic_write_bytes
+
+from .layout import Record, Rendered, Template
+
+DEFAULT_CHUNK = 16
+
+_template: Optional[Template] = None
+
+
+def _init(company: Record, compress: bool) -> None:
+    global _template
+    _template = Template(company, compress)
+
+
+def _render_chunk(estimates: List[Record]) -> List[Rendered]:
+    assert _template is not None, 'worker started without _init'
+    return [_template.render(e) for e in estimates]
+
+
+def render_all(
+    estimates: Iterable[Record],
+    company: Record,
+    workers: Optional[int] = None,
+    chunk: int = DEFAULT_CHUNK,
+    compress: bool = True,
+) -> Iterator[Rendered]:
+    """Rendered estimates, in input order; ``workers=1`` renders in this process."""
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        template = Template(company, compress)
+        yield from map(template.render, estimates)
+        return
+    source = iter(estimates)
+    pending: Deque['Future[List[Rendered]]'] = deque()
+    with ProcessPoolExecutor(workers, initializer=_init, initargs=(company, compress)) as pool:
+        while True:
+            while len(pending) < workers * 2:
+                batch = list(itertools.islice(source, chunk))
+                if not batch:
+                    break
+                pending.append(pool.submit(_render_chunk, batch))
+            if not pending:
+                return
+            yield from pending.popleft().result()
+
+
+class Sink:
+    def __init__(self, path: Path):
+        self.path = path
+        self.files = 0
+        self.bytes = 0
+
+    def write(self, rendered: Rendered) -> None:
+        self._write(rendered)
+        self.files += 1
+        self.bytes += len(rendered.data)
+
+    def _write(self, rendered: Rendered) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+    def abort(self) -> None:
+        pass
+
+
+class DirectorySink(Sink):
+    """One ``Estimate_<number>.pdf`` per estimate, each written atomically."""
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        path.mkdir(parents=True, exist_ok=True)
+
+    def _write(self, rendered: Rendered) -> None:
+        atomic_write_bytes(self.path / rendered.filename, rendered.data)
+
+
+class ZipSink(Sink):
+    """One zip of every estimate, renamed into place when complete.
+
+    Entries are stored, not deflated again: the page streams already are.
+    Timestamps are fixed, so the same estimates always give the same archive.
+    """
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=f'.{path.name}.', dir=path.parent)
+        os.close(fd)
+        self.tmp = Path(tmp)
+        self.zip = zipfile.ZipFile(self.tmp, 'w', zipfile.ZIP_STORED)
+
+    def _write(self, rendered: Rendered) -> None:
+        info = zipfile.ZipInfo(rendered.filename, date_time=(1980, 1, 1, 0, 0, 0))
+        self.zip.writestr(info, rendered.data)
+
+    def close(self) -> None:
+        self.zip.close()
+        os.replace(self.tmp, self.path)
+
+    def abort(self) -> None:
+        self.zip.close()
+        self.tmp.unlink(missing_ok=True)
+
+
+def open_sink(path: Path) -> Sink:
+    """A zip when ``path`` ends in ``.zip``, else a directory."""
+    return ZipSink(path) if path.suffix.lower() == '.zip' else DirectorySink(path)
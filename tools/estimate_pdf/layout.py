@@ -0,0 +1,240 @@
+"""The estimate layout of ``src/app/api/estimates/[id]/pdf/route.ts``, compiled.
+
+Same page, coordinates, fonts, colours and table as the route draws with
+jsPDF and jspdf-autotable (striped theme, 9pt cells, 3 mm padding, the
+default 40pt margin), so a batch-rendered estimate looks like the one the
+app serves. Two things the route leaves to chance are handled: an item table
+longer than a page continues on the next one under a repeated header, as
+autotable does, and totals or terms that would run off the last page move
+to a new one.
+
+A :class:`Template` is built once per company and worker. Everything that
+does not depend on the estimate (the company header, the titles, the table
+header of the first and of the following pages) is compiled to content-stream
+bytes then; rendering an estimate only lays out its own text.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from .pdf import (
+    A4,
+    HELVETICA,
+    HELVETICA_BOLD,
+    LINE_HEIGHT,
+    MM,
+    Color,
+    Writer,
+    lines,
+    rect,
+    text,
+    wrap,
+)
+
+Record = Dict[str, Any]
+
+PURPLE: Color = (124, 58, 237)
+RED: Color = (239, 68, 68)
+GRAY: Color = (100, 100, 100)
+CELL_TEXT: Color = (80, 80, 80)  # the striped theme's
+HEAD_FILL: Color = (248, 250, 252)
+HEAD_TEXT: Color = (100, 116, 139)
+STRIPE: Color = (245, 245, 245)
+
+MARGIN = 40 / MM  # jspdf-autotable's default margin, ~14.1 mm
+TABLE_TOP = 90.0
+CELL_FONT = 9
+PADDING = 3.0
+FOOTER_FONT = 8
+TERMS_WIDTH = 180.0
+BOTTOM = A4[1] - MARGIN
+FOOTER = (('TERMS & CONDITIONS', 'terms'), ('PAYMENT METHODS', 'payment_methods'))
+
+# (title, width in mm or None for the rest, align, bold body text)
+COLUMNS: Tuple[Tuple[str, Optional[float], str, bool], ...] = (
+    ('Item / Description', None, 'left', False),
+    ('Grade', 20.0, 'center', False),
+    ('Qty', 15.0, 'center', False),
+    ('Price', 25.0, 'right', False),
+    ('Total', 30.0, 'right', True),
+)
+TABLE_WIDTH = A4[0] - 2 * MARGIN
+
+
+def _widths() -> List[float]:
+    fixed = sum(w for _, w, _, _ in COLUMNS if w)
+    return [w if w else TABLE_WIDTH - fixed for _, w, _, _ in COLUMNS]
+
+
+WIDTHS = _widths()
+LEFTS = [MARGIN + sum(WIDTHS[:i]) for i in range(len(WIDTHS))]
+
+
+@dataclass
+class Rendered:
+    number: Any  # estimate_number
+    filename: str
+    data: bytes
+    pages: int
+
+
+def _line_height(size: float) -> float:
+    return size * LINE_HEIGHT / MM
+
+
+def _date(value: Union[str, dt.date, None]) -> str:
+    """``new Date(value).toLocaleDateString()`` on the en-US, UTC server: 1/5/2026."""
+    if isinstance(value, str):
+        value = dt.date.fromisoformat(value[:10])
+    return f'{value.month}/{value.day}/{value.year}' if value else 'Invalid Date'
+
+
+def _number(value: Union[None, int, float, str, Decimal]) -> float:
+    return float(value or 0)
+
+
+def _money(value: float) -> str:
+    """``toLocaleString('en-US', {minimumFractionDigits: 2})``: 1,234.50."""
+    return f'{value:,.2f}'
+
+
+def _address(estimate: Record, prefix: str, extra: Sequence[str] = ()) -> List[str]:
+    """The route's Bill To / Ship To block: blank fields dropped, the city line always kept."""
+    def get(field: str) -> Any:
+        return estimate.get(f'{prefix}_{field}')
+
+    city = f'{get("city") or ""}, {get("state") or ""} {get("zip") or ""}'
+    fields = [get('name'), get('address'), city, get('country')] + [get(e) for e in extra]
+    kept = [str(f) for f in fields if f]
+    return '\n'.join(kept).split('\n') if kept else ['N/A']
+
+
+class Template:
+    """The layout with one company's header, compiled; ``render`` is pure and reentrant."""
+
+    def __init__(self, company: Optional[Record] = None, compress: bool = True):
+        company = company or {}
+        contact = f'{company.get("company_phone") or ""} | {company.get("company_email") or ""}'
+        self.writer = Writer(compress=compress)
+        self.header = b''.join(
+            (
+                text(HELVETICA_BOLD, 22, 14, 20, company.get('company_name') or 'WindWireless'),
+                text(HELVETICA, 10, 14, 26, company.get('company_address') or ''),
+                text(HELVETICA, 10, 14, 31, contact),
+                text(HELVETICA, 18, 150, 20, 'ESTIMATE', PURPLE),
+                text(HELVETICA_BOLD, 10, 14, 55, 'Bill To:'),
+                text(HELVETICA_BOLD, 10, 105, 55, 'Ship To:'),
+            )
+        )
+        self.head_height = _line_height(CELL_FONT) + 2 * PADDING
+        self.head_first = self._head(TABLE_TOP)
+        self.head_next = self._head(MARGIN)
+        self.cell_line = _line_height(CELL_FONT)
+        # autotable puts the first baseline 0.85 em below the padding.
+        self.cell_ascent = CELL_FONT * (2 - LINE_HEIGHT) / MM
+        self.footer_line = _line_height(FOOTER_FONT)
+
+    def _head(self, y: float) -> bytes:
+        out = [rect(MARGIN, y, TABLE_WIDTH, self.head_height, HEAD_FILL)]
+        baseline = y + PADDING + CELL_FONT * (2 - LINE_HEIGHT) / MM
+        for (title, _, _, _), left in zip(COLUMNS, LEFTS):
+            out.append(text(HELVETICA_BOLD, CELL_FONT, left + PADDING, baseline, title, HEAD_TEXT))
+        return b''.join(out)
+
+    def _cells(self, item: Record) -> List[List[str]]:
+        name = ' '.join(str(v) for v in (item.get('model'), item.get('capacity')) if v)
+        price = _number(item.get('unit_price'))
+        quantity = item.get('quantity') or 0
+        values = (
+            f'{name}\n{item.get("description") or ""}',
+            str(item.get('grade') or ''),
+            str(quantity),
+            f'${price:.2f}',
+            f'${float(quantity) * price:.2f}',
+        )
+        cells = []
+        for value, (_, _, _, bold), width in zip(values, COLUMNS, WIDTHS):
+            font = HELVETICA_BOLD if bold else HELVETICA
+            cells.append(wrap(font, CELL_FONT, value, width - 2 * PADDING))
+        return cells
+
+    def _row(self, y: float, cells: List[List[str]], height: float, striped: bool) -> bytes:
+        out = [rect(MARGIN, y, TABLE_WIDTH, height, STRIPE)] if striped else []
+        baseline = y + PADDING + self.cell_ascent
+        for cell, (_, _, align, bold), left, width in zip(cells, COLUMNS, LEFTS, WIDTHS):
+            font = HELVETICA_BOLD if bold else HELVETICA
+            if align == 'left':
+                x = left + PADDING
+            elif align == 'center':
+                x = left + width / 2
+            else:
+                x = left + width - PADDING
+            out.append(lines(font, CELL_FONT, x, baseline, cell, CELL_TEXT, align))
+        return b''.join(out)
+
+    def _footer(self, estimate: Record) -> Tuple[List[Tuple[str, List[str]]], float]:
+        """The terms blocks, wrapped, and the height below the table they need."""
+        blocks = []
+        height = 40.0
+        for title, field in FOOTER:
+            value = estimate.get(field)
+            if value:
+                wrapped = wrap(HELVETICA, FOOTER_FONT, str(value), TERMS_WIDTH)
+                blocks.append((title, wrapped))
+                height += 5 + max(20.0, len(wrapped) * self.footer_line)
+        return blocks, height
+
+    def render(self, estimate: Record) -> Rendered:
+        number = estimate.get('estimate_number')
+        page = [self.header]
+        page.append(text(HELVETICA, 12, 150, 28, f'#{number}'))
+        page.append(text(HELVETICA, 10, 150, 35, f'Date: {_date(estimate.get("estimate_date"))}'))
+        if estimate.get('ship_date'):
+            page.append(
+                text(HELVETICA, 10, 150, 40, f'Ship Date: {_date(estimate["ship_date"])}')
+            )
+        page.append(lines(HELVETICA, 10, 14, 62, _address(estimate, 'bill_to')))
+        page.append(lines(HELVETICA, 10, 105, 62, _address(estimate, 'ship_to', ('phone',))))
+
+        pages: List[bytes] = []
+        page.append(self.head_first)
+        y = TABLE_TOP + self.head_height
+        for index, item in enumerate(estimate.get('items') or ()):
+            cells = self._cells(item)
+            height = max(map(len, cells)) * self.cell_line + 2 * PADDING
+            if y + height > BOTTOM:
+                pages.append(b''.join(page))
+                page = [self.head_next]
+                y = MARGIN + self.head_height
+            page.append(self._row(y, cells, height, index % 2 == 0))
+            y += height
+
+        blocks, needed = self._footer(estimate)
+        if y + needed > BOTTOM:
+            pages.append(b''.join(page))
+            page = []
+            y = MARGIN
+        subtotal = _number(estimate.get('subtotal'))
+        discount = _number(estimate.get('discount_amount'))
+        page.append(text(HELVETICA, 10, 140, y + 10, 'Subtotal:'))
+        page.append(text(HELVETICA, 10, 195, y + 10, f'${_money(subtotal)}', align='right'))
+        if discount > 0:
+            page.append(text(HELVETICA, 10, 140, y + 16, 'Discount:', RED))
+            page.append(text(HELVETICA, 10, 195, y + 16, f'-${_money(discount)}', RED, 'right'))
+        page.append(text(HELVETICA_BOLD, 14, 140, y + 25, 'Total:'))
+        page.append(
+            text(HELVETICA_BOLD, 14, 195, y + 25, f'${_money(subtotal - discount)}', align='right')
+        )
+        y += 40
+        for title, wrapped in blocks:
+            page.append(text(HELVETICA_BOLD, FOOTER_FONT, 14, y, title, GRAY))
+            page.append(lines(HELVETICA, FOOTER_FONT, 14, y + 5, wrapped, GRAY))
+            y += 5 + max(20.0, len(wrapped) * self.footer_line)
+        pages.append(b''.join(page))
+
+        data = self.writer.document(pages, title=f'Estimate #{number}')
+        return Rendered(number, f'Estimate_{number}.pdf', data, len(pages))
@@ -0,0 +1,264 @@
+"""A small PDF 1.4 writer: the two Helvetica faces, text and filled rectangles.
+
+Enough for the estimate layout and nothing more. The fonts are the standard
+Type 1 faces every viewer ships (jsPDF uses the same ones), so nothing is
+embedded. Text is WinAnsi-encoded (characters outside it print as ``?``)
+and measured with the Adobe AFM widths, which right alignment and wrapping
+need. Coordinates are millimetres from the top-left corner, baselines for
+text, as in jsPDF.
+
+Page content is built as byte fragments, so the parts of a page that never
+change can be compiled once and spliced into every document.
+"""
+
+from __future__ import annotations
+
+import unicodedata
+import zlib
+from typing import Dict, List, Sequence, Tuple
+
+MM = 72 / 25.4  # points per millimetre
+A4 = (210.0, 297.0)
+LINE_HEIGHT = 1.15  # jsPDF's line height factor
+
+Color = Tuple[int, int, int]
+BLACK: Color = (0, 0, 0)
+
+# AFM widths (1/1000 em) of ' ' .. '~'.
+_HELVETICA = (
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+)
+_HELVETICA_BOLD = (
+    278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+    975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+    333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+    611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584,
+)
+# The Windows-1252 punctuation text is likely to carry: € … ‘ ’ “ ” • – —
+_PUNCTUATION = (128, 133, 145, 146, 147, 148, 149, 150, 151)
+_PUNCTUATION_WIDTHS = {
+    'Helvetica': (556, 1000, 222, 222, 333, 333, 350, 556, 1000),
+    'Helvetica-Bold': (556, 1000, 278, 278, 500, 500, 350, 556, 1000),
+}
+
+
+class Font:
+    """A standard face: its resource name and widths per WinAnsi byte."""
+
+    def __init__(self, key: str, base: str, ascii_widths: Sequence[int]):
+        self.key = key
+        self.base = base
+        widths = [0] * 256
+        widths[32:127] = ascii_widths
+        for code, width in zip(_PUNCTUATION, _PUNCTUATION_WIDTHS[base]):
+            widths[code] = width
+        for code in range(160, 256):
+            # Accented letters are as wide as their base letter (dotless i for
+            # í ì î ï, which is wider than i); the rest as wide as a digit.
+            decomposed = unicodedata.decomposition(bytes([code]).decode('cp1252')).split()
+            canonical = decomposed and not decomposed[0].startswith('<')
+            letter = chr(int(decomposed[0], 16)) if canonical else ''
+            if letter == 'i':
+                widths[code] = 278
+            elif letter and ' ' <= letter <= '~':
+                widths[code] = widths[ord(letter)]
+            else:
+                widths[code] = 556
+        widths[160] = widths[32]  # no-break space
+        self.widths = widths
+        self.object = (
+            f'<< /Type /Font /Subtype /Type1 /BaseFont /{base} /Encoding /WinAnsiEncoding >>'
+        ).encode('ascii')
+
+    def width(self, text: str, size: float) -> float:
+        """Width of ``text`` at ``size`` points, in millimetres."""
+        widths = self.widths
+        return sum(widths[b] for b in encode(text)) * size / 1000 / MM
+
+
+HELVETICA = Font('F1', 'Helvetica', _HELVETICA)
+HELVETICA_BOLD = Font('F2', 'Helvetica-Bold', _HELVETICA_BOLD)
+FONTS = (HELVETICA, HELVETICA_BOLD)
+
+
+def encode(text: str) -> bytes:
+    return text.encode('cp1252', 'replace')
+
+
+def _escape(data: bytes) -> bytes:
+    return data.replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)')
+
+
+def text(
+    font: Font,
+    size: float,
+    x: float,
+    y: float,
+    value: str,
+    color: Color = BLACK,
+    align: str = 'left',
+    page_height: float = A4[1],
+) -> bytes:
+    """One line of text with its baseline at ``y``; ``x`` is its left, centre or right."""
+    if align != 'left':
+        width = font.width(value, size)
+        x -= width / 2 if align == 'center' else width
+    r, g, b = (c / 255 for c in color)
+    return b'BT /%s %g Tf %.3f %.3f %.3f rg %.2f %.2f Td (%s) Tj ET\n' % (
+        font.key.encode('ascii'),
+        size,
+        r,
+        g,
+        b,
+        x * MM,
+        (page_height - y) * MM,
+        _escape(encode(value)),
+    )
+
+
+def lines(
+    font: Font,
+    size: float,
+    x: float,
+    y: float,
+    values: Sequence[str],
+    color: Color = BLACK,
+    align: str = 'left',
+) -> bytes:
+    """Several lines, ``size * LINE_HEIGHT`` apart, the first baseline at ``y``."""
+    step = size * LINE_HEIGHT / MM
+    return b''.join(
+        text(font, size, x, y + i * step, value, color, align) for i, value in enumerate(values)
+    )
+
+
+def rect(
+    x: float, y: float, width: float, height: float, color: Color, page_height: float = A4[1]
+) -> bytes:
+    """A filled rectangle whose top-left corner is at ``(x, y)``."""
+    r, g, b = (c / 255 for c in color)
+    return b'%.3f %.3f %.3f rg %.2f %.2f %.2f %.2f re f\n' % (
+        r,
+        g,
+        b,
+        x * MM,
+        (page_height - y - height) * MM,
+        width * MM,
+        height * MM,
+    )
+
+
+def wrap(font: Font, size: float, value: str, max_width: float) -> List[str]:
+    """``value`` split into lines no wider than ``max_width`` mm, at spaces where possible.
+
+    Explicit newlines are kept; a word wider than a whole line is broken
+    between characters, as jsPDF's ``splitTextToSize`` does.
+    """
+    scale = size / 1000 / MM
+    widths = font.widths
+    space = widths[32] * scale
+    out: List[str] = []
+    for paragraph in value.split('\n'):
+        line: List[str] = []
+        used = 0.0
+        for word in paragraph.split(' '):
+            width = sum(widths[b] for b in encode(word)) * scale
+            if line and used + space + width > max_width:
+                out.append(' '.join(line))
+                line, used = [], 0.0
+            if width > max_width:
+                piece = ''
+                for char in word:
+                    if piece and font.width(piece + char, size) > max_width:
+                        out.append(piece)
+                        piece = ''
+                    piece += char
+                word, width = piece, font.width(piece, size)
+            used += (space if line else 0.0) + width
+            line.append(word)
+        out.append(' '.join(line))
+    return out
+
+
+class Writer:
+    """Assembles pages of content into a document.
+
+    The header, catalog and font objects are the same bytes in every file,
+    so they are serialised once, here, and copied into each document.
+    """
+
+    def __init__(
+        self,
+        fonts: Sequence[Font] = FONTS,
+        page_size: Tuple[float, float] = A4,
+        compress: bool = True,
+    ):
+        self.compress = compress
+        self.media_box = b'[0 0 %.2f %.2f]' % (page_size[0] * MM, page_size[1] * MM)
+        # Object 1 is the catalog, 2 the page tree (written last, once the
+        # pages are known), 3.. the fonts, then each page and its content.
+        prefix = [b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n']
+        self._offsets: Dict[int, int] = {}
+
+        def add(number: int, body: bytes) -> None:
+            self._offsets[number] = sum(map(len, prefix))
+            prefix.append(b'%d 0 obj\n%s\nendobj\n' % (number, body))
+
+        add(1, b'<< /Type /Catalog /Pages 2 0 R >>')
+        for number, font in enumerate(fonts, 3):
+            add(number, font.object)
+        self._prefix = b''.join(prefix)
+        self._first_page = 3 + len(fonts)
+        self.resources = b'<< /Font << %s >> >>' % b' '.join(
+            b'/%s %d 0 R' % (font.key.encode('ascii'), number)
+            for number, font in enumerate(fonts, 3)
+        )
+
+    def document(self, pages: Sequence[bytes], title: str = '') -> bytes:
+        """A complete PDF file of ``pages`` (content streams, uncompressed)."""
+        parts = [self._prefix]
+        size = len(self._prefix)
+        offsets = dict(self._offsets)
+
+        def add(number: int, body: bytes) -> None:
+            nonlocal size
+            offsets[number] = size
+            chunk = b'%d 0 obj\n%s\nendobj\n' % (number, body)
+            parts.append(chunk)
+            size += len(chunk)
+
+        kids = []
+        number = self._first_page
+        for content in pages:
+            kids.append(b'%d 0 R' % number)
+            add(
+                number,
+                b'<< /Type /Page /Parent 2 0 R /MediaBox %s /Resources %s /Contents %d 0 R >>'
+                % (self.media_box, self.resources, number + 1),
+            )
+            if self.compress:
+                content = zlib.compress(content, 6)
+                head = b'<< /Length %d /Filter /FlateDecode >>' % len(content)
+            else:
+                head = b'<< /Length %d >>' % len(content)
+            add(number + 1, b'%s\nstream\n%s\nendstream' % (head, content))
+            number += 2
+        add(2, b'<< /Type /Pages /Kids [%s] /Count %d >>' % (b' '.join(kids), len(pages)))
+        info = number
+        add(info, b'<< /Producer (tools.estimate_pdf) /Title (%s) >>' % _escape(encode(title)))
+
+        xref = [b'xref\n0 %d\n0000000000 65535 f \n' % (info + 1)]
+        xref += [b'%010d 00000 n \n' % offsets[n] for n in range(1, info + 1)]
+        trailer = b'trailer\n<< /Size %d /Root 1 0 R /Info %d 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (
+            info + 1,
+            info,
+            size,
+        )
+        return b''.join(parts + xref + [trailer])
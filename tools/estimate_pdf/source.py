@@ -0,0 +1,216 @@
+"""Where estimates come from: Postgres, a JSON fixture, or a synthetic batch.
+
+Every source yields the estimate rows the route reads (``estimates.*`` with
+an ``items`` list of ``estimate_items``) and the company the header prints,
+as plain dicts that pickle cheaply to the render workers.
+
+The route reads ``company_name`` / ``company_address`` / ``company_phone`` /
+``company_email`` from ``company_settings``, which has none of those columns
+(028_create_company_settings.sql), so it always prints "WindWireless" and
+blank contact lines. The loader fills them from the real columns instead;
+a fixture can set them directly.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import json
+import random
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .layout import Record
+
+ESTIMATE_COLUMNS = (
+    'estimate_number',
+    'estimate_date',
+    'ship_date',
+    'status',
+    'bill_to_name',
+    'bill_to_address',
+    'bill_to_city',
+    'bill_to_state',
+    'bill_to_zip',
+    'bill_to_country',
+    'ship_to_name',
+    'ship_to_address',
+    'ship_to_city',
+    'ship_to_state',
+    'ship_to_zip',
+    'ship_to_country',
+    'ship_to_phone',
+    'subtotal',
+    'discount_amount',
+    'terms',
+    'payment_methods',
+)
+ITEM_COLUMNS = ('model', 'capacity', 'grade', 'description', 'quantity', 'unit_price')
+
+_ITEMS = (
+    'COALESCE((SELECT json_agg(json_build_object({fields}) ORDER BY i.sort_order, i.created_at)'
+    " FROM public.estimate_items i WHERE i.estimate_id = e.id), '[]'::json)"
+).format(fields=', '.join(f"'{c}', i.{c}" for c in ITEM_COLUMNS))
+_COMPANY = (
+    "SELECT COALESCE(NULLIF(trade_name, ''), legal_name),"
+    " concat_ws(', ', NULLIF(address_line1, ''), NULLIF(address_line2, ''),"
+    " NULLIF(concat_ws(' ', city, state, zip_code), '')), phone, email"
+    ' FROM public.company_settings ORDER BY created_at LIMIT 1'
+)
+
+
+class SourceError(RuntimeError):
+    pass
+
+
+def load_fixture(path: Path) -> Tuple[Record, List[Record]]:
+    """``(company, estimates)`` from a JSON list of estimates or ``{company, estimates}``."""
+    try:
+        raw = json.loads(path.read_text(encoding='utf-8'))
+    except ValueError as e:
+        raise SourceError(f'{path}: {e}') from None
+    if isinstance(raw, list):
+        return {}, raw
+    if not isinstance(raw, dict) or not isinstance(raw.get('estimates'), list):
+        raise SourceError(f'{path}: expected a list of estimates or {{"company", "estimates"}}')
+    return raw.get('company') or {}, raw['estimates']
+
+
+class EstimateStore:
+    """Use as a context manager; reads through one connection."""
+
+    def __init__(self, dsn: str):
+        try:
+            import psycopg
+        except ImportError:
+            raise SourceError(
+                'psycopg is required to read estimates (pip install "psycopg[binary]")'
+            ) from None
+        self._psycopg = psycopg
+        try:
+            self.conn = psycopg.connect(dsn)
+        except psycopg.OperationalError as e:
+            raise SourceError(f'could not connect to Postgres: {e}') from None
+
+    def __enter__(self) -> 'EstimateStore':
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.conn.close()
+
+    def company(self) -> Record:
+        try:
+            row = self.conn.execute(_COMPANY).fetchone()
+        except self._psycopg.Error as e:
+            raise SourceError(f'reading company_settings failed: {e}') from None
+        keys = ('company_name', 'company_address', 'company_phone', 'company_email')
+        return dict(zip(keys, row)) if row else {}
+
+    def estimates(
+        self,
+        numbers: Sequence[int] = (),
+        statuses: Sequence[str] = (),
+        since: Optional[dt.date] = None,
+        until: Optional[dt.date] = None,
+        batch: int = 500,
+    ) -> Iterator[Record]:
+        """Estimates (not soft-deleted) by number, items included, ``batch`` per fetch."""
+        where = ['e.deleted_at IS NULL']
+        params: List[Any] = []
+        if numbers:
+            where.append('e.estimate_number = ANY(%s)')
+            params.append(list(numbers))
+        if statuses:
+            where.append('e.status = ANY(%s)')
+            params.append(list(statuses))
+        if since:
+            where.append('e.estimate_date >= %s')
+            params.append(since)
+        if until:
+            where.append('e.estimate_date <= %s')
+            params.append(until)
+        columns = ', '.join(f'e.{c}' for c in ESTIMATE_COLUMNS)
+        query = (
+            f'SELECT {columns}, {_ITEMS} FROM public.estimates e'
+            f' WHERE {" AND ".join(where)} ORDER BY e.estimate_number'
+        )
+        try:
+            with self.conn.transaction():
+                with self.conn.cursor(name='estimate_pdf') as cur:
+                    cur.execute(query, params)
+                    while True:
+                        rows = cur.fetchmany(batch)
+                        if not rows:
+                            return
+                        for row in rows:
+                            estimate: Dict[str, Any] = dict(zip(ESTIMATE_COLUMNS, row))
+                            estimate['items'] = row[-1]
+                            yield estimate
+        except self._psycopg.Error as e:
+            raise SourceError(f'reading estimates failed: {e}') from None
+
+
+_MODELS = (
+    ('iPhone 15 Pro Max', ('256GB', '512GB', '1TB')),
+    ('iPhone 14', ('128GB', '256GB')),
+    ('iPhone 13 mini', ('128GB',)),
+    ('Galaxy S24 Ultra', ('256GB', '512GB')),
+    ('iPad Air 5', ('64GB', '256GB')),
+    ('Pixel 8 Pro', ('128GB',)),
+)
+_GRADES = ('A', 'B', 'C', 'LEILAO')
+_NOTES = ('', 'AUCTION - NO TEST - NO WARRANTY', 'Unlocked, original box', 'Battery 80%+')
+_TERMS = (
+    'FOB Miami, USA. Wind Wireless, LLC does not guarantee battery percentage or product'
+    ' colors. This invoice documents a sale to the client listed in "Bill To." Final delivery'
+    " is made per the customer's instructions."
+)
+_PAYMENT = (
+    '1) CITIBANK: Wind Wireless Enterprises LLC, 175 SW 7th St, Ste 1602, Miami, FL 33130.'
+    ' 2) Zelle: wind.wireless2022@gmail.com. 3) Conduit Technology Inc (USDT).'
+)
+
+
+def synthetic(count: int, max_items: int = 40, seed: int = 0) -> Iterator[Record]:
+    """``count`` plausible estimates, 1 to ``max_items`` items each, the same for a seed."""
+    rng = random.Random(seed)
+    start = dt.date(2026, 1, 1)
+    for number in range(1001, 1001 + count):
+        items = []
+        for _ in range(rng.randint(1, max_items)):
+            model, capacities = rng.choice(_MODELS)
+            items.append(
+                {
+                    'model': model,
+                    'capacity': rng.choice(capacities),
+                    'grade': rng.choice(_GRADES),
+                    'description': rng.choice(_NOTES),
+                    'quantity': rng.randint(1, 200),
+                    'unit_price': round(rng.uniform(80, 1400), 2),
+                }
+            )
+        subtotal = round(sum(i['quantity'] * i['unit_price'] for i in items), 2)
+        day = start + dt.timedelta(rng.randrange(365))
+        yield {
+            'estimate_number': number,
+            'estimate_date': day.isoformat(),
+            'ship_date': (day + dt.timedelta(7)).isoformat() if rng.random() < 0.5 else None,
+            'status': 'sent',
+            'bill_to_name': f'Customer {rng.randrange(1, 500):03d} Trading LLC',
+            'bill_to_address': f'{rng.randrange(100, 9999)} NW {rng.randrange(1, 99)}th St',
+            'bill_to_city': 'Doral',
+            'bill_to_state': 'FL',
+            'bill_to_zip': '33172',
+            'bill_to_country': 'USA',
+            'ship_to_name': 'Forwarder Logistics Corp',
+            'ship_to_address': '8200 NW 41st St, Suite 200',
+            'ship_to_city': 'Miami',
+            'ship_to_state': 'FL',
+            'ship_to_zip': '33166',
+            'ship_to_country': 'USA',
+            'ship_to_phone': '+1 305 555 0100',
+            'subtotal': subtotal,
+            'discount_amount': round(subtotal * 0.02, 2) if rng.random() < 0.3 else 0,
+            'terms': _TERMS,
+            'payment_methods': _PAYMENT,
+            'items': items,
+        }
@@ -0,0 +1,145 @@
+"""Cached index of the files under the source directories.
+
+Adding, removing or renaming an entry bumps its parent directory's mtime, so a
+warm refresh only has to ``stat`` each known directory and re-list the ones
+whose mtime moved; file discovery then costs one syscall per directory instead
+of a full ``os.walk``. The index lives in ``.cache/file-index.json``.
+
+Directories modified within ``_RACY_NS`` of a scan are stored without an mtime
+and always re-listed next time: on filesystems with coarse timestamps a second
+change in the same tick would otherwise go unnoticed.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from tools.fsutil import atomic_write_text
+from tools.paths import IGNORED_DIRS, REPO_ROOT, SOURCE_DIRS, compile_glob
+
+INDEX_VERSION = 1
+INDEX_PATH = Path('.cache') / 'file-index.json'
+
+_RACY_NS = 2_000_000_000
+_WILDCARDS = frozenset('*?')
+
+
+@dataclass
+class _Dir:
+    mtime_ns: int
+    files: List[str] = field(default_factory=list)
+    subdirs: List[str] = field(default_factory=list)
+
+
+def _literal_prefix(pattern: str) -> str:
+    """The directory part of ``pattern`` before its first wildcard."""
+    cut = next((i for i, ch in enumerate(pattern) if ch in _WILDCARDS), len(pattern))
+    return pattern[:cut].rpartition('/')[0]
+
+
+class FileIndex:
+    """Repo-relative POSIX paths of every file under ``source_dirs``."""
+
+    def __init__(
+        self,
+        root: Path = REPO_ROOT,
+        source_dirs: Sequence[str] = SOURCE_DIRS,
+        cache_path: Optional[Path] = None,
+    ):
+        self.root = Path(root)
+        self.source_dirs = tuple(source_dirs)
+        self.cache_path = self.root / INDEX_PATH if cache_path is None else cache_path
+        self.dirs: Dict[str, _Dir] = {}
+        # Directories re-listed by the last refresh().
+        self.relisted: List[str] = []
+
+    def _load(self) -> None:
+        try:
+            raw = json.loads(self.cache_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        if raw.get('version') != INDEX_VERSION or raw.get('source_dirs') != list(self.source_dirs):
+            return
+        self.dirs = {
+            rel: _Dir(d['mtime_ns'], d['files'], d['subdirs']) for rel, d in raw['dirs'].items()
+        }
+
+    def _save(self) -> None:
+        payload = {
+            'version': INDEX_VERSION,
+            'source_dirs': list(self.source_dirs),
+            'dirs': {
+                rel: {'mtime_ns': d.mtime_ns, 'files': d.files, 'subdirs': d.subdirs}
+                for rel, d in sorted(self.dirs.items())
+            },
+        }
+        atomic_write_text(self.cache_path, json.dumps(payload, separators=(',', ':')))
+
+    def _list(self, rel: str, started_ns: int, mtime_ns: int) -> _Dir:
+        files, subdirs = [], []
+        with os.scandir(self.root / rel) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in IGNORED_DIRS:
+                        subdirs.append(entry.name)
+                elif entry.is_file():
+                    files.append(entry.name)
+        if started_ns - mtime_ns < _RACY_NS:
+            mtime_ns = 0
+        return _Dir(mtime_ns, sorted(files), sorted(subdirs))
+
+    def refresh(self) -> 'FileIndex':
+        """Bring the index up to date, re-listing only directories whose mtime changed."""
+        self._load()
+        started_ns = time.time_ns()
+        previous, self.dirs, self.relisted = self.dirs, {}, []
+        stack = list(reversed(self.source_dirs))
+        while stack:
+            rel = stack.pop()
+            try:
+                mtime_ns = os.stat(self.root / rel).st_mtime_ns
+            except OSError:
+                continue
+            cached = previous.get(rel)
+            if cached is None or cached.mtime_ns != mtime_ns:
+                try:
+                    cached = self._list(rel, started_ns, mtime_ns)
+                except OSError:
+                    continue
+                self.relisted.append(rel)
+            self.dirs[rel] = cached
+            stack.extend(f'{rel}/{name}' for name in reversed(cached.subdirs))
+        if self.relisted or self.dirs.keys() != previous.keys():
+            self._save()
+        return self
+
+    def __iter__(self) -> Iterator[str]:
+        for rel, d in sorted(self.dirs.items()):
+            for name in d.files:
+                yield f'{rel}/{name}'
+
+    def __len__(self) -> int:
+        return sum(len(d.files) for d in self.dirs.values())
+
+    def glob(self, *patterns: str) -> List[str]:
+        """Sorted paths matching any of ``patterns`` (see ``tools.paths.compile_glob``).
+
+        Only directories under each pattern's literal prefix are considered.
+        """
+        matched = set()
+        for pattern in patterns:
+            regex = compile_glob(pattern)
+            prefix = _literal_prefix(pattern)
+            for rel, d in self.dirs.items():
+                if prefix and rel != prefix and not rel.startswith(prefix + '/'):
+                    continue
+                for name in d.files:
+                    path = f'{rel}/{name}'
+                    if regex.match(path):
+                        matched.add(path)
+        return sorted(matched)
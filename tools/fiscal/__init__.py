@@ -0,0 +1,16 @@
+"""Fiscal weeks (closing on Friday) as in src/lib/fiscalWeek.ts, for reports and SQL.
+
+    python -m tools.fiscal month 2026-04
+    python -m tools.fiscal sql --from 2024 --to 2030 -o supabase/migrations/111_fiscal_weeks.sql
+    python -m tools.fiscal report --dsn postgresql://... --from 2026-01-01
+"""
+
+from .calendar import NO_WEEK, FiscalCalendar, FiscalWeek, fridays_in_month, weeks_for_month
+
+__all__ = [
+    'NO_WEEK',
+    'FiscalCalendar',
+    'FiscalWeek',
+    'fridays_in_month',
+    'weeks_for_month',
+]
@@ -0,0 +1,180 @@
+"""Command-line entry point: ``python -m tools.fiscal``.
+
+    month YYYY-MM      print the fiscal weeks of a month
+    sql                write the fiscal_weeks table and seed for a range of years
+    report             income / expense per fiscal week from financial_transactions,
+                       streamed in batches and bucketed with numpy
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import os
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from tools.fsutil import atomic_write_text
+
+from .calendar import FiscalCalendar, weeks_for_month
+
+DEFAULT_BATCH_SIZE = 100_000
+
+# Days since the epoch keep the transfer numeric; numpy takes them as datetime64[D].
+_TRANSACTIONS = """
+SELECT transaction_date - DATE '1970-01-01', amount::float8, transaction_type = 'income'
+  FROM public.financial_transactions
+ WHERE deleted_at IS NULL
+   AND coalesce(status, '') <> 'cancelled'
+   AND transaction_date BETWEEN %s AND %s
+"""
+
+
+class ReportError(RuntimeError):
+    pass
+
+
+def _month(value: str) -> Tuple[int, int]:
+    try:
+        parsed = dt.datetime.strptime(value, '%Y-%m')
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'expected YYYY-MM, got {value!r}') from None
+    return parsed.year, parsed.month
+
+
+def _date(value: str) -> dt.date:
+    try:
+        return dt.date.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'expected YYYY-MM-DD, got {value!r}') from None
+
+
+def weekly_totals(
+    dsn: str,
+    calendar: FiscalCalendar,
+    first: dt.date,
+    last: dt.date,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Tuple[np.ndarray, np.ndarray, int]:
+    """(income, expense) per week of ``calendar`` and the number of transactions read."""
+    try:
+        import psycopg
+    except ImportError:
+        raise ReportError(
+            'psycopg is required to read from Postgres (pip install "psycopg[binary]")'
+        ) from None
+    income = np.zeros(len(calendar))
+    expense = np.zeros(len(calendar))
+    read = 0
+    try:
+        with psycopg.connect(dsn) as conn, conn.cursor(name='fiscal_report') as cur:
+            cur.itersize = batch_size
+            cur.execute(_TRANSACTIONS, (first, last))
+            while True:
+                batch = cur.fetchmany(batch_size)
+                if not batch:
+                    break
+                days, amounts, is_income = (np.array(column) for column in zip(*batch))
+                dates = days.astype('datetime64[D]')
+                amounts = np.abs(amounts)
+                income += calendar.totals(dates[is_income], amounts[is_income])
+                expense += calendar.totals(dates[~is_income], amounts[~is_income])
+                read += len(batch)
+    except psycopg.OperationalError as e:
+        raise ReportError(f'could not connect to Postgres: {e}') from None
+    return income, expense, read
+
+
+def _print_month(args: argparse.Namespace) -> int:
+    year, month = args.month
+    for week in weeks_for_month(year, month):
+        print(f'{week.label}\t{week.start_date}\t{week.end_date}')
+    return 0
+
+
+def _sql(args: argparse.Namespace) -> int:
+    sql = FiscalCalendar(args.first_year, args.last_year).to_sql()
+    if args.output:
+        atomic_write_text(args.output, sql)
+        print(f'✅ wrote {args.output}')
+    else:
+        sys.stdout.write(sql)
+    return 0
+
+
+def _report(args: argparse.Namespace) -> int:
+    if not args.dsn:
+        print('❌ pass --dsn (or set $DATABASE_URL)', file=sys.stderr)
+        return 2
+    started = time.perf_counter()
+    calendar = FiscalCalendar(args.first.year, args.last.year)
+    income, expense, read = weekly_totals(
+        args.dsn, calendar, args.first, args.last, args.batch_size
+    )
+    print('month\tweek\tstart\tend\tincome\texpense\tnet')
+    for week, received, spent in zip(calendar.weeks, income, expense):
+        if week.end_date < args.first or week.start_date > args.last:
+            continue
+        print(
+            f'{week.month}\t{week.week}\t{week.start_date}\t{week.end_date}\t'
+            f'{received:.2f}\t{spent:.2f}\t{received - spent:.2f}'
+        )
+    print(
+        f'\n📊 {read} transactions, {income.sum() + expense.sum():.2f} in fiscal weeks, '
+        f'in {time.perf_counter() - started:.2f}s',
+        file=sys.stderr,
+    )
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m tools.fiscal',
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    month = commands.add_parser('month', help='print the weeks of a month')
+    month.add_argument('month', type=_month, help='YYYY-MM')
+
+    sql = commands.add_parser('sql', help='generate the fiscal_weeks migration')
+    sql.add_argument('--from', dest='first_year', type=int, required=True)
+    sql.add_argument('--to', dest='last_year', type=int, required=True)
+    sql.add_argument('-o', '--output', type=Path, help='default: stdout')
+
+    today = dt.date.today()
+    report = commands.add_parser('report', help='weekly totals of financial_transactions')
+    report.add_argument(
+        '--dsn', default=os.environ.get('DATABASE_URL'), help='default: $DATABASE_URL'
+    )
+    report.add_argument(
+        '--from',
+        dest='first',
+        type=_date,
+        default=today.replace(month=1, day=1),
+        help='YYYY-MM-DD (default: January 1st)',
+    )
+    report.add_argument(
+        '--to', dest='last', type=_date, default=today, help='YYYY-MM-DD (default: today)'
+    )
+    report.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == 'month':
+            return _print_month(args)
+        if args.command == 'sql':
+            return _sql(args)
+        return _report(args)
+    except (ReportError, ValueError, OSError) as e:
+        print(f'❌ {e}', file=sys.stderr)
+        return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""Fiscal-week calendar with the rules of ``src/lib/fiscalWeek.ts``.
+
+* A week closes on Friday and runs Monday to Friday;
+* the weeks of a month are those of its Fridays, numbered from 1, so the
+  first one may start in the previous month;
+* a date belongs to a week only if the week is in the date's own month
+  (``getFiscalWeekForDate`` searches that month alone). Weekends, and the
+  days after a month's last Friday, therefore belong to no week.
+
+The weeks of a range of years are generated once into parallel arrays sorted
+by end date, so bucketing any number of dates is one ``searchsorted`` plus two
+comparisons. Dates are plain calendar days, as the TypeScript version formats
+them in local time; the two agree on every day from 2019 to 2031.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import itertools
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    raise ImportError('numpy is required for the fiscal calendar (pip install numpy)') from None
+
+FRIDAY = 4  # date.weekday()
+NO_WEEK = -1
+
+DateLike = Union[dt.date, str, np.datetime64]
+
+
+@dataclass(frozen=True)
+class FiscalWeek:
+    week: int
+    month: str  # YYYY-MM
+    start_date: dt.date  # Monday
+    end_date: dt.date  # Friday
+
+    @property
+    def label(self) -> str:
+        return f'Semana {self.week}'
+
+
+def fridays_in_month(year: int, month: int) -> List[dt.date]:
+    first = dt.date(year, month, 1)
+    day = first + dt.timedelta(days=(FRIDAY - first.weekday()) % 7)
+    fridays = []
+    while day.month == month:
+        fridays.append(day)
+        day += dt.timedelta(days=7)
+    return fridays
+
+
+def weeks_for_month(year: int, month: int) -> List[FiscalWeek]:
+    """``getFiscalWeeksForMonth``."""
+    return [
+        FiscalWeek(n, f'{year}-{month:02d}', friday - dt.timedelta(days=4), friday)
+        for n, friday in enumerate(fridays_in_month(year, month), start=1)
+    ]
+
+
+def _months(first_year: int, last_year: int) -> Iterator[Tuple[int, int]]:
+    return itertools.product(range(first_year, last_year + 1), range(1, 13))
+
+
+class FiscalCalendar:
+    """Every fiscal week from January ``first_year`` to December ``last_year``."""
+
+    def __init__(self, first_year: int, last_year: int):
+        if last_year < first_year:
+            raise ValueError('last_year must not be before first_year')
+        self.first_year, self.last_year = first_year, last_year
+        self.weeks: List[FiscalWeek] = [
+            week
+            for year, month in _months(first_year, last_year)
+            for week in weeks_for_month(year, month)
+        ]
+        self.starts = np.array([w.start_date for w in self.weeks], dtype='datetime64[D]')
+        self.ends = np.array([w.end_date for w in self.weeks], dtype='datetime64[D]')
+        self.months = np.array([w.end_date.year * 12 + w.end_date.month - 1 for w in self.weeks])
+
+    def __len__(self) -> int:
+        return len(self.weeks)
+
+    def bucket(self, dates: Iterable[DateLike]) -> np.ndarray:
+        """Index into ``weeks`` of each date's fiscal week, or ``NO_WEEK``."""
+        days = np.asarray(dates, dtype='datetime64[D]')
+        idx = np.searchsorted(self.ends, days, side='left')
+        clipped = np.minimum(idx, len(self.weeks) - 1)
+        months = days.astype('datetime64[M]').astype(np.int64) + 1970 * 12
+        hit = (
+            (idx < len(self.weeks))
+            & (self.starts[clipped] <= days)
+            & (self.months[clipped] == months)
+        )
+        return np.where(hit, clipped, NO_WEEK)
+
+    def week_for(self, date: DateLike) -> Optional[FiscalWeek]:
+        """``getFiscalWeekForDate``."""
+        i = int(self.bucket([date])[0])
+        return None if i == NO_WEEK else self.weeks[i]
+
+    def totals(self, dates: Iterable[DateLike], values: Iterable[float]) -> np.ndarray:
+        """Sum of ``values`` per week, aligned with ``weeks``; unbucketed dates are dropped."""
+        idx = self.bucket(dates)
+        values = np.asarray(values, dtype=np.float64)
+        keep = idx != NO_WEEK
+        return np.bincount(idx[keep], weights=values[keep], minlength=len(self.weeks))
+
+    def to_sql(self, table: str = 'public.fiscal_weeks') -> str:
+        """A re-runnable migration creating ``table`` and seeding it with these weeks."""
+        rows = ',\n'.join(
+            f"  ('{w.month}', {w.week}, '{w.start_date}', '{w.end_date}', '{w.label}')"
+            for w in self.weeks
+        )
+        return (
+            f'-- Fiscal weeks {self.first_year}-{self.last_year} (weeks close on Friday).\n'
+            f'-- Generated by `python -m tools.fiscal sql`; same rules as src/lib/fiscalWeek.ts.\n'
+            f'CREATE TABLE IF NOT EXISTS {table} (\n'
+            f'  month TEXT NOT NULL,\n'
+            f'  week SMALLINT NOT NULL,\n'
+            f'  start_date DATE NOT NULL,\n'
+            f'  end_date DATE NOT NULL,\n'
+            f'  label TEXT NOT NULL,\n'
+            f'  PRIMARY KEY (month, week)\n'
+            f');\n'
+            f'CREATE INDEX IF NOT EXISTS idx_fiscal_weeks_range\n'
+            f'  ON {table} (start_date, end_date);\n'
+            f'ALTER TABLE {table} ENABLE ROW LEVEL SECURITY;\n'
+            f'DROP POLICY IF EXISTS "Authenticated users can read fiscal_weeks" ON {table};\n'
+            f'CREATE POLICY "Authenticated users can read fiscal_weeks"\n'
+            f'  ON {table} FOR SELECT TO authenticated USING (true);\n\n'
+            f'INSERT INTO {table} (month, week, start_date, end_date, label) VALUES\n'
+            f'{rows}\n'
+            f'ON CONFLICT (month, week) DO NOTHING;\n'
+        )
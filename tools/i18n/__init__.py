@@ -0,0 +1,5 @@
+"""Tooling for the next-intl message catalogs in ``src/messages``."""
+
+from .catalog import MESSAGES_DIR, Catalog, CatalogFormat, load_catalogs
+
+__all__ = ['MESSAGES_DIR', 'Catalog', 'CatalogFormat', 'load_catalogs']
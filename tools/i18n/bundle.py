@@ -0,0 +1,289 @@
+"""Compile the catalogs into per-namespace, minified, content-hashed bundles.
+
+``src/i18n/request.ts`` ships a whole locale to every page. This splits each
+catalog into namespaces so a route can load just the ones its
+``useTranslations()`` calls name::
+
+    public/i18n/manifest.json
+    public/i18n/en/Dashboard.Inventory.3f2a1b9c0d.json
+    public/i18n/en/Dashboard.9e01c2d4f5.json      (Dashboard's own leaves)
+    public/i18n/en/Header.b7c81e0a42.json
+
+A top-level object is one namespace; one whose minified JSON is larger than
+``--max-bytes`` is split into its child objects instead, recursively, and
+keeps its plain values in a bundle of its own. A bundle holds the messages
+under its namespace (not the path to it), so a loader sets each bundle at
+its dotted path, parents before children, which is the order the manifest
+lists them in. Root-level values, if any, go to the ``_`` bundle.
+
+Filenames carry a hash of the bundle's content, so bundles can be served
+with an immutable cache header. Builds are incremental: a locale whose
+catalog has not changed since the last build (``.cache/i18n-bundles.json``)
+is not even read, an unchanged namespace keeps its file, and files no
+longer referenced are removed. Locales build in parallel::
+
+    python -m tools.i18n.bundle [--out public/i18n] [--check]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from tools.fsutil import atomic_write_text, content_hash
+from tools.paths import REPO_ROOT
+
+from .catalog import MESSAGES_DIR
+
+OUT_DIR = REPO_ROOT / 'public' / 'i18n'
+CACHE_PATH = REPO_ROOT / '.cache' / 'i18n-bundles.json'
+CACHE_VERSION = 1
+MANIFEST_VERSION = 1
+DEFAULT_MAX_BYTES = 4096
+ROOT_NAMESPACE = '_'
+HASH_LENGTH = 10
+
+_BUNDLE_NAME = re.compile(r'^(.+)\.[0-9a-f]{%d}\.json$' % HASH_LENGTH)
+
+
+@dataclass
+class Bundle:
+    file: str  # relative to the output directory
+    bytes: int
+    keys: int  # leaf messages
+
+
+@dataclass
+class BuildResult:
+    locales: List['LocaleBuild']
+    manifest_changed: bool
+
+    @property
+    def stale(self) -> bool:
+        return self.manifest_changed or any(b.written or b.removed for b in self.locales)
+
+
+@dataclass
+class LocaleBuild:
+    locale: str
+    # (mtime_ns, size, digest) of the catalog the bundles were built from
+    source: Tuple[int, int, str]
+    bundles: Dict[str, Bundle] = field(default_factory=dict)
+    written: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    cached: bool = False  # catalog unchanged since the last build: not read
+    catalog_bytes: int = 0
+
+
+def minify(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def _leaves(value: Any) -> int:
+    if isinstance(value, dict):
+        return sum(_leaves(v) for v in value.values())
+    return 1
+
+
+def split(tree: Mapping[str, Any], max_bytes: int = DEFAULT_MAX_BYTES) -> Dict[str, Any]:
+    """``namespace -> messages``, parents before their children."""
+    bundles: Dict[str, Any] = {}
+
+    def walk(node: Mapping[str, Any], path: str) -> None:
+        own: Dict[str, Any] = {}
+        children = []
+        divide = not path or len(minify(node).encode('utf-8')) > max_bytes
+        for key, value in node.items():
+            if divide and isinstance(value, dict):
+                children.append((f'{path}.{key}' if path else key, value))
+            else:
+                own[key] = value
+        if own:
+            bundles[path or ROOT_NAMESPACE] = own
+        for dotted, value in children:
+            walk(value, dotted)
+
+    walk(tree, '')
+    return bundles
+
+
+def _build_locale(
+    job: Tuple[str, str, str, Optional[Dict[str, Any]], int, bool]
+) -> LocaleBuild:
+    locale, source, out, previous, max_bytes, write = job
+    out_dir = Path(out)
+    st = os.stat(source)
+    if previous is not None and tuple(previous['source'][:2]) == (st.st_mtime_ns, st.st_size):
+        bundles = {ns: Bundle(**b) for ns, b in previous['bundles'].items()}
+        if all((out_dir / b.file).exists() for b in bundles.values()):
+            mtime_ns, size, digest = previous['source']
+            return LocaleBuild(
+                locale, (mtime_ns, size, digest), bundles, cached=True, catalog_bytes=size
+            )
+
+    raw = Path(source).read_bytes()
+    build = LocaleBuild(locale, (st.st_mtime_ns, st.st_size, content_hash(raw)))
+    build.catalog_bytes = len(raw)
+    for namespace, messages in split(json.loads(raw.decode('utf-8')), max_bytes).items():
+        text = minify(messages)
+        data = text.encode('utf-8')
+        name = f'{locale}/{namespace}.{content_hash(data)[:HASH_LENGTH]}.json'
+        build.bundles[namespace] = Bundle(name, len(data), _leaves(messages))
+        if not (out_dir / name).exists():
+            build.written.append(name)
+            if write:
+                atomic_write_text(out_dir / name, text)
+
+    live = {b.file for b in build.bundles.values()}
+    locale_dir = out_dir / locale
+    if locale_dir.is_dir():
+        for path in sorted(locale_dir.iterdir()):
+            name = f'{locale}/{path.name}'
+            if _BUNDLE_NAME.match(path.name) and name not in live:
+                build.removed.append(name)
+                if write:
+                    path.unlink()
+    return build
+
+
+def _load_cache(path: Path, out: Path, max_bytes: int) -> Dict[str, Any]:
+    try:
+        raw = json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    settings = {'out': str(out), 'max_bytes': max_bytes}
+    if raw.get('version') != CACHE_VERSION or raw.get('settings') != settings:
+        return {}
+    return raw.get('locales', {})
+
+
+def build(
+    messages_dir: Path = MESSAGES_DIR,
+    out: Path = OUT_DIR,
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    jobs: Optional[int] = None,
+    write: bool = True,
+    cache_path: Optional[Path] = CACHE_PATH,
+) -> BuildResult:
+    """Bring ``out`` up to date with every catalog, one worker per locale.
+
+    With ``write=False`` nothing is touched and the result reports what would
+    be written and removed.
+    """
+    out = out.resolve()
+    previous = _load_cache(cache_path, out, max_bytes) if cache_path else {}
+    tasks = [
+        (p.stem, str(p), str(out), previous.get(p.stem), max_bytes, write)
+        for p in sorted(Path(messages_dir).glob('*.json'))
+    ]
+    workers = min(jobs or os.cpu_count() or 1, len(tasks))
+    if workers <= 1:
+        builds = [_build_locale(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            builds = list(pool.map(_build_locale, tasks))
+
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'locales': {
+            b.locale: {ns: bundle.file for ns, bundle in b.bundles.items()} for b in builds
+        },
+    }
+    manifest_text = json.dumps(manifest, ensure_ascii=False, indent=2) + '\n'
+    manifest_path = out / 'manifest.json'
+    try:
+        current = manifest_path.read_text(encoding='utf-8')
+    except OSError:
+        current = None
+    result = BuildResult(builds, current != manifest_text)
+    if not write:
+        return result
+    if result.manifest_changed:
+        atomic_write_text(manifest_path, manifest_text)
+    if cache_path and not all(b.cached for b in builds):
+        payload = {
+            'version': CACHE_VERSION,
+            'settings': {'out': str(out), 'max_bytes': max_bytes},
+            'locales': {
+                b.locale: {
+                    'source': list(b.source),
+                    'bundles': {ns: asdict(bundle) for ns, bundle in b.bundles.items()},
+                }
+                for b in builds
+            },
+        }
+        atomic_write_text(cache_path, json.dumps(payload, separators=(',', ':')))
+    return result
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m tools.i18n.bundle',
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--messages', type=Path, default=MESSAGES_DIR, help='catalog directory')
+    parser.add_argument('--out', type=Path, default=OUT_DIR, help='bundle directory')
+    parser.add_argument(
+        '--max-bytes',
+        type=int,
+        default=DEFAULT_MAX_BYTES,
+        help=f'split namespaces larger than this (default: {DEFAULT_MAX_BYTES})',
+    )
+    parser.add_argument('-j', '--jobs', type=int, help='worker processes (default: CPU count)')
+    parser.add_argument(
+        '--check', action='store_true', help='write nothing; exit 1 if the bundles are stale'
+    )
+    parser.add_argument('--no-cache', action='store_true', help='re-read every catalog')
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    try:
+        result = build(
+            args.messages,
+            args.out,
+            args.max_bytes,
+            args.jobs,
+            write=not args.check,
+            cache_path=None if args.no_cache else CACHE_PATH,
+        )
+    except (OSError, ValueError) as e:
+        print(f'❌ {e}', file=sys.stderr)
+        return 2
+    elapsed = time.perf_counter() - started
+
+    for b in result.locales:
+        if not b.bundles:
+            print(f'⚠️  {b.locale}: empty catalog, no bundles')
+            continue
+        largest = max(b.bundles.values(), key=lambda bundle: bundle.bytes)
+        total = sum(bundle.bytes for bundle in b.bundles.values())
+        verb = 'would write' if args.check else 'written'
+        state = 'unchanged' if b.cached else f'{len(b.written)} {verb}, {len(b.removed)} stale'
+        print(
+            f'✅ {b.locale}: {len(b.bundles)} bundles ({state}), '
+            f'{total / 1024:.1f} KiB minified vs. {b.catalog_bytes / 1024:.1f} KiB catalog; '
+            f'largest {largest.file} ({largest.bytes / 1024:.1f} KiB)'
+        )
+        if args.check:
+            for name in b.written:
+                print(f'   + {name}')
+            for name in b.removed:
+                print(f'   - {name}')
+    print(f'\n📊 {len(result.locales)} locales in {elapsed:.2f}s')
+    if args.check and result.stale:
+        print('❌ bundles are out of date: python -m tools.i18n.bundle')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
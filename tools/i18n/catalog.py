@@ -0,0 +1,104 @@
+"""Load and save the ``src/messages/<locale>.json`` catalogs.
+
+Catalogs are round-tripped with their original indentation, key order and
+trailing-newline convention, so a save only diffs the keys that changed.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Union
+
+from tools.fsutil import atomic_write_text
+from tools.paths import REPO_ROOT
+
+MESSAGES_DIR = REPO_ROOT / 'src' / 'messages'
+
+_FIRST_INDENT = re.compile(r'\n([ \t]+)\S')
+
+
+@dataclass(frozen=True)
+class CatalogFormat:
+    indent: Union[int, str] = 2
+    trailing_newline: bool = False
+
+    @classmethod
+    def detect(cls, text: str) -> 'CatalogFormat':
+        m = _FIRST_INDENT.search(text)
+        indent: Union[int, str] = 2
+        if m:
+            ws = m.group(1)
+            indent = len(ws) if set(ws) == {' '} else ws
+        return cls(indent=indent, trailing_newline=text.endswith('\n'))
+
+    def dumps(self, data: Any) -> str:
+        text = json.dumps(data, ensure_ascii=False, indent=self.indent)
+        return text + '\n' if self.trailing_newline else text
+
+
+class Catalog:
+    """One locale's message tree, addressed by dotted paths (``Dashboard.Users.title``)."""
+
+    def __init__(self, locale: str, path: Path, data: Dict[str, Any], fmt: CatalogFormat):
+        self.locale = locale
+        self.path = path
+        self.data = data
+        self.format = fmt
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'Catalog':
+        path = Path(path)
+        text = path.read_text(encoding='utf-8')
+        return cls(path.stem, path, json.loads(text), CatalogFormat.detect(text))
+
+    def get(self, dotted: str, default: Any = None) -> Any:
+        node: Any = self.data
+        for key in dotted.split('.'):
+            if not isinstance(node, dict) or key not in node:
+                return default
+            node = node[key]
+        return node
+
+    def set(self, dotted: str, value: Any, create_parents: bool = False) -> bool:
+        """Set ``dotted`` to ``value``; return True if the catalog changed.
+
+        New keys are appended to their parent object; existing keys keep their
+        position. Missing parent objects raise ``KeyError`` unless
+        ``create_parents`` is set.
+        """
+        *parents, leaf = dotted.split('.')
+        node = self.data
+        for i, key in enumerate(parents):
+            child = node.get(key)
+            if child is None and create_parents:
+                child = node[key] = {}
+            if not isinstance(child, dict):
+                where = '.'.join(parents[: i + 1])
+                raise KeyError(f'{self.locale}: {where} is not an object in {self.path.name}')
+            node = child
+        if leaf in node and node[leaf] == value:
+            return False
+        node[leaf] = value
+        self.dirty = True
+        return True
+
+    def dumps(self) -> str:
+        return self.format.dumps(self.data)
+
+    def save(self) -> bool:
+        """Atomically write the catalog if it changed; return True if written."""
+        if not self.dirty:
+            return False
+        atomic_write_text(self.path, self.dumps())
+        self.dirty = False
+        return True
+
+
+def load_catalogs(messages_dir: Path = MESSAGES_DIR) -> Dict[str, Catalog]:
+    """All catalogs in ``messages_dir`` keyed by locale, in a stable order."""
+    return {p.stem: Catalog.load(p) for p in sorted(Path(messages_dir).glob('*.json'))}
+
@@ -0,0 +1,123 @@
+"""Check translation-key coverage across the sources and the pt/en/es catalogs.
+
+Reports three kinds of problems:
+
+* missing   - a key used in the code that a locale does not define,
+* unused    - a catalog key no ``t()`` call (static or dynamic prefix) reaches,
+* divergent - a key defined in some locales but not in others.
+
+Usage index results are cached per file (see ``usage``), so warm runs are cheap
+enough for an on-save hook::
+
+    python -m tools.i18n.coverage [--json] [--where Dashboard.Inventory.table.date]
+
+Exits non-zero when a used key is missing from any locale.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Set, Tuple
+
+from tools.paths import REPO_ROOT
+
+from .catalog import MESSAGES_DIR, Catalog, load_catalogs
+from .usage import UsageIndex
+
+
+def iter_leaves(tree: Mapping[str, Any], prefix: str = '') -> Iterator[Tuple[str, Any]]:
+    """Yield ``(dotted_path, value)`` for every non-object value in ``tree``."""
+    for key, value in tree.items():
+        dotted = f'{prefix}.{key}' if prefix else key
+        if isinstance(value, dict):
+            yield from iter_leaves(value, dotted)
+        else:
+            yield dotted, value
+
+
+@dataclass
+class CoverageReport:
+    # key -> locales lacking it, with the sites that use it
+    missing: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    unused: List[str] = field(default_factory=list)
+    # key -> locales lacking it
+    divergent: Dict[str, List[str]] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not self.missing
+
+
+def check_coverage(index: UsageIndex, catalogs: Mapping[str, Catalog]) -> CoverageReport:
+    leaves: Dict[str, Set[str]] = {
+        locale: {key for key, _ in iter_leaves(catalog.data)} for locale, catalog in catalogs.items()
+    }
+    all_keys = set().union(*leaves.values()) if leaves else set()
+    report = CoverageReport()
+
+    for key, sites in sorted(index.keys.items()):
+        lacking = [locale for locale, keys in leaves.items() if key not in keys]
+        if lacking:
+            report.missing[key] = {
+                'locales': lacking,
+                'sites': [f'{path}:{line}' for path, line in sites],
+            }
+
+    prefixes = tuple(index.prefixes)
+    for key in sorted(all_keys):
+        if key not in index.keys and not key.startswith(prefixes):
+            report.unused.append(key)
+        lacking = [locale for locale, keys in leaves.items() if key not in keys]
+        if lacking:
+            report.divergent[key] = lacking
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m tools.i18n.coverage',
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--root', type=Path, default=REPO_ROOT, help='repository root')
+    parser.add_argument('--messages-dir', type=Path, help='default: <root>/src/messages')
+    parser.add_argument('--where', metavar='KEY', help='list the sites using KEY and exit')
+    parser.add_argument('--json', action='store_true', help='print the report as JSON')
+    parser.add_argument('-j', '--jobs', type=int, default=None, help='worker processes')
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    index = UsageIndex(args.root)
+    index.refresh(jobs=args.jobs)
+
+    if args.where:
+        for path, line in index.where(args.where):
+            print(f'{path}:{line}')
+        return 0
+
+    messages_dir = args.messages_dir or args.root / MESSAGES_DIR.relative_to(REPO_ROOT)
+    report = check_coverage(index, load_catalogs(messages_dir))
+    if args.json:
+        print(json.dumps(asdict(report), ensure_ascii=False, indent=2))
+        return 0 if report.ok else 1
+
+    for key, info in report.missing.items():
+        print(f'❌ missing {key} in {", ".join(info["locales"])}  ({info["sites"][0]})')
+    for key, locales in report.divergent.items():
+        print(f'⚠️  {key} not defined in {", ".join(locales)}')
+    print(
+        f'\n📊 {len(index.keys)} keys used in {len(index.files)} files '
+        f'({len(index.rescanned)} re-scanned): {len(report.missing)} missing, '
+        f'{len(report.divergent)} divergent, {len(report.unused)} unused '
+        f'in {time.perf_counter() - started:.2f}s'
+    )
+    return 0 if report.ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""Apply translation changesets to every locale in one load/save cycle.
+
+A changeset is a YAML or JSON mapping of dotted message paths to either one
+value per locale or a single value shared by all locales::
+
+    Dashboard.Users.modal.save:
+      pt: Enviar Convite
+      en: Send Invitation
+      es: Enviar Invitación
+    Dashboard.Inventory.table.imei: IMEI
+
+Any number of changesets can be passed; they are applied in order (later ones
+win) against catalogs loaded once, and each changed catalog is written once,
+atomically::
+
+    python -m tools.i18n.patch tools/i18n/changesets/*.yaml [--dry-run]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .catalog import MESSAGES_DIR, Catalog, load_catalogs
+
+Changeset = Dict[str, Dict[str, Any]]
+
+
+class ChangesetError(ValueError):
+    pass
+
+
+def load_changeset(path: Path) -> Changeset:
+    """Read ``path`` (``.json``, ``.yaml`` or ``.yml``) into ``{dotted: {locale: value}}``."""
+    text = path.read_text(encoding='utf-8')
+    if path.suffix in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            raise ChangesetError(
+                f'{path}: PyYAML is required for YAML changesets (pip install pyyaml)'
+            ) from None
+        raw = yaml.safe_load(text) or {}
+    else:
+        raw = json.loads(text)
+    if not isinstance(raw, dict):
+        raise ChangesetError(f'{path}: expected a mapping of message paths')
+    return {str(key): value for key, value in raw.items()}
+
+
+def apply_changeset(
+    catalogs: Mapping[str, Catalog],
+    changeset: Mapping[str, Any],
+    create_parents: bool = False,
+) -> List[str]:
+    """Apply ``changeset`` in memory; return the ``locale:path`` entries that changed."""
+    changed = []
+    for dotted, values in changeset.items():
+        if not isinstance(values, dict):
+            values = {locale: values for locale in catalogs}
+        unknown = set(values) - set(catalogs)
+        if unknown:
+            raise ChangesetError(f'{dotted}: unknown locale(s) {", ".join(sorted(unknown))}')
+        for locale, value in values.items():
+            if catalogs[locale].set(dotted, value, create_parents=create_parents):
+                changed.append(f'{locale}:{dotted}')
+    return changed
+
+
+def patch(
+    changesets: Iterable[Mapping[str, Any]],
+    messages_dir: Path = MESSAGES_DIR,
+    create_parents: bool = False,
+    write: bool = True,
+) -> Tuple[Dict[str, Catalog], List[str]]:
+    """Apply every changeset, then save each modified catalog once.
+
+    Returns the catalogs and the ``locale:path`` entries that changed.
+    """
+    catalogs = load_catalogs(messages_dir)
+    changed = []
+    for changeset in changesets:
+        changed += apply_changeset(catalogs, changeset, create_parents=create_parents)
+    if write:
+        for catalog in catalogs.values():
+            catalog.save()
+    return catalogs, changed
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m tools.i18n.patch',
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('changesets', nargs='+', type=Path, help='YAML/JSON changeset files')
+    parser.add_argument('--messages-dir', type=Path, default=MESSAGES_DIR)
+    parser.add_argument(
+        '--create-parents', action='store_true', help='create missing parent objects'
+    )
+    parser.add_argument('--dry-run', action='store_true', help='report changes without writing')
+    args = parser.parse_args(argv)
+
+    try:
+        changesets = [load_changeset(path) for path in args.changesets]
+        catalogs, changed = patch(
+            changesets, args.messages_dir, args.create_parents, write=not args.dry_run
+        )
+    except KeyError as e:
+        print(f'❌ {e.args[0]}')
+        return 1
+    except ValueError as e:
+        print(f'❌ {e}')
+        return 1
+    except OSError as e:
+        print(f'❌ {e}', file=sys.stderr)
+        return 2
+
+    for entry in changed:
+        print(f'  ✓ {entry}')
+    if not changed:
+        print('⏭️  Catalogs already up to date')
+    elif args.dry_run:
+        print(f'\n{len(changed)} message(s) would change (dry run, nothing written)')
+    else:
+        touched = sorted({entry.split(':', 1)[0] for entry in changed})
+        print(f'\n✅ Updated {", ".join(f"{locale}.json" for locale in touched)}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
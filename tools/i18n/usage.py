@@ -0,0 +1,196 @@
+"""Inverted index of translation keys used by the TSX sources.
+
+Each file is scanned for ``useTranslations('Ns')`` / ``getTranslations('Ns')``
+bindings and the ``t('key')`` calls made through them; the resolved
+``Ns.key`` is recorded with its line. Template keys such as
+``t(`form.types_list.${id}`)`` are kept as dynamic prefixes.
+
+Per-file results are cached in ``.cache/i18n-usage-index.json`` keyed by
+``(mtime_ns, size, content hash)``, so a warm run only stats unchanged files
+and re-scans the ones that were edited.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from tools.fileindex import FileIndex
+from tools.fsutil import atomic_write_text, content_hash
+from tools.paths import REPO_ROOT
+
+INDEX_VERSION = 1
+INDEX_PATH = Path('.cache') / 'i18n-usage-index.json'
+SOURCE_GLOBS = ('src/**/*.tsx', 'src/**/*.ts')
+
+# Below this many files to (re)scan, a process pool costs more than it saves.
+_POOL_THRESHOLD = 32
+
+_BINDING = re.compile(
+    r"\b(?:const|let|var)\s+(\w+)\s*=\s*(?:await\s+)?(?:useTranslations|getTranslations)\(\s*"
+    r"(?:(['\"`])([\w.]*)\2|\{[^}]*?\bnamespace:\s*(['\"`])([\w.]*)\4[^}]*\})?\s*\)"
+)
+_NEWLINE = re.compile('\n')
+_CALL = r"\b({names})(?:\.(?:rich|raw|markup|has))?\(\s*(['\"`])((?:(?!\2)[^\\\n])*)\2"
+
+# (dotted key, line, dynamic prefix?)
+Usage = Tuple[str, int, bool]
+
+
+def extract_usages(content: str) -> List[Usage]:
+    """Return every translation key referenced in ``content``."""
+    bindings = [
+        (m.start(), m.group(1), m.group(3) if m.group(2) else (m.group(5) or ''))
+        for m in _BINDING.finditer(content)
+    ]
+    if not bindings:
+        return []
+    names = sorted({name for _, name, _ in bindings}, key=len, reverse=True)
+    calls = re.compile(_CALL.format(names='|'.join(map(re.escape, names))))
+    newlines = [m.start() for m in _NEWLINE.finditer(content)]
+
+    usages: List[Usage] = []
+    for m in calls.finditer(content):
+        namespace = None
+        # The binding in effect is the closest one before the call.
+        for pos, name, ns in reversed(bindings):
+            if pos < m.start() and name == m.group(1):
+                namespace = ns
+                break
+        if namespace is None:
+            continue
+        key = m.group(3)
+        dynamic = m.group(2) == '`' and '${' in key
+        if dynamic:
+            key = key[: key.index('${')]
+        elif not key:
+            continue
+        full = f'{namespace}.{key}' if namespace else key
+        usages.append((full, bisect.bisect_left(newlines, m.start()) + 1, dynamic))
+    return usages
+
+
+@dataclass
+class _Entry:
+    mtime_ns: int
+    size: int
+    digest: str
+    usages: List[Usage] = field(default_factory=list)
+
+
+def _scan_file(job: Tuple[str, str, Optional[str]]) -> Tuple[str, Optional[_Entry], bool]:
+    """Worker: ``(root, path, known digest) -> (path, entry, digest unchanged?)``."""
+    root, path, known_digest = job
+    full_path = os.path.join(root, path)
+    try:
+        with open(full_path, 'rb') as f:
+            raw = f.read()
+        st = os.stat(full_path)
+    except OSError:
+        return path, None, False
+    digest = content_hash(raw)
+    if digest == known_digest:
+        return path, _Entry(st.st_mtime_ns, st.st_size, digest), True
+    usages = extract_usages(raw.decode('utf-8', errors='replace'))
+    return path, _Entry(st.st_mtime_ns, st.st_size, digest, usages), False
+
+
+class UsageIndex:
+    """``key -> [(path, line)]`` for static keys, plus the dynamic key prefixes."""
+
+    def __init__(self, root: Path = REPO_ROOT, cache_path: Optional[Path] = None):
+        self.root = Path(root)
+        self.cache_path = self.root / INDEX_PATH if cache_path is None else cache_path
+        self.files: Dict[str, _Entry] = {}
+        self.rescanned: List[str] = []
+        # Static keys / dynamic prefixes -> (path, line) sites; filled by refresh().
+        self.keys: Dict[str, List[Tuple[str, int]]] = {}
+        self.prefixes: Dict[str, List[Tuple[str, int]]] = {}
+
+    def _load(self) -> None:
+        try:
+            raw = json.loads(self.cache_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        if raw.get('version') != INDEX_VERSION:
+            return
+        self.files = {
+            path: _Entry(e['mtime_ns'], e['size'], e['digest'], [tuple(u) for u in e['usages']])
+            for path, e in raw.get('files', {}).items()
+        }
+
+    def _save(self) -> None:
+        payload = {
+            'version': INDEX_VERSION,
+            'files': {
+                path: {
+                    'mtime_ns': e.mtime_ns,
+                    'size': e.size,
+                    'digest': e.digest,
+                    'usages': e.usages,
+                }
+                for path, e in sorted(self.files.items())
+            },
+        }
+        atomic_write_text(self.cache_path, json.dumps(payload, separators=(',', ':')))
+
+    def refresh(self, paths: Optional[Iterable[str]] = None, jobs: Optional[int] = None) -> None:
+        """Bring the index up to date, re-scanning only files whose content changed."""
+        self._load()
+        if paths is None:
+            paths = FileIndex(self.root).refresh().glob(*SOURCE_GLOBS)
+        paths = list(paths)
+
+        todo = []
+        for path in paths:
+            entry = self.files.get(path)
+            if entry is not None:
+                try:
+                    st = os.stat(self.root / path)
+                except OSError:
+                    continue
+                if entry.mtime_ns == st.st_mtime_ns and entry.size == st.st_size:
+                    continue
+            todo.append((str(self.root), path, entry.digest if entry else None))
+
+        jobs = jobs or os.cpu_count() or 1
+        if jobs == 1 or len(todo) < _POOL_THRESHOLD:
+            results = [_scan_file(job) for job in todo]
+        else:
+            chunksize = max(1, len(todo) // (jobs * 4))
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                results = list(pool.map(_scan_file, todo, chunksize=chunksize))
+
+        self.rescanned = []
+        for path, entry, unchanged in results:
+            if entry is None:
+                self.files.pop(path, None)
+                continue
+            if unchanged:
+                entry.usages = self.files[path].usages
+            else:
+                self.rescanned.append(path)
+            self.files[path] = entry
+        live = set(paths)
+        stale = [p for p in self.files if p not in live]
+        for path in stale:
+            del self.files[path]
+        if results or stale:
+            self._save()
+        self._build()
+
+    def _build(self) -> None:
+        self.keys, self.prefixes = {}, {}
+        for path, entry in sorted(self.files.items()):
+            for key, line, dynamic in entry.usages:
+                target = self.prefixes if dynamic else self.keys
+                target.setdefault(key, []).append((path, line))
+
+    def where(self, key: str) -> Sequence[Tuple[str, int]]:
+        return self.keys.get(key, [])
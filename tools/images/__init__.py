@@ -0,0 +1,19 @@
+"""Sized, content-hashed AVIF/WebP variants of ``public/images``.
+
+    python -m tools.images [--formats avif,webp] [-j 4] [--check]
+"""
+
+from .pipeline import ImageBuild, ImageError, PipelineResult, build, referenced, sources
+from .sizes import DISPLAY_SIZES, Display, display_sizes
+
+__all__ = [
+    'DISPLAY_SIZES',
+    'Display',
+    'ImageBuild',
+    'ImageError',
+    'PipelineResult',
+    'build',
+    'display_sizes',
+    'referenced',
+    'sources',
+]
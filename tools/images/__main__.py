@@ -0,0 +1,123 @@
+"""Command-line entry point: ``python -m tools.images``.
+
+Encodes the 1x/2x AVIF and WebP variants of every image with a display
+size in ``tools/images/sizes.py`` into public/images/optimized and writes
+its manifest.json. ``--check`` writes nothing and exits 1 when the
+variants or the manifest are out of date.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from .pipeline import (
+    CACHE_PATH,
+    FORMATS,
+    IMAGES_DIR,
+    ImageBuild,
+    ImageError,
+    build,
+    referenced,
+)
+
+
+def _kib(size: int) -> str:
+    return f'{size / 1024:,.1f} KiB'
+
+
+def _largest(b: ImageBuild) -> int:
+    """Bytes of the largest variant of each size, in its smallest format."""
+    total = 0
+    for size in b.entry['sizes']:
+        top = max(v['density'] for v in size['variants'])
+        total += min(v['bytes'] for v in size['variants'] if v['density'] == top)
+    return total
+
+
+def _describe(size: dict) -> str:
+    variants = ', '.join(
+        f"{v['density']}x {v['format']} {_kib(v['bytes'])}" for v in size['variants']
+    )
+    return f"{size['display']} {variants}"
+
+
+def _formats(value: str) -> List[str]:
+    formats = [v.strip().lower() for v in value.split(',') if v.strip()]
+    unknown = sorted(set(formats) - set(FORMATS))
+    if not formats or unknown:
+        raise argparse.ArgumentTypeError(f'expected some of {",".join(FORMATS)}')
+    return formats
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m tools.images',
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--images', type=Path, default=IMAGES_DIR, help='source directory')
+    parser.add_argument(
+        '--formats', type=_formats, default=list(FORMATS), help='default: ' + ','.join(FORMATS)
+    )
+    parser.add_argument('-j', '--jobs', type=int, help='worker processes (default: CPU count)')
+    parser.add_argument(
+        '--check', action='store_true', help='write nothing; exit 1 if the variants are stale'
+    )
+    parser.add_argument('--no-cache', action='store_true', help='decode every source again')
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    try:
+        result = build(
+            args.images,
+            args.formats,
+            args.jobs,
+            write=not args.check,
+            cache_path=None if args.no_cache else CACHE_PATH,
+        )
+        used = referenced()
+    except (ImageError, OSError, ValueError) as e:
+        print(f'❌ {e}', file=sys.stderr)
+        return 2
+    elapsed = time.perf_counter() - started
+
+    for fmt in result.skipped_formats:
+        print(f'⚠️  this Pillow cannot encode {fmt}; skipped')
+    verb = 'would write' if args.check else 'written'
+    sources = served = 0
+    for b in result.images:
+        if not b.configured:
+            if b.path in used:
+                print(f'⚠️  {b.path}: used by src/ but has no size in tools/images/sizes.py')
+            else:
+                print(f'ℹ️  {b.path}: not referenced from src/, no display size; skipped')
+            continue
+        sources += b.entry['bytes']
+        served += _largest(b)
+        sizes = '; '.join(_describe(size) for size in b.entry['sizes'])
+        state = 'unchanged' if b.cached else f'{len(b.written)} {verb}'
+        print(f"✅ {b.path} ({_kib(b.entry['bytes'])}, {state}): {sizes}")
+        if args.check:
+            for name in b.written:
+                print(f'   + {name}')
+    for name in result.removed:
+        print(f'   - {name}' if args.check else f'🗑️  {name}')
+
+    variants = sum(len(b.files) for b in result.images)
+    print(
+        f'\n📊 {variants} variants of {sum(b.configured for b in result.images)} images '
+        f'in {elapsed:.2f}s; the largest of each size is {_kib(served)} '
+        f'against {_kib(sources)} of sources'
+    )
+    if args.check and result.stale:
+        print('❌ images are out of date: python -m tools.images')
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,304 @@
+"""Encode the images of ``public/images`` into sized, content-hashed variants.
+
+For every display size of an image (see ``sizes.py``) a 1x and a 2x
+variant is encoded in each format, named after a hash of its bytes::
+
+    public/images/optimized/hero_iphone.500x500.3f2a1b9c0d.avif
+    public/images/optimized/icon/apple.24x24.9e01c2d4f5.webp
+
+``public/images/optimized/manifest.json`` maps each source to its
+variants, so a ``<picture>``/``srcSet`` can be written from it and the
+files served with an immutable cache header. A 2x variant is dropped when
+the source is too small to give one.
+
+Sources encode in a process pool, one image per task. A source whose
+content and settings are unchanged since the last build
+(``.cache/images.json``) and whose variants are all still there is not
+decoded again; files no longer referenced by the manifest are removed.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from tools.fileindex import FileIndex
+from tools.fsutil import atomic_write_bytes, atomic_write_text, content_hash
+from tools.paths import REPO_ROOT
+
+from .sizes import Display, display_sizes
+
+IMAGES_DIR = REPO_ROOT / 'public' / 'images'
+OUT_NAME = 'optimized'
+CACHE_PATH = REPO_ROOT / '.cache' / 'images.json'
+CACHE_VERSION = 1
+MANIFEST_VERSION = 1
+SOURCE_SUFFIXES = ('.png', '.jpg', '.jpeg', '.webp')
+FORMATS = ('avif', 'webp')
+QUALITY = {'avif': 55, 'webp': 80}
+DENSITIES = (1, 2)
+HASH_LENGTH = 10
+
+_VARIANT_NAME = re.compile(
+    r'\.\d+x\d+\.[0-9a-f]{%d}\.(?:%s)$' % (HASH_LENGTH, '|'.join(FORMATS))
+)
+_REFERENCE = re.compile(r'/images/([\w./ -]+?\.(?:png|jpe?g|webp))\b', re.I)
+
+
+class ImageError(RuntimeError):
+    pass
+
+
+def _pillow() -> Any:
+    try:
+        from PIL import Image, ImageOps, features
+    except ImportError:
+        raise ImageError('Pillow is required to encode images (pip install Pillow)') from None
+    return Image, ImageOps, features
+
+
+def available_formats(formats: Sequence[str] = FORMATS) -> Tuple[List[str], List[str]]:
+    """``(formats this Pillow can encode, formats it cannot)``."""
+    _, _, features = _pillow()
+    usable = [f for f in formats if features.check(f)]
+    return usable, [f for f in formats if f not in usable]
+
+
+@dataclass
+class ImageBuild:
+    path: str  # relative to the images directory
+    # (mtime_ns, size, digest) of the source the variants were built from
+    source: Tuple[int, int, str]
+    entry: Dict[str, Any] = field(default_factory=dict)  # the manifest entry
+    written: List[str] = field(default_factory=list)
+    cached: bool = False  # unchanged since the last build: not decoded
+    configured: bool = True  # has display sizes
+
+    @property
+    def files(self) -> List[str]:
+        """Every variant of the entry, relative to the output directory."""
+        return [v['file'] for size in self.entry.get('sizes', []) for v in size['variants']]
+
+
+def _settings(sizes: Sequence[Display], formats: Sequence[str]) -> Dict[str, Any]:
+    return {
+        'sizes': [[d.width, d.height, d.fit] for d in sizes],
+        'formats': list(formats),
+        'quality': {f: QUALITY[f] for f in formats},
+    }
+
+
+def _prepare(image: Any) -> Any:
+    """RGB, or RGBA when the image has any transparency, upright."""
+    Image, ImageOps, _ = _pillow()
+    image = ImageOps.exif_transpose(image)
+    alpha = image.mode in ('RGBA', 'LA', 'PA') or 'transparency' in image.info
+    image = image.convert('RGBA' if alpha else 'RGB')
+    if alpha and image.getchannel('A').getextrema() == (255, 255):
+        image = image.convert('RGB')
+    return image
+
+
+def _encode(image: Any, fmt: str) -> bytes:
+    buf = io.BytesIO()
+    if fmt == 'webp':
+        image.save(buf, 'WEBP', quality=QUALITY['webp'], method=6)
+    else:
+        image.save(buf, 'AVIF', quality=QUALITY['avif'], speed=6)
+    return buf.getvalue()
+
+
+def _build_image(
+    job: Tuple[str, str, str, Tuple[Display, ...], Tuple[str, ...], Optional[Dict[str, Any]], bool]
+) -> ImageBuild:
+    """Worker: encode (or reuse) every variant of one source."""
+    path, source, out, sizes, formats, previous, write = job
+    out_dir = Path(out)
+    st = os.stat(source)
+    raw: Optional[bytes] = None
+    if previous is not None and previous['settings'] == _settings(sizes, formats):
+        mtime_ns, size, digest = previous['source']
+        if (mtime_ns, size) != (st.st_mtime_ns, st.st_size):
+            # Touched, or changed: only the content hash can tell.
+            raw = Path(source).read_bytes()
+            mtime_ns, size = st.st_mtime_ns, st.st_size
+            digest = digest if content_hash(raw) == digest else ''
+        build = ImageBuild(path, (mtime_ns, size, digest), previous['entry'], cached=True)
+        if digest and all((out_dir / name).exists() for name in build.files):
+            return build
+
+    if raw is None:
+        raw = Path(source).read_bytes()
+    build = ImageBuild(path, (st.st_mtime_ns, st.st_size, content_hash(raw)))
+    Image, _, _ = _pillow()
+    with Image.open(io.BytesIO(raw)) as opened:
+        size = opened.size
+        if opened.format == 'JPEG':
+            # Decode at a fraction of the size when even the 2x variants are smaller.
+            largest = max(d.scaled(size, max(DENSITIES)) for d in sizes)
+            opened.draft('RGB', largest)
+        image = _prepare(opened)
+    build.entry = {
+        'src': f'/images/{path}',
+        'width': size[0],
+        'height': size[1],
+        'bytes': len(raw),
+        'sizes': [],
+    }
+    stem, _ = os.path.splitext(path)
+    for display in sizes:
+        variants = []
+        seen = set()
+        for density in DENSITIES:
+            width, height = display.scaled(size, density)
+            if (width, height) in seen:
+                continue
+            seen.add((width, height))
+            resized = image if (width, height) == image.size else image.resize(
+                (width, height), Image.LANCZOS, reducing_gap=3.0
+            )
+            for fmt in formats:
+                data = _encode(resized, fmt)
+                name = f'{stem}.{width}x{height}.{content_hash(data)[:HASH_LENGTH]}.{fmt}'
+                variants.append(
+                    {
+                        'density': density,
+                        'format': fmt,
+                        'width': width,
+                        'height': height,
+                        'bytes': len(data),
+                        'file': name,
+                    }
+                )
+                if not (out_dir / name).exists():
+                    build.written.append(name)
+                    if write:
+                        atomic_write_bytes(out_dir / name, data)
+        build.entry['sizes'].append(
+            {'display': str(display), 'fit': display.fit, 'variants': variants}
+        )
+    return build
+
+
+@dataclass
+class PipelineResult:
+    images: List[ImageBuild]
+    removed: List[str]
+    manifest_changed: bool
+    skipped_formats: List[str]
+
+    @property
+    def stale(self) -> bool:
+        return self.manifest_changed or bool(self.removed) or any(b.written for b in self.images)
+
+
+def _load_cache(path: Path) -> Dict[str, Any]:
+    try:
+        raw = json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    if raw.get('version') != CACHE_VERSION:
+        return {}
+    return raw.get('images', {})
+
+
+def sources(images_dir: Path = IMAGES_DIR) -> List[str]:
+    """Images under ``images_dir`` (not the output), relative POSIX paths."""
+    found = []
+    for path in sorted(images_dir.rglob('*')):
+        rel = path.relative_to(images_dir).as_posix()
+        if rel.split('/')[0] != OUT_NAME and path.suffix.lower() in SOURCE_SUFFIXES:
+            found.append(rel)
+    return found
+
+
+def referenced(root: Path = REPO_ROOT) -> Set[str]:
+    """Images the TypeScript sources name (``/images/<path>``), relative paths."""
+    found: Set[str] = set()
+    for path in FileIndex(root).refresh().glob('src/**/*.tsx', 'src/**/*.ts'):
+        text = (root / path).read_text(encoding='utf-8', errors='replace')
+        found.update(m.group(1) for m in _REFERENCE.finditer(text))
+    return found
+
+
+def build(
+    images_dir: Path = IMAGES_DIR,
+    formats: Sequence[str] = FORMATS,
+    jobs: Optional[int] = None,
+    write: bool = True,
+    cache_path: Optional[Path] = CACHE_PATH,
+) -> PipelineResult:
+    """Bring ``<images_dir>/optimized`` up to date with every configured source.
+
+    Formats this Pillow cannot encode are left out and reported. With
+    ``write=False`` nothing is touched and the result reports what would be.
+    """
+    usable, skipped = available_formats(formats)
+    if not usable:
+        raise ImageError(f'this Pillow cannot encode any of {", ".join(formats)}')
+    images_dir = images_dir.resolve()
+    out = images_dir / OUT_NAME
+    previous = _load_cache(cache_path) if cache_path else {}
+    tasks = []
+    unconfigured = []
+    for path in sources(images_dir):
+        sizes = display_sizes(path)
+        if sizes is None:
+            st = (images_dir / path).stat()
+            stamp = (st.st_mtime_ns, st.st_size, '')
+            unconfigured.append(ImageBuild(path, stamp, configured=False))
+            continue
+        source = str(images_dir / path)
+        tasks.append((path, source, str(out), sizes, tuple(usable), previous.get(path), write))
+
+    workers = min(jobs or os.cpu_count() or 1, len(tasks))
+    if workers <= 1:
+        builds = [_build_image(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            builds = list(pool.map(_build_image, tasks))
+
+    live = {name for b in builds for name in b.files}
+    removed = []
+    if out.is_dir():
+        for path in sorted(out.rglob('*')):
+            name = path.relative_to(out).as_posix()
+            if _VARIANT_NAME.search(name) and name not in live:
+                removed.append(name)
+                if write:
+                    path.unlink()
+
+    manifest = {'version': MANIFEST_VERSION, 'images': {b.path: b.entry for b in builds}}
+    manifest_text = json.dumps(manifest, indent=2) + '\n'
+    manifest_path = out / 'manifest.json'
+    try:
+        current = manifest_path.read_text(encoding='utf-8')
+    except OSError:
+        current = None
+    result = PipelineResult(builds + unconfigured, removed, current != manifest_text, skipped)
+    if not write:
+        return result
+    if result.manifest_changed:
+        atomic_write_text(manifest_path, manifest_text)
+    if cache_path and any(
+        not b.cached or previous[b.path]['source'] != list(b.source) for b in builds
+    ):
+        payload = {
+            'version': CACHE_VERSION,
+            'images': {
+                b.path: {
+                    'source': list(b.source),
+                    'settings': _settings(display_sizes(b.path) or (), usable),
+                    'entry': b.entry,
+                }
+                for b in builds
+            },
+        }
+        atomic_write_text(cache_path, json.dumps(payload, separators=(',', ':')))
+    return result
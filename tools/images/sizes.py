@@ -0,0 +1,55 @@
+"""The CSS sizes each image of ``public/images`` is displayed at.
+
+Keys are globs relative to ``public/images``; the first that matches wins.
+An image with no entry is reported but not encoded: without a display size
+the only variant would be a full-size re-encode. Boxes are the element's
+content box in CSS pixels (padding excluded); ``fit`` follows its
+``object-fit``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+from tools.paths import match_glob
+
+
+@dataclass(frozen=True)
+class Display:
+    width: int
+    height: int
+    fit: str = 'contain'  # 'contain' | 'cover'
+
+    def scaled(self, source: Tuple[int, int], density: int) -> Tuple[int, int]:
+        """Pixel size of the variant for ``density``; never larger than ``source``."""
+        src_w, src_h = source
+        box_w, box_h = self.width * density, self.height * density
+        fits = (box_w / src_w, box_h / src_h)
+        scale = min(1.0, min(fits) if self.fit == 'contain' else max(fits))
+        return max(1, round(src_w * scale)), max(1, round(src_h * scale))
+
+    def __str__(self) -> str:
+        return f'{self.width}x{self.height}'
+
+
+DISPLAY_SIZES: Dict[str, Tuple[Display, ...]] = {
+    # Sidebar.tsx: 36px <img> with 4px padding, object-fit: contain.
+    'wind_wireless.png': (Display(28, 28),),
+    # Header.tsx: <Image fill> in a 180x50 box, object-fit: contain.
+    'wind_wireless_2.png': (Display(180, 50),),
+    # [locale]/page.tsx hero: half of the 1200px container, 500px tall, contain.
+    'hero_iphone.png': (Display(576, 500),),
+    # [locale]/page.tsx about section: half of the grid (100px gap), 600px tall, cover.
+    'quality_check.png': (Display(526, 600, 'cover'),),
+    # ManufacturersPage.tsx: manufacturer logos at 24x24.
+    'icon/*.png': (Display(24, 24),),
+}
+
+
+def display_sizes(path: str) -> Optional[Tuple[Display, ...]]:
+    """The sizes ``path`` (relative to ``public/images``) is shown at, if configured."""
+    for pattern, sizes in DISPLAY_SIZES.items():
+        if match_glob(path, pattern):
+            return sizes
+    return None
@@ -0,0 +1,29 @@
+"""Bulk inventory import from the stock spreadsheet (CSV/XLSX) into Postgres.
+
+The server-side counterpart of ``processInventoryFile`` for files too large to
+handle in the browser::
+
+    python -m tools.inventory_import estoque.xlsx --dsn postgresql://...
+    python -m tools.inventory_import estoque.csv --dry-run
+"""
+
+from .imei import BloomFilter, ExistingStock, ImeiValidator
+from .importer import ImportResult, import_file
+from .reader import COLUMNS, SpreadsheetError, read_rows
+from .sink import PostgresSink, SinkError
+from .validate import Rejection, validate_chunk
+
+__all__ = [
+    'BloomFilter',
+    'COLUMNS',
+    'ExistingStock',
+    'ImeiValidator',
+    'ImportResult',
+    'PostgresSink',
+    'Rejection',
+    'SinkError',
+    'SpreadsheetError',
+    'import_file',
+    'read_rows',
+    'validate_chunk',
+]
@@ -0,0 +1,79 @@
+"""Command-line entry point: ``python -m tools.inventory_import``.
+
+Rejected rows are printed as they are found (``Linha N: ...``, the messages the
+app shows); the exit status is 1 if any row was rejected.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from .importer import DEFAULT_CHUNK_SIZE, import_file
+from .reader import SpreadsheetError
+from .sink import MODES, PostgresSink, SinkError
+from .validate import Rejection
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m tools.inventory_import',
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('file', type=Path, help='.csv or .xlsx in the downloadTemplate layout')
+    parser.add_argument(
+        '--dsn',
+        default=os.environ.get('DATABASE_URL'),
+        help='Postgres connection string (default: $DATABASE_URL)',
+    )
+    parser.add_argument('--sheet', help='worksheet name (default: the first one)')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--mode', choices=MODES, default='copy', help='bulk write strategy')
+    parser.add_argument('--created-by', metavar='UUID', help='profile id stored as created_by')
+    parser.add_argument(
+        '--bloom',
+        action='store_true',
+        help='hold existing stock IMEIs in a Bloom filter instead of a set (large stock)',
+    )
+    parser.add_argument('--dry-run', action='store_true', help='validate only, do not connect')
+    args = parser.parse_args(argv)
+
+    if not args.dry_run and not args.dsn:
+        parser.error('--dsn (or $DATABASE_URL) is required unless --dry-run is given')
+
+    def report(rejection: Rejection) -> None:
+        print(f'❌ {rejection}')
+
+    started = time.perf_counter()
+    options = dict(
+        sheet=args.sheet,
+        chunk_size=args.chunk_size,
+        created_by=args.created_by,
+        bloom=args.bloom,
+        on_reject=report,
+    )
+    try:
+        if args.dry_run:
+            result = import_file(args.file, **options)
+        else:
+            with PostgresSink(args.dsn, mode=args.mode) as sink:
+                result = import_file(args.file, sink, **options)
+    except (SpreadsheetError, SinkError, OSError) as e:
+        print(f'❌ {e}', file=sys.stderr)
+        return 2
+
+    verb = 'valid' if args.dry_run else 'imported'
+    print(
+        f'\n📊 {result.rows} rows: {result.imported} {verb}, {result.rejected} rejected '
+        f'in {time.perf_counter() - started:.2f}s'
+    )
+    return 1 if result.rejected else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
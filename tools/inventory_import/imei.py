@@ -0,0 +1,213 @@
+"""Vectorized IMEI checks for whole import chunks.
+
+A chunk's IMEIs are turned into a ``(n, 15)`` digit matrix with one
+``frombuffer`` call, and every check is an array operation over it:
+
+* format     - exactly 15 ASCII digits,
+* Luhn       - the check digit (last position) must validate,
+* duplicates - repeated IMEIs in the file; the first occurrence wins, found
+               with ``unique``/``searchsorted`` against the sorted IMEIs of
+               earlier chunks (16 bytes per IMEI with its row),
+* in stock   - membership in ``ExistingStock``, built once per import from
+               the non-deleted IMEIs in ``public.inventory``.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Callable, Iterable, List, Optional, Sequence, Set, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    raise ImportError('numpy is required for IMEI validation (pip install numpy)') from None
+
+from .validate import Rejection
+
+IMEI_LENGTH = 15
+
+_POWERS = 10 ** np.arange(IMEI_LENGTH - 1, -1, -1, dtype=np.int64)
+
+
+def parse_imeis(imeis: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Return ``(well_formed, values)``: a mask of 15-ASCII-digit entries and their int64 values.
+
+    ``values`` is 0 where the entry is malformed.
+    """
+    n = len(imeis)
+    lengths = np.fromiter(map(len, imeis), dtype=np.int64, count=n)
+    sized = lengths == IMEI_LENGTH
+    values = np.zeros(n, dtype=np.int64)
+    if not sized.any():
+        return sized, values
+    # Non-ASCII characters become '?', which keeps one byte per character.
+    joined = ''.join(s for s, ok in zip(imeis, sized.tolist()) if ok)
+    digits = np.frombuffer(joined.encode('ascii', 'replace'), dtype=np.uint8) - ord('0')
+    digits = digits.reshape(-1, IMEI_LENGTH)
+    numeric = (digits <= 9).all(axis=1)  # bytes below '0' wrap around past 9
+    well_formed = sized.copy()
+    well_formed[sized] = numeric
+    values[well_formed] = digits[numeric].astype(np.int64) @ _POWERS
+    return well_formed, values
+
+
+def luhn_valid(values: np.ndarray) -> np.ndarray:
+    """Luhn check of 15-digit ``values``; the last digit is the check digit."""
+    digits = (values[:, None] // _POWERS) % 10
+    doubled = digits[:, 1::2] * 2
+    doubled -= 9 * (doubled > 9)
+    return (digits[:, 0::2].sum(axis=1) + doubled.sum(axis=1)) % 10 == 0
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over int64 keys, with vectorized add/contains."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        capacity = max(capacity, 1)
+        self.size = max(64, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = np.zeros((self.size + 7) // 8, dtype=np.uint8)
+
+    @staticmethod
+    def _mix(x: np.ndarray) -> np.ndarray:
+        # splitmix64 finalizer
+        x = x ^ (x >> np.uint64(30))
+        x = x * np.uint64(0xBF58476D1CE4E5B9)
+        x = x ^ (x >> np.uint64(27))
+        x = x * np.uint64(0x94D049BB133111EB)
+        return x ^ (x >> np.uint64(31))
+
+    def _positions(self, keys: np.ndarray) -> np.ndarray:
+        keys = keys.astype(np.uint64)
+        h1 = self._mix(keys)
+        h2 = self._mix(keys ^ np.uint64(0x9E3779B97F4A7C15)) | np.uint64(1)
+        rounds = np.arange(self.hashes, dtype=np.uint64)
+        return (h1[:, None] + rounds * h2[:, None]) % np.uint64(self.size)
+
+    def add(self, keys: np.ndarray) -> None:
+        pos = self._positions(keys).ravel()
+        masks = np.left_shift(np.uint8(1), (pos & np.uint64(7)).astype(np.uint8))
+        np.bitwise_or.at(self.bits, pos >> np.uint64(3), masks)
+
+    def contains(self, keys: np.ndarray) -> np.ndarray:
+        pos = self._positions(keys)
+        shifts = (pos & np.uint64(7)).astype(np.uint8)
+        return ((self.bits[pos >> np.uint64(3)] >> shifts) & 1).all(axis=1)
+
+
+class ExistingStock:
+    """IMEIs already in stock, as an exact hash set or a Bloom filter.
+
+    The Bloom filter needs ~1.8 bytes per IMEI instead of a Python int's ~70;
+    its rare false positives are re-checked with ``confirm`` (a database
+    lookup of just those IMEIs), so results stay exact.
+    """
+
+    def __init__(
+        self,
+        exact: Optional[Set[int]] = None,
+        bloom: Optional[BloomFilter] = None,
+        confirm: Optional[Callable[[Sequence[str]], Set[str]]] = None,
+    ):
+        if (exact is None) == (bloom is None):
+            raise ValueError('pass exactly one of exact or bloom')
+        if bloom is not None and confirm is None:
+            raise ValueError('a Bloom filter needs a confirm callback')
+        self.exact = exact
+        self.bloom = bloom
+        self.confirm = confirm
+
+    @classmethod
+    def build(
+        cls,
+        batches: Iterable[Sequence[str]],
+        *,
+        count: Optional[int] = None,
+        confirm: Optional[Callable[[Sequence[str]], Set[str]]] = None,
+    ) -> 'ExistingStock':
+        """Build from batches of stored IMEIs; a Bloom filter when ``count`` is given."""
+        bloom = BloomFilter(count) if count is not None else None
+        exact: Optional[Set[int]] = None if bloom is not None else set()
+        for batch in batches:
+            well_formed, values = parse_imeis([s.strip() for s in batch])
+            values = values[well_formed]
+            if bloom is not None:
+                bloom.add(values)
+            else:
+                exact.update(values.tolist())
+        return cls(exact=exact, bloom=bloom, confirm=confirm)
+
+    def contains(self, values: np.ndarray) -> np.ndarray:
+        if self.exact is not None:
+            exact = self.exact
+            return np.fromiter((v in exact for v in values.tolist()), dtype=bool, count=len(values))
+        hits = self.bloom.contains(values)
+        if hits.any():
+            candidates = [f'{v:015d}' for v in values[hits].tolist()]
+            confirmed = self.confirm(candidates)
+            hits[hits] = [c in confirmed for c in candidates]
+        return hits
+
+
+class ImeiValidator:
+    """Stateful across the chunks of one file, so duplicates between chunks are caught."""
+
+    def __init__(self, existing: Optional[ExistingStock] = None):
+        self.existing = existing
+        self._seen = np.empty(0, dtype=np.int64)
+        self._seen_rows = np.empty(0, dtype=np.int64)
+
+    def check(self, rows: Sequence[int], imeis: Sequence[str]) -> List[Rejection]:
+        """Rejections for one chunk; ``rows`` are the spreadsheet row numbers of ``imeis``."""
+        row_numbers = np.asarray(rows, dtype=np.int64)
+        well_formed, values = parse_imeis(imeis)
+        rejected: List[Rejection] = []
+
+        def reject(mask: np.ndarray, message: Callable[[int, str], str]) -> None:
+            for i in np.flatnonzero(mask).tolist():
+                rejected.append(Rejection(int(row_numbers[i]), message(i, imeis[i])))
+
+        reject(~well_formed, lambda i, imei: f'IMEI {imei} deve ter 15 dígitos')
+        candidates = well_formed.copy()
+        candidates[well_formed] = luhn_valid(values[well_formed])
+        reject(
+            well_formed & ~candidates,
+            lambda i, imei: f'IMEI {imei} com dígito verificador inválido',
+        )
+
+        # Duplicates, first within the chunk, then against earlier chunks.
+        idx = np.flatnonzero(candidates)
+        first_row = np.zeros(len(values), dtype=np.int64)
+        if len(idx):
+            _, first, inverse = np.unique(values[idx], return_index=True, return_inverse=True)
+            first_row[idx] = row_numbers[idx[first[inverse]]]
+            pos = np.searchsorted(self._seen, values[idx])
+            pos = np.minimum(pos, max(len(self._seen) - 1, 0))
+            if len(self._seen):
+                earlier = self._seen[pos] == values[idx]
+            else:
+                earlier = np.zeros(len(idx), dtype=bool)
+            first_row[idx[earlier]] = self._seen_rows[pos[earlier]]
+        duplicate = candidates & (first_row != row_numbers)
+        reject(
+            duplicate,
+            lambda i, imei: f'IMEI {imei} duplicado na planilha (linha {first_row[i]})',
+        )
+        candidates &= ~duplicate
+        self._remember(values[candidates], row_numbers[candidates])
+
+        if self.existing is not None and candidates.any():
+            in_stock = np.zeros(len(values), dtype=bool)
+            in_stock[candidates] = self.existing.contains(values[candidates])
+            reject(in_stock, lambda i, imei: f'IMEI {imei} já existe no estoque')
+
+        rejected.sort(key=lambda r: r.row)
+        return rejected
+
+    def _remember(self, values: np.ndarray, rows: np.ndarray) -> None:
+        """Merge a chunk's first occurrences (none seen before) into the sorted IMEIs."""
+        order = np.argsort(values)
+        values = values[order]
+        at = np.searchsorted(self._seen, values)
+        self._seen = np.insert(self._seen, at, values)
+        self._seen_rows = np.insert(self._seen_rows, at, rows[order])
@@ -0,0 +1,65 @@
+"""Chunked spreadsheet -> ``public.inventory`` import.
+
+Rows are read, validated and written one chunk at a time; only the running
+counts outlive a chunk, and rejections are handed to a callback as they are
+found, so memory stays flat regardless of the file size.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+from .imei import ExistingStock, ImeiValidator
+from .reader import SpreadsheetError, chunked, read_rows
+from .sink import PostgresSink
+from .validate import Rejection, validate_chunk
+
+DEFAULT_CHUNK_SIZE = 5000
+
+
+@dataclass
+class ImportResult:
+    rows: int = 0
+    imported: int = 0
+    rejected: int = 0
+
+
+def import_file(
+    path: Path,
+    sink: Optional[PostgresSink] = None,
+    *,
+    sheet: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    created_by: Optional[str] = None,
+    bloom: bool = False,
+    on_reject: Optional[Callable[[Rejection], None]] = None,
+) -> ImportResult:
+    """Import ``path`` into ``sink``; without a sink, only validate (no stock lookup).
+
+    The IMEIs already in stock are loaded once up front, into a hash set or,
+    with ``bloom``, a Bloom filter whose hits are confirmed against the database.
+    """
+    existing = None
+    if sink is not None:
+        existing = ExistingStock.build(
+            sink.iter_imeis(),
+            count=sink.count_imeis() if bloom else None,
+            confirm=sink.existing_imeis,
+        )
+    validator = ImeiValidator(existing)
+    result = ImportResult()
+    for rows in chunked(read_rows(path, sheet), chunk_size):
+        result.rows += len(rows)
+        records, rejected = validate_chunk(rows, validator, created_by)
+        if sink is not None:
+            sink.write(records)
+        result.imported += len(records)
+        result.rejected += len(rejected)
+        if on_reject is not None:
+            for rejection in rejected:
+                on_reject(rejection)
+    if result.rows == 0:
+        raise SpreadsheetError('Planilha vazia!')
+    return result
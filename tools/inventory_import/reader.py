@@ -0,0 +1,112 @@
+"""Row-streaming readers for the inventory import spreadsheet.
+
+Both readers yield one row at a time, so memory does not grow with the file:
+CSV goes through ``csv.reader``, XLSX through openpyxl's read-only mode, which
+parses the sheet XML incrementally instead of building the whole workbook.
+"""
+
+from __future__ import annotations
+
+import csv
+import itertools
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+# Spreadsheet header -> inventory column, in ``downloadTemplate`` order
+# (src/lib/inventoryImport.ts).
+COLUMNS: Dict[str, str] = {
+    'Modelo': 'model',
+    'Capacidade': 'capacity',
+    'Cor': 'color',
+    'Grade': 'grade',
+    'Preço': 'price',
+    'Status': 'status',
+    'IMEI': 'imei',
+    'Número de Série': 'serial_number',
+    'Invoice de Compra': 'purchase_invoice',
+}
+
+# (spreadsheet row number, header -> cell text)
+Row = Tuple[int, Dict[str, str]]
+
+T = TypeVar('T')
+
+
+class SpreadsheetError(ValueError):
+    """The file cannot be read as an inventory spreadsheet."""
+
+
+def _cell_text(value: Any) -> str:
+    if value is None:
+        return ''
+    # Excel stores long digit strings typed as numbers as floats.
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
+
+def _rows(header: Sequence[Any], records: Iterable[Sequence[Any]]) -> Iterator[Row]:
+    names = [_cell_text(h) for h in header]
+    # Row 1 is the header, as in processInventoryFile.
+    for row_number, record in enumerate(records, start=2):
+        cells = {name: _cell_text(value) for name, value in zip(names, record) if name}
+        # Blank rows (such as the template's ",,,,,,,,") are skipped, like sheet_to_json does.
+        if any(cells.values()):
+            yield row_number, cells
+
+
+def _read_csv(path: Path) -> Iterator[Row]:
+    # utf-8-sig drops the BOM downloadTemplate writes.
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        sample = f.read(4096)
+        f.seek(0)
+        try:
+            dialect: Any = csv.Sniffer().sniff(sample, delimiters=',;\t')
+        except csv.Error:
+            dialect = csv.excel
+        records = csv.reader(f, dialect)
+        header = next(records, None)
+        if header is None:
+            raise SpreadsheetError(f'{path}: empty file')
+        yield from _rows(header, records)
+
+
+def _read_xlsx(path: Path, sheet: Optional[str]) -> Iterator[Row]:
+    try:
+        import openpyxl
+    except ImportError:
+        raise SpreadsheetError(
+            f'{path}: openpyxl is required for .xlsx files (pip install openpyxl)'
+        ) from None
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        # Like processInventoryFile, the first sheet unless told otherwise.
+        worksheet = workbook[sheet] if sheet else workbook.worksheets[0]
+        records = worksheet.iter_rows(values_only=True)
+        header = next(records, None)
+        if header is None:
+            raise SpreadsheetError(f'{path}: empty sheet')
+        yield from _rows(header, records)
+    finally:
+        workbook.close()
+
+
+def read_rows(path: Path, sheet: Optional[str] = None) -> Iterator[Row]:
+    """Stream ``(row_number, {header: text})`` from a ``.csv`` or ``.xlsx`` file."""
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == '.csv':
+        return _read_csv(path)
+    if suffix in ('.xlsx', '.xlsm'):
+        return _read_xlsx(path, sheet)
+    raise SpreadsheetError(f'{path}: unsupported file type {suffix or "(none)"}')
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Split ``items`` into lists of at most ``size``."""
+    iterator = iter(items)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
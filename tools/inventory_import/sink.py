@@ -0,0 +1,114 @@
+"""Bulk writers into ``public.inventory``.
+
+The whole import runs in one transaction, as the app's single ``insert()``
+does: either every valid row lands or none does. Each chunk is sent with
+``COPY ... FROM STDIN`` (default) or multi-row ``INSERT`` statements, so the
+round trips grow with the number of chunks, not rows.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterator, List, Optional, Sequence, Set
+
+from .validate import INSERT_COLUMNS, Record
+
+MODES = ('copy', 'insert')
+
+# Postgres caps a statement at 65535 bind parameters.
+_MAX_PARAMS = 65535
+
+
+class SinkError(RuntimeError):
+    pass
+
+
+def _connect(dsn: str) -> Any:
+    try:
+        import psycopg
+    except ImportError:
+        raise SinkError(
+            'psycopg is required to write to Postgres (pip install "psycopg[binary]")'
+        ) from None
+    try:
+        return psycopg.connect(dsn)
+    except psycopg.OperationalError as e:
+        raise SinkError(f'cannot connect to Postgres: {e}') from e
+
+
+class PostgresSink:
+    """Context manager: commits on a clean exit, rolls back on an exception."""
+
+    def __init__(self, dsn: str, mode: str = 'copy', table: str = 'public.inventory'):
+        if mode not in MODES:
+            raise ValueError(f'mode must be one of {", ".join(MODES)}')
+        self.dsn = dsn
+        self.mode = mode
+        self.table = table
+        self.conn: Any = None
+        self.written = 0
+
+    def __enter__(self) -> 'PostgresSink':
+        self.conn = _connect(self.dsn)
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        try:
+            if exc_type is None:
+                self.conn.commit()
+            else:
+                self.conn.rollback()
+        finally:
+            self.conn.close()
+
+    def count_imeis(self) -> int:
+        with self.conn.cursor() as cur:
+            cur.execute(f'SELECT count(imei) FROM {self.table} WHERE deleted_at IS NULL')
+            return cur.fetchone()[0]
+
+    def iter_imeis(self, batch_size: int = 50_000) -> Iterator[List[str]]:
+        """Stream the IMEIs in non-deleted stock through a server-side cursor."""
+        with self.conn.cursor(name='inventory_import_imeis') as cur:
+            cur.itersize = batch_size
+            cur.execute(
+                f'SELECT imei FROM {self.table} WHERE deleted_at IS NULL AND imei IS NOT NULL'
+            )
+            while True:
+                rows = cur.fetchmany(batch_size)
+                if not rows:
+                    return
+                yield [imei for (imei,) in rows]
+
+    def existing_imeis(self, imeis: Sequence[str]) -> Set[str]:
+        """The subset of ``imeis`` already in non-deleted stock."""
+        if not imeis:
+            return set()
+        with self.conn.cursor() as cur:
+            cur.execute(
+                f'SELECT imei FROM {self.table} WHERE deleted_at IS NULL AND imei = ANY(%s)',
+                (list(imeis),),
+            )
+            return {imei for (imei,) in cur}
+
+    def write(self, records: Sequence[Record]) -> None:
+        if not records:
+            return
+        columns = ', '.join(INSERT_COLUMNS)
+        with self.conn.cursor() as cur:
+            if self.mode == 'copy':
+                with cur.copy(f'COPY {self.table} ({columns}) FROM STDIN') as copy:
+                    for record in records:
+                        copy.write_row(record)
+            else:
+                row = '(' + ', '.join(['%s'] * len(INSERT_COLUMNS)) + ')'
+                step = _MAX_PARAMS // len(INSERT_COLUMNS)
+                for start in range(0, len(records), step):
+                    batch = records[start : start + step]
+                    params: List[Optional[object]] = []
+                    for record in batch:
+                        params.extend(record)
+                    cur.execute(
+                        f'INSERT INTO {self.table} ({columns}) VALUES '
+                        + ', '.join([row] * len(batch)),
+                        params,
+                    )
+        self.written += len(records)
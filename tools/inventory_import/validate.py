@@ -0,0 +1,96 @@
+"""Row validation and mapping to ``public.inventory`` records.
+
+Mirrors ``processInventoryFile``: Modelo, Preço and IMEI are required, blanks
+default to ``N/A`` / ``Available``, and rejections carry the spreadsheet row
+number in the app's ``Linha N: ...`` form. IMEIs are checked chunk-wide by
+``imei.ImeiValidator`` (format, Luhn, duplicates, existing stock).
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple
+
+from .reader import Row
+
+if TYPE_CHECKING:
+    from .imei import ImeiValidator
+
+# Column order of the records handed to the sink.
+INSERT_COLUMNS = (
+    'model',
+    'capacity',
+    'color',
+    'grade',
+    'price',
+    'status',
+    'imei',
+    'serial_number',
+    'purchase_invoice',
+    'created_by',
+)
+
+Record = Tuple[Optional[object], ...]
+
+# parseFloat(): the longest numeric prefix, else NaN.
+_NUMBER_PREFIX = re.compile(r'\s*([+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)')
+
+
+@dataclass(frozen=True)
+class Rejection:
+    row: int
+    message: str
+
+    def __str__(self) -> str:
+        return f'Linha {self.row}: {self.message}'
+
+
+def parse_price(raw: str) -> Decimal:
+    """``parseFloat(raw.replace(',', '.'))``, with NaN mapped to 0 as the app does."""
+    m = _NUMBER_PREFIX.match(raw.replace(',', '.', 1))
+    return Decimal(m.group(1)) if m else Decimal(0)
+
+
+def to_record(cells: dict, created_by: Optional[str]) -> Record:
+    return (
+        cells['Modelo'],
+        cells.get('Capacidade') or 'N/A',
+        cells.get('Cor') or 'N/A',
+        cells.get('Grade') or 'N/A',
+        parse_price(cells['Preço']),
+        cells.get('Status') or 'Available',
+        cells['IMEI'],
+        cells.get('Número de Série') or None,
+        cells.get('Invoice de Compra') or None,
+        created_by,
+    )
+
+
+def check_required(rows: Sequence[Row]) -> Tuple[List[Row], List[Rejection]]:
+    """Split ``rows`` into those with Modelo, Preço and IMEI and rejections for the rest."""
+    kept, rejected = [], []
+    for row_number, cells in rows:
+        if cells.get('Modelo') and cells.get('Preço') and cells.get('IMEI'):
+            kept.append((row_number, cells))
+        else:
+            rejected.append(Rejection(row_number, 'Modelo, Preço e IMEI são obrigatórios'))
+    return kept, rejected
+
+
+def validate_chunk(
+    rows: Sequence[Row], validator: 'ImeiValidator', created_by: Optional[str] = None
+) -> Tuple[List[Record], List[Rejection]]:
+    """Validate one chunk; ``validator`` carries the duplicate state between chunks."""
+    kept, rejected = check_required(rows)
+    imei_rejections = validator.check(
+        [row_number for row_number, _ in kept], [cells['IMEI'] for _, cells in kept]
+    )
+    bad_rows = {r.row for r in imei_rejections}
+    records = [
+        to_record(cells, created_by) for row_number, cells in kept if row_number not in bad_rows
+    ]
+    rejected.extend(imei_rejections)
+    rejected.sort(key=lambda r: r.row)
+    return records, rejected
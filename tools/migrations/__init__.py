@@ -0,0 +1,24 @@
+"""Supabase migration planner and runner.
+
+    python -m tools.migrations plan
+    python -m tools.migrations apply --defer --dsn postgresql://...
+    python -m tools.migrations status
+"""
+
+from .plan import Conflict, Migration, Plan, PlanError, load_migrations
+from .runner import MigrationRunner, RunnerError
+from .sql import SqlSyntaxError, Statement, split_statements, tokenize
+
+__all__ = [
+    'Conflict',
+    'Migration',
+    'MigrationRunner',
+    'Plan',
+    'PlanError',
+    'RunnerError',
+    'SqlSyntaxError',
+    'Statement',
+    'load_migrations',
+    'split_statements',
+    'tokenize',
+]
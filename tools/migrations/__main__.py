@@ -0,0 +1,210 @@
+"""Command-line entry point: ``python -m tools.migrations``.
+
+    plan       order supabase/migrations by what each file creates and uses,
+               and report ordering conflicts (exit 1 on errors)
+    status     applied, pending and changed migrations of a database
+    apply      apply the pending migrations in batched transactions
+    baseline   record migrations as applied without running them (for
+               databases that were migrated by hand in the SQL editor)
+
+Migrations listed in DEV_ONLY_MIGRATIONS.md are skipped unless
+--include-dev-only is given.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from tools.paths import REPO_ROOT
+
+from .plan import MIGRATIONS_DIR, Batch, Migration, Plan, PlanError, load_migrations
+from .runner import DEFAULT_TRACKING_TABLE, Applied, MigrationRunner, RunnerError
+
+_SEVERITY_ICON = {'error': '❌', 'warning': '⚠️ '}
+
+
+def _wanted(plan: Plan, include_dev_only: bool) -> List[Migration]:
+    return [m for m in plan.sequence if include_dev_only or not m.dev_only]
+
+
+def _changed(migrations: List[Migration], applied: Dict[str, Applied]) -> List[Migration]:
+    return [m for m in migrations if m.name in applied and applied[m.name].checksum != m.checksum]
+
+
+def _print_conflicts(plan: Plan) -> None:
+    for conflict in plan.conflicts:
+        print(f'{_SEVERITY_ICON[conflict.severity]} {conflict.message}')
+
+
+def _plan(args: argparse.Namespace, plan: Plan) -> int:
+    wanted = _wanted(plan, args.include_dev_only)
+    batches = plan.batches([m.name for m in wanted], args.batch_size)
+    if args.json:
+        report = {
+            'migrations': [
+                {
+                    'name': m.name,
+                    'level': plan.level[m.name],
+                    'depends_on': sorted(plan.depends[m.name]),
+                    'creates': sorted(m.effects.creates),
+                    'writes': sorted(m.effects.writes),
+                    'isolated': m.effects.isolated,
+                    'dev_only': m.dev_only,
+                    'checksum': m.checksum,
+                }
+                for m in plan.sequence
+            ],
+            'batches': [[m.name for m in b.migrations] for b in batches],
+            'conflicts': [vars(c) for c in plan.conflicts],
+            'external': plan.external,
+        }
+        print(json.dumps(report, indent=2))
+    else:
+        for number, batch in enumerate(batches, 1):
+            first = batch.migrations[0]
+            mode = '' if batch.transactional else f' (alone: {first.effects.isolated})'
+            print(f'batch {number}{mode}: {", ".join(m.name for m in batch.migrations)}')
+        print()
+        _print_conflicts(plan)
+        for obj, users in plan.external.items():
+            print(f'🔗 needs {obj} (Supabase platform), used by {len(users)} migrations')
+        skipped = len(plan.sequence) - len(wanted)
+        print(
+            f'\n📊 {len(plan.sequence)} migrations, {len(batches)} batches, '
+            f'{max(plan.level.values(), default=-1) + 1} levels, {skipped} dev-only skipped'
+        )
+    return 1 if any(c.severity == 'error' for c in plan.conflicts) else 0
+
+
+def _status(args: argparse.Namespace, plan: Plan, runner: MigrationRunner) -> int:
+    applied = runner.applied()
+    wanted = _wanted(plan, args.include_dev_only)
+    pending = [m for m in wanted if m.name not in applied]
+    changed = _changed(wanted, applied)
+    unknown = sorted(set(applied) - set(plan.by_name))
+    for m in changed:
+        print(f'❌ {m.name} changed after it was applied (batch {applied[m.name].batch})')
+    for name in unknown:
+        print(f'⚠️  {name} is recorded as applied but no longer exists')
+    for m in pending:
+        print(f'⏭️  {m.name} pending')
+    print(
+        f'\n📊 {len(applied)} applied, {len(pending)} pending, {len(changed)} changed, '
+        f'{len(unknown)} unknown'
+    )
+    return 1 if changed or pending else 0
+
+
+def _apply(args: argparse.Namespace, plan: Plan, runner: MigrationRunner) -> int:
+    missing = runner.missing_schemas()
+    if missing and plan.external:
+        raise RunnerError(
+            f'the database has no {", ".join(missing)} schema: the migrations expect a Supabase '
+            'database (e.g. the one `supabase start` runs on port 54322)'
+        )
+    applied = runner.applied()
+    wanted = _wanted(plan, args.include_dev_only)
+    changed = _changed(wanted, applied)
+    if changed and not args.allow_changed:
+        for m in changed:
+            print(f'❌ {m.name} changed after it was applied', file=sys.stderr)
+        print('   re-run with --allow-changed to ignore', file=sys.stderr)
+        return 2
+    for conflict in plan.conflicts:
+        if conflict.severity == 'error':
+            print(f'⚠️  {conflict.message}')
+    pending = [m.name for m in wanted if m.name not in applied]
+    batches = plan.batches(pending, args.batch_size)
+    if not batches:
+        print('✅ nothing to apply')
+        return 0
+
+    def report(batch: Batch, elapsed: float) -> None:
+        names = ', '.join(m.name for m in batch.migrations)
+        print(f'✅ {names} ({elapsed * 1000:.0f}ms)')
+
+    started = time.perf_counter()
+    count = runner.apply(batches, report)
+    print(
+        f'\n📊 {count} migrations applied in {len(batches)} batches, '
+        f'{time.perf_counter() - started:.2f}s'
+    )
+    return 0
+
+
+def _baseline(args: argparse.Namespace, plan: Plan, runner: MigrationRunner) -> int:
+    applied = runner.applied()
+    wanted = _wanted(plan, args.include_dev_only)
+    if args.through:
+        if args.through not in plan.by_name:
+            raise PlanError(f'no migration named {args.through}')
+        through = plan.by_name[args.through].order_key
+        wanted = [m for m in wanted if m.order_key <= through]
+    marked = [m for m in wanted if m.name not in applied]
+    if marked:
+        batch = runner.baseline(marked)
+        print(f'✅ recorded {len(marked)} migrations as applied (batch {batch})')
+    else:
+        print('✅ nothing to record')
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m tools.migrations',
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--dir', type=Path, default=REPO_ROOT / MIGRATIONS_DIR)
+    parser.add_argument('--table', default=DEFAULT_TRACKING_TABLE, help='tracking table')
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        '--dsn', default=os.environ.get('DATABASE_URL'), help='default: $DATABASE_URL'
+    )
+    common.add_argument('--include-dev-only', action='store_true')
+    common.add_argument(
+        '--defer',
+        action='store_true',
+        help='run files that use an object before it is created after its creator',
+    )
+    common.add_argument('--batch-size', type=int, default=50, help='migrations per transaction')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    plan_cmd = commands.add_parser('plan', parents=[common], help='print batches and conflicts')
+    plan_cmd.add_argument('--json', action='store_true')
+    commands.add_parser('status', parents=[common], help='compare the directory with the database')
+    apply = commands.add_parser('apply', parents=[common], help='apply pending migrations')
+    apply.add_argument('--allow-changed', action='store_true', help='ignore changed checksums')
+    baseline = commands.add_parser(
+        'baseline', parents=[common], help='record migrations without running them'
+    )
+    baseline.add_argument('--through', metavar='FILE', help='last migration to record')
+    args = parser.parse_args(argv)
+
+    try:
+        plan = Plan(load_migrations(args.dir), defer=args.defer)
+        if args.command == 'plan':
+            return _plan(args, plan)
+        if not args.dsn:
+            print('❌ pass --dsn (or set $DATABASE_URL)', file=sys.stderr)
+            return 2
+        with MigrationRunner(args.dsn, args.table) as runner:
+            runner.ensure_table()
+            if args.command == 'status':
+                return _status(args, plan, runner)
+            if args.command == 'apply':
+                return _apply(args, plan, runner)
+            return _baseline(args, plan, runner)
+    except (PlanError, RunnerError, OSError) as e:
+        print(f'❌ {e}', file=sys.stderr)
+        return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,460 @@
+"""Read ``supabase/migrations``, work out what each file touches, and order it.
+
+Every statement is reduced to the objects it *writes* (creates, alters, drops,
+adds policies / triggers / indexes to, or changes rows of) and the known
+objects it merely *names*. A migration must follow every earlier migration
+that wrote an object it names, and every earlier migration that named an
+object it writes; everything else is independent. Migrations on the same
+level of that graph can run together in one transaction, in any order.
+
+Besides the order, the plan reports what makes the directory ambiguous:
+shared number prefixes whose files touch the same objects, date-prefixed
+files outside the numbering, files repeating another one statement for
+statement, and objects used before the migration that creates them.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from tools.fsutil import content_hash
+
+from .sql import (
+    Statement,
+    Token,
+    block_statements,
+    names,
+    read_name,
+    split_statements,
+    tokenize,
+)
+
+MIGRATIONS_DIR = Path('supabase') / 'migrations'
+DEV_ONLY_NOTES = 'DEV_ONLY_MIGRATIONS.md'
+# Objects the Supabase platform provides; a plain Postgres must be prepared with them.
+EXTERNAL_SCHEMAS = ('auth', 'storage', 'extensions')
+# Pseudo-object written by statements whose targets cannot be known statically.
+EVERYTHING = '*'
+
+_PREFIX = re.compile(r'^(\d+)_')
+_DEV_ONLY = re.compile(r'^###\s+(\S+\.sql)\s*$', re.MULTILINE)
+
+_CREATED_KINDS = frozenset(
+    ('table', 'view', 'function', 'procedure', 'type', 'sequence', 'schema', 'extension', 'domain')
+)
+_MODIFIERS = frozenset(
+    'or replace unique temp temporary unlogged materialized constraint recursive global local '
+    'trusted procedural'.split()
+)
+_FLAGS = frozenset(('if', 'not', 'exists', 'only', 'concurrently'))
+_ON_TARGET = frozenset(('policy', 'trigger', 'rule'))
+_DDL = frozenset('create alter drop comment insert update delete truncate grant revoke'.split())
+_GRANT_KINDS = frozenset(
+    'table tables function functions sequence sequences schema all in type'.split()
+)
+_TRANSACTION_CONTROL = frozenset(('begin', 'commit', 'rollback', 'start', 'end', 'savepoint'))
+
+
+class PlanError(ValueError):
+    pass
+
+
+@dataclass
+class Effects:
+    creates: Set[str] = field(default_factory=set)
+    writes: Set[str] = field(default_factory=set)
+    names: Set[str] = field(default_factory=set)
+    # Why the statement cannot share a transaction with other migrations.
+    isolated: Optional[str] = None
+
+    def update(self, other: 'Effects') -> None:
+        self.creates |= other.creates
+        self.writes |= other.writes
+        self.names |= other.names
+        self.isolated = self.isolated or other.isolated
+
+
+def _skip(tokens: Tuple[Token, ...], i: int, words: FrozenSet[str]) -> int:
+    while i < len(tokens) and tokens[i].kind == 'word' and tokens[i].value in words:
+        i += 1
+    return i
+
+
+def _skip_parens(tokens: Tuple[Token, ...], i: int) -> int:
+    if i >= len(tokens) or tokens[i].value != '(' or tokens[i].kind != 'op':
+        return i
+    depth = 0
+    while i < len(tokens):
+        if tokens[i].kind == 'op':
+            depth += tokens[i].value == '('
+            depth -= tokens[i].value == ')'
+            if depth == 0:
+                return i + 1
+        i += 1
+    return i
+
+
+def _on_target(tokens: Tuple[Token, ...], i: int) -> Optional[str]:
+    """The table after the first ``ON`` from ``tokens[i]`` (CREATE POLICY x ON t ...)."""
+    for j in range(i, len(tokens)):
+        if tokens[j].kind == 'word' and tokens[j].value == 'on':
+            name, _ = read_name(tokens, _skip(tokens, j + 1, frozenset(('only', 'table'))))
+            return name
+    return None
+
+
+def _name_list(tokens: Tuple[Token, ...], i: int) -> List[str]:
+    """``a, b(args), c`` as in DROP TABLE / TRUNCATE."""
+    found: List[str] = []
+    while i < len(tokens):
+        name, i = read_name(tokens, _skip(tokens, i, frozenset(('only',))))
+        if name is None:
+            break
+        found.append(name)
+        i = _skip_parens(tokens, i)
+        if i < len(tokens) and tokens[i].value == ',':
+            i += 1
+            continue
+        break
+    return found
+
+
+def _parent(name: str) -> str:
+    """``table.column`` -> ``table`` (for COMMENT ON COLUMN)."""
+    return name.rsplit('.', 1)[0] if '.' in name else name
+
+
+def statement_effects(tokens: Tuple[Token, ...]) -> Effects:
+    """What one statement (given as tokens) creates, writes and names."""
+    effects = Effects(names=set(names(tokens)))
+    if not tokens or tokens[0].kind != 'word':
+        return effects
+    verb = tokens[0].value
+    writes = effects.writes
+
+    if verb in _TRANSACTION_CONTROL and verb != 'end':
+        effects.isolated = 'controls its own transaction'
+    elif verb == 'create':
+        i = _skip(tokens, 1, _MODIFIERS)
+        kind = tokens[i].value if i < len(tokens) else ''
+        i += 1
+        if kind in _CREATED_KINDS:
+            name, _ = read_name(tokens, _skip(tokens, i, _FLAGS))
+            if name:
+                effects.creates.add(name)
+                writes.add(name)
+        elif kind == 'index':
+            if i < len(tokens) and tokens[i].value == 'concurrently':
+                effects.isolated = 'creates an index concurrently'
+            target = _on_target(tokens, i)
+            if target:
+                writes.add(target)
+        elif kind in _ON_TARGET:
+            target = _on_target(tokens, i)
+            if target:
+                writes.add(target)
+    elif verb == 'alter':
+        i = _skip(tokens, 1, _MODIFIERS)
+        kind = tokens[i].value if i < len(tokens) else ''
+        if kind in _ON_TARGET:
+            target = _on_target(tokens, i + 1)
+        else:
+            target, _ = read_name(tokens, _skip(tokens, i + 1, _FLAGS))
+        if target:
+            writes.add(target)
+        if kind == 'type' and any(
+            a.value == 'add' and b.value == 'value' for a, b in zip(tokens, tokens[1:])
+        ):
+            effects.isolated = 'adds an enum value'
+    elif verb == 'drop':
+        i = _skip(tokens, 1, _MODIFIERS)
+        kind = tokens[i].value if i < len(tokens) else ''
+        if kind in _ON_TARGET:
+            target = _on_target(tokens, i + 1)
+            writes.update([target] if target else [])
+        else:
+            writes.update(_name_list(tokens, _skip(tokens, i + 1, _FLAGS)))
+    elif verb == 'comment':
+        kind = tokens[2].value if len(tokens) > 2 else ''
+        if kind in _ON_TARGET:
+            target = _on_target(tokens, 3)
+        else:
+            target, _ = read_name(tokens, _skip(tokens, 3, _MODIFIERS))
+            if target and kind == 'column':
+                target = _parent(target)
+        writes.update([target] if target else [])
+    elif verb in ('insert', 'delete'):
+        target, _ = read_name(tokens, _skip(tokens, 2, _FLAGS))
+        writes.update([target] if target else [])
+    elif verb == 'update':
+        target, _ = read_name(tokens, _skip(tokens, 1, _FLAGS))
+        writes.update([target] if target else [])
+    elif verb == 'truncate':
+        writes.update(_name_list(tokens, _skip(tokens, 1, frozenset(('table', 'only')))))
+    elif verb in ('grant', 'revoke'):
+        for j, token in enumerate(tokens):
+            if token.kind == 'word' and token.value == 'on':
+                writes.update(_name_list(tokens, _skip(tokens, j + 1, _GRANT_KINDS)))
+                break
+    elif verb == 'do':
+        for token in tokens:
+            if token.kind == 'body':
+                effects.update(_block_effects(token.value))
+    return effects
+
+
+def _block_effects(body: str) -> Effects:
+    """Effects of the SQL statements inside a plpgsql block."""
+    effects = Effects()
+    tokens = tuple(tokenize(body))
+    for statement in block_statements(tokens, _DDL):
+        effects.update(statement_effects(statement))
+    dynamic = any(True for _ in block_statements(tokens, frozenset(('execute',))))
+    if dynamic:
+        # EXECUTE format('DROP POLICY %I ON public.profiles', ...): the target is in a literal.
+        literal = ' '.join(t.value[1:-1] for t in tokens if t.kind == 'string')
+        targets = set(names(tuple(tokenize(literal)))) if literal else set()
+        effects.writes |= targets or {EVERYTHING}
+    return effects
+
+
+@dataclass
+class Migration:
+    path: Path
+    prefix: str
+    checksum: str
+    statements: List[Statement]
+    effects: Effects
+    dev_only: bool = False
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+    @property
+    def sql(self) -> str:
+        return self.path.read_text(encoding='utf-8')
+
+    @property
+    def order_key(self) -> Tuple[int, str]:
+        return order_key(self.name)
+
+    @property
+    def date_prefixed(self) -> bool:
+        return len(self.prefix) == 8 and self.prefix.startswith('20')
+
+
+def order_key(name: str) -> Tuple[int, str]:
+    """Sort key of a migration file name: its number prefix, then the name."""
+    match = _PREFIX.match(name)
+    return (int(match.group(1)) if match else -1), name
+
+
+def load_migration(path: Path, dev_only: bool = False) -> Migration:
+    match = _PREFIX.match(path.name)
+    if match is None:
+        raise PlanError(f'{path.name}: migration names start with a number (NNN_name.sql)')
+    data = path.read_bytes()
+    try:
+        statements = split_statements(data.decode('utf-8'))
+    except ValueError as e:
+        raise PlanError(f'{path.name}: {e}') from None
+    effects = Effects()
+    for statement in statements:
+        effects.update(statement_effects(statement.tokens))
+    return Migration(path, match.group(1), content_hash(data), statements, effects, dev_only)
+
+
+def dev_only_names(directory: Path) -> Set[str]:
+    """Files listed under a heading in DEV_ONLY_MIGRATIONS.md."""
+    notes = directory / DEV_ONLY_NOTES
+    if not notes.exists():
+        return set()
+    return set(_DEV_ONLY.findall(notes.read_text(encoding='utf-8')))
+
+
+def load_migrations(directory: Path) -> List[Migration]:
+    dev_only = dev_only_names(directory)
+    migrations = [load_migration(p, p.name in dev_only) for p in directory.glob('*.sql')]
+    return sorted(migrations, key=lambda m: m.order_key)
+
+
+@dataclass(frozen=True)
+class Conflict:
+    kind: str  # duplicate-prefix | duplicate-content | date-prefix | forward-reference
+    severity: str  # error | warning
+    migrations: Tuple[str, ...]
+    message: str
+
+
+@dataclass
+class Batch:
+    level: int
+    migrations: List[Migration]
+    transactional: bool = True
+
+
+class Plan:
+    """Dependency graph, levels and conflicts of a sorted list of migrations.
+
+    With ``defer``, a migration that uses an object only a later file creates
+    (053 altering invoice_items, created in 061) is moved right after that
+    file, which is what a fresh database needs; otherwise file order stands
+    and the plan reports the conflict as an error.
+    """
+
+    def __init__(self, migrations: List[Migration], defer: bool = False):
+        self.migrations = migrations
+        self.by_name = {m.name: m for m in migrations}
+        self.known: Set[str] = set().union(*(m.effects.creates for m in migrations))
+        self.forward = self._forward_references()
+        self.sequence = self._deferred() if defer else list(migrations)
+        self.defer = defer
+        self.depends: Dict[str, Set[str]] = {}
+        self.level: Dict[str, int] = {}
+        self._build()
+        self.conflicts = self._conflicts()
+
+    def reads(self, migration: Migration) -> Set[str]:
+        return (migration.effects.names & self.known) - migration.effects.writes
+
+    def touches(self, migration: Migration) -> Set[str]:
+        return (migration.effects.writes | self.reads(migration)) - {EVERYTHING}
+
+    @property
+    def external(self) -> Dict[str, List[str]]:
+        """Platform objects (auth.users, storage.buckets, ...) and the migrations using them."""
+        found: Dict[str, List[str]] = defaultdict(list)
+        for m in self.migrations:
+            for obj in sorted(m.effects.names):
+                parts = obj.split('.')
+                if len(parts) > 1 and parts[0] in EXTERNAL_SCHEMAS:
+                    found['.'.join(parts[:2])].append(m.name)
+        return {obj: sorted(set(users)) for obj, users in sorted(found.items())}
+
+    def _forward_references(self) -> Dict[str, Dict[str, Migration]]:
+        """migration -> {object: the later migration that first creates it}."""
+        first_creator: Dict[str, Migration] = {}
+        for m in self.migrations:
+            for obj in m.effects.creates:
+                first_creator.setdefault(obj, m)
+        forward: Dict[str, Dict[str, Migration]] = {}
+        for m in self.migrations:
+            early = {
+                obj: first_creator[obj]
+                for obj in self.touches(m) - m.effects.creates
+                if obj in first_creator and first_creator[obj].order_key > m.order_key
+            }
+            if early:
+                forward[m.name] = early
+        return forward
+
+    def _deferred(self) -> List[Migration]:
+        waiting: Dict[str, List[Migration]] = defaultdict(list)
+        for name, early in self.forward.items():
+            last = max(early.values(), key=lambda c: c.order_key)
+            waiting[last.name].append(self.by_name[name])
+        sequence: List[Migration] = []
+
+        def place(m: Migration) -> None:
+            sequence.append(m)
+            for deferred in waiting.pop(m.name, []):
+                place(deferred)
+
+        for m in self.migrations:
+            if m.name not in self.forward:
+                place(m)
+        return sequence
+
+    def _build(self) -> None:
+        last_writer: Dict[str, str] = {}
+        readers: Dict[str, List[str]] = defaultdict(list)
+        for m in self.sequence:
+            deps: Set[str] = set()
+            writes = m.effects.writes
+            reads = self.reads(m) | {EVERYTHING}
+            for obj in reads | writes:
+                if obj in last_writer:
+                    deps.add(last_writer[obj])
+            for obj in writes:
+                deps.update(readers[obj])
+            for obj in writes:
+                last_writer[obj] = m.name
+                readers[obj] = []
+            for obj in reads:
+                readers[obj].append(m.name)
+            deps.discard(m.name)
+            self.depends[m.name] = deps
+            self.level[m.name] = 1 + max((self.level[d] for d in deps), default=-1)
+
+    def _conflicts(self) -> List[Conflict]:
+        conflicts: List[Conflict] = []
+        by_prefix: Dict[str, List[Migration]] = defaultdict(list)
+        for m in self.migrations:
+            by_prefix[m.prefix].append(m)
+        for prefix, group in by_prefix.items():
+            if len(group) < 2:
+                continue
+            files = tuple(m.name for m in group)
+            shared = sorted(
+                set.intersection(*(self.touches(m) for m in group))
+                & set.union(*(m.effects.writes for m in group))
+            )
+            if shared:
+                message = (
+                    f'{prefix}_ is used {len(group)} times and the files touch the same objects '
+                    f'({", ".join(shared)}): only the file name decides their order'
+                )
+                conflicts.append(Conflict('duplicate-prefix', 'error', files, message))
+            else:
+                message = f'{prefix}_ is used {len(group)} times (the files are independent)'
+                conflicts.append(Conflict('duplicate-prefix', 'warning', files, message))
+
+        numbered = [m for m in self.migrations if not m.date_prefixed]
+        last = numbered[-1].name if numbered else '-'
+        by_content: Dict[str, Migration] = {}
+        for m in self.migrations:
+            fingerprint = content_hash(
+                '\x00'.join(' '.join(t.value for t in s.tokens) for s in m.statements).encode()
+            )
+            original = by_content.setdefault(fingerprint, m)
+            if original is not m:
+                message = f'{m.name} repeats {original.name} statement for statement'
+                conflicts.append(
+                    Conflict('duplicate-content', 'warning', (original.name, m.name), message)
+                )
+            if m.date_prefixed:
+                message = (
+                    f'{m.name} is date-prefixed and sorts after every numbered migration '
+                    f'(last: {last})'
+                )
+                conflicts.append(Conflict('date-prefix', 'warning', (m.name,), message))
+
+        for name, early in self.forward.items():
+            for obj, creator in sorted(early.items()):
+                message = f'{name} uses {obj}, which is first created by the later {creator.name}'
+                if self.defer:
+                    message += ' (deferred until after it)'
+                severity = 'warning' if self.defer else 'error'
+                conflicts.append(
+                    Conflict('forward-reference', severity, (name, creator.name), message)
+                )
+        return conflicts
+
+    def batches(self, pending: Iterable[str], max_size: int = 50) -> List[Batch]:
+        """Group ``pending`` migrations by level; isolated ones get a batch of their own."""
+        by_level: Dict[int, List[Migration]] = defaultdict(list)
+        for name in pending:
+            by_level[self.level[name]].append(self.by_name[name])
+        batches: List[Batch] = []
+        for level in sorted(by_level):
+            group = sorted(by_level[level], key=lambda m: m.order_key)
+            together = [m for m in group if not m.effects.isolated]
+            for start in range(0, len(together), max_size):
+                batches.append(Batch(level, together[start : start + max_size]))
+            batches.extend(Batch(level, [m], False) for m in group if m.effects.isolated)
+        return batches
@@ -0,0 +1,162 @@
+"""Apply planned migrations to Postgres and record them in a tracking table.
+
+Everything runs over one connection opened for the whole run. A batch of
+independent migrations is sent as a single query inside one transaction,
+together with its tracking rows, so a batch is applied completely or not at
+all. Migrations that cannot run inside a transaction (enum values added, their
+own BEGIN / COMMIT) run alone, statement by statement, in autocommit.
+
+If a batch fails it is rolled back and retried one migration at a time, so
+the error names the file and line and the migrations before it still land.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from .plan import EXTERNAL_SCHEMAS, Batch, Migration
+
+DEFAULT_TRACKING_TABLE = 'tooling.applied_migrations'
+
+
+class RunnerError(RuntimeError):
+    pass
+
+
+@dataclass
+class Applied:
+    name: str
+    checksum: str
+    batch: int
+
+
+def _quote(table: str) -> str:
+    return '.'.join(f'"{part}"' for part in table.split('.'))
+
+
+class MigrationRunner:
+    """Use as a context manager; the connection stays open until exit."""
+
+    def __init__(self, dsn: str, table: str = DEFAULT_TRACKING_TABLE):
+        try:
+            import psycopg
+        except ImportError:
+            raise RunnerError(
+                'psycopg is required to apply migrations (pip install "psycopg[binary]")'
+            ) from None
+        self._psycopg = psycopg
+        self.table = _quote(table)
+        self._schema = _quote(table.rsplit('.', 1)[0]) if '.' in table else None
+        try:
+            self.conn = psycopg.connect(dsn, autocommit=True)
+        except psycopg.OperationalError as e:
+            raise RunnerError(f'could not connect to Postgres: {e}') from None
+
+    def __enter__(self) -> 'MigrationRunner':
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.conn.close()
+
+    def ensure_table(self) -> None:
+        with self.conn.transaction():
+            if self._schema:
+                self.conn.execute(f'CREATE SCHEMA IF NOT EXISTS {self._schema}')
+            self.conn.execute(
+                f'CREATE TABLE IF NOT EXISTS {self.table} ('
+                ' name TEXT PRIMARY KEY,'
+                ' checksum TEXT NOT NULL,'
+                ' batch INTEGER NOT NULL,'
+                ' applied_at TIMESTAMPTZ NOT NULL DEFAULT now(),'
+                ' duration_ms INTEGER)'
+            )
+
+    def applied(self) -> Dict[str, Applied]:
+        rows = self.conn.execute(f'SELECT name, checksum, batch FROM {self.table}').fetchall()
+        return {name: Applied(name, checksum, batch) for name, checksum, batch in rows}
+
+    def missing_schemas(self, schemas: Iterable[str] = EXTERNAL_SCHEMAS) -> List[str]:
+        wanted = sorted(set(schemas))
+        rows = self.conn.execute(
+            'SELECT nspname FROM pg_namespace WHERE nspname = ANY(%s)', (wanted,)
+        ).fetchall()
+        present = {name for (name,) in rows}
+        return [schema for schema in wanted if schema not in present]
+
+    def _next_batch(self) -> int:
+        query = f'SELECT coalesce(max(batch), 0) + 1 FROM {self.table}'
+        (batch,) = self.conn.execute(query).fetchone()
+        return batch
+
+    def _record(self, migrations: Sequence[Migration], batch: int, elapsed: float) -> None:
+        per_file = int(elapsed * 1000 / max(len(migrations), 1))
+        with self.conn.cursor() as cur:
+            cur.executemany(
+                f'INSERT INTO {self.table} (name, checksum, batch, duration_ms) '
+                'VALUES (%s, %s, %s, %s) '
+                'ON CONFLICT (name) DO UPDATE SET checksum = excluded.checksum, '
+                'batch = excluded.batch, applied_at = now(), duration_ms = excluded.duration_ms',
+                [(m.name, m.checksum, batch, per_file) for m in migrations],
+            )
+
+    def baseline(self, migrations: Sequence[Migration]) -> int:
+        """Record ``migrations`` as applied without running them (databases set up by hand)."""
+        with self.conn.transaction():
+            batch = self._next_batch()
+            self._record(migrations, batch, 0.0)
+        return batch
+
+    def _run_statements(self, migration: Migration) -> None:
+        for statement in migration.statements:
+            try:
+                self.conn.execute(statement.text)
+            except self._psycopg.Error as e:
+                raise RunnerError(f'{migration.name}:{statement.line}: {_message(e)}') from None
+
+    def _apply_alone(self, migration: Migration, batch: int, transactional: bool) -> None:
+        started = time.perf_counter()
+        if transactional:
+            with self.conn.transaction():
+                self._run_statements(migration)
+                self._record([migration], batch, time.perf_counter() - started)
+            return
+        try:
+            self._run_statements(migration)
+        finally:
+            if self.conn.info.transaction_status != self._psycopg.pq.TransactionStatus.IDLE:
+                self.conn.rollback()
+        self._record([migration], batch, time.perf_counter() - started)
+
+    def apply(
+        self,
+        batches: Iterable[Batch],
+        on_batch: Optional[Callable[[Batch, float], Any]] = None,
+    ) -> int:
+        """Apply ``batches`` in order; returns the number of migrations applied."""
+        count = 0
+        for batch in batches:
+            number = self._next_batch()
+            started = time.perf_counter()
+            if not batch.transactional:
+                self._apply_alone(batch.migrations[0], number, False)
+            else:
+                try:
+                    with self.conn.transaction():
+                        self.conn.execute('\n;\n'.join(m.sql for m in batch.migrations))
+                        self._record(batch.migrations, number, time.perf_counter() - started)
+                except self._psycopg.Error:
+                    # Rolled back: one at a time, the error names the file and line.
+                    for migration in batch.migrations:
+                        self._apply_alone(migration, number, True)
+            count += len(batch.migrations)
+            if on_batch:
+                on_batch(batch, time.perf_counter() - started)
+        return count
+
+
+def _message(error: Exception) -> str:
+    diag = getattr(error, 'diag', None)
+    primary = getattr(diag, 'message_primary', None)
+    return primary or str(error).strip()
@@ -0,0 +1,181 @@
+"""A small PostgreSQL lexer: enough to split migration files into statements
+and to see which objects each statement names.
+
+It understands what can hide a ``;`` — quoted strings (standard and ``E''``),
+quoted identifiers, nested block comments, line comments and dollar-quoted
+bodies — and nothing more; it is not a parser. Dollar-quoted bodies (function
+and ``DO`` blocks) are kept as single ``body`` tokens and can be lexed again
+with :func:`tokenize`.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import FrozenSet, Iterator, List, NamedTuple, Optional, Tuple
+
+_TOKEN = re.compile(
+    r"""
+      (?P<space>\s+)
+    | (?P<comment>--[^\n]*)
+    | (?P<block>/\*)
+    | (?P<dollar>\$(?:[A-Za-z_][A-Za-z0-9_]*)?\$)
+    | (?P<estring>[Ee]'(?:[^'\\]|''|\\.)*')
+    | (?P<string>'(?:[^']|'')*')
+    | (?P<qident>"(?:[^"]|"")*")
+    | (?P<number>\d+(?:\.\d*)?(?:[eE][+-]?\d+)?)
+    | (?P<word>[^\W\d][\w$]*)
+    | (?P<param>\$\d+)
+    | (?P<op>::|\S)
+    """,
+    re.VERBOSE,
+)
+
+# plpgsql words after which a new SQL statement can start inside a block.
+PLPGSQL_LEADS = frozenset(('begin', 'then', 'else', 'loop', 'declare'))
+
+
+class SqlSyntaxError(ValueError):
+    pass
+
+
+class Token(NamedTuple):
+    kind: str  # word | qident | string | body | number | param | op
+    value: str  # words are lower-cased, qidents unquoted, bodies without their tags
+    pos: int
+
+
+@dataclass(frozen=True)
+class Statement:
+    text: str  # source text, without the terminating semicolon
+    line: int  # 1-based line of the first token
+    tokens: Tuple[Token, ...]
+
+    def words(self, count: int) -> Tuple[str, ...]:
+        """The first ``count`` tokens as words (non-words become '')."""
+        return tuple(t.value if t.kind == 'word' else '' for t in self.tokens[:count])
+
+    @property
+    def keyword(self) -> str:
+        return self.tokens[0].value if self.tokens and self.tokens[0].kind == 'word' else ''
+
+
+def _block_end(text: str, pos: int) -> int:
+    depth = 0
+    while True:
+        opening = text.find('/*', pos)
+        closing = text.find('*/', pos)
+        if closing < 0:
+            raise SqlSyntaxError('unterminated block comment')
+        if 0 <= opening < closing:
+            depth += 1
+            pos = opening + 2
+            continue
+        depth -= 1
+        pos = closing + 2
+        if depth == 0:
+            return pos
+
+
+def tokenize(text: str) -> Iterator[Token]:
+    """Yield the tokens of ``text``; whitespace and comments are dropped."""
+    pos, end = 0, len(text)
+    while pos < end:
+        m = _TOKEN.match(text, pos)
+        if m is None:  # pragma: no cover - the op branch matches any non-space
+            raise SqlSyntaxError(f'unexpected input at offset {pos}')
+        kind = m.lastgroup
+        if kind == 'block':
+            pos = _block_end(text, pos)
+            continue
+        if kind == 'dollar':
+            tag = m.group()
+            close = text.find(tag, m.end())
+            if close < 0:
+                raise SqlSyntaxError(f'unterminated {tag} quote at offset {pos}')
+            yield Token('body', text[m.end() : close], pos)
+            pos = close + len(tag)
+            continue
+        pos = m.end()
+        if kind == 'space' or kind == 'comment':
+            continue
+        value = m.group()
+        if kind == 'word':
+            value = value.lower()
+        elif kind == 'qident':
+            value = value[1:-1].replace('""', '"')
+        elif kind == 'estring':
+            kind = 'string'
+        yield Token(kind, value, m.start())
+
+
+def split_statements(text: str) -> List[Statement]:
+    """Split ``text`` on top-level semicolons; empty statements are dropped."""
+    statements: List[Statement] = []
+    current: List[Token] = []
+    for token in tokenize(text):
+        if token.kind == 'op' and token.value == ';':
+            if current:
+                statements.append(_statement(text, current, token.pos))
+            current = []
+        else:
+            current.append(token)
+    if current:
+        statements.append(_statement(text, current, len(text)))
+    return statements
+
+
+def _statement(text: str, tokens: List[Token], end: int) -> Statement:
+    start = tokens[0].pos
+    return Statement(text[start:end].rstrip(), text.count('\n', 0, start) + 1, tuple(tokens))
+
+
+def read_name(tokens: Tuple[Token, ...], i: int) -> Tuple[Optional[str], int]:
+    """The (possibly schema-qualified) name starting at ``tokens[i]`` and the index after it.
+
+    ``public.`` is dropped so that qualified and bare references agree.
+    """
+    parts: List[str] = []
+    while i < len(tokens) and tokens[i].kind in ('word', 'qident'):
+        parts.append(tokens[i].value)
+        if i + 1 < len(tokens) and tokens[i + 1].value == '.' and tokens[i + 1].kind == 'op':
+            i += 2
+            continue
+        i += 1
+        break
+    if not parts:
+        return None, i
+    if len(parts) > 1 and parts[0] == 'public':
+        parts = parts[1:]
+    return '.'.join(parts), i
+
+
+def names(tokens: Tuple[Token, ...]) -> Iterator[str]:
+    """Every (qualified) name in ``tokens``, including those inside dollar-quoted bodies."""
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        if token.kind == 'body':
+            yield from names(tuple(tokenize(token.value)))
+            i += 1
+        elif token.kind in ('word', 'qident'):
+            name, i = read_name(tokens, i)
+            yield name  # type: ignore[misc]
+        else:
+            i += 1
+
+
+def block_statements(
+    tokens: Tuple[Token, ...], verbs: FrozenSet[str]
+) -> Iterator[Tuple[Token, ...]]:
+    """The statements starting with one of ``verbs`` inside a lexed plpgsql block.
+
+    ``IF ... THEN ALTER TABLE ...; END IF;`` yields the ALTER TABLE statement.
+    """
+    for i, token in enumerate(tokens):
+        if token.kind != 'word' or token.value not in verbs:
+            continue
+        follows = tokens[i - 1] if i else None
+        if follows is None or follows.value == ';' or follows.value in PLPGSQL_LEADS:
+            end = next((j for j in range(i, len(tokens)) if tokens[j].value == ';'), len(tokens))
+            yield tokens[i:end]
@@ -0,0 +1,79 @@
+"""Repository paths and glob helpers shared by the tooling."""
+
+from __future__ import annotations
+
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Union
+
+# Set to point the tooling at another checkout without passing --root everywhere.
+ROOT_ENV = 'WWUSA_ROOT'
+ROOT_MARKERS = ('.git', 'package.json')
+
+
+def find_repo_root(start: Optional[Union[str, Path]] = None) -> Path:
+    """Locate the repository root.
+
+    ``$WWUSA_ROOT`` wins when set. Otherwise the closest ancestor of ``start``
+    (default: the working directory) holding ``.git`` is used, then the closest
+    one holding ``package.json``; outside any checkout, the one this package
+    lives in.
+    """
+    env = os.environ.get(ROOT_ENV)
+    if env:
+        return Path(env).expanduser().resolve()
+    for origin in (Path(start or os.getcwd()), Path(__file__).parent):
+        origin = origin.resolve()
+        found = {}
+        for directory in (origin, *origin.parents):
+            for marker in ROOT_MARKERS:
+                if marker not in found and (directory / marker).exists():
+                    found[marker] = directory
+            if '.git' in found:
+                break
+        for marker in ROOT_MARKERS:
+            if marker in found:
+                return found[marker]
+    return Path(__file__).resolve().parent.parent
+
+
+REPO_ROOT = find_repo_root()
+
+# Directories that never contain sources we want to touch.
+IGNORED_DIRS = frozenset({'node_modules', '.next', '.git', '.turbo', '__pycache__', '.vercel'})
+SOURCE_DIRS = ('src',)
+
+
+@lru_cache(maxsize=256)
+def compile_glob(pattern: str) -> re.Pattern[str]:
+    """Compile a POSIX glob (``*``, ``?``, ``**``) into a regex.
+
+    Brackets are matched literally so Next.js segments such as ``[locale]``
+    can be written as-is.
+    """
+    out = []
+    i = 0
+    while i < len(pattern):
+        if pattern.startswith('**/', i):
+            out.append('(?:.*/)?')
+            i += 3
+        elif pattern.startswith('**', i):
+            out.append('.*')
+            i += 2
+        elif pattern[i] == '*':
+            out.append('[^/]*')
+            i += 1
+        elif pattern[i] == '?':
+            out.append('[^/]')
+            i += 1
+        else:
+            out.append(re.escape(pattern[i]))
+            i += 1
+    return re.compile(''.join(out) + r'\Z')
+
+
+def match_glob(path: str, pattern: str) -> bool:
+    """Return True if the repo-relative POSIX ``path`` matches ``pattern``."""
+    return compile_glob(pattern).match(path) is not None
@@ -0,0 +1,194 @@
+"""Command-line entry point: ``python -m tools.querybench``.
+
+    shapes   list the query shapes and the code they come from
+    setup    apply supabase/migrations to the database (tools.migrations, --defer)
+    seed     generate the synthetic data: 1M inventory rows, 5M financial
+             transactions, estimates with items, sales orders (--scale to shrink)
+    run      time every shape, print p50 / p95, the plan summary and the
+             indexes worth adding; --save writes a JSON baseline and
+             --baseline compares with one (exit 1 on a p95 regression)
+
+Point --dsn at a throwaway Supabase database (``supabase start`` serves one on
+port 54322); the seed writes millions of rows.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from tools.fsutil import atomic_write_text
+from tools.migrations.plan import MIGRATIONS_DIR, Batch, Plan, PlanError, load_migrations
+from tools.migrations.runner import MigrationRunner, RunnerError
+from tools.paths import REPO_ROOT
+
+from .bench import Bench, BenchError, Recommendation, Result, baseline, compare
+from .seed import DEFAULT_CHUNK, Scale, SeedError, Step, seed, steps
+from .shapes import BY_NAME, SHAPES
+
+_SEVERITY_ICON = {'error': '❌', 'warning': '⚠️ ', 'info': 'ℹ️ '}
+
+
+def _shapes(args: argparse.Namespace) -> int:
+    for shape in SHAPES:
+        sampled = ' (sampled parameters)' if shape.sample else ''
+        print(f'{shape.name:<28} {shape.source}{sampled}')
+    return 0
+
+
+def _setup(args: argparse.Namespace) -> int:
+    plan = Plan(load_migrations(REPO_ROOT / MIGRATIONS_DIR), defer=True)
+    with MigrationRunner(args.dsn) as runner:
+        runner.ensure_table()
+        missing = runner.missing_schemas()
+        if missing:
+            raise RunnerError(
+                f'the database has no {", ".join(missing)} schema: start one with `supabase start`'
+            )
+        applied = runner.applied()
+        pending = [m.name for m in plan.sequence if not m.dev_only and m.name not in applied]
+
+        def report(batch: Batch, elapsed: float) -> None:
+            print(f'✅ {", ".join(m.name for m in batch.migrations)} ({elapsed * 1000:.0f}ms)')
+
+        count = runner.apply(plan.batches(pending), report)
+    print(f'\n📊 {count} migrations applied, {len(applied)} already were')
+    return 0
+
+
+def _seed(args: argparse.Namespace) -> int:
+    scale = Scale().times(args.scale)
+    started = time.perf_counter()
+
+    def report(step: Step, lo: int, hi: int, elapsed: float) -> None:
+        print(f'✅ {step.table} {lo:,}-{hi:,} of {step.rows:,} ({elapsed:.1f}s)')
+
+    inserted = seed(args.dsn, scale, args.seed, args.chunk, args.only, report)
+    print(f'\n📊 {inserted:,} rows inserted in {time.perf_counter() - started:.1f}s')
+    return 0
+
+
+def _print_result(result: Result) -> None:
+    print(
+        f'✅ {result.shape:<28} p50 {result.p50_ms:8.2f}ms  p95 {result.p95_ms:8.2f}ms  '
+        f'server {result.execution_ms:8.2f}ms  {result.rows:>5} rows  '
+        f'{result.shared_hit} hit / {result.shared_read} read'
+    )
+
+
+def _run(args: argparse.Namespace) -> int:
+    unknown = [name for name in args.shape or [] if name not in BY_NAME]
+    if unknown:
+        print(f'❌ unknown shape: {", ".join(unknown)} (see the shapes command)', file=sys.stderr)
+        return 2
+    wanted = [BY_NAME[name] for name in args.shape] if args.shape else list(SHAPES)
+    rng = random.Random(args.random_seed)
+    results: List[Result] = []
+    recommendations: List[Recommendation] = []
+    with Bench(args.dsn, as_owner=args.as_owner, user=args.user) as bench:
+        for shape in wanted:
+            result, suggested = bench.run(shape, args.repeat, args.warmup, rng)
+            results.append(result)
+            recommendations.extend(r for r in suggested if r not in recommendations)
+            if not args.json:
+                _print_result(result)
+                if args.plans:
+                    for line in result.plan:
+                        print(f'      {line}')
+        meta: Dict[str, Any] = {
+            'postgres': bench.version,
+            'rls': not args.as_owner,
+            'repeat': args.repeat,
+            'rows': bench.counts([s.table for s in steps(Scale()) if '.' not in s.table]),
+        }
+    report = baseline(results, recommendations, meta)
+
+    notes = []
+    if args.baseline:
+        notes = compare(json.loads(args.baseline.read_text()), report, args.max_ratio)
+    if args.json:
+        print(json.dumps(report, indent=2, sort_keys=True))
+    else:
+        for r in recommendations:
+            print(f'\n⚠️  {r.shape}: {r.table} {r.reason}\n   {r.sql}')
+        if notes:
+            print()
+        for severity, message in notes:
+            print(f'{_SEVERITY_ICON[severity]} {message}')
+        print(f'\n📊 {len(results)} shapes, {len(recommendations)} index suggestions')
+    if args.save:
+        atomic_write_text(args.save, json.dumps(report, indent=2, sort_keys=True) + '\n')
+        if not args.json:
+            print(f'✅ baseline written to {args.save}')
+    return 1 if any(severity == 'error' for severity, _ in notes) else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m tools.querybench',
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        '--dsn', default=os.environ.get('DATABASE_URL'), help='default: $DATABASE_URL'
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    commands.add_parser('shapes', help='list the query shapes')
+    commands.add_parser('setup', parents=[common], help='apply the migrations')
+    seed_cmd = commands.add_parser('seed', parents=[common], help='generate synthetic data')
+    seed_cmd.add_argument(
+        '--scale', type=float, default=1.0, help='row count factor (0.01 for a quick run)'
+    )
+    seed_cmd.add_argument('--seed', type=float, default=0.42, help='setseed() value, -1 to 1')
+    seed_cmd.add_argument('--chunk', type=int, default=DEFAULT_CHUNK, help='rows per transaction')
+    seed_cmd.add_argument(
+        '--only',
+        action='append',
+        metavar='TABLE',
+        choices=[step.table for step in steps(Scale())],
+        help='seed only this table (repeatable)',
+    )
+    run = commands.add_parser('run', parents=[common], help='time the query shapes')
+    run.add_argument('--shape', action='append', metavar='NAME', help='only this shape')
+    run.add_argument('--repeat', type=int, default=30, help='timed runs per shape')
+    run.add_argument('--warmup', type=int, default=3, help='untimed runs per shape')
+    run.add_argument('--random-seed', type=int, default=0, help='parameter sampling seed')
+    run.add_argument(
+        '--as-owner', action='store_true', help='run as the connecting role (RLS bypassed)'
+    )
+    run.add_argument('--user', metavar='UUID', help='profile to run as (default: a bench user)')
+    run.add_argument('--plans', action='store_true', help='print the plan of every shape')
+    run.add_argument('--json', action='store_true', help='print the report as JSON')
+    run.add_argument('--save', type=Path, metavar='PATH', help='write the report as a baseline')
+    run.add_argument('--baseline', type=Path, metavar='PATH', help='compare with a baseline')
+    run.add_argument(
+        '--max-ratio', type=float, default=1.5, help='p95 slowdown that fails --baseline'
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == 'shapes':
+        return _shapes(args)
+    if not args.dsn:
+        print('❌ pass --dsn (or set $DATABASE_URL)', file=sys.stderr)
+        return 2
+    try:
+        if args.command == 'setup':
+            return _setup(args)
+        if args.command == 'seed':
+            return _seed(args)
+        return _run(args)
+    except (BenchError, SeedError, PlanError, RunnerError, OSError, ValueError) as e:
+        print(f'❌ {e}', file=sys.stderr)
+        return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,320 @@
+"""Time the query shapes, read their plans and suggest the indexes they lack.
+
+Each run is one transaction, as PostgREST sends it: ``SET LOCAL ROLE
+authenticated`` and the JWT claims of a bench user, so RLS policies are part
+of what is measured. Latency is client-side (execute plus fetch); the
+``EXPLAIN (ANALYZE, BUFFERS)`` run after the timed ones gives the server
+time, the buffers touched and the plan.
+
+An index is suggested for a sequential scan that reads many rows to return a
+few, or that feeds a sort: the equality columns of its filter, then the range
+or sort column, partial on the ``IS NULL`` conditions (``deleted_at``).
+Suggestions whose leading columns an index already covers are dropped.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import random
+import re
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .shapes import Shape
+
+BASELINE_VERSION = 1
+
+# A scan reading fewer rows than this is cheap whatever it filters.
+MIN_SCANNED_ROWS = 10_000
+# ... and one keeping more than this share of what it reads is better as a scan.
+MAX_SELECTIVITY = 0.05
+# p95 changes below this many milliseconds are noise, whatever the ratio.
+NOISE_MS = 1.0
+
+_EQUALS = re.compile(r'\((?:\w+\.)?(\w+) = ')
+_RANGE = re.compile(r'\((?:\w+\.)?(\w+) (?:>=|<=|>|<) ')
+_IS_NULL = re.compile(r'\((?:\w+\.)?(\w+) IS NULL\)')
+# Nodes below which the rows are no longer in the order a sort above asks for.
+_GROUPING = frozenset(('Aggregate', 'Group', 'Unique', 'WindowAgg', 'SetOp'))
+
+_INDEXES = """
+SELECT c.relname, array_agg(a.attname ORDER BY k.n)
+  FROM pg_index i
+  JOIN pg_class c ON c.oid = i.indrelid
+  JOIN pg_namespace ns ON ns.oid = c.relnamespace
+ CROSS JOIN LATERAL unnest(i.indkey) WITH ORDINALITY AS k(attnum, n)
+  JOIN pg_attribute a ON a.attrelid = c.oid AND a.attnum = k.attnum
+ WHERE ns.nspname = 'public'
+ GROUP BY i.indexrelid, c.relname
+"""
+
+_BENCH_USER = """
+SELECT id FROM public.profiles WHERE email LIKE 'querybench-%' ORDER BY email LIMIT 1
+"""
+
+
+class BenchError(RuntimeError):
+    pass
+
+
+@dataclass
+class Result:
+    shape: str
+    source: str
+    runs: int
+    rows: int
+    p50_ms: float
+    p95_ms: float
+    execution_ms: float  # EXPLAIN ANALYZE, server side
+    planning_ms: float
+    shared_hit: int
+    shared_read: int
+    plan: List[str]
+
+
+@dataclass(frozen=True)
+class Recommendation:
+    shape: str
+    table: str
+    columns: Tuple[str, ...]  # may end with ' DESC'
+    where: Optional[str]
+    reason: str
+
+    @property
+    def sql(self) -> str:
+        names = '_'.join(c.split()[0] for c in self.columns)
+        where = f' WHERE {self.where}' if self.where else ''
+        return (
+            f'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_{self.table}_{names} '
+            f'ON public.{self.table} ({", ".join(self.columns)}){where};'
+        )
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile, ``q`` in [0, 1]."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+def plan_lines(node: Dict[str, Any], depth: int = 0) -> List[str]:
+    """One line per plan node: the node type, index and relation, indented by depth."""
+    line = node['Node Type']
+    if node.get('Index Name'):
+        line += f' using {node["Index Name"]}'
+    if node.get('Relation Name'):
+        line += f' on {node["Relation Name"]}'
+    lines = ['  ' * depth + line]
+    for child in node.get('Plans', []):
+        lines.extend(plan_lines(child, depth + 1))
+    return lines
+
+
+def recommend(
+    shape: str,
+    node: Dict[str, Any],
+    indexes: Dict[str, List[Tuple[str, ...]]],
+    sort_keys: Tuple[str, ...] = (),
+) -> List[Recommendation]:
+    """Indexes that would replace the sequential scans of a plan (see the module docstring)."""
+    kind = node['Node Type']
+    if kind == 'Sort':
+        sort_keys = tuple(node.get('Sort Key', ()))
+    elif kind in _GROUPING:
+        sort_keys = ()
+    found: List[Recommendation] = []
+    if kind == 'Seq Scan':
+        suggestion = _for_scan(shape, node, indexes, sort_keys)
+        if suggestion is not None:
+            found.append(suggestion)
+    for child in node.get('Plans', []):
+        for suggestion in recommend(shape, child, indexes, sort_keys):
+            if suggestion not in found:
+                found.append(suggestion)
+    return found
+
+
+def _for_scan(
+    shape: str,
+    node: Dict[str, Any],
+    indexes: Dict[str, List[Tuple[str, ...]]],
+    sort_keys: Tuple[str, ...],
+) -> Optional[Recommendation]:
+    table = node['Relation Name']
+    alias = node.get('Alias', table)
+    loops = node.get('Actual Loops', 1)
+    returned = node.get('Actual Rows', 0) * loops
+    scanned = returned + node.get('Rows Removed by Filter', 0) * loops
+    condition = node.get('Filter', '')
+    columns = list(dict.fromkeys(_EQUALS.findall(condition)))
+    ranges = [c for c in _RANGE.findall(condition) if c not in columns]
+    ordered = [
+        key.split('.', 1)[1] if '.' in key else key
+        for key in sort_keys
+        if key.startswith(f'{alias}.') or '.' not in key
+    ]
+    if ordered:
+        columns.append(ordered[0])
+        reason = f'sorts {scanned} scanned rows for ORDER BY {ordered[0]}'
+    elif columns or ranges:
+        columns.extend(ranges[:1])
+        if scanned < MIN_SCANNED_ROWS or returned > scanned * MAX_SELECTIVITY:
+            return None
+        reason = f'reads {scanned} rows to return {returned}'
+        if loops > 1:
+            reason += f' over {loops} loops'
+    else:
+        return None
+    if scanned < MIN_SCANNED_ROWS:
+        return None
+    leading = tuple(c.split()[0] for c in columns)
+    if any(cols[: len(leading)] == leading for cols in indexes.get(table, [])):
+        return None
+    nulls = sorted(set(_IS_NULL.findall(condition)) - set(leading))
+    where = ' AND '.join(f'{c} IS NULL' for c in nulls) or None
+    return Recommendation(shape, table, tuple(columns), where, reason)
+
+
+class Bench:
+    """Use as a context manager; one connection for every shape."""
+
+    def __init__(self, dsn: str, as_owner: bool = False, user: Optional[str] = None):
+        try:
+            import psycopg
+        except ImportError:
+            raise BenchError(
+                'psycopg is required to run the benchmark (pip install "psycopg[binary]")'
+            ) from None
+        self._psycopg = psycopg
+        try:
+            self.conn = psycopg.connect(dsn, autocommit=True)
+        except psycopg.OperationalError as e:
+            raise BenchError(f'could not connect to Postgres: {e}') from None
+        self.as_owner = as_owner
+        self.claims: Optional[str] = None
+        if not as_owner:
+            if user is None:
+                row = self.conn.execute(_BENCH_USER).fetchone()
+                if row is None:
+                    raise BenchError('no bench user in profiles: run the seed command first')
+                user = str(row[0])
+            self.claims = json.dumps({'sub': user, 'role': 'authenticated'})
+        self.version = self.conn.execute('SHOW server_version').fetchone()[0]
+        self._indexes: Optional[Dict[str, List[Tuple[str, ...]]]] = None
+
+    def __enter__(self) -> 'Bench':
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.conn.close()
+
+    def indexes(self) -> Dict[str, List[Tuple[str, ...]]]:
+        found: Dict[str, List[Tuple[str, ...]]] = {}
+        for table, columns in self.conn.execute(_INDEXES):
+            found.setdefault(table, []).append(tuple(columns))
+        return found
+
+    def counts(self, tables: Sequence[str]) -> Dict[str, int]:
+        """Planner row estimates, which ANALYZE keeps close enough for a report."""
+        rows = self.conn.execute(
+            "SELECT relname, reltuples::bigint FROM pg_class"
+            " WHERE relnamespace = 'public'::regnamespace AND relname = ANY(%s)",
+            (list(tables),),
+        )
+        return {name: max(count, 0) for name, count in rows}
+
+    def _impersonate(self) -> None:
+        if self.claims is not None:
+            self.conn.execute('SET LOCAL ROLE authenticated')
+            self.conn.execute("SELECT set_config('request.jwt.claims', %s, true)", (self.claims,))
+
+    def run(
+        self, shape: Shape, repeat: int, warmup: int, rng: random.Random
+    ) -> Tuple[Result, List[Recommendation]]:
+        params: List[Sequence[Any]] = [()]
+        if shape.sample:
+            params = [tuple(row) for row in self.conn.execute(shape.sample)]
+            if not params:
+                raise BenchError(f'{shape.name}: nothing to sample (run the seed command first)')
+        timings: List[float] = []
+        rows = 0
+        try:
+            for number in range(warmup + repeat):
+                args = rng.choice(params)
+                with self.conn.transaction(force_rollback=True):
+                    self._impersonate()
+                    started = time.perf_counter()
+                    cur = self.conn.execute(shape.sql, args)
+                    rows = len(cur.fetchall())
+                    elapsed = time.perf_counter() - started
+                if number >= warmup:
+                    timings.append(elapsed * 1000)
+            with self.conn.transaction(force_rollback=True):
+                self._impersonate()
+                explain = self.conn.execute(
+                    'EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) ' + shape.sql, rng.choice(params)
+                ).fetchone()[0]
+        except self._psycopg.Error as e:
+            raise BenchError(f'{shape.name}: {e}') from None
+        report = explain[0] if isinstance(explain, list) else json.loads(explain)[0]
+        if self._indexes is None:
+            self._indexes = self.indexes()
+        result = Result(
+            shape.name,
+            shape.source,
+            repeat,
+            rows,
+            round(percentile(timings, 0.50), 3),
+            round(percentile(timings, 0.95), 3),
+            round(report.get('Execution Time', 0.0), 3),
+            round(report.get('Planning Time', 0.0), 3),
+            report['Plan'].get('Shared Hit Blocks', 0),
+            report['Plan'].get('Shared Read Blocks', 0),
+            plan_lines(report['Plan']),
+        )
+        return result, recommend(shape.name, report['Plan'], self._indexes)
+
+
+def baseline(
+    results: List[Result], recommendations: List[Recommendation], meta: Dict[str, Any]
+) -> Dict[str, Any]:
+    """The JSON written by --save: stable keys and order, so two baselines diff cleanly."""
+    return {
+        'version': BASELINE_VERSION,
+        **meta,
+        'shapes': {r.shape: {k: v for k, v in asdict(r).items() if k != 'shape'} for r in results},
+        'recommendations': [
+            {'shape': r.shape, 'table': r.table, 'sql': r.sql, 'reason': r.reason}
+            for r in recommendations
+        ],
+    }
+
+
+def compare(
+    old: Dict[str, Any], new: Dict[str, Any], max_ratio: float
+) -> List[Tuple[str, str]]:
+    """``(severity, message)`` for every shape slower or re-planned since ``old``."""
+    if old.get('version') != BASELINE_VERSION:
+        raise BenchError(f'baseline version {old.get("version")} is not {BASELINE_VERSION}')
+    notes: List[Tuple[str, str]] = []
+    for name, now in new['shapes'].items():
+        before = old['shapes'].get(name)
+        if before is None:
+            notes.append(('info', f'{name}: new shape, no baseline'))
+            continue
+        ratio = now['p95_ms'] / before['p95_ms'] if before['p95_ms'] else math.inf
+        slower = now['p95_ms'] - before['p95_ms'] > NOISE_MS
+        if ratio > max_ratio and slower:
+            notes.append(
+                (
+                    'error',
+                    f'{name}: p95 {before["p95_ms"]:.1f} -> {now["p95_ms"]:.1f}ms '
+                    f'({ratio:.2f}x, limit {max_ratio:.2f}x)',
+                )
+            )
+        if now['plan'] != before['plan']:
+            notes.append(('warning', f'{name}: plan changed'))
+    return notes
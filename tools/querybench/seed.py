@@ -0,0 +1,282 @@
+"""Synthetic data at production scale, generated inside Postgres.
+
+Rows come from ``generate_series`` in chunks, so nothing crosses the wire but
+the statements. Ids are ``md5('<table>:<n>')::uuid`` and every insert is
+``ON CONFLICT (id) DO NOTHING``: seeding is repeatable, and re-running with a
+larger scale only adds the missing rows. ``setseed`` is reset per chunk, so
+the same scale and seed always produce the same data.
+
+User triggers on the seeded tables (created_by defaults, back-to-back
+estimates, estimate totals) are disabled while a chunk is written; foreign
+keys are still checked.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, fields, replace
+from typing import Callable, Iterator, List, Optional, Tuple
+
+DEFAULT_CHUNK = 250_000
+
+
+class SeedError(RuntimeError):
+    pass
+
+
+@dataclass(frozen=True)
+class Scale:
+    users: int = 20
+    agents: int = 2_000
+    locations: int = 12
+    classes: int = 60
+    inventory: int = 1_000_000
+    estimates: int = 100_000
+    estimate_items: int = 500_000
+    sales_orders: int = 50_000
+    transactions: int = 5_000_000
+
+    def times(self, factor: float) -> 'Scale':
+        """Every count multiplied by ``factor`` (at least 1 row each)."""
+        return replace(
+            self, **{f.name: max(1, round(getattr(self, f.name) * factor)) for f in fields(self)}
+        )
+
+
+@dataclass(frozen=True)
+class Step:
+    table: str
+    rows: int
+    # %(lo)s / %(hi)s bound generate_series for one chunk; a literal % is written %%.
+    sql: str
+    triggers: bool = False  # disable the table's user triggers while writing
+
+
+def _id(table: str, expr: str = 'g') -> str:
+    return f"md5('{table}:' || {expr})::uuid"
+
+
+def _pick(table: str, count: int, expr: str = 'random()') -> str:
+    """A random id among the first ``count`` seeded rows of ``table``."""
+    return _id(table, f'(1 + floor({expr} * {count})::int)')
+
+
+_MODELS = (
+    "(ARRAY['iPhone 15 Pro Max','iPhone 15 Pro','iPhone 15','iPhone 14 Pro Max',"
+    "'iPhone 14 Pro','iPhone 14','iPhone 13','iPhone 13 mini','iPhone 12','iPhone SE',"
+    "'Galaxy S24 Ultra','Galaxy S23','Pixel 8 Pro','iPad Pro 11','MacBook Air M2'])"
+)
+# random()^2 skews towards the first models, as sales do.
+_MODEL = f'{_MODELS}[1 + floor(power(random(), 2) * 15)::int]'
+_CAPACITY = "(ARRAY['64GB','128GB','256GB','512GB','1TB'])[1 + floor(random() * 5)::int]"
+_GRADE = "(ARRAY['A','A','B','B','C','D','Open Box','LACRADO'])[1 + floor(random() * 8)::int]"
+_COLOR = "(ARRAY['Black','White','Blue','Natural','Pink','Green'])[1 + floor(random() * 6)::int]"
+# Three years back from a fixed day, so the data does not depend on when it was seeded.
+_CREATED = "timestamptz '2026-01-01' - random() * interval '1095 days'"
+
+
+def steps(scale: Scale) -> List[Step]:
+    """Parents first. auth.users rows become profiles through handle_new_user()."""
+    s = scale
+    return [
+        Step(
+            'auth.users',
+            s.users,
+            f"""
+INSERT INTO auth.users (instance_id, id, aud, role, email, raw_user_meta_data, created_at)
+SELECT '00000000-0000-0000-0000-000000000000', {_id('user')}, 'authenticated',
+       'authenticated', 'querybench-' || g || '@example.invalid',
+       jsonb_build_object('full_name', 'Bench User ' || g), now()
+  FROM generate_series(%(lo)s, %(hi)s) g
+ON CONFLICT (id) DO NOTHING
+""",
+        ),
+        Step(
+            'agents',
+            s.agents,
+            f"""
+INSERT INTO public.agents (id, name, country, roles)
+SELECT {_id('agent')}, 'Bench Agent ' || g, CASE WHEN g %% 4 = 0 THEN 'BR' ELSE 'US' END,
+       CASE WHEN g %% 2 = 0 THEN ARRAY['cliente'] ELSE ARRAY['fornecedor'] END
+  FROM generate_series(%(lo)s, %(hi)s) g
+ON CONFLICT (id) DO NOTHING
+""",
+        ),
+        Step(
+            'stock_locations',
+            s.locations,
+            f"""
+INSERT INTO public.stock_locations (id, name, is_wind_stock)
+SELECT {_id('location')}, 'Bench Location ' || g, g %% 3 = 0
+  FROM generate_series(%(lo)s, %(hi)s) g
+ON CONFLICT (id) DO NOTHING
+""",
+        ),
+        Step(
+            'financial_classes',
+            s.classes,
+            f"""
+INSERT INTO public.financial_classes (id, name)
+SELECT {_id('class')}, 'Bench Class ' || g
+  FROM generate_series(%(lo)s, %(hi)s) g
+ON CONFLICT (id) DO NOTHING
+""",
+        ),
+        Step(
+            'inventory',
+            s.inventory,
+            f"""
+INSERT INTO public.inventory (
+  id, model, capacity, color, grade, price, status, imei, location_id, agent_id,
+  purchase_invoice, created_by, created_at, updated_at, deleted_at
+)
+SELECT {_id('inventory')}, {_MODEL}, {_CAPACITY}, {_COLOR}, {_GRADE},
+       round((80 + random() * 1400)::numeric, 2),
+       CASE WHEN r < 0.60 THEN 'Sold' WHEN r < 0.90 THEN 'Available'
+            WHEN r < 0.97 THEN 'Reserved' ELSE 'RMA' END,
+       (350000000000000 + g)::text,
+       {_pick('location', s.locations)}, {_pick('agent', s.agents)},
+       'PI-' || (g / 200), {_pick('user', s.users)}, created, created,
+       CASE WHEN random() < 0.02 THEN created + interval '30 days' END
+  FROM (SELECT g, random() AS r, {_CREATED} AS created
+          FROM generate_series(%(lo)s, %(hi)s) g) series
+ON CONFLICT (id) DO NOTHING
+""",
+            triggers=True,
+        ),
+        Step(
+            'estimates',
+            s.estimates,
+            f"""
+INSERT INTO public.estimates (
+  id, customer_id, stock_location_id, salesperson_id, estimate_date, status,
+  created_by, created_at, deleted_at
+)
+SELECT {_id('estimate')}, {_pick('agent', s.agents)}, {_pick('location', s.locations)},
+       {_pick('user', s.users)}, created::date,
+       (ARRAY['draft','sent','approved','rejected','expired','converted'])
+         [1 + floor(random() * 6)::int],
+       {_pick('user', s.users)}, created,
+       CASE WHEN random() < 0.03 THEN created + interval '7 days' END
+  FROM (SELECT g, {_CREATED} AS created FROM generate_series(%(lo)s, %(hi)s) g) series
+ON CONFLICT (id) DO NOTHING
+""",
+            triggers=True,
+        ),
+        Step(
+            'estimate_items',
+            s.estimate_items,
+            f"""
+INSERT INTO public.estimate_items (
+  id, estimate_id, model, capacity, grade, quantity, unit_price, sort_order
+)
+SELECT {_id('estimate_item')}, {_id('estimate', f'(1 + (g - 1) %% {s.estimates})')},
+       {_MODEL}, {_CAPACITY}, {_GRADE}, 1 + floor(random() * 20)::int,
+       round((80 + random() * 1400)::numeric, 2), g / {s.estimates}
+  FROM generate_series(%(lo)s, %(hi)s) g
+ON CONFLICT (id) DO NOTHING
+""",
+            triggers=True,
+        ),
+        Step(
+            'sales_orders',
+            s.sales_orders,
+            f"""
+INSERT INTO public.sales_orders (
+  id, estimate_id, customer_id, salesperson_id, order_date, status, payment_status,
+  subtotal, total, created_by, created_at, deleted_at
+)
+SELECT {_id('sales_order')}, {_id('estimate', f'(1 + (g - 1) %% {s.estimates})')},
+       {_pick('agent', s.agents)}, {_pick('user', s.users)}, created::date,
+       (ARRAY['pending','approved','processing','shipped','delivered','cancelled'])
+         [1 + floor(random() * 6)::int],
+       (ARRAY['pending','partial','paid','refunded'])[1 + floor(random() * 4)::int],
+       amount, amount, {_pick('user', s.users)}, created,
+       CASE WHEN random() < 0.02 THEN created + interval '7 days' END
+  FROM (SELECT g, {_CREATED} AS created, round((500 + random() * 50000)::numeric, 2) AS amount
+          FROM generate_series(%(lo)s, %(hi)s) g) series
+ON CONFLICT (id) DO NOTHING
+""",
+            triggers=True,
+        ),
+        Step(
+            'financial_transactions',
+            s.transactions,
+            f"""
+INSERT INTO public.financial_transactions (
+  id, financial_class_id, transaction_date, description, amount, transaction_type,
+  agent_id, invoice_number, status, created_by, created_at, deleted_at
+)
+SELECT {_id('transaction')}, {_pick('class', s.classes)}, created::date,
+       'Bench transaction ' || g, round((1 + random() * 9999)::numeric, 2),
+       CASE WHEN random() < 0.4 THEN 'income' ELSE 'expense' END,
+       {_pick('agent', s.agents)}, 'INV-' || (g / 3),
+       (ARRAY['pending','approved','paid','paid','paid','cancelled'])
+         [1 + floor(random() * 6)::int],
+       {_pick('user', s.users)}, created,
+       CASE WHEN random() < 0.01 THEN created + interval '1 day' END
+  FROM (SELECT g, {_CREATED} AS created FROM generate_series(%(lo)s, %(hi)s) g) series
+ON CONFLICT (id) DO NOTHING
+""",
+            triggers=True,
+        ),
+    ]
+
+
+def chunks(rows: int, size: int) -> Iterator[Tuple[int, int]]:
+    for lo in range(1, rows + 1, size):
+        yield lo, min(rows, lo + size - 1)
+
+
+def seed(
+    dsn: str,
+    scale: Scale,
+    seed_value: float = 0.42,
+    chunk: int = DEFAULT_CHUNK,
+    tables: Optional[List[str]] = None,
+    on_chunk: Optional[Callable[[Step, int, int, float], None]] = None,
+) -> int:
+    """Write the synthetic rows, one committed transaction per chunk; return rows inserted.
+
+    ``seed_value`` is Postgres' ``setseed`` argument, in [-1, 1].
+    """
+    try:
+        import psycopg
+    except ImportError:
+        raise SeedError(
+            'psycopg is required to seed Postgres (pip install "psycopg[binary]")'
+        ) from None
+    inserted = 0
+    try:
+        with psycopg.connect(dsn, autocommit=True) as conn:
+            for number, step in enumerate(steps(scale)):
+                if tables and step.table not in tables:
+                    continue
+                table = _qualified(step.table)
+                for lo, hi in chunks(step.rows, chunk):
+                    started = time.perf_counter()
+                    with conn.transaction():
+                        if step.triggers:
+                            # Transactional: other sessions never see the triggers off.
+                            conn.execute(f'ALTER TABLE {table} DISABLE TRIGGER USER')
+                        # Distinct per step and chunk, and within setseed's range.
+                        offset = ((number * 7919 + lo) % 10_000) / 1e6
+                        conn.execute('SELECT setseed(%s)', ((seed_value + offset) % 1,))
+                        cur = conn.execute(step.sql, {'lo': lo, 'hi': hi})
+                        inserted += max(cur.rowcount, 0)
+                        if step.triggers:
+                            conn.execute(f'ALTER TABLE {table} ENABLE TRIGGER USER')
+                    if on_chunk:
+                        on_chunk(step, lo, hi, time.perf_counter() - started)
+            for step in steps(scale):
+                if not tables or step.table in tables:
+                    conn.execute(f'VACUUM (ANALYZE) {_qualified(step.table)}')
+    except psycopg.OperationalError as e:
+        raise SeedError(f'could not connect to Postgres: {e}') from None
+    except psycopg.Error as e:
+        raise SeedError(f'seeding failed: {e}') from None
+    return inserted
+
+
+def _qualified(table: str) -> str:
+    return table if '.' in table else f'public.{table}'
@@ -0,0 +1,174 @@
+"""The query shapes the app sends most, written as the SQL PostgREST runs for them.
+
+supabase-js calls become one statement each: embedded resources
+(``profiles:created_by(full_name)``) are ``LEFT JOIN LATERAL`` subqueries that
+PostgREST turns into JSON, and every read is capped at Supabase's default
+``max_rows`` of 1000. ``source`` points at the call site, so a shape can be
+checked against the code when the page changes.
+
+Shapes that look up one row take their parameters from ``sample``: a query
+returning candidate parameter tuples, drawn at random on every run.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+# PostgREST's db-max-rows as set by Supabase (Settings > API > Max rows).
+MAX_ROWS = 1000
+
+
+@dataclass(frozen=True)
+class Shape:
+    name: str
+    source: str  # path:line of the supabase-js call
+    sql: str  # %s placeholders, filled from a row of ``sample``
+    sample: Optional[str] = None
+
+
+SHAPES: Tuple[Shape, ...] = (
+    Shape(
+        'inventory_list',
+        'src/hooks/useQueries.ts:20',
+        f"""
+SELECT inventory.*, row_to_json(profiles) AS profiles
+  FROM public.inventory
+  LEFT JOIN LATERAL (
+        SELECT p.full_name, p.email FROM public.profiles p WHERE p.id = inventory.created_by
+       ) profiles ON true
+ WHERE inventory.deleted_at IS NULL
+ ORDER BY inventory.created_at DESC
+ LIMIT {MAX_ROWS}
+""",
+    ),
+    Shape(
+        'inventory_page',
+        'src/app/[locale]/dashboard/inventory/page.tsx:85',
+        f"""
+SELECT inventory.*, row_to_json(profiles) AS profiles, row_to_json(location) AS location
+  FROM public.inventory
+  LEFT JOIN LATERAL (
+        SELECT p.full_name, p.first_name, p.last_name, p.email
+          FROM public.profiles p WHERE p.id = inventory.created_by
+       ) profiles ON true
+  LEFT JOIN LATERAL (
+        SELECT l.name, l.is_wind_stock FROM public.stock_locations l
+         WHERE l.id = inventory.location_id
+       ) location ON true
+ WHERE inventory.deleted_at IS NULL
+ ORDER BY inventory.created_at DESC
+ LIMIT {MAX_ROWS}
+""",
+    ),
+    Shape(
+        'inventory_valuation',
+        'src/app/[locale]/operations/dashboard/page.tsx:57',
+        f"""
+SELECT inventory.id, inventory.model, inventory.price, inventory.status,
+       inventory.created_at, inventory.location_id, row_to_json(location) AS location
+  FROM public.inventory
+  LEFT JOIN LATERAL (
+        SELECT l.name, l.include_in_avg_cost, l.include_in_inventory_valuation, l.is_wind_stock
+          FROM public.stock_locations l WHERE l.id = inventory.location_id
+       ) location ON true
+ WHERE inventory.deleted_at IS NULL
+ LIMIT {MAX_ROWS}
+""",
+    ),
+    Shape(
+        'inventory_available_models',
+        'src/app/[locale]/commercial/estimates/new/page.tsx:145',
+        f"""
+SELECT model, capacity, grade, price
+  FROM public.inventory
+ WHERE status = 'Available' AND deleted_at IS NULL
+ LIMIT {MAX_ROWS}
+""",
+    ),
+    Shape(
+        'inventory_by_imei',
+        'src/lib/inventoryImport.ts:83',
+        f"""
+SELECT id FROM public.inventory WHERE imei = %s AND deleted_at IS NULL LIMIT {MAX_ROWS}
+""",
+        sample='SELECT imei FROM public.inventory TABLESAMPLE BERNOULLI (1) WHERE imei IS NOT NULL',
+    ),
+    Shape(
+        'inventory_supplier_invoices',
+        'src/components/dashboard/StockEntryWizard.tsx:192',
+        f"""
+SELECT purchase_invoice FROM public.inventory
+ WHERE agent_id = %s AND deleted_at IS NULL
+ LIMIT {MAX_ROWS}
+""",
+        sample='SELECT DISTINCT agent_id FROM public.inventory TABLESAMPLE BERNOULLI (1)',
+    ),
+    Shape(
+        'estimates_list',
+        'src/app/[locale]/dashboard/comercial/estimates/page.tsx:50',
+        f"""
+SELECT estimates.*, row_to_json(customer) AS customer,
+       row_to_json(stock_locations) AS stock_locations
+  FROM public.estimates
+  LEFT JOIN LATERAL (
+        SELECT a.name FROM public.agents a WHERE a.id = estimates.customer_id
+       ) customer ON true
+  LEFT JOIN LATERAL (
+        SELECT l.name FROM public.stock_locations l WHERE l.id = estimates.stock_location_id
+       ) stock_locations ON true
+ WHERE estimates.deleted_at IS NULL
+ ORDER BY estimates.estimate_number DESC
+ LIMIT {MAX_ROWS}
+""",
+    ),
+    Shape(
+        'estimate_detail',
+        'src/app/[locale]/commercial/estimates/[id]/page.tsx:199',
+        """
+SELECT estimates.*, coalesce(items.items, '[]') AS items
+  FROM public.estimates
+  LEFT JOIN LATERAL (
+        SELECT json_agg(i) AS items FROM public.estimate_items i
+         WHERE i.estimate_id = estimates.id
+       ) items ON true
+ WHERE estimates.id = %s
+""",
+        sample='SELECT id FROM public.estimates TABLESAMPLE BERNOULLI (1)',
+    ),
+    Shape(
+        'sales_orders_list',
+        'src/app/[locale]/dashboard/comercial/orders/page.tsx:24',
+        f"""
+SELECT sales_orders.*, row_to_json(customer) AS customer
+  FROM public.sales_orders
+  LEFT JOIN LATERAL (
+        SELECT a.name FROM public.agents a WHERE a.id = sales_orders.customer_id
+       ) customer ON true
+ WHERE sales_orders.deleted_at IS NULL
+ ORDER BY sales_orders.order_number DESC
+ LIMIT {MAX_ROWS}
+""",
+    ),
+    # The app does not read financial_transactions yet (the finance pages list
+    # invoices); the fiscal report is what scans it.
+    Shape(
+        'transactions_quarter',
+        'tools/fiscal/__main__.py:28',
+        """
+SELECT transaction_date - DATE '1970-01-01', amount::float8, transaction_type = 'income'
+  FROM public.financial_transactions
+ WHERE deleted_at IS NULL
+   AND coalesce(status, '') <> 'cancelled'
+   AND transaction_date BETWEEN %s AND %s
+""",
+        sample="""
+SELECT d, d + 90 FROM (
+  SELECT DISTINCT date_trunc('quarter', transaction_date)::date AS d
+    FROM public.financial_transactions TABLESAMPLE BERNOULLI (0.1)
+) quarters
+""",
+    ),
+)
+
+BY_NAME = {shape.name: shape for shape in SHAPES}
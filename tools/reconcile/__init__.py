@@ -0,0 +1,29 @@
+"""Model + capacity reconciliation between spreadsheets and catalog/invoice items.
+
+The matching rules are those of ``src/lib/modelNameCanonical.ts``::
+
+    python -m tools.reconcile entrada.xlsx --catalog invoice_items.json
+    python -m tools.reconcile entrada.xlsx --invoice <uuid> --dsn postgresql://...
+"""
+
+from .canonical import (
+    canonicalize_for_match,
+    match_key,
+    match_model_and_capacity,
+    normalize_model_name,
+)
+from .engine import Reconciliation, build_index, load_items, reconcile
+from .index import CatalogIndex, Suggestion
+
+__all__ = [
+    'CatalogIndex',
+    'Reconciliation',
+    'Suggestion',
+    'build_index',
+    'canonicalize_for_match',
+    'load_items',
+    'match_key',
+    'match_model_and_capacity',
+    'normalize_model_name',
+    'reconcile',
+]
@@ -0,0 +1,127 @@
+"""Command-line entry point: ``python -m tools.reconcile``.
+
+Matches the Modelo/Capacidade of every spreadsheet row against catalog or
+invoice items and prints, per item, the quantity expected vs. found, plus the
+rows that matched nothing with the closest catalog names. Exits 1 on any
+divergence.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from tools.inventory_import.reader import SpreadsheetError, read_rows
+
+from .engine import (
+    CatalogError,
+    build_index,
+    expected_quantity,
+    item_model,
+    load_invoice_items,
+    load_items,
+    reconcile,
+)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m tools.reconcile',
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('spreadsheet', type=Path, help='.csv or .xlsx with Modelo / Capacidade')
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
+        '--catalog', type=Path, help='items as .json or .csv (model_name/name, capacity, quantity)'
+    )
+    source.add_argument('--invoice', metavar='ID', help='reconcile against this invoice\'s items')
+    parser.add_argument(
+        '--dsn', default=os.environ.get('DATABASE_URL'), help='default: $DATABASE_URL'
+    )
+    parser.add_argument('--sheet', help='worksheet name (default: the first one)')
+    parser.add_argument('--json', action='store_true', help='print the report as JSON')
+    args = parser.parse_args(argv)
+
+    if args.invoice and not args.dsn:
+        parser.error('--invoice needs --dsn (or $DATABASE_URL)')
+
+    started = time.perf_counter()
+    try:
+        if args.catalog:
+            items = load_items(args.catalog)
+        else:
+            items = load_invoice_items(args.dsn, args.invoice)
+        index = build_index(items)
+        result = reconcile(read_rows(args.spreadsheet, args.sheet), index)
+    except (CatalogError, SpreadsheetError, OSError) as e:
+        print(f'❌ {e}', file=sys.stderr)
+        return 2
+
+    report: Dict[str, Any] = {'rows': result.rows, 'items': [], 'unmatched': []}
+    divergent = False
+    for key, entries in index.by_key.items():
+        expected = expected_quantity(entries)
+        found = result.found.get(key, 0)
+        divergent |= expected is not None and expected != found
+        report['items'].append(
+            {
+                'model': item_model(entries[0]),
+                'capacity': entries[0].get('capacity') or '',
+                'expected': expected,
+                'found': found,
+            }
+        )
+    for miss in result.unmatched.values():
+        divergent = True
+        report['unmatched'].append(
+            {
+                'model': miss.model,
+                'capacity': miss.capacity,
+                'rows': miss.rows,
+                'first_row': miss.first_row,
+                'suggestions': [
+                    {
+                        'model': item_model(s.entries[0]),
+                        'capacity': s.entries[0].get('capacity') or '',
+                        'similarity': s.similarity,
+                    }
+                    for s in miss.suggestions
+                ],
+            }
+        )
+
+    if args.json:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return 1 if divergent else 0
+
+    for item in report['items']:
+        ok = item['expected'] is None or item['expected'] == item['found']
+        expected = '?' if item['expected'] is None else f'{item["expected"]:g}'
+        print(
+            f'{"✅" if ok else "⚠️ "} {item["model"]} {item["capacity"]}: '
+            f'{item["found"]} found, {expected} expected'
+        )
+    for miss in report['unmatched']:
+        hint = ', '.join(
+            f'{s["model"]} {s["capacity"]} ({s["similarity"]:.2f})' for s in miss['suggestions']
+        )
+        print(
+            f'❌ {miss["model"]} {miss["capacity"]}: {miss["rows"]} rows without a match '
+            f'(first: Linha {miss["first_row"]})' + (f' - closest: {hint}' if hint else '')
+        )
+    matched = sum(result.found.values())
+    print(
+        f'\n📊 {result.rows} rows, {matched} matched against {len(index)} items, '
+        f'{result.rows - matched} unmatched in {time.perf_counter() - started:.2f}s'
+    )
+    return 1 if divergent else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,44 @@
+"""Model-name canonicalization, ported from ``src/lib/modelNameCanonical.ts``.
+
+Spreadsheet rows (``IPHONE SE2 64GB (2020)``) and catalog entries
+(``iPhone SE (2ª geração) 64GB``) must reduce to the same key. Keep these rules
+in step with the TypeScript version; ``re.ASCII`` matches JS ``\\b``/``\\d``.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+_YEAR = re.compile(r'\s*\(\d{4}\)\s*', re.ASCII)
+_SE2 = re.compile(r'\bSE2\b', re.ASCII | re.IGNORECASE)
+_NON_ALNUM = re.compile(r'[^a-z0-9]')
+
+
+def canonicalize_for_match(name: str) -> str:
+    """Apply known aliases: file variants -> the catalog's wording."""
+    s = _YEAR.sub(' ', name or '')
+    s = _SE2.sub('SE 2ª geração', s)
+    return s.strip()
+
+
+@lru_cache(maxsize=8192)
+def normalize_model_name(name: str) -> str:
+    """Lowercase alphanumerics of the canonical form (``normalizeModelNameForMatch``).
+
+    Memoized: the same few model strings repeat across thousands of rows.
+    """
+    return _NON_ALNUM.sub('', canonicalize_for_match(name).lower())
+
+
+def match_key(model: str, capacity: str = '') -> str:
+    """Key of a model + capacity pair, as ``matchModelAndCapacity`` compares them."""
+    return normalize_model_name((model or '') + (capacity or ''))
+
+
+def match_model_and_capacity(
+    spreadsheet_model: str, spreadsheet_capacity: str, catalog_model: str, catalog_capacity: str
+) -> bool:
+    return match_key(spreadsheet_model, spreadsheet_capacity) == match_key(
+        catalog_model, catalog_capacity
+    )
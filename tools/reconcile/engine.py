@@ -0,0 +1,114 @@
+"""Reconcile spreadsheet rows against catalog / invoice items.
+
+Rows are streamed and only counted per match key, so the spreadsheet is never
+held in memory; the per-item tally is the "DIVERGÊNCIAS POR MODELO" view of
+the stock entry wizard.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from tools.inventory_import.reader import Row
+
+from .index import CatalogIndex, Suggestion
+
+Item = Dict[str, Any]
+
+# Field names accepted for the model of a catalog / invoice item.
+MODEL_FIELDS = ('model_name', 'name', 'model')
+
+
+class CatalogError(ValueError):
+    pass
+
+
+def item_model(item: Item) -> str:
+    return next((str(item[f]) for f in MODEL_FIELDS if item.get(f)), '')
+
+
+def load_items(path: Path) -> List[Item]:
+    """Catalog / invoice items from a ``.json`` list or a ``.csv`` with a header."""
+    path = Path(path)
+    if path.suffix.lower() == '.json':
+        items = json.loads(path.read_text(encoding='utf-8'))
+        if not isinstance(items, list):
+            raise CatalogError(f'{path}: expected a JSON list of items')
+        return items
+    if path.suffix.lower() == '.csv':
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            return list(csv.DictReader(f))
+    raise CatalogError(f'{path}: expected .json or .csv')
+
+
+def load_invoice_items(dsn: str, invoice_id: str) -> List[Item]:
+    """The items of one invoice, named after their catalog product as the wizard shows them."""
+    try:
+        import psycopg
+        from psycopg.rows import dict_row
+    except ImportError:
+        raise CatalogError(
+            'psycopg is required to read from Postgres (pip install "psycopg[binary]")'
+        ) from None
+    with psycopg.connect(dsn, row_factory=dict_row) as conn:
+        return conn.execute(
+            'SELECT ii.id, coalesce(pc.name, ii.description) AS model_name, ii.capacity,'
+            ' ii.quantity, ii.unit_price, ii.lot_id'
+            ' FROM public.invoice_items ii'
+            ' LEFT JOIN public.product_catalog pc ON pc.id = ii.product_id'
+            ' WHERE ii.invoice_id = %s ORDER BY ii.created_at',
+            (invoice_id,),
+        ).fetchall()
+
+
+def build_index(items: Iterable[Item]) -> CatalogIndex[Item]:
+    return CatalogIndex((item_model(item), str(item.get('capacity') or ''), item) for item in items)
+
+
+@dataclass
+class Unmatched:
+    model: str
+    capacity: str
+    rows: int = 0
+    first_row: int = 0
+    suggestions: List[Suggestion[Item]] = field(default_factory=list)
+
+
+@dataclass
+class Reconciliation:
+    # match key -> rows matched
+    found: Counter = field(default_factory=Counter)
+    unmatched: Dict[Tuple[str, str], Unmatched] = field(default_factory=dict)
+    rows: int = 0
+
+
+def expected_quantity(items: Iterable[Item]) -> Optional[float]:
+    """Summed ``quantity`` of ``items``; None when none of them carries one."""
+    quantities = [float(i['quantity']) for i in items if i.get('quantity') not in (None, '')]
+    return sum(quantities) if quantities else None
+
+
+def reconcile(
+    rows: Iterable[Row], index: CatalogIndex[Item], suggest: bool = True
+) -> Reconciliation:
+    result = Reconciliation()
+    for row_number, cells in rows:
+        result.rows += 1
+        model, capacity = cells.get('Modelo', ''), cells.get('Capacidade', '')
+        key = index.key_for(model, capacity)
+        if key is not None:
+            result.found[key] += 1
+            continue
+        miss = result.unmatched.get((model, capacity))
+        if miss is None:
+            miss = Unmatched(model, capacity, first_row=row_number)
+            result.unmatched[(model, capacity)] = miss
+            if suggest:
+                miss.suggestions = index.suggest(model, capacity)
+        miss.rows += 1
+    return result
@@ -0,0 +1,95 @@
+"""Catalog index: exact matches by hash, near misses by trigram similarity.
+
+``matchModelAndCapacity`` re-normalizes both sides for every (row, item) pair,
+so reconciling N rows against M items is O(N*M) regex work. Here each catalog
+entry is normalized once into ``key -> entries``; a row costs one (usually
+memoized) normalization and a dict lookup. Rows without an exact match can
+ask for suggestions, scored by Dice similarity over the trigrams of the key.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, Generic, Iterable, List, Optional, Set, Tuple, TypeVar
+
+from .canonical import match_key
+
+T = TypeVar('T')
+
+DEFAULT_MIN_SIMILARITY = 0.6
+
+
+def trigrams(key: str) -> Set[str]:
+    padded = f'  {key} '
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+@dataclass(frozen=True)
+class Suggestion(Generic[T]):
+    key: str
+    entries: Tuple[T, ...]
+    similarity: float
+
+
+class CatalogIndex(Generic[T]):
+    """``(model, capacity, entry)`` triples indexed by their match key."""
+
+    def __init__(self, items: Iterable[Tuple[str, str, T]] = ()):
+        self.by_key: Dict[str, List[T]] = {}
+        self._by_trigram: Dict[str, List[str]] = {}
+        self._trigram_counts: Dict[str, int] = {}
+        for model, capacity, entry in items:
+            self.add(model, capacity, entry)
+
+    def add(self, model: str, capacity: str, entry: T) -> str:
+        key = match_key(model, capacity)
+        if key not in self.by_key:
+            self.by_key[key] = []
+            grams = trigrams(key)
+            self._trigram_counts[key] = len(grams)
+            for gram in grams:
+                self._by_trigram.setdefault(gram, []).append(key)
+        self.by_key[key].append(entry)
+        return key
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self.by_key.values())
+
+    def key_for(self, model: str, capacity: str = '') -> Optional[str]:
+        """The match key of ``model`` + ``capacity`` if any entry has it."""
+        key = match_key(model, capacity)
+        return key if key in self.by_key else None
+
+    def lookup(self, model: str, capacity: str = '') -> List[T]:
+        """Entries whose model + capacity match exactly, in insertion order."""
+        return self.by_key.get(match_key(model, capacity), [])
+
+    def first(self, model: str, capacity: str = '') -> Optional[T]:
+        """The entry ``invoiceItems.find(matchModels(...))`` would return."""
+        entries = self.lookup(model, capacity)
+        return entries[0] if entries else None
+
+    def suggest(
+        self,
+        model: str,
+        capacity: str = '',
+        limit: int = 3,
+        min_similarity: float = DEFAULT_MIN_SIMILARITY,
+    ) -> List[Suggestion[T]]:
+        """Closest keys by trigram Dice similarity, best first."""
+        key = match_key(model, capacity)
+        grams = trigrams(key)
+        shared: Counter = Counter()
+        for gram in grams:
+            shared.update(self._by_trigram.get(gram, ()))
+        scored = []
+        for candidate, common in shared.items():
+            similarity = 2 * common / (len(grams) + self._trigram_counts[candidate])
+            if similarity >= min_similarity:
+                scored.append((similarity, candidate))
+        scored.sort(key=lambda s: (-s[0], s[1]))
+        return [
+            Suggestion(candidate, tuple(self.by_key[candidate]), round(similarity, 4))
+            for similarity, candidate in scored[:limit]
+        ]
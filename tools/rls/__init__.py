@@ -0,0 +1,20 @@
+"""Static analysis of the RLS policies the SQL files leave in place.
+
+    python -m tools.rls
+    python -m tools.rls --table inventory --policies
+    python -m tools.rls --json
+"""
+
+from .analyze import Finding, Policy, Schema, Table, lint, render
+from .parse import ParseCache, parse_sql
+
+__all__ = [
+    'Finding',
+    'ParseCache',
+    'Policy',
+    'Schema',
+    'Table',
+    'lint',
+    'parse_sql',
+    'render',
+]
@@ -0,0 +1,154 @@
+"""Command-line entry point: ``python -m tools.rls``.
+
+Replays supabase/migrations in order and prints the effective policies of
+each table with the predicates that do per-row work. Exits 1 when anything
+is flagged as a warning.
+
+The hand-applied scripts (root *.sql, supabase/*.sql,
+supabase/maintenance_scripts/*.sql) are left out unless asked for: most are
+stale one-offs that later migrations superseded. --scripts replays them too;
+one named after a migration number (MANUAL_MIGRATION_087.sql,
+APPLY_110_...sql) runs right after that migration, the others after every
+migration, by path. --script replays only the given ones, in that order.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from tools.migrations.plan import MIGRATIONS_DIR, order_key
+from tools.paths import REPO_ROOT
+
+from .analyze import Finding, Schema, lint, render
+from .parse import CACHE_PATH, ParseCache
+
+SCRIPT_GLOBS = ('*.sql', 'supabase/*.sql', 'supabase/maintenance_scripts/*.sql')
+# Loose scripts standing in for a migration: MANUAL_MIGRATION_087.sql, APPLY_110_FIX_....sql
+_NUMBERED_SCRIPT = re.compile(r'(?:MANUAL_MIGRATION|APPLY)_(\d+)', re.I)
+
+_ICON = {'warning': '⚠️ ', 'info': 'ℹ️ '}
+
+
+def sources(root: Path, scripts: Optional[List[str]], loose: bool) -> List[str]:
+    """Paths to replay, relative to ``root``, in replay order."""
+    migrations = sorted(
+        (p.relative_to(root).as_posix() for p in (root / MIGRATIONS_DIR).glob('*.sql')),
+        key=lambda path: order_key(path.rsplit('/', 1)[-1]),
+    )
+    if scripts is not None:
+        return migrations + scripts
+    if not loose:
+        return migrations
+    keyed = [(order_key(path.rsplit('/', 1)[-1])[0], 0, path) for path in migrations]
+    found = {p.relative_to(root).as_posix() for g in SCRIPT_GLOBS for p in root.glob(g)}
+    for path in sorted(found):
+        match = _NUMBERED_SCRIPT.match(path.rsplit('/', 1)[-1])
+        keyed.append((int(match.group(1)), 1, path) if match else (sys.maxsize, 1, path))
+    return [path for _, _, path in sorted(keyed)]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m tools.rls',
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('--root', type=Path, default=REPO_ROOT)
+    parser.add_argument('--table', action='append', help='only these tables (repeatable)')
+    scripts = parser.add_mutually_exclusive_group()
+    scripts.add_argument(
+        '--scripts', action='store_true', help='also replay the hand-applied scripts'
+    )
+    scripts.add_argument(
+        '--script', action='append', metavar='PATH', help='replay these scripts, in this order'
+    )
+    parser.add_argument('--policies', action='store_true', help='print every effective policy')
+    parser.add_argument('--json', action='store_true', help='print the report as JSON')
+    parser.add_argument(
+        '--no-cache', action='store_true', help='ignore and do not update the parse cache'
+    )
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    root = args.root.resolve()
+    cache = ParseCache(root, root / CACHE_PATH, persist=not args.no_cache)
+    schema = Schema()
+    try:
+        paths = sources(root, args.script, args.scripts)
+        for path, nodes in cache.load(paths):
+            schema.replay(path, nodes)
+    except (OSError, ValueError) as e:
+        print(f'❌ {e}', file=sys.stderr)
+        return 2
+
+    tables = args.table or sorted(
+        name for name, t in schema.tables.items() if t.policies or t.rls
+    )
+    findings = lint(schema, tables)
+    for name in tables:
+        table = schema.tables.get(name)
+        if table is not None and table.rls is False and table.policies:
+            message = f'RLS is disabled, so its {len(table.policies)} policies are not enforced'
+            findings.append(Finding(name, None, 'warning', message, ''))
+    by_table: Dict[str, List[Finding]] = {}
+    for finding in findings:
+        by_table.setdefault(finding.table, []).append(finding)
+
+    if args.json:
+        report = {
+            name: {
+                'rls': schema.tables[name].rls,
+                'policies': [
+                    {
+                        'name': p.name,
+                        'command': p.command,
+                        'roles': p.roles,
+                        'permissive': p.permissive,
+                        'using': render(p.using),
+                        'check': render(p.check),
+                        'source': p.source,
+                    }
+                    for p in schema.tables[name].policies.values()
+                ],
+                'findings': [vars(f) for f in by_table.get(name, [])],
+            }
+            for name in tables
+            if name in schema.tables
+        }
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        for name in tables:
+            table = schema.tables.get(name)
+            if table is None:
+                print(f'❌ {name}: no such table in the replayed SQL')
+                continue
+            state = {True: 'on', False: 'OFF', None: 'never enabled'}[table.rls]
+            print(f'📋 {name}: RLS {state}, {len(table.policies)} policies')
+            if args.policies:
+                for p in table.policies.values():
+                    print(f'   "{p.name}" {p.command.upper()} TO {", ".join(p.roles)} ({p.source})')
+                    if p.using:
+                        print(f'      USING ({render(p.using)})')
+                    if p.check:
+                        print(f'      WITH CHECK ({render(p.check)})')
+            for f in by_table.get(name, []):
+                where = f' "{f.policy}" ({f.source}):' if f.policy else ''
+                print(f'   {_ICON[f.severity]}{where} {f.message}')
+        warnings = sum(f.severity == 'warning' for f in findings)
+        policies = sum(len(schema.tables[n].policies) for n in tables if n in schema.tables)
+        print(
+            f'\n📊 {len(paths)} files ({len(cache.parsed)} parsed, '
+            f'{len(paths) - len(cache.parsed)} cached), {len(tables)} tables, {policies} '
+            f'policies, {warnings} warnings in {time.perf_counter() - started:.2f}s'
+        )
+    return 1 if any(f.severity == 'warning' for f in findings) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
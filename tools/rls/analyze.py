@@ -0,0 +1,374 @@
+"""Replay parsed SQL into the effective policies per table, then lint them.
+
+Postgres evaluates a policy predicate for every row a query touches, so the
+costly shapes are the ones that do work per row:
+
+* ``auth.uid()`` / ``auth.jwt()`` called bare instead of ``(select auth.uid())``,
+  which Postgres evaluates once as an initplan;
+* calls to functions that read tables (``current_user_is_staff_or_admin()``
+  reads profiles) outside ``(select ...)``;
+* subqueries correlated with the row (``EXISTS (SELECT 1 FROM invoices i
+  WHERE i.id = invoice_id ...)``) without an index on the lookup column.
+
+Uncorrelated subqueries already run once per statement and are not flagged.
+Several permissive policies for the same command and role are reported too:
+they are OR-ed, so each one is evaluated for every row.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .parse import Node, Tree
+
+COMMANDS = ('select', 'insert', 'update', 'delete')
+AUTH_FUNCTIONS = ('auth.uid', 'auth.jwt', 'auth.role', 'auth.email')
+
+# Words after FROM / JOIN <table> that are not an alias.
+_NOT_ALIAS = frozenset(
+    'where join inner left right full cross on using limit group order having union as'.split()
+)
+
+
+@dataclass
+class Policy:
+    table: str
+    name: str
+    command: str
+    roles: List[str]
+    permissive: bool
+    using: Optional[Tree]
+    check: Optional[Tree]
+    source: str  # path:line
+
+    def applies_to(self, command: str, role: str) -> bool:
+        return self.command in (command, 'all') and (role in self.roles or 'public' in self.roles)
+
+
+@dataclass
+class Table:
+    name: str
+    rls: Optional[bool] = None
+    columns: Set[str] = field(default_factory=set)
+    # (columns, unique) of every index, including primary keys and UNIQUE constraints.
+    indexes: List[Tuple[Tuple[str, ...], bool]] = field(default_factory=list)
+    policies: Dict[str, Policy] = field(default_factory=dict)
+
+    def indexed(self, column: str) -> bool:
+        """Is ``column`` the leading column of an index?"""
+        return any(cols and cols[0] == column for cols, _ in self.indexes)
+
+
+@dataclass(frozen=True)
+class Finding:
+    table: str
+    policy: Optional[str]
+    severity: str  # warning | info
+    message: str
+    source: str
+
+
+class Schema:
+    """Tables, indexes, functions and policies after replaying nodes in order."""
+
+    def __init__(self) -> None:
+        self.tables: Dict[str, Table] = {}
+        self.functions: Dict[str, Node] = {}
+
+    def table(self, name: str) -> Table:
+        if name not in self.tables:
+            self.tables[name] = Table(name)
+        return self.tables[name]
+
+    def replay(self, path: str, nodes: Iterable[Node]) -> None:
+        for node in nodes:
+            op = node['op']
+            source = f'{path}:{node["line"]}'
+            if op == 'function':
+                self.functions[node['name']] = node
+                continue
+            name = node['table']
+            if op == 'create_table':
+                if name not in self.tables or not self.tables[name].columns:
+                    self.table(name).columns.update(node['columns'])
+            elif op == 'add_columns':
+                self.table(name).columns.update(node['columns'])
+            elif op == 'drop_table':
+                self.tables.pop(name, None)
+            elif op == 'rename_table' and name in self.tables and node['to']:
+                table = self.tables.pop(name)
+                table.name = node['to']
+                for policy in table.policies.values():
+                    policy.table = table.name
+                self.tables[table.name] = table
+            elif op == 'index':
+                entry = (tuple(node['columns']), node['unique'])
+                if entry not in self.table(name).indexes:
+                    self.table(name).indexes.append(entry)
+            elif op == 'rls':
+                self.table(name).rls = node['enabled']
+            elif op == 'create_policy':
+                self.table(name).policies[node['name']] = Policy(
+                    name,
+                    node['name'],
+                    node['command'],
+                    node['roles'],
+                    node['permissive'],
+                    node['using'],
+                    node['check'],
+                    source,
+                )
+            elif op == 'alter_policy':
+                policies = self.table(name).policies
+                policy = policies.get(node['name'])
+                if policy is None:
+                    continue
+                if node.get('rename'):
+                    del policies[policy.name]
+                    policy.name = node['rename']
+                    policies[policy.name] = policy
+                for key in ('roles', 'using', 'check'):
+                    if key in node:
+                        setattr(policy, key, node[key])
+                policy.source = source
+            elif op == 'drop_policy':
+                self.table(name).policies.pop(node['name'], None)
+            elif op == 'drop_all_policies':
+                self.table(name).policies.clear()
+
+
+def render(tree: Optional[Tree]) -> str:
+    """Predicate tree back to compact SQL."""
+    if tree is None:
+        return ''
+    parts: List[str] = []
+    for item in tree:
+        if _is_leaf(item):
+            kind, value = item
+            if kind == 'qident':
+                value = f'"{value}"'
+            parts.append(value)
+        else:
+            parts.append(f'({render(item)})')
+    return ' '.join(parts).replace(' . ', '.').replace(' (', '(').replace('( ', '(')
+
+
+def _is_leaf(item: Any) -> bool:
+    return len(item) == 2 and isinstance(item[0], str)
+
+
+def _is_subquery(item: Any) -> bool:
+    return not _is_leaf(item) and bool(item) and _is_leaf(item[0]) and item[0] == ['word', 'select']
+
+
+def _name_at(items: Tree, i: int) -> Optional[Tuple[int, str]]:
+    """The dotted name ``a . b`` starting at ``items[i]``, and the index after it."""
+    item = items[i] if i < len(items) else None
+    if item is None or not _is_leaf(item) or item[0] not in ('word', 'qident'):
+        return None
+    parts = [item[1]]
+    j = i + 1
+    while j + 1 < len(items) and items[j] == ['op', '.'] and _is_leaf(items[j + 1]):
+        parts.append(items[j + 1][1])
+        j += 2
+    if parts[0] == 'public' and len(parts) > 1:
+        parts = parts[1:]
+    return j, '.'.join(parts)
+
+
+def _names(items: Tree) -> Iterator[Tuple[int, str]]:
+    """``(index after, dotted name)`` for each name at this level of ``items``."""
+    i = 0
+    while i < len(items):
+        found = _name_at(items, i)
+        if found is None:
+            i += 1
+            continue
+        yield found
+        i = found[0]
+
+
+class _Linter:
+    def __init__(self, schema: Schema, table: Table, policy: Policy):
+        self.schema = schema
+        self.table = table
+        self.policy = policy
+        self.findings: List[Finding] = []
+
+    def add(self, severity: str, message: str) -> None:
+        finding = Finding(self.table.name, self.policy.name, severity, message, self.policy.source)
+        if finding not in self.findings:
+            self.findings.append(finding)
+
+    def run(self) -> List[Finding]:
+        for predicate in (self.policy.using, self.policy.check):
+            if predicate:
+                self.walk(predicate)
+        return self.findings
+
+    def walk(self, items: Tree) -> None:
+        """Check the per-row level of a predicate (not inside a subquery)."""
+        calls = {end: name for end, name in _names(items)}
+        for i, item in enumerate(items):
+            if _is_leaf(item):
+                continue
+            if _is_subquery(item):
+                self.subquery(item)
+                continue
+            name = calls.get(i)
+            if name is not None:
+                self.call(name, item)
+            self.walk(item)
+
+    def call(self, name: str, args: Tree) -> None:
+        if name in AUTH_FUNCTIONS:
+            self.add(
+                'warning',
+                f'{name}() is evaluated for every row; write (select {name}()) to run it once',
+            )
+            return
+        function = self.schema.functions.get(name)
+        if function is None or not function['tables']:
+            return
+        reads = ', '.join(function['tables'])
+        per_row = self.row_refs(args)
+        if per_row:
+            self.add(
+                'warning',
+                f'{name}({", ".join(sorted(per_row))}) reads {reads} for every row and cannot '
+                'be hoisted; index the columns it looks up',
+            )
+        else:
+            volatile = ' (VOLATILE: never cached)' if function['volatility'] == 'volatile' else ''
+            self.add(
+                'warning',
+                f'{name}() reads {reads} for every row{volatile}; write (select {name}()) '
+                'to run it once',
+            )
+
+    def row_refs(self, items: Tree) -> Set[str]:
+        """Columns of the policy's table referenced in ``items`` (outside subqueries)."""
+        refs: Set[str] = set()
+        for _, name in _names(items):
+            parts = name.split('.')
+            if len(parts) == 2 and parts[0] == self.table.name:
+                refs.add(parts[1])
+            elif len(parts) == 1 and parts[0] in self.table.columns:
+                refs.add(parts[0])
+        for item in items:
+            if not _is_leaf(item) and not _is_subquery(item):
+                refs |= self.row_refs(item)
+        return refs
+
+    def subquery(self, items: Tree) -> None:
+        scope = self._from_items(items)
+        inner_columns: Set[str] = set()
+        for name in scope.values():
+            if name in self.schema.tables:
+                inner_columns |= self.schema.tables[name].columns
+        correlated = self._correlated(items, scope, inner_columns)
+        if not correlated or not scope:
+            return
+        main = next(iter(scope.values()))
+        lookups = self._equalities(items, scope, inner_columns, main)
+        table = self.schema.tables.get(main)
+        if table is None or any(table.indexed(column) for column in lookups):
+            return
+        columns = ', '.join(sorted(lookups)) or '?'
+        self.add(
+            'warning',
+            f'subquery on {main} runs for every row (correlated on '
+            f'{", ".join(sorted(correlated))}) and no index leads with {columns}',
+        )
+
+    def _from_items(self, items: Tree) -> Dict[str, str]:
+        """``alias -> table`` for FROM / JOIN at this level."""
+        scope: Dict[str, str] = {}
+        for i, item in enumerate(items):
+            if not (_is_leaf(item) and item[0] == 'word' and item[1] in ('from', 'join')):
+                continue
+            found = _name_at(items, i + 1)
+            if found is None:
+                continue
+            end, table = found
+            alias = table.split('.')[-1]
+            if end < len(items) and items[end] == ['word', 'as']:
+                end += 1
+            nxt = items[end] if end < len(items) else None
+            if nxt is not None and _is_leaf(nxt) and nxt[0] == 'word' and nxt[1] not in _NOT_ALIAS:
+                alias = nxt[1]
+            scope[alias] = table
+            scope.setdefault(table, table)
+        return scope
+
+    def _correlated(self, items: Tree, scope: Dict[str, str], inner: Set[str]) -> Set[str]:
+        refs: Set[str] = set()
+        for _, name in _names(items):
+            parts = name.split('.')
+            if len(parts) == 2 and parts[0] == self.table.name and parts[0] not in scope:
+                refs.add(parts[1])
+            elif (
+                len(parts) == 1
+                and parts[0] in self.table.columns
+                and parts[0] not in inner
+                and parts[0] not in scope
+            ):
+                refs.add(parts[0])
+        for item in items:
+            if not _is_leaf(item):
+                refs |= self._correlated(item, scope, inner)
+        return refs
+
+    def _equalities(
+        self, items: Tree, scope: Dict[str, str], inner: Set[str], main: str
+    ) -> Set[str]:
+        """Columns of ``main`` compared with ``=`` / ``IN`` in the subquery's conditions."""
+        columns: Set[str] = set()
+        flat = [item for item in items if _is_leaf(item)]
+        for i, item in enumerate(flat):
+            if item not in (['op', '='], ['word', 'in']):
+                continue
+            for side in (flat[i - 3 : i], flat[i + 1 : i + 4]):
+                for _, name in _names(side):
+                    parts = name.split('.')
+                    if len(parts) == 2 and scope.get(parts[0]) == main:
+                        columns.add(parts[1])
+                    elif len(parts) == 1 and parts[0] in inner:
+                        columns.add(parts[0])
+                    break
+        for item in items:
+            if not _is_leaf(item) and not _is_subquery(item):
+                columns |= self._equalities(item, scope, inner, main)
+        return columns
+
+
+def lint(schema: Schema, tables: Optional[Iterable[str]] = None) -> List[Finding]:
+    findings: List[Finding] = []
+    wanted = sorted(schema.tables) if tables is None else list(tables)
+    for name in wanted:
+        table = schema.tables.get(name)
+        if table is None:
+            continue
+        for policy in table.policies.values():
+            findings.extend(_Linter(schema, table, policy).run())
+        roles = sorted({role for p in table.policies.values() for role in p.roles})
+        for command in COMMANDS:
+            for role in roles:
+                permissive = [
+                    p.name
+                    for p in table.policies.values()
+                    if p.permissive and p.applies_to(command, role)
+                ]
+                if len(permissive) > 1:
+                    findings.append(
+                        Finding(
+                            name,
+                            None,
+                            'info',
+                            f'{len(permissive)} permissive {command.upper()} policies for {role} '
+                            f'are OR-ed for every row: {", ".join(permissive)}',
+                            '',
+                        )
+                    )
+    return findings
@@ -0,0 +1,417 @@
+"""Reduce SQL files to the statements that shape row-level security.
+
+Each file becomes a list of JSON-able nodes (``{'op': ..., ...}``):
+
+    create_policy / alter_policy / drop_policy / drop_all_policies
+    rls (ENABLE / DISABLE ROW LEVEL SECURITY), create_table, add_columns,
+    drop_table, index, function
+
+Policy predicates are kept as trees: a parenthesized group is a nested list,
+a token is a ``[kind, value]`` pair. Statements inside ``DO`` blocks count
+too, and so does the ``FOR pol IN SELECT ... FROM pg_policies`` idiom of
+``EXECUTE format('DROP POLICY %I ON public.t', ...)``, which drops every
+policy of ``t``.
+
+Nodes per file are cached in ``.cache/rls-ast.json`` keyed by
+``(mtime_ns, size, content hash)``; a warm run parses nothing.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from tools.fsutil import atomic_write_text, content_hash
+from tools.migrations.sql import (
+    Token,
+    block_statements,
+    read_name,
+    split_statements,
+    tokenize,
+)
+from tools.paths import REPO_ROOT
+
+CACHE_VERSION = 1
+CACHE_PATH = Path('.cache') / 'rls-ast.json'
+
+Node = Dict[str, Any]
+# A predicate: [kind, value] leaves and nested lists for parenthesized groups.
+Tree = List[Any]
+
+_RELEVANT = frozenset(('create', 'alter', 'drop'))
+_TABLE_CONSTRAINTS = frozenset(('constraint', 'primary', 'unique', 'foreign', 'check', 'exclude'))
+_VOLATILITY = ('volatile', 'stable', 'immutable')
+
+
+def tree(tokens: Tuple[Token, ...]) -> Tree:
+    """Nest ``tokens`` by parentheses."""
+    root: Tree = []
+    stack = [root]
+    for token in tokens:
+        if token.kind == 'op' and token.value == '(':
+            group: Tree = []
+            stack[-1].append(group)
+            stack.append(group)
+        elif token.kind == 'op' and token.value == ')' and len(stack) > 1:
+            stack.pop()
+        else:
+            stack[-1].append([token.kind, token.value])
+    return root
+
+
+def _word(tokens: Tuple[Token, ...], i: int) -> str:
+    return tokens[i].value if i < len(tokens) and tokens[i].kind == 'word' else ''
+
+
+def _skip(tokens: Tuple[Token, ...], i: int, *words: str) -> int:
+    while _word(tokens, i) in words and _word(tokens, i):
+        i += 1
+    return i
+
+
+def _group(tokens: Tuple[Token, ...], i: int) -> Tuple[Tuple[Token, ...], int]:
+    """The tokens inside the parenthesized group opening at ``tokens[i]``, and the index after."""
+    depth = 0
+    for j in range(i, len(tokens)):
+        if tokens[j].kind != 'op':
+            continue
+        depth += tokens[j].value == '('
+        depth -= tokens[j].value == ')'
+        if depth == 0:
+            return tokens[i + 1 : j], j + 1
+    return tokens[i + 1 :], len(tokens)
+
+
+def _split_commas(tokens: Tuple[Token, ...]) -> List[Tuple[Token, ...]]:
+    parts: List[Tuple[Token, ...]] = []
+    depth, start = 0, 0
+    for j, token in enumerate(tokens):
+        if token.kind != 'op':
+            continue
+        depth += token.value == '('
+        depth -= token.value == ')'
+        if token.value == ',' and depth == 0:
+            parts.append(tokens[start:j])
+            start = j + 1
+    parts.append(tokens[start:])
+    return [p for p in parts if p]
+
+
+def _policy_clauses(tokens: Tuple[Token, ...], i: int, node: Node) -> None:
+    while i < len(tokens):
+        word = _word(tokens, i)
+        if word == 'as':
+            node['permissive'] = _word(tokens, i + 1) != 'restrictive'
+            i += 2
+        elif word == 'for':
+            node['command'] = _word(tokens, i + 1)
+            i += 2
+        elif word == 'to':
+            roles = []
+            i += 1
+            while i < len(tokens) and tokens[i].kind in ('word', 'qident'):
+                if _word(tokens, i) in ('using', 'with'):
+                    break
+                roles.append(tokens[i].value)
+                i += 1
+                if i < len(tokens) and tokens[i].value == ',':
+                    i += 1
+            node['roles'] = roles
+        elif word == 'using' or (word == 'with' and _word(tokens, i + 1) == 'check'):
+            key = 'using' if word == 'using' else 'check'
+            i += 1 if word == 'using' else 2
+            inner, i = _group(tokens, i)
+            node[key] = tree(inner)
+        else:
+            i += 1
+
+
+def _policy_target(tokens: Tuple[Token, ...], i: int) -> Tuple[Optional[str], Optional[str], int]:
+    """``name ON table`` -> (name, table, index after)."""
+    name = tokens[i].value if i < len(tokens) else None
+    i += 1
+    if _word(tokens, i) != 'on':
+        return name, None, i
+    table, i = read_name(tokens, _skip(tokens, i + 1, 'only'))
+    return name, table, i
+
+
+def _columns(element: Tuple[Token, ...]) -> Optional[str]:
+    return element[0].value if element and element[0].kind in ('word', 'qident') else None
+
+
+def _index_columns(tokens: Tuple[Token, ...]) -> List[str]:
+    """Leading names of the index elements; expressions become ''."""
+    return [
+        part[0].value if part[0].kind in ('word', 'qident') and len(part) <= 3 else ''
+        for part in _split_commas(tokens)
+    ]
+
+
+def _create_table(tokens: Tuple[Token, ...], i: int, nodes: List[Node]) -> None:
+    table, i = read_name(tokens, _skip(tokens, i, 'if', 'not', 'exists'))
+    if table is None or i >= len(tokens) or tokens[i].value != '(':
+        return
+    body, _ = _group(tokens, i)
+    columns: List[str] = []
+    for element in _split_commas(body):
+        first = _word(element, 0)
+        if first in _TABLE_CONSTRAINTS:
+            _constraint_index(table, element, nodes)
+            continue
+        column = _columns(element)
+        if column is None:
+            continue
+        columns.append(column)
+        words = [t.value for t in element if t.kind == 'word']
+        if 'primary' in words or 'unique' in words:
+            nodes.append({'op': 'index', 'table': table, 'columns': [column], 'unique': True})
+    nodes.append({'op': 'create_table', 'table': table, 'columns': columns})
+
+
+def _constraint_index(table: str, element: Tuple[Token, ...], nodes: List[Node]) -> None:
+    """PRIMARY KEY (a, b) / UNIQUE (a) constraints are backed by an index."""
+    for j, token in enumerate(element):
+        if token.kind == 'word' and token.value in ('primary', 'unique'):
+            k = _skip(element, j + 1, 'key', 'nulls', 'not', 'distinct')
+            if k < len(element) and element[k].value == '(':
+                inner, _ = _group(element, k)
+                columns = _index_columns(inner)
+                nodes.append({'op': 'index', 'table': table, 'columns': columns, 'unique': True})
+            return
+
+
+def _alter_table(tokens: Tuple[Token, ...], i: int, nodes: List[Node]) -> None:
+    table, i = read_name(tokens, _skip(tokens, i, 'if', 'exists', 'only'))
+    if table is None:
+        return
+    added: List[str] = []
+    for action in _split_commas(tokens[i:]):
+        words = [t.value for t in action[:4] if t.kind == 'word']
+        if words[:1] in (['enable'], ['disable']) and 'row' in words:
+            nodes.append({'op': 'rls', 'table': table, 'enabled': words[0] == 'enable'})
+        elif words[:1] == ['add'] and words[1:2] == ['constraint']:
+            _constraint_index(table, action[3:], nodes)
+        elif words[:1] == ['add']:
+            k = _skip(action, 1, 'column', 'if', 'not', 'exists')
+            column = _columns(action[k:])
+            if column and column not in _TABLE_CONSTRAINTS:
+                added.append(column)
+        elif words[:2] == ['rename', 'to']:
+            new_name, _ = read_name(action, 2)
+            nodes.append({'op': 'rename_table', 'table': table, 'to': new_name})
+    if added:
+        nodes.append({'op': 'add_columns', 'table': table, 'columns': added})
+
+
+def _function(tokens: Tuple[Token, ...], i: int, nodes: List[Node]) -> None:
+    name, i = read_name(tokens, i)
+    if name is None:
+        return
+    args, i = _group(tokens, i) if i < len(tokens) and tokens[i].value == '(' else ((), i)
+    words = {t.value for t in tokens[i:] if t.kind == 'word'}
+    body = next((t.value for t in tokens[i:] if t.kind in ('body', 'string')), '')
+    body_tokens = tuple(tokenize(body.strip("'"))) if body else ()
+    tables = sorted(
+        {
+            read_name(body_tokens, j + 1)[0] or ''
+            for j, t in enumerate(body_tokens)
+            if t.kind == 'word' and t.value in ('from', 'join')
+        }
+        - {''}
+    )
+    nodes.append(
+        {
+            'op': 'function',
+            'name': name,
+            'arity': len(_split_commas(args)),
+            'volatility': next((v for v in _VOLATILITY if v in words), 'volatile'),
+            'security_definer': 'definer' in words,
+            'tables': tables,
+        }
+    )
+
+
+def statement_nodes(tokens: Tuple[Token, ...], line: int) -> List[Node]:
+    """The RLS-relevant nodes of one statement."""
+    nodes: List[Node] = []
+    verb = _word(tokens, 0)
+    if verb == 'create':
+        i = _skip(tokens, 1, 'or', 'replace', 'unique', 'temp', 'temporary', 'unlogged')
+        kind = _word(tokens, i)
+        if kind == 'policy':
+            name, table, j = _policy_target(tokens, i + 1)
+            if table:
+                node: Node = {
+                    'op': 'create_policy',
+                    'table': table,
+                    'name': name,
+                    'command': 'all',
+                    'roles': ['public'],
+                    'permissive': True,
+                    'using': None,
+                    'check': None,
+                }
+                _policy_clauses(tokens, j, node)
+                nodes.append(node)
+        elif kind == 'table':
+            _create_table(tokens, i + 1, nodes)
+        elif kind == 'index':
+            unique = 'unique' in (t.value for t in tokens[1:i])
+            j = next((k for k in range(i, len(tokens)) if _word(tokens, k) == 'on'), None)
+            if j is not None:
+                table, k = read_name(tokens, _skip(tokens, j + 1, 'only'))
+                if _word(tokens, k) == 'using':
+                    k += 2
+                if table and k < len(tokens) and tokens[k].value == '(':
+                    inner, k = _group(tokens, k)
+                    partial = _word(tokens, k) == 'where'
+                    nodes.append(
+                        {
+                            'op': 'index',
+                            'table': table,
+                            'columns': _index_columns(inner),
+                            'unique': unique,
+                            'partial': partial,
+                        }
+                    )
+        elif kind in ('function', 'procedure'):
+            _function(tokens, i + 1, nodes)
+    elif verb == 'alter':
+        kind = _word(tokens, 1)
+        if kind == 'table':
+            _alter_table(tokens, 2, nodes)
+        elif kind == 'policy':
+            name, table, j = _policy_target(tokens, 2)
+            if table:
+                node = {'op': 'alter_policy', 'table': table, 'name': name}
+                if _word(tokens, j) == 'rename':
+                    node['rename'] = tokens[j + 2].value if j + 2 < len(tokens) else None
+                else:
+                    _policy_clauses(tokens, j, node)
+                nodes.append(node)
+    elif verb == 'drop':
+        kind = _word(tokens, 1)
+        i = _skip(tokens, 2, 'if', 'exists')
+        if kind == 'policy':
+            name, table, _ = _policy_target(tokens, i)
+            if table:
+                nodes.append({'op': 'drop_policy', 'table': table, 'name': name})
+        elif kind == 'table':
+            while i < len(tokens):
+                table, i = read_name(tokens, i)
+                if table:
+                    nodes.append({'op': 'drop_table', 'table': table})
+                if i < len(tokens) and tokens[i].value == ',':
+                    i += 1
+                    continue
+                break
+    elif verb == 'do':
+        for token in tokens:
+            if token.kind == 'body':
+                nodes.extend(_block_nodes(token.value, line))
+    for node in nodes:
+        node.setdefault('line', line)
+    return nodes
+
+
+def _block_nodes(body: str, line: int) -> List[Node]:
+    tokens = tuple(tokenize(body))
+    nodes: List[Node] = []
+    for statement in block_statements(tokens, _RELEVANT):
+        nodes.extend(statement_nodes(statement, line))
+    for statement in block_statements(tokens, frozenset(('execute',))):
+        literal = ' '.join(t.value[1:-1] for t in statement if t.kind == 'string').lower()
+        if 'drop policy' not in literal:
+            continue
+        inner = tuple(tokenize(literal.replace('%i', 'x')))
+        _, table, _ = _policy_target(inner, _skip(inner, 2, 'if', 'exists'))
+        if table:
+            nodes.append({'op': 'drop_all_policies', 'table': table, 'line': line})
+    return nodes
+
+
+def parse_sql(text: str) -> List[Node]:
+    nodes: List[Node] = []
+    for statement in split_statements(text):
+        nodes.extend(statement_nodes(statement.tokens, statement.line))
+    return nodes
+
+
+@dataclass
+class _Entry:
+    mtime_ns: int
+    size: int
+    digest: str
+    nodes: List[Node] = field(default_factory=list)
+
+
+class ParseCache:
+    """``path -> nodes`` for SQL files, reparsed only when their content changes."""
+
+    def __init__(
+        self, root: Path = REPO_ROOT, cache_path: Optional[Path] = None, persist: bool = True
+    ):
+        self.root = Path(root)
+        self.cache_path = self.root / CACHE_PATH if cache_path is None else cache_path
+        self.persist = persist
+        self.files: Dict[str, _Entry] = {}
+        self.parsed: List[str] = []
+        self._dirty = False
+        if persist:
+            self._load()
+
+    def _load(self) -> None:
+        try:
+            raw = json.loads(self.cache_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        if raw.get('version') != CACHE_VERSION:
+            return
+        self.files = {
+            path: _Entry(e['mtime_ns'], e['size'], e['digest'], e['nodes'])
+            for path, e in raw.get('files', {}).items()
+        }
+
+    def save(self) -> None:
+        if not self._dirty or not self.persist:
+            return
+        payload = {
+            'version': CACHE_VERSION,
+            'files': {
+                path: {'mtime_ns': e.mtime_ns, 'size': e.size, 'digest': e.digest, 'nodes': e.nodes}
+                for path, e in sorted(self.files.items())
+            },
+        }
+        atomic_write_text(self.cache_path, json.dumps(payload, separators=(',', ':')))
+
+    def nodes(self, path: str) -> List[Node]:
+        """Nodes of ``path`` (relative to the root), from the cache when it is current."""
+        full_path = self.root / path
+        st = os.stat(full_path)
+        entry = self.files.get(path)
+        if entry is not None and entry.mtime_ns == st.st_mtime_ns and entry.size == st.st_size:
+            return entry.nodes
+        raw = full_path.read_bytes()
+        digest = content_hash(raw)
+        if entry is None or entry.digest != digest:
+            entry = _Entry(st.st_mtime_ns, st.st_size, digest, parse_sql(raw.decode('utf-8')))
+            self.parsed.append(path)
+        else:
+            entry = _Entry(st.st_mtime_ns, st.st_size, digest, entry.nodes)
+        self.files[path] = entry
+        self._dirty = True
+        return entry.nodes
+
+    def load(self, paths: Iterable[str]) -> List[Tuple[str, List[Node]]]:
+        """``(path, nodes)`` for each path, in order; saves the cache if anything was parsed."""
+        result = [(path, self.nodes(path)) for path in paths]
+        live = {path for path, _ in result}
+        for stale in [p for p in self.files if p not in live]:
+            del self.files[stale]
+            self._dirty = True
+        self.save()
+        return result
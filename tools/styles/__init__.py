@@ -0,0 +1,26 @@
+"""Inline ``style={{...}}`` literals of the TSX sources: frequency index and hoisting.
+
+Usage::
+
+    python -m tools.styles index --top 30 --json styles.json
+    python -m tools.styles hoist --min-count 3 --dry-run > hoist.patch
+    python -m tools.styles hoist --tokens 'src/app/[locale]/dashboard/inventory/**'
+"""
+
+from .hoist import HoistResult, hoist, rewrite
+from .index import StyleEntry, StyleIndex, find_styles
+from .literal import StyleLiteral, StyleSyntaxError, parse_object
+from .tokens import DesignTokens
+
+__all__ = [
+    'DesignTokens',
+    'HoistResult',
+    'StyleEntry',
+    'StyleIndex',
+    'StyleLiteral',
+    'StyleSyntaxError',
+    'find_styles',
+    'hoist',
+    'parse_object',
+    'rewrite',
+]
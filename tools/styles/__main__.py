@@ -0,0 +1,136 @@
+"""Command-line entry point: ``python -m tools.styles``.
+
+    index    the most repeated style={{...}} literals under src/components and
+             src/app, and the most used property values with their
+             DESIGN_SYSTEM.md token; --json writes the whole index
+    hoist    move the static literals used at least --min-count times into
+             src/lib/styles.ts and point every copy at the constant; globs
+             narrow the files rewritten, --tokens spells the colours as
+             MODULE_COLORS tokens, --dry-run prints the diff instead
+
+Dynamic literals (spreads, ternaries, variables) are indexed but never
+rewritten.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from tools.paths import REPO_ROOT
+
+from .hoist import MODULE_PATH, hoist
+from .index import StyleIndex
+from .tokens import DesignTokens
+
+
+def _clip(text: str, width: int) -> str:
+    return text if len(text) <= width else text[: width - 1] + '…'
+
+
+def _index(index: StyleIndex, args: argparse.Namespace) -> int:
+    tokens = DesignTokens.load(args.root / 'DESIGN_SYSTEM.md')
+    styles = index.ranked()
+    sites = sum(s.count for s in styles)
+    static = [s for s in styles if s.literal.static]
+    repeated = index.repeated(2)
+    print(
+        f'📊 {sites:,} inline styles in {len(index.files)} files: {len(styles):,} distinct, '
+        f'{sum(s.count for s in static):,} static; {sum(s.count for s in repeated):,} repeat '
+        f'one of {len(repeated):,} static literals'
+    )
+    print('\n📋 most repeated (× files <tag> hash style):')
+    for s in styles[: args.top]:
+        tag = s.tags.most_common(1)[0][0]
+        kind = '' if s.literal.static else ' (dynamic)'
+        line = f'{s.count:>6}× {len(s.files):>3} <{tag}> {s.hash} {s.literal.text}{kind}'
+        print(_clip(line, 140))
+    print('\n📋 most used values:')
+    for (key, value), count in index.values.most_common(args.values):
+        token = tokens.token(value)
+        print(f'{count:>6}× {key}: {value}' + (f'  = {token}' if token else ''))
+    for path, error in index.errors.items():
+        print(f'⚠️  {path}: {error} (skipped)')
+    if args.json:
+        args.json.write_text(json.dumps(index.as_dict(), indent=1) + '\n', encoding='utf-8')
+        print(f'\n✅ {args.json}')
+    return 0
+
+
+def _hoist(index: StyleIndex, args: argparse.Namespace) -> int:
+    status = sys.stderr if args.dry_run else sys.stdout
+    tokens = DesignTokens.load(args.root / 'DESIGN_SYSTEM.md') if args.tokens else None
+    if args.tokens and not tokens:
+        print('❌ no MODULE_COLORS block in DESIGN_SYSTEM.md', file=sys.stderr)
+        return 2
+    result = hoist(index, args.min_count, args.module, tokens, args.paths, not args.dry_run)
+    for change in [result.module, *result.files]:
+        if change.after == change.before:
+            continue
+        if args.dry_run:
+            sys.stdout.write(change.diff())
+        elif change is not result.module:
+            print(f'✅ {change.path} ({change.sites} styles)', file=status)
+    verb = 'would point' if args.dry_run else 'pointed'
+    print(
+        f'\n📊 {len(result.added)} new constants in {args.module.as_posix()}; '
+        f'{verb} {result.sites:,} style attributes in {len(result.files)} files at them',
+        file=status,
+    )
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog='python -m tools.styles',
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--root', type=Path, default=REPO_ROOT, help='repository root')
+    common.add_argument('-j', '--jobs', type=int, help='worker processes (default: CPU count)')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    index = commands.add_parser('index', parents=[common], help='report repeated literals')
+    index.add_argument('--top', type=int, default=25, help='literals to list')
+    index.add_argument('--values', type=int, default=15, help='property values to list')
+    index.add_argument('--json', type=Path, help='write the full index to this file')
+
+    hoist_cmd = commands.add_parser('hoist', parents=[common], help='hoist repeated literals')
+    hoist_cmd.add_argument('paths', nargs='*', help='only rewrite files matching these globs')
+    hoist_cmd.add_argument(
+        '--min-count', type=int, default=2, help='hoist literals used this often (default: 2)'
+    )
+    hoist_cmd.add_argument(
+        '--module', type=Path, default=MODULE_PATH, help=f'default: {MODULE_PATH.as_posix()}'
+    )
+    hoist_cmd.add_argument(
+        '--tokens', action='store_true', help='write DESIGN_SYSTEM.md colours as tokens'
+    )
+    hoist_cmd.add_argument('--dry-run', action='store_true', help='print diffs instead of writing')
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    styles = StyleIndex(args.root)
+    try:
+        styles.refresh(jobs=args.jobs)
+        status = sys.stderr if getattr(args, 'dry_run', False) else sys.stdout
+        print(
+            f'ℹ️  indexed {len(styles.files)} files ({len(styles.rescanned)} re-scanned) '
+            f'in {time.perf_counter() - started:.2f}s',
+            file=status,
+        )
+        if args.command == 'index':
+            return _index(styles, args)
+        return _hoist(styles, args)
+    except (OSError, ValueError) as e:
+        print(f'❌ {e}', file=sys.stderr)
+        return 2
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,277 @@
+"""Hoist repeated static style literals into one shared module.
+
+Each literal used at least ``min_count`` times becomes an exported
+``CSSProperties`` constant of ``src/lib/styles.ts``, and every
+``style={{...}}`` spelling it becomes ``style={name}``: one object for the
+whole app instead of a fresh one per element per render, which is what the
+big tables (the inventory list draws a dozen styled cells per row) pay for.
+
+Constants are matched to literals by value, not by name, so they can be
+renamed by hand and a later run reuses them: it only appends the literals
+that became frequent since, and rewrites new spellings of old ones. With
+``tokens`` the colours that are ``DESIGN_SYSTEM.md`` tokens are written as
+``MODULE_COLORS.<module>.<shade>`` references, and the module declares
+``MODULE_COLORS`` as the document has it.
+"""
+
+from __future__ import annotations
+
+import difflib
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from tools.fsutil import atomic_write_text
+from tools.paths import match_glob
+
+from .index import StyleEntry, StyleIndex, find_styles
+from .literal import StyleSyntaxError, object_end, parse_object
+from .tokens import TOKENS_NAME, DesignTokens
+
+MODULE_PATH = Path('src') / 'lib' / 'styles.ts'
+PRINT_WIDTH = 100
+
+HEADER = """\
+import type { CSSProperties } from 'react';
+
+// Inline styles shared across components, hoisted by `python -m tools.styles hoist`.
+// Rename freely: later runs match these constants by value, not by name.
+"""
+
+_CONSTANT = re.compile(r'^export const (\w+): CSSProperties = (?=\{)', re.M)
+_TOKEN_REF = re.compile(r'\b%s\.\w+\.\w+\b' % TOKENS_NAME)
+_IMPORT = re.compile(r'^import\s[^;]*;[^\n]*\n?', re.M)
+_DIRECTIVE = re.compile(r"""\A(?:\s*(?:'use \w+'|"use \w+");?[^\n]*\n)+""")
+_SPECIFIER = re.compile(r'^(\w+)(?:\s+as\s+(\w+))?$')
+
+
+@dataclass
+class FileChange:
+    path: str
+    before: str
+    after: str
+    sites: int  # style attributes rewritten
+
+    def diff(self) -> str:
+        return ''.join(
+            difflib.unified_diff(
+                self.before.splitlines(keepends=True),
+                self.after.splitlines(keepends=True),
+                f'a/{self.path}',
+                f'b/{self.path}',
+            )
+        )
+
+
+@dataclass
+class HoistResult:
+    module: FileChange
+    added: List[Tuple[str, StyleEntry]] = field(default_factory=list)
+    files: List[FileChange] = field(default_factory=list)
+
+    @property
+    def sites(self) -> int:
+        return sum(f.sites for f in self.files)
+
+
+def import_path(module: Path) -> str:
+    """How the sources import ``module``: through the ``@/`` alias when under ``src``."""
+    parts = module.with_suffix('').parts
+    return '@/' + '/'.join(parts[1:]) if parts[0] == 'src' else '/'.join(parts)
+
+
+def _words(key: str, value: str) -> List[str]:
+    """A name fragment for one property: ``display: 'flex'`` -> flex, ``gap: '12px'`` -> gap12."""
+    value = value.strip('\'"')
+    if key == 'display':
+        return [value]
+    if re.fullmatch(r'[a-z-]+', value):
+        return [key, value]
+    if value.startswith('#'):
+        return [key, value[1:]]
+    plain = re.sub(r'#[0-9A-Fa-f]+|\w+\([^)]*\)', ' ', value)  # colours, rgba(), blur(), ...
+    numbers = re.findall(r'\d+(?:\.\d+)?', plain)
+    return [key, 'x'.join(n.replace('.', '_') for n in numbers[:2])] if numbers else [key]
+
+
+def _name(properties: Tuple[Tuple[str, str], ...], taken: Set[str]) -> str:
+    """``<first two properties>Style``, numbered on a clash."""
+    words = [w for key, value in properties[:2] for w in _words(key.strip("'"), value)]
+    parts = [p for w in words for p in re.split(r'[^A-Za-z0-9_]+', w) if p]
+    base = ''.join(p[0].upper() + p[1:] for p in parts) + 'Style'
+    base = base[0].lower() + base[1:]
+    name, n = base, 1
+    while name in taken:
+        n += 1
+        name = f'{base}{n}'
+    taken.add(name)
+    return name
+
+
+def declaration(name: str, entry: StyleEntry, tokens: Optional[DesignTokens] = None) -> str:
+    """``export const <name>: CSSProperties = {...};`` laid out as Prettier would."""
+    members = []
+    for key, value in entry.literal.properties:
+        token = tokens.token(value) if tokens else None
+        members.append(f'{key}: {token or value}')
+    head = f'export const {name}: CSSProperties = '
+    line = f'{head}{{ {", ".join(members)} }};'
+    if len(line) <= PRINT_WIDTH:
+        return line + '\n'
+    return head + '{\n' + ''.join(f'  {m},\n' for m in members) + '};\n'
+
+
+def read_constants(source: str, tokens: DesignTokens) -> Dict[str, str]:
+    """``literal hash -> constant name`` of an existing shared module."""
+    references = {token: f"'{value}'" for value, token in tokens.values.items()}
+    constants = {}
+    for m in _CONSTANT.finditer(source):
+        try:
+            end = object_end(source, m.end())
+        except StyleSyntaxError:
+            continue
+        text = _TOKEN_REF.sub(
+            lambda r: references.get(r.group(), r.group()), source[m.end() : end]
+        )
+        literal = parse_object(text)
+        if literal.static:
+            constants.setdefault(literal.hash, m.group(1))
+    return constants
+
+
+def _add_import(source: str, specifier: str, names: Iterable[str]) -> str:
+    """``source`` importing ``names`` (``'a'`` or ``'a as b'``) from ``specifier``."""
+    names = set(names)
+    existing = re.compile(
+        r'^import \{([^}]*)\} from [\'"]%s[\'"];[^\n]*\n?' % re.escape(specifier), re.M
+    )
+    m = existing.search(source)
+    if m:
+        names.update(n.strip() for n in m.group(1).split(',') if n.strip())
+    statement = f"import {{ {', '.join(sorted(names))} }} from '{specifier}';\n"
+    if len(statement) > PRINT_WIDTH + 1:
+        listed = ''.join(f'  {name},\n' for name in sorted(names))
+        statement = f"import {{\n{listed}}} from '{specifier}';\n"
+    if m:
+        return source[: m.start()] + statement + source[m.end() :]
+    imports = list(_IMPORT.finditer(source))
+    if imports:
+        at = imports[-1].end()
+        if not source[imports[-1].start() : at].endswith('\n'):
+            statement = '\n' + statement
+    else:
+        directive = _DIRECTIVE.match(source)
+        at = directive.end() if directive else 0
+        statement += '\n'
+    return source[:at] + statement + source[at:]
+
+
+def _local_names(source: str, specifier: str) -> Dict[str, str]:
+    """``constant -> local name`` already imported from the shared module."""
+    m = re.search(r'^import \{([^}]*)\} from [\'"]%s[\'"]' % re.escape(specifier), source, re.M)
+    names = {}
+    for spec in (m.group(1).split(',') if m else ()):
+        parsed = _SPECIFIER.match(spec.strip())
+        if parsed:
+            names[parsed.group(1)] = parsed.group(2) or parsed.group(1)
+    return names
+
+
+def rewrite(source: str, constants: Dict[str, str], specifier: str) -> Tuple[str, int]:
+    """``source`` with each known literal replaced by its constant; and how many were."""
+    sites = [s for s in find_styles(source) if s.literal.static and s.literal.hash in constants]
+    if not sites:
+        return source, 0
+    imported = _local_names(source, specifier)
+    local: Dict[str, str] = {}
+    specs = []
+    for name in sorted({constants[s.literal.hash] for s in sites}):
+        if name in imported:
+            local[name] = imported[name]
+            continue
+        alias = name
+        while re.search(r'\b%s\b' % alias, source):
+            alias = f'shared{alias[0].upper()}{alias[1:]}'
+        local[name] = alias
+        specs.append(name if alias == name else f'{name} as {alias}')
+
+    out, pos = [], 0
+    for site in sites:
+        out.append(source[pos : site.start])
+        out.append(f'{{{local[constants[site.literal.hash]]}}}')
+        pos = site.end
+    out.append(source[pos:])
+    rewritten = ''.join(out)
+    if specs:
+        rewritten = _add_import(rewritten, specifier, specs)
+    return rewritten, len(sites)
+
+
+def hoist(
+    index: StyleIndex,
+    min_count: int = 2,
+    module: Path = MODULE_PATH,
+    tokens: Optional[DesignTokens] = None,
+    paths: Iterable[str] = (),
+    write: bool = True,
+) -> HoistResult:
+    """Extend the shared module and rewrite the sources (``paths`` globs narrow them).
+
+    With ``write=False`` nothing is touched; the result holds the new texts.
+    """
+    root = index.root
+    module_file = root / module
+    try:
+        before = module_file.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        before = ''
+    known = DesignTokens.load(root / 'DESIGN_SYSTEM.md') if tokens is None else tokens
+    constants = read_constants(before, known)
+    taken = set(_CONSTANT.findall(before))
+
+    result = HoistResult(FileChange(module.as_posix(), before, before, 0))
+    for entry in index.repeated(min_count):
+        if entry.hash in constants or not entry.literal.properties:
+            continue
+        name = _name(entry.literal.properties, taken)
+        constants[entry.hash] = name
+        result.added.append((name, entry))
+
+    if not (before or result.added):
+        return result
+    after = before or HEADER
+    if tokens and f'const {TOKENS_NAME} ' not in after:
+        first = _CONSTANT.search(after)
+        at = first.start() if first else len(after)
+        after = f'{after[:at].rstrip()}\n\n{tokens.source}\n\n{after[at:].lstrip()}'
+        after = after.rstrip() + '\n'
+    if result.added:
+        after = after.rstrip() + '\n\n' + '\n'.join(
+            declaration(name, entry, tokens) for name, entry in result.added
+        )
+    result.module.after = after
+
+    specifier = import_path(module)
+    patterns = list(paths)
+    targets = sorted(
+        {
+            path
+            for h in constants
+            if h in index.styles
+            for path in index.styles[h].files
+            if not patterns or any(match_glob(path, p) for p in patterns)
+        }
+    )
+    for path in targets:
+        source = (root / path).read_text(encoding='utf-8')
+        rewritten, count = rewrite(source, constants, specifier)
+        if count:
+            result.files.append(FileChange(path, source, rewritten, count))
+
+    if write:
+        if result.module.after != before:
+            atomic_write_text(module_file, result.module.after)
+        for change in result.files:
+            atomic_write_text(root / change.path, change.after)
+    return result
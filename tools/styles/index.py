@@ -0,0 +1,249 @@
+"""Frequency index of the ``style={{...}}`` literals in the TSX sources.
+
+Every literal is keyed by the hash of its canonical text (see
+``literal.py``), with how often it occurs, in which files and on which tags.
+Per-file results are cached in ``.cache/style-index.json`` keyed by
+``(mtime_ns, size, content hash)``, like the i18n usage index, so a warm run
+only stats unchanged files.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from tools.codemods.jsx import JsxSyntaxError, Tag, tokenize
+from tools.fileindex import FileIndex
+from tools.fsutil import atomic_write_text, content_hash
+from tools.paths import REPO_ROOT
+
+from .literal import StyleLiteral, parse_attr, parse_object
+
+INDEX_VERSION = 1
+INDEX_PATH = Path('.cache') / 'style-index.json'
+SOURCE_GLOBS = ('src/components/**/*.tsx', 'src/app/**/*.tsx')
+
+# Below this many files to (re)scan, a process pool costs more than it saves.
+_POOL_THRESHOLD = 32
+
+_NEWLINE = re.compile('\n')
+
+# (literal text, tag, line)
+Site = Tuple[str, str, int]
+
+
+@dataclass(frozen=True)
+class StyleSite:
+    """A ``style={{...}}`` attribute, with the offsets of its ``{{...}}`` value."""
+
+    literal: StyleLiteral
+    tag: str
+    line: int
+    start: int
+    end: int
+
+
+def find_styles(content: str) -> List[StyleSite]:
+    """Every ``style={{...}}`` of ``content``, in source order."""
+    newlines = [m.start() for m in _NEWLINE.finditer(content)]
+    sites = []
+    for token in tokenize(content):
+        if not isinstance(token, Tag):
+            continue
+        for attr in token.attrs:
+            if attr.name != 'style' or attr.value is None:
+                continue
+            literal = parse_attr(attr.value)
+            if literal is not None:
+                line = bisect.bisect_left(newlines, attr.start) + 1
+                sites.append(
+                    StyleSite(literal, token.name, line, attr.value_start, attr.value_end)
+                )
+    return sites
+
+
+@dataclass
+class _Entry:
+    mtime_ns: int
+    size: int
+    digest: str
+    sites: List[Site] = field(default_factory=list)
+    error: Optional[str] = None
+
+
+def _scan_file(job: Tuple[str, str, Optional[str]]) -> Tuple[str, Optional[_Entry], bool]:
+    """Worker: ``(root, path, known digest) -> (path, entry, digest unchanged?)``."""
+    root, path, known_digest = job
+    full_path = os.path.join(root, path)
+    try:
+        with open(full_path, 'rb') as f:
+            raw = f.read()
+        st = os.stat(full_path)
+    except OSError:
+        return path, None, False
+    digest = content_hash(raw)
+    entry = _Entry(st.st_mtime_ns, st.st_size, digest)
+    if digest == known_digest:
+        return path, entry, True
+    try:
+        sites = find_styles(raw.decode('utf-8', errors='replace'))
+    except JsxSyntaxError as e:
+        entry.error = str(e)
+    else:
+        entry.sites = [(s.literal.text, s.tag, s.line) for s in sites]
+    return path, entry, False
+
+
+@dataclass
+class StyleEntry:
+    hash: str
+    literal: StyleLiteral
+    count: int = 0
+    files: Counter = field(default_factory=Counter)
+    tags: Counter = field(default_factory=Counter)
+    sites: List[Tuple[str, int]] = field(default_factory=list)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'hash': self.hash,
+            'style': self.literal.text,
+            'static': self.literal.static,
+            'count': self.count,
+            'files': dict(self.files.most_common()),
+            'tags': dict(self.tags.most_common()),
+            'sites': [f'{path}:{line}' for path, line in self.sites],
+        }
+
+
+class StyleIndex:
+    """``hash -> StyleEntry`` for every inline style literal, plus value counts."""
+
+    def __init__(self, root: Path = REPO_ROOT, cache_path: Optional[Path] = None):
+        self.root = Path(root)
+        self.cache_path = self.root / INDEX_PATH if cache_path is None else cache_path
+        self.files: Dict[str, _Entry] = {}
+        self.rescanned: List[str] = []
+        # Filled by refresh().
+        self.styles: Dict[str, StyleEntry] = {}
+        self.values: Counter = Counter()  # (property, value) over every literal
+
+    def _load(self) -> None:
+        try:
+            raw = json.loads(self.cache_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return
+        if raw.get('version') != INDEX_VERSION:
+            return
+        self.files = {
+            path: _Entry(
+                e['mtime_ns'], e['size'], e['digest'], [tuple(s) for s in e['sites']], e['error']
+            )
+            for path, e in raw.get('files', {}).items()
+        }
+
+    def _save(self) -> None:
+        payload = {
+            'version': INDEX_VERSION,
+            'files': {
+                path: {
+                    'mtime_ns': e.mtime_ns,
+                    'size': e.size,
+                    'digest': e.digest,
+                    'sites': e.sites,
+                    'error': e.error,
+                }
+                for path, e in sorted(self.files.items())
+            },
+        }
+        atomic_write_text(self.cache_path, json.dumps(payload, separators=(',', ':')))
+
+    def refresh(self, paths: Optional[Iterable[str]] = None, jobs: Optional[int] = None) -> None:
+        """Bring the index up to date, re-scanning only files whose content changed."""
+        self._load()
+        if paths is None:
+            paths = FileIndex(self.root).refresh().glob(*SOURCE_GLOBS)
+        paths = list(paths)
+
+        todo = []
+        for path in paths:
+            entry = self.files.get(path)
+            if entry is not None:
+                try:
+                    st = os.stat(self.root / path)
+                except OSError:
+                    continue
+                if entry.mtime_ns == st.st_mtime_ns and entry.size == st.st_size:
+                    continue
+            todo.append((str(self.root), path, entry.digest if entry else None))
+
+        jobs = jobs or os.cpu_count() or 1
+        if jobs == 1 or len(todo) < _POOL_THRESHOLD:
+            results = [_scan_file(job) for job in todo]
+        else:
+            chunksize = max(1, len(todo) // (jobs * 4))
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                results = list(pool.map(_scan_file, todo, chunksize=chunksize))
+
+        self.rescanned = []
+        for path, entry, unchanged in results:
+            if entry is None:
+                self.files.pop(path, None)
+                continue
+            if unchanged:
+                previous = self.files[path]
+                entry.sites, entry.error = previous.sites, previous.error
+            else:
+                self.rescanned.append(path)
+            self.files[path] = entry
+        live = set(paths)
+        stale = [p for p in self.files if p not in live]
+        for path in stale:
+            del self.files[path]
+        if results or stale:
+            self._save()
+        self._build()
+
+    def _build(self) -> None:
+        self.styles, self.values = {}, Counter()
+        for path, entry in sorted(self.files.items()):
+            for text, tag, line in entry.sites:
+                literal = parse_object(text)
+                style = self.styles.get(literal.hash)
+                if style is None:
+                    style = self.styles[literal.hash] = StyleEntry(literal.hash, literal)
+                style.count += 1
+                style.files[path] += 1
+                style.tags[tag] += 1
+                style.sites.append((path, line))
+                self.values.update(literal.properties)
+
+    @property
+    def errors(self) -> Dict[str, str]:
+        return {path: e.error for path, e in sorted(self.files.items()) if e.error}
+
+    def ranked(self) -> List[StyleEntry]:
+        """Literals, most frequent first."""
+        return sorted(self.styles.values(), key=lambda s: (-s.count, s.literal.text))
+
+    def repeated(self, min_count: int = 2) -> List[StyleEntry]:
+        """Static literals used at least ``min_count`` times, most frequent first."""
+        return [s for s in self.ranked() if s.literal.static and s.count >= min_count]
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'version': INDEX_VERSION,
+            'files': len(self.files),
+            'sites': sum(s.count for s in self.styles.values()),
+            'styles': [s.as_dict() for s in self.ranked()],
+            'values': [
+                {'property': key, 'value': value, 'count': count}
+                for (key, value), count in self.values.most_common()
+            ],
+        }
@@ -0,0 +1,174 @@
+"""Parse the object literals of ``style={{...}}`` attributes.
+
+A literal is *static* when every member is a plain ``key: value`` pair whose
+value is a string, number or boolean: those can be hoisted out of a
+component unchanged. Anything else (a spread, a ternary, a variable, a
+template with ``${}``) makes it dynamic; its static members are still
+reported, but the literal itself stays where it is.
+
+Static literals are printed in one canonical form (single quotes, one space
+after each colon and comma) so the same style written two ways hashes the
+same. Member order is kept: React applies the properties in order, so
+``{ padding, paddingTop }`` and ``{ paddingTop, padding }`` differ.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+from tools.fsutil import content_hash
+
+HASH_LENGTH = 12
+
+_TOKEN = re.compile(
+    r"""
+     (?P<str>'(?:[^'\\\n]|\\.)*'|"(?:[^"\\\n]|\\.)*")
+    |(?P<template>`(?:[^`\\]|\\.)*`)
+    |(?P<comment>//[^\n]*|/\*.*?\*/)
+    |(?P<open>[(\[{])
+    |(?P<close>[)\]}])
+    |(?P<comma>,)
+    |(?P<other>[^'"`/(\[{)\]},]+|/)
+    """,
+    re.S | re.X,
+)
+_MEMBER = re.compile(
+    r"""\s*(?:(?P<ident>[A-Za-z_$][\w$]*)|'(?P<sq>[^'\\]*)'|"(?P<dq>[^"\\]*)")"""
+    r'\s*:(?P<value>.*)',
+    re.S,
+)
+_NUMBER = re.compile(r'-?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][+-]?\d+)?')
+_IDENT = re.compile(r'[A-Za-z_$][\w$]*\Z')
+
+
+class StyleSyntaxError(ValueError):
+    pass
+
+
+@dataclass(frozen=True)
+class StyleLiteral:
+    text: str  # canonical source of a static literal; whitespace-collapsed otherwise
+    static: bool
+    # (key, canonical value) of the static members, in source order
+    properties: Tuple[Tuple[str, str], ...]
+
+    @property
+    def hash(self) -> str:
+        return content_hash(self.text.encode('utf-8'))[:HASH_LENGTH]
+
+
+def _split(body: str) -> List[str]:
+    """``body`` (between the braces) split on its top-level commas."""
+    members: List[str] = []
+    depth, start, pos = 0, 0, 0
+    while pos < len(body):
+        m = _TOKEN.match(body, pos)
+        if m is None:
+            raise StyleSyntaxError(f'unterminated literal in {body!r}')
+        kind = m.lastgroup
+        if kind == 'open':
+            depth += 1
+        elif kind == 'close':
+            depth -= 1
+            if depth < 0:
+                raise StyleSyntaxError(f'unbalanced {m.group()!r} in {body!r}')
+        elif kind == 'comma' and depth == 0:
+            members.append(body[start : m.start()])
+            start = m.end()
+        pos = m.end()
+    if depth:
+        raise StyleSyntaxError(f'unbalanced brackets in {body!r}')
+    members.append(body[start:])
+    return [member for member in members if member.strip()]
+
+
+def object_end(source: str, start: int) -> int:
+    """Offset just past the ``}`` closing the object literal opened at ``start``."""
+    depth, pos = 0, start
+    while pos < len(source):
+        m = _TOKEN.match(source, pos)
+        if m is None:
+            break
+        if m.lastgroup == 'open':
+            depth += 1
+        elif m.lastgroup == 'close':
+            depth -= 1
+            if depth == 0:
+                return m.end()
+        pos = m.end()
+    raise StyleSyntaxError(f'unterminated object literal at offset {start}')
+
+
+def _value(raw: str) -> Optional[str]:
+    """Canonical source of a literal value, or None when it is an expression."""
+    raw = raw.strip()
+    if _NUMBER.fullmatch(raw) or raw in ('true', 'false'):
+        return raw
+    quote = raw[:1]
+    if quote in ('"', "'", '`') and len(raw) >= 2 and raw[-1] == quote:
+        m = _TOKEN.match(raw)
+        if m is None or m.end() != len(raw) or (quote == '`' and '${' in raw):
+            return None
+        content = raw[1:-1]
+        if quote == "'":
+            return raw
+        if "'" in content or '\\' in content or '\n' in content:
+            return raw if quote == '"' else None
+        return f"'{content}'"
+    return None
+
+
+def _strip_comments(source: str) -> str:
+    parts, pos = [], 0
+    while pos < len(source):
+        m = _TOKEN.match(source, pos)
+        if m is None:
+            parts.append(source[pos:])
+            break
+        parts.append(' ' if m.lastgroup == 'comment' else m.group())
+        pos = m.end()
+    return ''.join(parts)
+
+
+def _key(m: 're.Match[str]') -> str:
+    key = m.group('ident') or m.group('sq') or m.group('dq') or ''
+    return key if _IDENT.match(key) else f"'{key}'"
+
+
+@lru_cache(maxsize=4096)
+def parse_object(source: str) -> StyleLiteral:
+    """Parse ``{ ... }``, the object literal source (not the JSX ``{{ }}``)."""
+    source = source.strip()
+    if not (source.startswith('{') and object_end(source, 0) == len(source)):
+        raise StyleSyntaxError(f'not a single object literal: {source!r}')
+    static = True
+    properties: List[Tuple[str, str]] = []
+    for member in _split(source[1:-1]):
+        m = _MEMBER.match(_strip_comments(member))
+        value = _value(m.group('value')) if m else None
+        if m is None or value is None:
+            static = False
+            continue
+        properties.append((_key(m), value))
+    if static:
+        inner = ', '.join(f'{key}: {value}' for key, value in properties)
+        text = f'{{ {inner} }}' if inner else '{}'
+    else:
+        text = ' '.join(_strip_comments(source).split())
+    return StyleLiteral(text, static, tuple(properties))
+
+
+def parse_attr(value: str) -> Optional[StyleLiteral]:
+    """The literal of a ``style`` attribute's raw value, if it is ``{{ ... }}``."""
+    if not value.startswith('{'):
+        return None
+    inner = value[1:-1].strip()
+    if not inner.startswith('{'):
+        return None
+    try:
+        return parse_object(inner)
+    except StyleSyntaxError:
+        return None
@@ -0,0 +1,59 @@
+"""The colour tokens of ``DESIGN_SYSTEM.md``.
+
+The document's ``MODULE_COLORS`` block is the palette every module page is
+meant to use. It is read from the Markdown itself, so the tooling never
+drifts from the document: ``{'#2563eb': 'MODULE_COLORS.cadastro.primary', ...}``.
+A value that two tokens share is left out, since it cannot be told apart.
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Dict, Optional
+
+from tools.paths import REPO_ROOT
+
+DESIGN_SYSTEM = REPO_ROOT / 'DESIGN_SYSTEM.md'
+TOKENS_NAME = 'MODULE_COLORS'
+
+_BLOCK = re.compile(
+    r'```(?:typescript|ts)\n(export const %s = \{.*?\n\};?)\n```' % TOKENS_NAME, re.S
+)
+_GROUP = re.compile(r'^  (\w+): \{(.*?)^  \},?', re.S | re.M)
+_COLOR = re.compile(r"^\s+(\w+): '(#[0-9A-Fa-f]{3,8})'", re.M)
+
+
+class DesignTokens:
+    def __init__(self, source: str = ''):
+        self.source = source  # the TypeScript declaration, as the document has it
+        self.values: Dict[str, str] = {}  # lower-cased value -> dotted token
+        shared = set()
+        for group in _GROUP.finditer(source):
+            for color in _COLOR.finditer(group.group(2)):
+                value = color.group(2).lower()
+                token = f'{TOKENS_NAME}.{group.group(1)}.{color.group(1)}'
+                if value in self.values:
+                    shared.add(value)
+                self.values.setdefault(value, token)
+        for value in shared:
+            del self.values[value]
+
+    @classmethod
+    def load(cls, path: Path = DESIGN_SYSTEM) -> 'DesignTokens':
+        """The tokens of ``path``; none when the document or its block is missing."""
+        try:
+            text = path.read_text(encoding='utf-8')
+        except OSError:
+            return cls()
+        m = _BLOCK.search(text)
+        return cls(m.group(1) if m else '')
+
+    def token(self, value: str) -> Optional[str]:
+        """The token spelling a quoted literal such as ``'#2563eb'``, if any."""
+        if len(value) < 3 or value[0] not in '\'"' or value[-1] != value[0]:
+            return None
+        return self.values.get(value[1:-1].lower())
+
+    def __bool__(self) -> bool:
+        return bool(self.values)
@@ -1,6 +1,10 @@
 import re
 
-with open(r'D:\dev\wwusa-saas-app\src\app\[locale]\dashboard\inventory\page.tsx', 'r', encoding='utf-8') as f:
+from tools.paths import REPO_ROOT
+
+INVENTORY_PAGE = REPO_ROOT / 'src' / 'app' / '[locale]' / 'dashboard' / 'inventory' / 'page.tsx'
+
+with open(INVENTORY_PAGE, 'r', encoding='utf-8') as f:
     content = f.read()
 
 # Find and replace the handleFileUpload function
@@ -49,7 +53,7 @@ new_function = '''    const handleFileUpload = async (e: React.ChangeEvent<HTMLI
 
 content = re.sub(old_function, new_function, content, flags=re.DOTALL)
 
-with open(r'D:\dev\wwusa-saas-app\src\app\[locale]\dashboard\inventory\page.tsx', 'w', encoding='utf-8') as f:
+with open(INVENTORY_PAGE, 'w', encoding='utf-8') as f:
     f.write(content)
 
 print("✅ Updated handleFileUpload!")
@@ -1,48 +1,15 @@
-import json
+#!/usr/bin/env python3
+"""
+Switch the user creation flow to "Invite" terminology.
 
-files = [
-    (r'D:\dev\wwusa-saas-app\src\messages\pt.json', {
-        'Users': {
-            'newButton': 'Convidar Usuário',
-            'modal': {
-                'titleNew': 'Convidar Novo Usuário',
-                'save': 'Enviar Convite'
-            }
-        }
-    }),
-    (r'D:\dev\wwusa-saas-app\src\messages\en.json', {
-        'Users': {
-            'newButton': 'Invite User',
-            'modal': {
-                'titleNew': 'Invite New User',
-                'save': 'Send Invitation'
-            }
-        }
-    }),
-    (r'D:\dev\wwusa-saas-app\src\messages\es.json', {
-        'Users': {
-            'newButton': 'Invitar Usuario',
-            'modal': {
-                'titleNew': 'Invitar Nuevo Usuario',
-                'save': 'Enviar Invitación'
-            }
-        }
-    })
-]
+The messages live in ``tools/i18n/changesets/invite_terms.yaml`` and are applied by
+``python -m tools.i18n.patch``, which keeps the catalogs' formatting intact.
+"""
 
-for file_path, updates in files:
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    if 'Dashboard' in data and 'Users' in data['Dashboard']:
-        # Update deep keys
-        if 'newButton' in updates['Users']:
-            data['Dashboard']['Users']['newButton'] = updates['Users']['newButton']
-        
-        if 'modal' in updates['Users']:
-            data['Dashboard']['Users']['modal'].update(updates['Users']['modal'])
-            
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
+import sys
 
-print("✅ Updated translations to use 'Invite' terminology")
+from tools.i18n.patch import main
+from tools.paths import REPO_ROOT
+
+if __name__ == '__main__':
+    sys.exit(main([str(REPO_ROOT / 'tools/i18n/changesets/invite_terms.yaml'), *sys.argv[1:]]))
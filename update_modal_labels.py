@@ -1,40 +1,15 @@
-import json
+#!/usr/bin/env python3
+"""
+Split the Save/Invite labels of the user modal.
 
-files = [
-    (r'D:\dev\wwusa-saas-app\src\messages\pt.json', {
-        'Users': {
-            'modal': {
-                'save': 'Enviar Convite',
-                'saveEdit': 'Salvar Alterações'
-            }
-        }
-    }),
-    (r'D:\dev\wwusa-saas-app\src\messages\en.json', {
-        'Users': {
-            'modal': {
-                'save': 'Send Invitation',
-                'saveEdit': 'Save Changes'
-            }
-        }
-    }),
-    (r'D:\dev\wwusa-saas-app\src\messages\es.json', {
-        'Users': {
-            'modal': {
-                'save': 'Enviar Invitación',
-                'saveEdit': 'Guardar Cambios'
-            }
-        }
-    })
-]
+The messages live in ``tools/i18n/changesets/modal_labels.yaml`` and are applied by
+``python -m tools.i18n.patch``, which keeps the catalogs' formatting intact.
+"""
 
-for file_path, updates in files:
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    if 'Dashboard' in data and 'Users' in data['Dashboard'] and 'modal' in data['Dashboard']['Users']:
-        data['Dashboard']['Users']['modal'].update(updates['Users']['modal'])
-            
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
+import sys
 
-print("✅ Updated translations with split Save/Invite labels")
+from tools.i18n.patch import main
+from tools.paths import REPO_ROOT
+
+if __name__ == '__main__':
+    sys.exit(main([str(REPO_ROOT / 'tools/i18n/changesets/modal_labels.yaml'), *sys.argv[1:]]))
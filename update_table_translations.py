@@ -1,18 +1,15 @@
-import json
+#!/usr/bin/env python3
+"""
+Add the Responsible and Date inventory table labels.
 
-files = [
-    (r'D:\dev\wwusa-saas-app\src\messages\pt.json', {'responsible': 'Responsável', 'date': 'Data'}),
-    (r'D:\dev\wwusa-saas-app\src\messages\en.json', {'responsible': 'Responsible', 'date': 'Date'}),
-    (r'D:\dev\wwusa-saas-app\src\messages\es.json', {'responsible': 'Responsável', 'date': 'Fecha'})
-]
+The messages live in ``tools/i18n/changesets/inventory_table.yaml`` and are applied by
+``python -m tools.i18n.patch``, which keeps the catalogs' formatting intact.
+"""
 
-for file_path, new_keys in files:
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    if 'Dashboard' in data and 'Inventory' in data['Dashboard'] and 'table' in data['Dashboard']['Inventory']:
-        data['Dashboard']['Inventory']['table'].update(new_keys)
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=4)
+import sys
 
-print("✅ Updated translations with Responsible and Date columns")
+from tools.i18n.patch import main
+from tools.paths import REPO_ROOT
+
+if __name__ == '__main__':
+    sys.exit(main([str(REPO_ROOT / 'tools/i18n/changesets/inventory_table.yaml'), *sys.argv[1:]]))